@@ -0,0 +1,67 @@
+# ==================================================================== #
+#  File name:      check_import_time.py         #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Script which measures the    #  |#   #   $      #|  #
+#                  time it takes to import the  #  |#   #   #      #|  #
+#                  package and checks it        #   #\  #   #     /#   #
+#                  against a budget.            #    *= #   #    =+    #
+#  Rev:            1.1                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Time the whole statement, including lazy imports        #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+import os, sys, subprocess
+from _directory import *
+
+RUNS = 5
+""" Amount of fresh interpreters to measure, the fastest run is compared to the budget """
+LIGHT_STATEMENTS = {
+    "import tkinter_tools": 10,
+    "from tkinter_tools import CallbackSet, FancyCallback": 30,
+}
+""" Statements which are not allowed to import tkinter or Pillow, with their budget in milliseconds.
+The budget covers everything the statement imports, including standard library modules like functools and weakref """
+
+def measure_import_time(statement):
+    """
+    Measure the time a statement takes in a fresh interpreter.
+    The whole statement is timed, "python -X importtime" does not see the modules imported by the lazy names of the package (importlib.import_module)
+
+    :param statement: Python statement which imports (a part of) the package
+    :type statement: string
+    :return: Time of the statement in milliseconds and the names of the imported modules
+    :rtype: tuple(float, list[string])
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"from time import perf_counter; start = perf_counter(); {statement}; end = perf_counter(); import sys; print((end - start) * 1000, ' '.join(sys.modules))"],
+        cwd=MAIN_DIRECTORY, capture_output=True, text=True, check=True
+    )
+
+    lWords = result.stdout.split()
+    return float(lWords[0]), lWords[1:]
+
+failed = False
+
+for statement, budget in LIGHT_STATEMENTS.items():
+    lResults = [measure_import_time(statement) for _ in range(RUNS)]
+    fastest = min(importTime for importTime, _ in lResults)
+    lHeavyModules = [module for module in ("tkinter", "PIL") if module in lResults[0][1]]
+
+    print(f"{statement}: {fastest:.2f} ms (budget {budget} ms)")
+    if fastest > budget:
+        print("\tOver budget!")
+        failed = True
+    if len(lHeavyModules) > 0:
+        print(f"\tImports {', '.join(lHeavyModules)}, which should only be imported when a widget is used")
+        failed = True
+
+sys.exit(1 if failed else 0)
\ No newline at end of file
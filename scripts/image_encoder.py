@@ -7,51 +7,174 @@
 #                  all images in the assets     #  |#   #   #      #|  #
 #                  folder to python source      #   #\  #   #     /#   #
 #                  code.                        #    *= #   #    =+    #
-#  Rev:            1.0                          #     *++######++*     #
+#  Rev:            2.1                          #     *++######++*     #
 #                                               #        *-==-*        #
 # ==================================================================== #
 #  Revision history:                                                   #
 #  Date        Description                                             #
 #  02-Jun-2023 File created                                            #
+#  18-Oct-2026 Also embed pre-sized variants of each image             #
+#  18-Oct-2026 Write one module per image so they load on demand       #
+#  18-Oct-2026 Only re-encode changed images, deterministic output     #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
 # ==================================================================== #
 
-import os, sys, base64, datetime
+import os, base64, hashlib, json
+from io import BytesIO
+import PIL.Image as Image
 from _directory import *
 
 ASSETS_FOLDER = os.path.join(MAIN_DIRECTORY, "assets")
-OUTPUT_FILE = os.path.join(PROJECT_DIRECTORY, "resources", "_encoded_images.py")
+OUTPUT_FOLDER = os.path.join(PROJECT_DIRECTORY, "resources", "_encoded_images")
+MANIFEST_FILE = os.path.join(OUTPUT_FOLDER, "_manifest.json")
+""" Content hash and generated modules of each encoded image, used to skip images which did not change """
+NEWLINE = "\r\n"
+""" Line ending of the generated files, fixed so the output is byte identical on every platform """
 
-# Clear the previous files
-if os.path.exists(OUTPUT_FILE):
-    os.remove(OUTPUT_FILE)
+ICON_SIZES = [15]
+""" Sizes in pixels (at a scale factor of 1) for which pre-sized variants of each image are embedded """
+SCALE_FACTORS = [1, 1.5, 2]
+""" Scale factors for which each of the ICON_SIZES is embedded, used for HiDPI displays """
 
-original_stdout = sys.stdout # Save a reference to the original standard output
+def get_variant_sizes():
+    """
+    Get the pixel sizes of all pre-sized variants, must match get_icon in tkinter_tools.resources.icons
 
-# Create a new file
-with open(OUTPUT_FILE, "w+") as outputFile:
-    sys.stdout = outputFile
-    
-    print(f"# ==================================================================== #\n\
-#  File name:      _encoded_images.py           #        _.==._        #\n\
-#  Author:         Arjan Lemmens                #     .+=##**##=+.     #\n\
-#  Date:           {datetime.datetime.today()}  #    *= #        =*    #\n\
-# ============================================= #   #/  #         \#   #\n\
-#  Description:    Embedded data for images in  #  |#   #   $      #|  #\n\
-#                  ./assets/                    #  |#   #   #      #|  #\n\
-#                  This file is automatically   #   #\  #   #     /#   #\n\
-#                  generated using the          #    *= #   #    =+    #\n\
-#                  _image_encoder.py script.    #     *++######++*     #\n\
-#                                               #        *-==-*        #\n\
-# ==================================================================== #\n\n"
+    :return: Sorted pixel sizes without duplicates
+    :rtype: list[integer]
+    """
+    return sorted({int(size * factor + 0.5) for size in ICON_SIZES for factor in SCALE_FACTORS})
+
+def encode_variant(filePath, size):
+    """
+    Resize an image and encode it as base64 PNG data
+
+    :param filePath: Path to the original image
+    :type filePath: string
+    :param size: Width and height of the variant in pixels
+    :type size: integer
+    :return: Base64 encoded PNG data of the variant
+    :rtype: bytes
+    """
+    buffer = BytesIO()
+    with Image.open(filePath) as image:
+        image.convert("RGBA").resize((size, size), Image.LANCZOS).save(buffer, format="PNG", optimize=True)
+    return base64.b64encode(buffer.getvalue())
+
+def write_if_changed(filePath, content):
+    """
+    Write a file only if its content differs, so unchanged files keep their timestamp
+
+    :param filePath: Path of the file to write
+    :type filePath: string
+    :param content: New content of the file
+    :type content: string
+    :return: If the file was written
+    :rtype: boolean
+    """
+    content = content.replace("\n", NEWLINE).encode("ascii")
+    if os.path.exists(filePath):
+        with open(filePath, "rb") as existingFile:
+            if existingFile.read() == content:
+                return False
+
+    with open(filePath, "wb") as outputFile:
+        outputFile.write(content)
+    return True
+
+def write_asset(varName, data):
+    """
+    Write the data of a single asset to its own module, so it is only imported when it is requested
+
+    :param varName: Name of the asset, also used as module name
+    :type varName: string
+    :param data: Base64 encoded image data
+    :type data: bytes
+    """
+    write_if_changed(
+        os.path.join(OUTPUT_FOLDER, varName + ".py"),
+        "# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.\n" +
+        f"data = {data}\n"
     )
-    
-    # Name of the file to encode
-    for filename in [name for name in os.listdir(ASSETS_FOLDER) if name.endswith(".png")]: # Only embed png files
-        varName = filename.replace(".png", "")
-        print(f"{varName} = {base64.b64encode(open(os.path.join(ASSETS_FOLDER, filename),'rb').read())}\n")
 
+def load_manifest():
+    """
+    Load the manifest of the previous run
+
+    :return: Dictionary of image file name: {"sha256": content hash, "modules": generated module names}
+    :rtype: dict
+    """
+    try:
+        with open(MANIFEST_FILE, "r") as manifestFile:
+            return json.load(manifestFile)
+    except (OSError, ValueError):
+        return dict() # No (valid) manifest, encode everything
+
+def hash_file(filePath):
+    """
+    Get the content hash of a file
+
+    :param filePath: Path of the file
+    :type filePath: string
+    :return: SHA-256 hash in hexadecimal form
+    :rtype: string
+    """
+    with open(filePath, "rb") as inputFile:
+        return hashlib.sha256(inputFile.read()).hexdigest()
+
+if not os.path.exists(OUTPUT_FOLDER):
+    os.makedirs(OUTPUT_FOLDER)
+
+dManifest = load_manifest()
+dNewManifest = dict()
+
+# Name of the file to encode
+for filename in sorted([name for name in os.listdir(ASSETS_FOLDER) if name.endswith(".png")]): # Only embed png files
+    varName = filename.replace(".png", "")
+    filePath = os.path.join(ASSETS_FOLDER, filename)
+    dEntry = {
+        "sha256": hash_file(filePath),
+        "modules": [varName] + [f"{varName}_{size}px" for size in get_variant_sizes()]
+    }
+    dNewManifest[filename] = dEntry
+
+    # Skip images which are unchanged since the previous run
+    if dManifest.get(filename) == dEntry and all(os.path.exists(os.path.join(OUTPUT_FOLDER, module + ".py")) for module in dEntry["modules"]):
+        continue
+
+    print(f"Encoding {filename}")
+    write_asset(varName, base64.b64encode(open(filePath,'rb').read()))
+
+    # Pre-sized variants, so that no image needs to be resized at runtime
+    for size in get_variant_sizes():
+        write_asset(f"{varName}_{size}px", encode_variant(filePath, size))
+
+# Remove modules of images which were deleted or variants which are no longer generated
+lAssetNames = [module for dEntry in dNewManifest.values() for module in dEntry["modules"]]
+for filename in [name for name in os.listdir(OUTPUT_FOLDER) if name.endswith(".py") and name != "__init__.py"]:
+    if filename.replace(".py", "") not in lAssetNames:
+        print(f"Removing {filename}")
+        os.remove(os.path.join(OUTPUT_FOLDER, filename))
+
+# The combined hash replaces a date, so the index only changes when an image changes
+sourceHash = hashlib.sha256("".join(dEntry["sha256"] for dEntry in dNewManifest.values()).encode("ascii")).hexdigest()[:12]
+
+# Create the package index, which only holds the names of the assets
+write_if_changed(os.path.join(OUTPUT_FOLDER, "__init__.py"), f"# ==================================================================== #\n\
+#  File name:      _encoded_images/__init__.py  #        _.==._        #\n\
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #\n\
+#  Source hash:    {sourceHash:<29}#    *= #        =*    #\n\
+# ============================================= #   #/  #         \\#   #\n\
+#  Description:    Index of the embedded data   #  |#   #   $      #|  #\n\
+#                  for images in ./assets/,     #  |#   #   #      #|  #\n\
+#                  each image is stored in its  #   #\\  #   #     /#   #\n\
+#                  own module. This file is     #    *= #   #    =+    #\n\
+#                  automatically generated      #     *++######++*     #\n\
+#                  using image_encoder.py.      #        *-==-*        #\n\
+# ==================================================================== #\n\n\
+ASSET_NAMES = {tuple(lAssetNames)}\n"
+)
 
-sys.stdout = original_stdout # Reset the standard output to its original value
\ No newline at end of file
+write_if_changed(MANIFEST_FILE, json.dumps(dNewManifest, indent=4, sort_keys=True) + "\n")
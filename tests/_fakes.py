@@ -0,0 +1,289 @@
+# ==================================================================== #
+#  File name:      _fakes.py                    #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tcl interpreter and widgets  #  |#   #   $      #|  #
+#                  which don't need a display,  #  |#   #   #      #|  #
+#                  the Tk commands are replaced #   #\  #   #     /#   #
+#                  by stubs which count calls.  #    *= #   #    =+    #
+#  Rev:            1.7                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Root with a fake clock which runs after() calls         #
+#  18-Oct-2026 Bindings per event and bindtag, stub widget classes     #
+#  18-Oct-2026 Stub ttk widget classes                                 #
+#  18-Oct-2026 Stub ttk scrollbar                                      #
+#  18-Oct-2026 Reading options with configure                          #
+#  18-Oct-2026 Text of stub entries                                    #
+#  18-Oct-2026 Shared patch of the icon creation                       #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+from itertools import count
+from unittest import mock
+from tkinter_tools.resources import icons
+
+# =============== #
+#   Definitions   #
+# =============== #
+_STUB_COMMANDS = """
+set ::log {}
+array set ::bindings {}
+array set ::bindtags {}
+array set ::options {}
+proc grid {args} { lappend ::log [concat grid $args] }
+proc bind {w sequence args} {
+    set key [list $w $sequence]
+    if {[llength $args] == 0} {
+        if {[info exists ::bindings($key)]} { return [join $::bindings($key) \\n] }
+        return {}
+    }
+    set script [lindex $args 0]
+    if {$script eq ""} {
+        unset -nocomplain ::bindings($key)
+    } elseif {[string index $script 0] eq "+"} {
+        lappend ::bindings($key) [string range $script 1 end]
+    } else {
+        set ::bindings($key) [list $script]
+    }
+}
+proc bindtags {w args} {
+    if {[llength $args] > 0} { set ::bindtags($w) [lindex $args 0]; return }
+    if {[info exists ::bindtags($w)]} { return $::bindtags($w) }
+    if {$w eq "."} { return [list .] }
+    return [list $w .]
+}
+proc destroy {args} {
+    foreach w $args {
+        foreach tag [bindtags $w] {
+            set key [list $tag <Destroy>]
+            if {[info exists ::bindings($key)]} {
+                foreach script $::bindings($key) { uplevel #0 [string map [list %W $w] [regsub -all {%[^W]} $script 0]] }
+            }
+        }
+        unset -nocomplain ::bindings([list $w <Destroy>]) ::bindtags($w) ::options($w) ::text($w)
+    }
+    lappend ::log [concat destroy $args]
+}
+proc winfo {option w} { return 1 }
+proc _widget {w args} {
+    set ::options($w) $args
+    set ::text($w) {}
+    proc $w {command args} [string map [list @W $w] {
+        switch -- $command {
+            configure {
+                if {[llength $args] == 0} {
+                    set options {}
+                    dict for {option value} $::options(@W) { lappend options [list $option [string range $option 1 end] {} {} $value] }
+                    return $options
+                }
+                if {[llength $args] == 1} {
+                    set option [lindex $args 0]
+                    set value {}
+                    if {[dict exists $::options(@W) $option]} { set value [dict get $::options(@W) $option] }
+                    return [list $option [string range $option 1 end] {} {} $value]
+                }
+                foreach {option value} $args { dict set ::options(@W) $option $value }
+            }
+            cget {
+                if {[dict exists $::options(@W) [lindex $args 0]]} { return [dict get $::options(@W) [lindex $args 0]] }
+                return {}
+            }
+            get { return $::text(@W) }
+            insert {
+                if {[lindex $args 0] eq "0"} { set ::text(@W) [lindex $args 1]$::text(@W) } else { append ::text(@W) [lindex $args 1] }
+                lappend ::log [concat @W $command $args]
+            }
+            delete {
+                set ::text(@W) {}
+                lappend ::log [concat @W $command $args]
+            }
+            default { lappend ::log [concat @W $command $args] }
+        }
+    }]
+    return $w
+}
+foreach class {button frame label entry} { proc $class {w args} { _widget $w {*}$args } }
+namespace eval ttk {}
+foreach class {frame label entry scrollbar} { proc ttk::$class {w args} { _widget $w {*}$args } }
+"""
+""" Tk commands replaced by stubs, grid and destroy are logged and destroy runs the <Destroy> bindings of the bindtags of a widget.
+Widgets of the classes button, frame, label and entry, and of their ttk versions (scrollbar instead of button) can be created, their options are kept and other widget commands are logged.
+configure reads the kept options in the format of Tk, with an empty default.
+The text of entries is kept for insert (at 0 or the end) and get, delete clears all of it. """
+
+#=============#
+#   Classes   #
+#=============#
+class FakeInterpreter:
+    """
+    Tcl interpreter without Tk, it counts the calls made from Python.
+    It is used as the tk attribute of FakeWidget.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.tcl = tk.Tcl()
+        """ Tcl interpreter which runs the stub commands """
+        self.tcl.eval(_STUB_COMMANDS)
+        self.dCalls = dict()
+        """ Amount of calls made from Python, as command: count, scripts count as "eval" """
+
+    def eval(self, script:str):
+        self.dCalls["eval"] = self.dCalls.get("eval", 0) + 1
+        return self.tcl.tk.eval(script)
+
+    def call(self, *args):
+        self.dCalls[args[0]] = self.dCalls.get(args[0], 0) + 1
+        return self.tcl.tk.call(*args)
+
+    def get_log(self):
+        """
+        Get the grid and destroy commands which have run
+
+        :return: Commands, each as a list of words
+        :rtype: list[tuple[string]]
+        """
+        return [tuple(self.tcl.tk.splitlist(command)) for command in self.tcl.tk.splitlist(self.tcl.eval("set ::log"))]
+
+    def get_bindings(self, path:str, sequence:str):
+        """
+        Get the scripts bound to an event of a widget or bindtag
+
+        :param path: Tcl path of the widget, or the name of a bindtag
+        :type path: string
+        :param sequence: Event sequence, for example "<Destroy>"
+        :type sequence: string
+        :return: Bound scripts, in the order in which they run
+        :rtype: list[string]
+        """
+        script = self.tcl.eval(f"bind {{{path}}} {{{sequence}}}")
+        return [line for line in script.split("\n") if line != ""]
+
+    def reset(self):
+        """
+        Clear the call counts and the log
+        """
+        self.dCalls.clear()
+        self.tcl.eval("set ::log {}")
+
+    def __getattr__(self, name:str):
+        return getattr(self.tcl.tk, name)
+
+class FakeWidget(tk.Widget):
+    """
+    Tkinter widget of which the Tk window is never created, the widget methods of tkinter run against the stub commands
+    """
+
+    def __init__(self, interpreter:FakeInterpreter, name:str, master=None):
+        """
+        Constructor
+
+        :param interpreter: Interpreter which runs the commands of the widget
+        :type interpreter: FakeInterpreter
+        :param name: Name of the widget, the Tcl path is the path of the master followed by the name
+        :type name: string
+        :param master: Parent widget, None for the root, defaults to None
+        :type master: FakeWidget, optional
+        """
+        self.tk = interpreter
+        self.master = master
+        self._name = name
+        self._w = "." if master is None else (master._w.rstrip(".") + "." + name)
+        self.children = dict()
+        if master is not None:
+            master.children[name] = self
+
+    def __str__(self):
+        return self._w
+
+class FakeRoot(FakeWidget):
+    """
+    Root widget with a fake clock, after() and after_idle() calls only run when the clock is advanced.
+    Use monotonic as replacement of time.monotonic, so rate limiters see the same clock.
+    """
+
+    def __init__(self, interpreter:FakeInterpreter):
+        """
+        Constructor
+
+        :param interpreter: Interpreter which runs the commands of the widgets
+        :type interpreter: FakeInterpreter
+        """
+        FakeWidget.__init__(self, interpreter, "")
+        self.now = 0
+        """ Time of the fake clock in milliseconds """
+        self.dScheduled = dict()
+        """ Scheduled calls, as id: (time in milliseconds, id, function, arguments) """
+        self._ids = count()
+        """ Numbers of the scheduled call ids, which also keep calls at the same time in order """
+
+    def after(self, ms:int, func=None, *args):
+        afterId = f"after#{next(self._ids)}"
+        self.dScheduled[afterId] = (self.now + ms, afterId, func, args)
+        return afterId
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, afterId:str):
+        self.dScheduled.pop(afterId, None)
+
+    def monotonic(self):
+        """
+        Get the time of the fake clock
+
+        :return: Time in seconds
+        :rtype: float
+        """
+        return self.now / 1000
+
+    def advance(self, ms:int=0):
+        """
+        Move the clock forward, running the calls which become due in order of their time
+
+        :param ms: Time in milliseconds, 0 only runs the calls which are due now (idle calls), defaults to 0
+        :type ms: integer, optional
+        """
+        end = self.now + ms
+        while True:
+            lDue = [scheduled for scheduled in self.dScheduled.values() if scheduled[0] <= end]
+            if len(lDue) == 0:
+                break
+
+            due, afterId, func, args = min(lDue, key=lambda scheduled: (scheduled[0], int(scheduled[1][6:])))
+            del self.dScheduled[afterId]
+            self.now = max(self.now, due)
+            func(*args)
+
+        self.now = end
+
+# =========== #
+#   Methods   #
+# =========== #
+def patch_icons(testCase, root:FakeRoot):
+    """
+    Replace the creation of icons for the duration of a test, since real icons need a display.
+    Each icon is the string "icon" and the display scale is 1, the icons of the root are released when the test ends.
+
+    :param testCase: Test which uses the icons, the patches are stopped by its cleanup
+    :type testCase: unittest.TestCase
+    :param root: Root of which the icons are released
+    :type root: FakeRoot
+    """
+    for patcher in (mock.patch.object(icons, "_create_icon", side_effect=lambda data, root, size: "icon"), mock.patch.object(icons, "get_display_scale", return_value=1)):
+        patcher.start()
+        testCase.addCleanup(patcher.stop)
+    testCase.addCleanup(icons.release_icons, root)
@@ -0,0 +1,148 @@
+# ==================================================================== #
+#  File name:      test_async_bridge.py         #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of stepping asyncio    #  |#   #   $      #|  #
+#                  from the Tk event loop and   #  |#   #   #      #|  #
+#                  of coroutine callbacks of    #   #\  #   #     /#   #
+#                  CallbackSets.                #    *= #   #    =+    #
+#  Rev:            1.0                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import asyncio
+import unittest
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools.async_bridge import get_async_bridge, close_async_bridge
+from tkinter_tools.fancy_callbacks import CallbackSet
+
+#=============#
+#   Classes   #
+#=============#
+class TestAsyncBridge(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.root.report_callback_exception = mock.Mock()
+        self.widget = FakeWidget(self.interpreter, "widget", self.root)
+        self.bridge = get_async_bridge(self.widget)
+        self.addCleanup(close_async_bridge, self.root)
+        self.lCalls = list()
+
+    def get_step_delays(self, steps:int):
+        lDelays = list()
+        for _ in range(steps):
+            due = self.root.dScheduled[self.bridge._afterId][0]
+            lDelays.append(due - self.root.now)
+            self.root.advance(due - self.root.now)
+        return lDelays
+
+    async def wait(self, future):
+        self.lCalls.append("start")
+        self.lCalls.append(await future)
+
+    def test_one_bridge_per_root(self):
+        self.assertIs(get_async_bridge(self.root), self.bridge)
+
+    def test_idle_without_tasks(self):
+        self.assertIsNone(self.bridge._afterId)
+        self.assertEqual(self.root.dScheduled, dict())
+
+    def test_coroutine_runs_on_step(self):
+        future = self.bridge.loop.create_future()
+        task = self.bridge.schedule(self.wait(future))
+        self.assertEqual(self.lCalls, [])
+
+        self.root.advance()
+        self.assertEqual(self.lCalls, ["start"])
+
+        future.set_result("done")
+        self.root.advance(self.bridge.maxInterval)
+        self.assertEqual(self.lCalls, ["start", "done"])
+        self.assertTrue(task.done())
+
+        # Nothing is pending, so the loop is no longer stepped
+        self.assertIsNone(self.bridge._afterId)
+
+    def test_backoff(self):
+        future = self.bridge.loop.create_future()
+        self.bridge.schedule(self.wait(future))
+        self.root.advance()
+
+        self.assertEqual(self.get_step_delays(6), [10, 20, 40, 80, 160, 200])
+        future.cancel()
+
+    def test_schedule_resets_backoff(self):
+        future = self.bridge.loop.create_future()
+        self.bridge.schedule(self.wait(future))
+        self.root.advance()
+        self.get_step_delays(5)
+
+        self.bridge.schedule(self.wait(future))
+        self.assertEqual(self.get_step_delays(3), [0, 10, 20])
+        self.assertEqual(self.lCalls, ["start", "start"])
+        future.cancel()
+
+    def test_exception_reported(self):
+        async def fail():
+            raise ValueError("fail")
+
+        self.bridge.schedule(fail())
+        self.root.advance()
+
+        self.root.report_callback_exception.assert_called_once()
+        self.assertIs(self.root.report_callback_exception.call_args[0][0], ValueError)
+
+    def test_close_cancels_tasks(self):
+        future = self.bridge.loop.create_future()
+        task = self.bridge.schedule(self.wait(future))
+        self.root.advance()
+
+        close_async_bridge(self.root)
+        self.assertTrue(task.cancelled())
+        self.assertTrue(self.bridge.loop.is_closed())
+        self.assertEqual(self.root.dScheduled, dict())
+
+    def test_close_from_coroutine(self):
+        async def close():
+            close_async_bridge(self.root)
+
+        self.bridge.schedule(close())
+        self.root.advance()
+        self.assertTrue(self.bridge.loop.is_closed())
+
+    def test_callback_set_runs_in_order(self):
+        async def slow(name):
+            self.lCalls.append(f"{name} start")
+            await asyncio.sleep(0)
+            self.lCalls.append(f"{name} end")
+
+        callbackSet = CallbackSet(widget=self.widget)
+        callbackSet.add_callback("sync", self.lCalls.append, "sync")
+        callbackSet.add_callback("slow", slow, "slow")
+        callbackSet.add_callback("after", self.lCalls.append, "after")
+
+        # The part of the chain before the coroutine callback runs right away
+        callbackSet.call_callbacks()
+        callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["sync", "sync"])
+
+        # The coroutine parts of the two calls don't overlap
+        self.root.advance(self.bridge.maxInterval)
+        self.assertEqual(self.lCalls, ["sync", "sync", "slow start", "slow end", "after", "slow start", "slow end", "after"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+# ==================================================================== #
+#  File name:      test_background_tasks.py     #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of running functions   #  |#   #   $      #|  #
+#                  on the thread pool and the   #  |#   #   #      #|  #
+#                  background modes of Button.  #   #\  #   #     /#   #
+#                                               #    *= #   #    =+    #
+#  Rev:            1.1                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Tasks which finish during a poll, shutdown              #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import threading
+import unittest
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools import background_tasks
+from tkinter_tools.background_tasks import run_in_background, shutdown_background_tasks, POLL_INTERVAL
+from tkinter_tools.composite_widgets.button import Button
+
+#=============#
+#   Classes   #
+#=============#
+class TestBackgroundTasks(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.root.report_callback_exception = mock.Mock()
+        self.widget = FakeWidget(self.interpreter, "widget", self.root)
+        self.lCalls = list()
+        self.addCleanup(background_tasks._dPendingTasks.pop, self.root, None)
+
+    def deliver(self, future):
+        """ Wait for the thread and let the Tk thread poll for the result """
+        future.exception(timeout=5)
+        self.root.advance(POLL_INTERVAL)
+
+    def test_result_delivered_on_poll(self):
+        lThreads = list()
+        def work():
+            lThreads.append(threading.current_thread())
+            return 42
+
+        future = run_in_background(self.widget, work, self.lCalls.append)
+        future.result(timeout=5)
+        self.assertEqual(self.lCalls, []) # Only delivered by the Tk thread
+        self.assertIsNot(lThreads[0], threading.current_thread())
+
+        self.root.advance(POLL_INTERVAL)
+        self.assertEqual(self.lCalls, [42])
+
+        # Polling stops once nothing is pending
+        self.assertNotIn(self.root, background_tasks._dPendingTasks)
+        self.assertEqual(self.root.dScheduled, dict())
+
+    def test_error_delivered(self):
+        future = run_in_background(self.widget, lambda: int("not a number"), self.lCalls.append, lambda error: self.lCalls.append(type(error)))
+        self.deliver(future)
+        self.assertEqual(self.lCalls, [ValueError])
+
+    def test_error_reported_without_handler(self):
+        future = run_in_background(self.widget, lambda: int("not a number"), self.lCalls.append)
+        self.deliver(future)
+        self.assertEqual(self.lCalls, [])
+        self.assertIs(self.root.report_callback_exception.call_args[0][0], ValueError)
+
+    def test_failing_handler_keeps_delivering(self):
+        def fail(result):
+            raise RuntimeError(result)
+
+        lFutures = [run_in_background(self.widget, lambda: 1, fail), run_in_background(self.widget, lambda: 2, self.lCalls.append)]
+        for future in lFutures:
+            future.result(timeout=5)
+        self.root.advance(POLL_INTERVAL)
+
+        self.assertEqual(self.lCalls, [2])
+        self.root.report_callback_exception.assert_called_once()
+
+    def test_finished_during_poll(self):
+        # The task finishes between the first and a later done() check of the same poll
+        future = mock.Mock()
+        future.done.side_effect = [False, True, True]
+        future.cancelled.return_value = False
+        future.exception.return_value = None
+        future.result.return_value = 42
+        background_tasks._dPendingTasks[self.root] = [(future, self.lCalls.append, None)]
+
+        background_tasks._deliver_results(self.root)
+        self.assertEqual(self.lCalls, [])
+        self.assertEqual(len(background_tasks._dPendingTasks[self.root]), 1)
+
+        background_tasks._deliver_results(self.root)
+        self.assertEqual(self.lCalls, [42])
+
+    def test_shutdown_cancels_waiting_tasks(self):
+        event = threading.Event()
+        lFutures = [run_in_background(self.widget, event.wait, self.lCalls.append) for _ in range(background_tasks.MAX_WORKERS + 1)]
+        shutdown_background_tasks(wait=False)
+        self.assertTrue(lFutures[-1].cancelled())
+
+        event.set()
+        for future in lFutures[:-1]:
+            future.result(timeout=5)
+        self.root.advance(POLL_INTERVAL)
+        self.assertEqual(self.lCalls, [True] * background_tasks.MAX_WORKERS)
+
+    def test_root_destroyed(self):
+        event = threading.Event()
+        future = run_in_background(self.widget, event.wait, self.lCalls.append)
+        self.interpreter.eval(f"destroy {self.root._w}")
+        event.set()
+        future.result(timeout=5)
+
+        self.root.advance(POLL_INTERVAL)
+        self.assertEqual(self.lCalls, [])
+        self.assertNotIn(self.root, background_tasks._dPendingTasks)
+
+class TestButtonBackgroundMode(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.button = Button(self.root, cursor="arrow", state="normal")
+        self.lCalls = list()
+        self.addCleanup(background_tasks._dPendingTasks.pop, self.root, None)
+
+    def click(self):
+        self.button.call_callbacks()
+        for future, _, _ in list(background_tasks._dPendingTasks.get(self.root, ())):
+            future.exception(timeout=5)
+        self.root.advance(POLL_INTERVAL)
+
+    def test_busy_while_running(self):
+        event = threading.Event()
+        self.button.add_callback(callbackKey="wait", callback=event.wait, argument=5)
+        self.button.set_background_mode(onDone=lambda: self.lCalls.append("done"))
+
+        self.button.call_callbacks()
+        self.assertTrue(self.button.is_busy())
+        self.assertEqual(self.button.cget("state"), "disabled")
+        self.assertEqual(self.button.cget("cursor"), "watch")
+
+        # A second click while busy is ignored
+        self.button.call_callbacks()
+        self.assertEqual(len(background_tasks._dPendingTasks[self.root]), 1)
+
+        event.set()
+        self.click()
+        self.assertFalse(self.button.is_busy())
+        self.assertEqual(self.button.cget("state"), "normal")
+        self.assertEqual(self.button.cget("cursor"), "arrow")
+        self.assertEqual(self.lCalls, ["done"])
+
+    def test_callbacks_run_in_order(self):
+        self.button.add_callback(callbackKey="a", callback=self.lCalls.append, argument="a")
+        self.button.add_callback(callbackKey="b", callback=self.lCalls.append, argument="b")
+        self.button.set_background_mode()
+        self.click()
+        self.assertEqual(self.lCalls, ["a", "b"])
+
+    def test_error_restores_button(self):
+        self.button.add_callback(callbackKey="fail", callback=int, argument="not a number")
+        self.button.set_background_mode(onError=lambda error: self.lCalls.append(type(error)))
+        self.click()
+        self.assertEqual(self.lCalls, [ValueError])
+        self.assertFalse(self.button.is_busy())
+
+    def test_weak_callback_rejected(self):
+        self.button.add_callback(callbackKey="weak", callback=self.test_weak_callback_rejected, weak=True)
+        self.button.set_background_mode()
+        with self.assertRaises(ValueError):
+            self.button.call_callbacks()
+        self.assertFalse(self.button.is_busy())
+
+    def test_coroutine_rejected(self):
+        async def coroutine():
+            pass
+
+        self.button.add_callback(callbackKey="coroutine", callback=coroutine)
+        self.button.set_background_mode()
+        with self.assertRaises(ValueError):
+            self.button.call_callbacks()
+
+    def test_background_mode_disabled(self):
+        self.button.add_callback(callbackKey="a", callback=self.lCalls.append, argument="a")
+        self.button.set_background_mode()
+        self.button.set_background_mode(background=False)
+        self.button.call_callbacks()
+        self.assertEqual(self.lCalls, ["a"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# ==================================================================== #
+#  File name:      test_callback_profiler.py    #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the opt-in timing   #  |#   #   $      #|  #
+#                  of callbacks, including      #  |#   #   #      #|  #
+#                  coroutine callbacks and      #   #\  #   #     /#   #
+#                  rate limited runs.           #    *= #   #    =+    #
+#  Rev:            1.0                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import asyncio
+import gc
+import json
+import unittest
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools.callback_profiler import gProfiler
+from tkinter_tools.fancy_callbacks import CallbackSet
+
+#=============#
+#   Classes   #
+#=============#
+class TestCallbackProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.lCalls = list()
+        gProfiler.reset()
+        gProfiler.enable()
+        self.addCleanup(gProfiler.reset)
+        self.addCleanup(gProfiler.disable)
+
+    def get_entry(self, setName:str, key:str):
+        return next(entry for entry in gProfiler.get_report() if entry["set"] == setName and entry["key"] == key)
+
+    def test_counts_per_key(self):
+        callbackSet = CallbackSet("TestCounts")
+        callbackSet.add_callback("a", self.lCalls.append, "a")
+        callbackSet.add_callback("b", self.lCalls.append, "b")
+        for _ in range(3):
+            callbackSet.call_callbacks()
+
+        self.assertEqual(self.lCalls, ["a", "b"] * 3)
+        self.assertEqual(self.get_entry("TestCounts", "a")["count"], 3)
+        self.assertEqual(self.get_entry("TestCounts", "b")["count"], 3)
+        self.assertFalse(self.get_entry("TestCounts", "a")["async"])
+
+    def test_disabled_runs_directly(self):
+        gProfiler.disable()
+        callbackSet = CallbackSet("TestDisabled")
+        callbackSet.add_callback("a", self.lCalls.append)
+        self.assertEqual(callbackSet.compile(), (self.lCalls.append,))
+
+        # Enabling the profiler recompiles the set with timed callbacks
+        gProfiler.enable()
+        self.assertIsNot(callbackSet.compile()[0], self.lCalls.append)
+
+    def test_same_name_combined(self):
+        lSets = [CallbackSet("TestShared") for _ in range(4)]
+        for callbackSet in lSets:
+            callbackSet.add_callback("a", self.lCalls.append, "a")
+            callbackSet.call_callbacks()
+
+        self.assertEqual(len([entry for entry in gProfiler.get_report() if entry["set"] == "TestShared"]), 1)
+        self.assertEqual(self.get_entry("TestShared", "a")["count"], 4)
+
+    def test_exception_is_timed(self):
+        callbackSet = CallbackSet("TestException")
+        callbackSet.add_callback("fail", int, "not a number")
+        with self.assertRaises(ValueError):
+            callbackSet.call_callbacks()
+        self.assertEqual(self.get_entry("TestException", "fail")["count"], 1)
+
+    def test_coroutine_timed_until_finished(self):
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        callbackSet = CallbackSet("TestCoroutine")
+        timedCall = gProfiler.wrap(callbackSet, "slow", slow)
+        self.assertEqual(asyncio.run(timedCall()), "done")
+
+        dEntry = self.get_entry("TestCoroutine", "slow")
+        self.assertTrue(dEntry["async"])
+        self.assertEqual(dEntry["count"], 1)
+        self.assertGreaterEqual(dEntry["max_ms"], 40)
+
+    def test_unnamed_set_dropped(self):
+        callbackSet = CallbackSet()
+        callbackSet.add_callback("a", self.lCalls.append, "a")
+        callbackSet.call_callbacks()
+        name = callbackSet.name
+        self.assertEqual(self.get_entry(name, "a")["count"], 1)
+
+        del callbackSet
+        gc.collect()
+        self.assertFalse(any(entry["set"] == name for entry in gProfiler.get_report()))
+
+    def test_rate_limited_run_timed(self):
+        interpreter = FakeInterpreter()
+        root = FakeRoot(interpreter)
+        widget = FakeWidget(interpreter, "widget", root)
+
+        patcher = mock.patch("tkinter_tools.rate_limiter.monotonic", root.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        callbackSet = CallbackSet("TestRateLimited")
+        callbackSet.add_callback("a", self.lCalls.append, "a")
+        callbackSet.set_debounce(widget, 0, key="a")
+        for _ in range(5):
+            callbackSet.call_callbacks()
+        root.advance()
+
+        # The requests are not timed, the deferred run is
+        self.assertEqual(self.lCalls, ["a"])
+        self.assertEqual(self.get_entry("TestRateLimited", "a")["count"], 1)
+
+    def test_export_json(self):
+        callbackSet = CallbackSet("TestJson")
+        callbackSet.add_callback("a", self.lCalls.append, "a")
+        callbackSet.call_callbacks()
+
+        lReport = json.loads(gProfiler.export_json())
+        self.assertEqual(lReport, gProfiler.get_report())
+
+if __name__ == "__main__":
+    unittest.main()
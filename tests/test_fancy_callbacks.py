@@ -0,0 +1,253 @@
+# ==================================================================== #
+#  File name:      test_fancy_callbacks.py      #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of CallbackSet         #  |#   #   $      #|  #
+#                  objects: the compiled call   #  |#   #   #      #|  #
+#                  chain and the order of       #   #\  #   #     /#   #
+#                  adding and moving callbacks. #    *= #   #    =+    #
+#  Rev:            1.3                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Compiled call chain                                     #
+#  18-Oct-2026 Read only order, random changes against a plain list    #
+#  18-Oct-2026 Changing the order through the list like view           #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import random
+import unittest
+from tkinter_tools.fancy_callbacks import CallbackSet
+
+#=============#
+#   Classes   #
+#=============#
+class TestCallChain(unittest.TestCase):
+
+    def setUp(self):
+        self.lCalls = list()
+        self.callbackSet = CallbackSet("TestCallChain")
+
+    def record(self, *args):
+        self.lCalls.append(args)
+
+    def test_arguments_bound_once(self):
+        lArguments = [1, 2]
+        self.callbackSet.add_callback("list", self.record, lArguments)
+        self.callbackSet.add_callback("single", self.record, "a")
+        self.callbackSet.add_callback("none", self.record)
+
+        # A list is exploded when the callback is added, later changes to the list are not seen
+        lArguments.append(3)
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, [(1, 2), ("a",), ()])
+
+        # Callbacks without arguments are called directly
+        self.assertEqual(self.callbackSet.compile()[2], self.record)
+
+    def test_chain_reused(self):
+        self.callbackSet.add_callback("a", self.record, "a")
+        self.callbackSet.call_callbacks()
+        tCallChain = self.callbackSet._tCallChain
+        self.assertIsNotNone(tCallChain)
+
+        self.callbackSet.call_callbacks()
+        self.assertIs(self.callbackSet._tCallChain, tCallChain)
+
+    def test_changes_recompile(self):
+        self.callbackSet.add_callback("a", self.record, "a")
+        self.callbackSet.add_callback("b", self.record, "b")
+
+        for change in (
+            lambda: self.callbackSet.update_callback_argument("a", "A"),
+            lambda: self.callbackSet.update_callback_key("b", "c"),
+            lambda: self.callbackSet.set_callback_order(["c", "a"]),
+            lambda: self.callbackSet.insert_callback("d", self.record, "d", beforeKey="a"),
+            lambda: self.callbackSet.remove_callback("c"),
+        ):
+            self.callbackSet.call_callbacks()
+            change()
+            self.assertIsNone(self.callbackSet._tCallChain)
+
+        self.lCalls.clear()
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, [("d",), ("A",)])
+
+    def test_direct_change_needs_compile(self):
+        self.callbackSet.add_callback("a", self.record, "a")
+        self.callbackSet.call_callbacks()
+
+        self.callbackSet.dCallbacks["a"].set_argument("changed")
+        self.callbackSet.compile()
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, [("a",), ("changed",)])
+
+class TestCallbackOrder(unittest.TestCase):
+
+    def setUp(self):
+        self.lCalls = list()
+        self.callbackSet = CallbackSet("TestCallbackOrder")
+        for key in ("a", "b", "c"):
+            self.callbackSet.add_callback(key, self.lCalls.append, key)
+
+    def assertOrder(self, lKeys:list):
+        self.assertEqual(self.callbackSet.get_keys(), tuple(lKeys))
+        self.assertEqual(len(self.callbackSet), len(lKeys))
+
+        # The compiled call chain has to follow the same order
+        self.lCalls.clear()
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, lKeys)
+
+    def test_added_order(self):
+        self.assertOrder(["a", "b", "c"])
+        self.assertEqual(self.callbackSet.lCallbackOrder, ("a", "b", "c"))
+
+    def test_keys_cached_until_changed(self):
+        tKeys = self.callbackSet.get_keys()
+        self.assertIs(self.callbackSet.get_keys(), tKeys)
+
+        self.callbackSet.add_callback("d", self.lCalls.append, "d")
+        self.assertIsNot(self.callbackSet.get_keys(), tKeys)
+        self.assertOrder(["a", "b", "c", "d"])
+
+    def test_insert(self):
+        self.callbackSet.insert_callback("x", self.lCalls.append, "x", beforeKey="b")
+        self.callbackSet.insert_callback("y", self.lCalls.append, "y", afterKey="c")
+        self.callbackSet.insert_callback("z", self.lCalls.append, "z", beforeKey="a")
+        self.assertOrder(["z", "a", "x", "b", "c", "y"])
+
+    def test_insert_before_itself(self):
+        self.callbackSet.insert_callback("b", self.lCalls.append, "B", beforeKey="b")
+        self.assertEqual(self.callbackSet.get_keys(), ("a", "b", "c"))
+
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["a", "B", "c"])
+
+    def test_insert_unknown_key(self):
+        with self.assertRaises(KeyError):
+            self.callbackSet.insert_callback("x", self.lCalls.append, "x", beforeKey="unknown")
+        self.assertOrder(["a", "b", "c"])
+
+    def test_remove(self):
+        self.callbackSet.remove_callback("b")
+        self.assertNotIn("b", self.callbackSet)
+        self.assertOrder(["a", "c"])
+
+        self.callbackSet.remove_callback("a")
+        self.callbackSet.remove_callback("c")
+        self.assertOrder([])
+
+    def test_rename_keeps_position(self):
+        self.callbackSet.update_callback_key("b", "renamed")
+        self.assertNotIn("b", self.callbackSet)
+        self.assertIn("renamed", self.callbackSet)
+        self.assertEqual(self.callbackSet.get_keys(), ("a", "renamed", "c"))
+
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["a", "b", "c"])
+
+    def test_rename_replaces_existing_key(self):
+        self.callbackSet.update_callback_key("a", "c")
+        self.assertEqual(self.callbackSet.get_keys(), ("c", "b"))
+
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["a", "b"])
+
+    def test_set_callback_order(self):
+        self.callbackSet.set_callback_order(["c", "unknown", "a", "c"])
+        self.assertOrder(["c", "a"])
+
+        # Callbacks left out of the order stay in the set
+        self.assertIn("b", self.callbackSet.dCallbacks)
+        self.callbackSet.lCallbackOrder = ["b", "c", "a"]
+        self.assertOrder(["b", "c", "a"])
+
+    def test_clear_all(self):
+        self.callbackSet.clear_all()
+        self.assertOrder([])
+
+        self.callbackSet.add_callback("a", self.lCalls.append, "a")
+        self.assertOrder(["a"])
+
+    def test_order_view(self):
+        order = self.callbackSet.lCallbackOrder
+        self.assertEqual(order, ["a", "b", "c"])
+        self.assertEqual((len(order), order[-1], order[1:]), (3, "c", ["b", "c"]))
+        self.assertIn("b", order)
+
+        # Removing keeps the callback in the set, like the list did
+        order.remove("b")
+        self.assertOrder(["a", "c"])
+        self.assertIn("b", self.callbackSet.dCallbacks)
+
+        order.append("b")
+        self.assertOrder(["a", "c", "b"])
+        order.insert(0, "b")
+        self.assertOrder(["b", "a", "c"])
+        order.insert(-1, "a")
+        self.assertOrder(["b", "a", "c"])
+        self.assertEqual(order.pop(), "c")
+        self.assertOrder(["b", "a"])
+        del order[0]
+        self.assertOrder(["a"])
+
+        order.extend(["b", "c"])
+        order.reverse()
+        self.assertOrder(["c", "b", "a"])
+        order[0] = "a"
+        self.assertOrder(["a", "b"])
+
+        # Only keys of callbacks in the set can be added
+        with self.assertRaises(KeyError):
+            order.append("unknown")
+        self.assertOrder(["a", "b"])
+
+    def test_random_changes(self):
+        # The linked order has to match a plain list which is changed the same way
+        generator = random.Random(3)
+        lExpected = ["a", "b", "c"]
+        for step in range(500):
+            key = f"k{generator.randrange(30)}"
+            action = generator.randrange(4)
+            if action == 0:
+                self.callbackSet.add_callback(key, self.lCalls.append, key)
+                if key in lExpected:
+                    lExpected.remove(key)
+                lExpected.append(key)
+            elif action == 1 and key in lExpected:
+                self.callbackSet.remove_callback(key)
+                lExpected.remove(key)
+            elif action == 2 and len(lExpected) > 0:
+                beforeKey = generator.choice(lExpected)
+                self.callbackSet.insert_callback(key, self.lCalls.append, key, beforeKey=beforeKey)
+                if key != beforeKey:
+                    if key in lExpected:
+                        lExpected.remove(key)
+                    lExpected.insert(lExpected.index(beforeKey), key)
+            elif action == 3 and key in lExpected:
+                newKey = f"r{step}"
+                self.callbackSet.update_callback_key(key, newKey)
+                lExpected[lExpected.index(key)] = newKey
+
+            self.assertEqual(self.callbackSet.get_keys(), tuple(lExpected))
+        self.assertEqual(len(self.callbackSet), len(lExpected))
+
+    def test_update_argument(self):
+        self.callbackSet.call_callbacks()
+        self.callbackSet.update_callback_argument("b", "new")
+        self.lCalls.clear()
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["a", "new", "c"])
+
+if __name__ == "__main__":
+    unittest.main()
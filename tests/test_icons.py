@@ -0,0 +1,171 @@
+# ==================================================================== #
+#  File name:      test_icons.py                #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the shared icon     #  |#   #   $      #|  #
+#                  cache and the scaling of     #  |#   #   #      #|  #
+#                  icons, images are replaced   #   #\  #   #     /#   #
+#                  so no display is needed.     #    *= #   #    =+    #
+#  Rev:            1.2                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Loading icons with Tk, Pillow only as fallback          #
+#  18-Oct-2026 Pre-sized variants and the display scale                #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import unittest
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools.resources import assets, icons
+from tkinter_tools.resources._encoded_images import ASSET_NAMES
+
+#=============#
+#   Classes   #
+#=============#
+class FakePhotoImage:
+    """
+    PhotoImage of which zoom and subsample only change the size, subsample rounds up like Tk does
+    """
+
+    def __init__(self, master=None, data=None, size:int=30):
+        self.size = size
+
+    def width(self):
+        return self.size
+
+    def height(self):
+        return self.size
+
+    def zoom(self, x:int, y:int):
+        return FakePhotoImage(size=self.size * x)
+
+    def subsample(self, x:int, y:int):
+        return FakePhotoImage(size=-(-self.size // x))
+
+class TestIconCache(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.lWidgets = [FakeWidget(self.interpreter, f"w{index}", self.root) for index in range(3)]
+
+        patcher = mock.patch.object(icons, "_create_icon", side_effect=lambda data, root, size: object())
+        self.createIcon = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(icons.release_icons)
+
+    def test_shared_between_widgets(self):
+        lIcons = [icons.get_icon("plus_icon", widget, scale=1) for widget in self.lWidgets for _ in range(100)]
+        self.assertTrue(all(icon is lIcons[0] for icon in lIcons))
+        self.assertEqual(self.createIcon.call_count, 1)
+
+    def test_key(self):
+        icon = icons.get_icon("plus_icon", self.root, scale=1)
+        self.assertIsNot(icons.get_icon("plus_icon", self.root, theme="dark", scale=1), icon)
+        self.assertIsNot(icons.get_icon("minus_icon", self.root, scale=1), icon)
+        self.assertIsNot(icons.get_icon("plus_icon", self.root, size=30, scale=1), icon)
+
+        # An unknown theme is the light theme, and the same pixel size is the same icon
+        self.assertIs(icons.get_icon("plus_icon", self.root, theme="unknown", scale=1), icon)
+        self.assertIs(icons.get_icon("plus_icon", self.root, size=10, scale=1.5), icon)
+        self.assertEqual(self.createIcon.call_count, 4)
+
+    def test_separate_interpreters(self):
+        otherRoot = FakeRoot(FakeInterpreter())
+        icon = icons.get_icon("plus_icon", self.root, scale=1)
+        otherIcon = icons.get_icon("plus_icon", otherRoot, scale=1)
+        self.assertIsNot(otherIcon, icon)
+
+        icons.release_icons(otherRoot)
+        self.assertIs(icons.get_icon("plus_icon", self.root, scale=1), icon)
+        self.assertIsNot(icons.get_icon("plus_icon", otherRoot, scale=1), otherIcon)
+
+class TestIconLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.root = FakeRoot(FakeInterpreter())
+
+        patcher = mock.patch.object(icons, "_create_icon_with_pillow", return_value="pillow")
+        self.createWithPillow = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_scale_operation(self):
+        self.assertEqual(icons._get_scale_operation(15, 15), ("zoom", 1))
+        self.assertEqual(icons._get_scale_operation(15, 30), ("zoom", 2))
+        self.assertEqual(icons._get_scale_operation(30, 15), ("subsample", 2))
+        self.assertEqual(icons._get_scale_operation(29, 15), ("subsample", 2)) # Tk rounds 14.5 up
+        self.assertIsNone(icons._get_scale_operation(15, 23))
+        self.assertIsNone(icons._get_scale_operation(32, 15))
+        self.assertIsNone(icons._get_scale_operation(0, 15))
+
+    def test_tk_scales_without_pillow(self):
+        with mock.patch.object(icons.tk, "PhotoImage", FakePhotoImage):
+            self.assertEqual(icons._create_icon(b"data", self.root, 15).width(), 15)
+            self.assertEqual(icons._create_icon(b"data", self.root, 60).width(), 60)
+        self.createWithPillow.assert_not_called()
+
+    def test_pillow_fallback(self):
+        # No integer factor scales 30 pixels to 23
+        with mock.patch.object(icons.tk, "PhotoImage", FakePhotoImage):
+            self.assertEqual(icons._create_icon(b"data", self.root, 23), "pillow")
+
+        # Tk can't read the data
+        with mock.patch.object(icons.tk, "PhotoImage", side_effect=icons.tk.TclError):
+            self.assertEqual(icons._create_icon(b"data", self.root, 15), "pillow")
+        self.assertEqual(self.createWithPillow.call_count, 2)
+
+class TestIconVariants(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.lWidgets = [FakeWidget(self.interpreter, f"w{index}", self.root) for index in range(3)]
+
+        patcher = mock.patch.object(icons, "_create_icon", side_effect=lambda data, root, size: object())
+        self.createIcon = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(icons.release_icons)
+
+    def test_variants_embedded(self):
+        # The encoder embeds the default icon size at the scale factors 1, 1.5 and 2
+        for name in ("plus_icon", "minus_icon", "trash_icon", "eye_icon"):
+            for theme in ("", "_inv"):
+                for pixels in (15, 23, 30):
+                    self.assertIn(f"{name}{theme}_{pixels}px", ASSET_NAMES)
+
+    def test_variant_used(self):
+        for scale, pixels in ((1, 15), (1.5, 23), (2, 30)):
+            icons.get_icon("plus_icon", self.root, theme="dark", scale=scale)
+            self.assertIs(self.createIcon.call_args[0][0], getattr(assets, f"plus_icon_inv_{pixels}px"))
+            self.assertEqual(self.createIcon.call_args[0][2], pixels)
+
+    def test_original_scaled_without_variant(self):
+        icons.get_icon("plus_icon", self.root, size=17, scale=1)
+        self.assertIs(self.createIcon.call_args[0][0], assets.plus_icon)
+        self.assertEqual(self.createIcon.call_args[0][2], 17)
+
+    def test_display_scale_looked_up_once(self):
+        with mock.patch.object(icons, "get_display_scale", return_value=2) as getDisplayScale:
+            for widget in self.lWidgets:
+                icons.get_icon("plus_icon", widget)
+        self.assertEqual(getDisplayScale.call_count, 1)
+        self.assertEqual(self.createIcon.call_args[0][2], 30)
+
+    def test_display_scale_rounded(self):
+        for scaling, expected in (("1.3333", 1), ("2.0", 1.5), ("2.6666", 2), ("1.0", 1)):
+            master = mock.Mock()
+            master.tk.call.return_value = scaling
+            self.assertEqual(icons.get_display_scale(master), expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# ==================================================================== #
+#  File name:      test_lazy_imports.py         #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the lazily resolved #  |#   #   $      #|  #
+#                  public names of the package, #  |#   #   #      #|  #
+#                  imports are checked in a     #   #\  #   #     /#   #
+#                  fresh interpreter.           #    *= #   #    =+    #
+#  Rev:            1.0                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import importlib
+import os
+import subprocess
+import sys
+import unittest
+import tkinter_tools
+
+# =============== #
+#   Definitions   #
+# =============== #
+MAIN_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+""" Directory holding the package """
+
+# =========== #
+#   Methods   #
+# =========== #
+def get_imported_modules(statement:str):
+    """
+    Run a statement in a fresh interpreter and get the modules it imported
+
+    :param statement: Python statement
+    :type statement: string
+    :return: Names of the imported modules
+    :rtype: set[string]
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; lBefore = set(sys.modules); {statement}; print(' '.join(set(sys.modules) - lBefore))"],
+        cwd=MAIN_DIRECTORY, capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+#=============#
+#   Classes   #
+#=============#
+class TestLazyImports(unittest.TestCase):
+
+    def assertLight(self, setModules:set):
+        self.assertNotIn("tkinter", setModules)
+        self.assertFalse(any(module == "PIL" or module.startswith("PIL.") for module in setModules))
+
+    def test_package_import(self):
+        setModules = get_imported_modules("import tkinter_tools")
+        self.assertLight(setModules)
+        self.assertEqual({module for module in setModules if module.startswith("tkinter_tools")}, {"tkinter_tools"})
+
+    def test_callback_set_import(self):
+        setModules = get_imported_modules("from tkinter_tools import CallbackSet, FancyCallback")
+        self.assertLight(setModules)
+        self.assertIn("tkinter_tools.fancy_callbacks", setModules)
+        self.assertNotIn("tkinter_tools.widget_lists", setModules)
+
+    def test_public_names(self):
+        for name in tkinter_tools.__all__:
+            value = getattr(tkinter_tools, name)
+            self.assertIs(value, getattr(importlib.import_module(tkinter_tools._dLazyImports[name]), name))
+            self.assertIn(name, vars(tkinter_tools)) # Following accesses don't reach __getattr__
+
+        self.assertTrue(set(tkinter_tools.__all__) <= set(dir(tkinter_tools)))
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            tkinter_tools.UnknownName
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+# ==================================================================== #
+#  File name:      test_list_entry.py           #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the mode switches   #  |#   #   $      #|  #
+#                  and widget placement of      #  |#   #   #      #|  #
+#                  ListEntry objects, run with  #   #\  #   #     /#   #
+#                  stub Tk commands.            #    *= #   #    =+    #
+#  Rev:            1.3                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Placement of inserted and removed widgets               #
+#  18-Oct-2026 Reindexed entries with theme buttons                    #
+#  18-Oct-2026 Label text of composite widgets set by the script       #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import unittest
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools.composite_widgets.button import Button
+from tkinter_tools.composite_widgets.entry_label_pair import EntryLabelPair
+from tkinter_tools.tcl_batch import batch
+from tkinter_tools.widget_lists.list_entry import ListEntry
+
+#=============#
+#   Classes   #
+#=============#
+class TestModeSwitch(unittest.TestCase):
+
+    ROWS = 100
+    """ Amount of entries in the list """
+    COLUMNS = 3
+    """ Amount of widgets in each entry, all of them are shown in edit mode and hidden in view mode """
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeWidget(self.interpreter, "")
+        self.lEntries = list()
+        for row in range(self.ROWS):
+            entry = ListEntry(self.root, row)
+            for column in range(self.COLUMNS):
+                widget = FakeWidget(self.interpreter, f"w{row}_{column}", self.root)
+                entry.add_widget(widget, editKey=str(column), editCallback=widget.grid, viewKey=str(column), viewCallback=widget.grid_remove)
+            self.lEntries.append(entry)
+        self.interpreter.reset()
+
+    def tearDown(self):
+        self.lEntries.clear()
+
+    def switch(self, mode:str):
+        with batch(self.root):
+            for entry in self.lEntries:
+                getattr(entry, mode)()
+
+    def test_single_script(self):
+        for mode in ("set_edit_mode", "set_view_mode", "set_edit_mode"):
+            self.interpreter.reset()
+            self.switch(mode)
+            self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+
+        lLog = self.interpreter.get_log()
+        self.assertEqual(len(lLog), 1)
+        self.assertEqual(lLog[0][:2], ("grid", "configure"))
+        self.assertEqual(len(lLog[0]), 2 + self.ROWS * self.COLUMNS)
+
+    def test_hidden_widgets(self):
+        self.switch("set_view_mode")
+        lLog = self.interpreter.get_log()
+        self.assertEqual(lLog[0][:2], ("grid", "remove"))
+        self.assertEqual(len(lLog[0]), 2 + self.ROWS * self.COLUMNS)
+
+    def test_destroyed_widget_dropped(self):
+        self.interpreter.eval("destroy .w0_1")
+        self.interpreter.reset()
+        self.switch("set_edit_mode")
+
+        lLog = self.interpreter.get_log()
+        self.assertNotIn(".w0_1", lLog[0])
+        self.assertEqual(len(lLog[0]), 1 + self.ROWS * self.COLUMNS)
+        self.assertNotIn("1", self.lEntries[0].editCallbacks)
+
+    def test_reindex_with_buttons(self):
+        # The theme images of the buttons are configured in the same script as the moves
+        for row, entry in enumerate(self.lEntries):
+            button = Button(self.root, "light", "dark")
+            entry.add_widget(button, editKey="button", editCallback=button.grid, viewKey="button", viewCallback=button.grid_remove)
+        self.interpreter.reset()
+
+        with batch(self.root):
+            for row, entry in enumerate(self.lEntries):
+                entry.set_row_index(row + 1)
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertTrue(all(entry.lWidgets[-1].cget("image") == "light" for entry in self.lEntries))
+
+    def test_label_text_in_script(self):
+        lPairs = list()
+        for row, entry in enumerate(self.lEntries):
+            pair = EntryLabelPair(self.root, f"old{row}")
+            entry.add_widget(pair, editKey="pair", editCallback=pair.show_entry, viewKey="pair", viewCallback=pair.show_label)
+            pair.entry.insert("end", "+")
+            lPairs.append(pair)
+        self.interpreter.reset()
+
+        # The labels read the text of their entries in the same script
+        self.switch("set_view_mode")
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertEqual([pair.label.cget("text") for pair in lPairs], [f"old{row}+" for row in range(self.ROWS)])
+
+        # Without a batch the text is set right away
+        lPairs[0].set("new")
+        lPairs[0].entry.insert("end", "!")
+        lPairs[0].show_label()
+        self.assertEqual(lPairs[0].label.cget("text"), "new!")
+
+    def test_user_callback_strong(self):
+        lCalls = list()
+        widget = FakeWidget(self.interpreter, "extra", self.root)
+        self.lEntries[0].add_widget(widget, editKey="user", editCallback=lambda: lCalls.append(True))
+        self.assertFalse(self.lEntries[0].editCallbacks.dCallbacks["user"].weak)
+
+        self.switch("set_edit_mode")
+        self.assertEqual(lCalls, [True])
+
+class TestWidgetPlacement(unittest.TestCase):
+
+    COLUMNS = 5
+    """ Amount of widgets in the entry before a change """
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.entry = ListEntry(self.root, 2, rowOffset=1)
+        for column in range(self.COLUMNS):
+            self.entry.add_widget(FakeWidget(self.interpreter, f"w{column}", self.root), rowOffset=1)
+        self.interpreter.reset()
+
+    def get_cells(self):
+        """ Last cell each widget was gridded in, read from the Tcl log """
+        dCells = dict()
+        for command in self.interpreter.get_log():
+            if command[:2] == ("grid", "configure"):
+                dOptions = dict(zip(command[3::2], command[4::2]))
+                dCells[command[2]] = (int(dOptions["-row"]), int(dOptions["-column"]))
+        return dCells
+
+    def assert_placed(self, lMovedWidgets:list):
+        dCells = self.get_cells()
+        for widget in lMovedWidgets:
+            self.assertEqual(dCells[widget._w], (3, self.entry.lWidgets.index(widget)))
+
+    def test_insert_single_script(self):
+        widget = self.entry.add_widget_at_index(1, FakeWidget(self.interpreter, "new", self.root), rowOffset=1)
+
+        # The new widget and the widgets right of it are placed with one script, without reading grid_info back
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertEqual(self.entry.lWidgets[1], widget)
+        self.assert_placed(self.entry.lWidgets[1:])
+        self.assertNotIn(".w0", self.get_cells())
+
+    def test_insert_negative_index(self):
+        widget = self.entry.add_widget_at_index(-1, FakeWidget(self.interpreter, "new", self.root), rowOffset=1)
+        self.assertEqual(self.entry.lWidgets[self.COLUMNS - 1], widget)
+        self.assert_placed(self.entry.lWidgets[self.COLUMNS - 1:])
+
+    def test_remove(self):
+        self.entry.remove_widget(1)
+        self.assertEqual([widget._w for widget in self.entry.lWidgets], [".w0", ".w2", ".w3", ".w4"])
+        self.assertEqual(self.interpreter.dCalls, {"destroy": 1, "eval": 1})
+        self.assert_placed(self.entry.lWidgets[1:])
+
+    def test_composite_moved_through_parts(self):
+        pair = self.entry.add_widget_at_index(0, EntryLabelPair(self.root, "text"), rowOffset=1)
+        self.interpreter.reset()
+
+        self.entry.set_row_index(4)
+        dCells = self.get_cells()
+        for widget in pair.get_tk_widgets():
+            self.assertEqual(dCells[widget._w], (5, 0))
+
+    def test_replace(self):
+        widget = self.entry.replace_widget(2, FakeWidget(self.interpreter, "new", self.root))
+        self.assertEqual(self.entry.lWidgets[2], widget)
+        self.assertEqual(len(self.entry.lWidgets), self.COLUMNS)
+        self.assertEqual(self.get_cells()[".new"], (3, 2))
+
+if __name__ == "__main__":
+    unittest.main()
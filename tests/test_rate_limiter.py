@@ -0,0 +1,181 @@
+# ==================================================================== #
+#  File name:      test_rate_limiter.py         #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the debounce and    #  |#   #   $      #|  #
+#                  throttle timing of the       #  |#   #   #      #|  #
+#                  RateLimiter and CallbackSet, #   #\  #   #     /#   #
+#                  run against a fake clock.    #    *= #   #    =+    #
+#  Rev:            1.1                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Rate limit policies of CallbackSets                     #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import unittest
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools.fancy_callbacks import CallbackSet
+from tkinter_tools.rate_limiter import RateLimiter, DEBOUNCE, THROTTLE
+
+#=============#
+#   Classes   #
+#=============#
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.widget = FakeWidget(self.interpreter, "widget", self.root)
+        self.lCalls = list()
+
+        patcher = mock.patch("tkinter_tools.rate_limiter.monotonic", self.root.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create(self, delay:int, policy:str=DEBOUNCE):
+        return RateLimiter(lambda: self.lCalls.append(self.root.now), self.widget, delay, policy)
+
+    def test_debounce_waits_for_quiet(self):
+        limiter = self.create(50)
+        for _ in range(5):
+            limiter.request()
+            self.root.advance(10)
+        self.assertEqual(self.lCalls, [])
+
+        # The window starts at the last request, made at 40 ms (the elapsed time is rounded down to whole milliseconds)
+        self.root.advance(39)
+        self.assertEqual(self.lCalls, [])
+        self.root.advance(50)
+        self.assertEqual(len(self.lCalls), 1)
+        self.assertIn(self.lCalls[0], (90, 91))
+        self.assertFalse(limiter.is_pending())
+
+    def test_debounce_zero_delay_runs_when_idle(self):
+        limiter = self.create(0)
+        for _ in range(100):
+            limiter.request()
+        self.assertEqual(self.lCalls, [])
+
+        self.root.advance()
+        self.assertEqual(self.lCalls, [0])
+
+    def test_throttle_combines_requests(self):
+        limiter = self.create(100, THROTTLE)
+
+        # The first request runs right away, the rest of the window is combined into one call at its end
+        limiter.request()
+        self.root.advance()
+        self.assertEqual(self.lCalls, [0])
+
+        for _ in range(5):
+            self.root.advance(10)
+            limiter.request()
+        self.root.advance(200)
+        self.assertEqual(self.lCalls, [0, 100])
+
+    def test_throttle_after_quiet_period(self):
+        limiter = self.create(100, THROTTLE)
+        limiter.request()
+        self.root.advance(500)
+
+        limiter.request()
+        self.root.advance()
+        self.assertEqual(self.lCalls, [0, 500])
+
+    def test_flush_and_cancel(self):
+        limiter = self.create(50)
+        limiter.request()
+        limiter.flush()
+        self.assertEqual(self.lCalls, [0])
+        self.assertFalse(limiter.is_pending())
+
+        limiter.request()
+        limiter.cancel()
+        self.root.advance(100)
+        self.assertEqual(self.lCalls, [0])
+        self.assertEqual(self.root.dScheduled, {})
+
+    def test_destroyed_widget(self):
+        limiter = self.create(50)
+        limiter.request()
+        with mock.patch.object(self.widget, "winfo_exists", return_value=0):
+            self.root.advance(100)
+        self.assertEqual(self.lCalls, [])
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            self.create(50, "sometimes")
+
+class TestCallbackSetRateLimits(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.widget = FakeWidget(self.interpreter, "widget", self.root)
+        self.lCalls = list()
+
+        patcher = mock.patch("tkinter_tools.rate_limiter.monotonic", self.root.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.callbackSet = CallbackSet()
+        self.callbackSet.add_callback("a", self.lCalls.append, "a")
+        self.callbackSet.add_callback("b", self.lCalls.append, "b")
+
+    def test_debounce_set(self):
+        self.callbackSet.set_debounce(self.widget, 50)
+        for _ in range(5):
+            self.callbackSet.call_callbacks()
+            self.root.advance(10)
+        self.assertEqual(self.lCalls, [])
+
+        self.root.advance(100)
+        self.assertEqual(self.lCalls, ["a", "b"])
+
+    def test_throttle_set(self):
+        self.callbackSet.set_throttle(self.widget, 100)
+        for _ in range(30):
+            self.callbackSet.call_callbacks()
+            self.root.advance(10)
+        self.root.advance(100)
+
+        # A run at the start of each window, and one for the calls at the end of the last window
+        self.assertEqual(self.lCalls, ["a", "b"] * 4)
+
+    def test_debounce_single_callback(self):
+        self.callbackSet.set_debounce(self.widget, 0, key="b")
+        for _ in range(3):
+            self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["a"] * 3)
+
+        self.root.advance()
+        self.assertEqual(self.lCalls, ["a"] * 3 + ["b"])
+
+    def test_call_now_skips_policy(self):
+        self.callbackSet.set_debounce(self.widget, 50)
+        self.callbackSet.call_now()
+        self.assertEqual(self.lCalls, ["a", "b"])
+
+    def test_clear_rate_limit(self):
+        self.callbackSet.set_debounce(self.widget, 50)
+        self.callbackSet.call_callbacks()
+        self.callbackSet.clear_rate_limit()
+        self.root.advance(100)
+        self.assertEqual(self.lCalls, [])
+
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["a", "b"])
+
+if __name__ == "__main__":
+    unittest.main()
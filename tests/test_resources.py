@@ -0,0 +1,115 @@
+# ==================================================================== #
+#  File name:      test_resources.py            #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the lazily resolved #  |#   #   $      #|  #
+#                  embedded assets and their    #  |#   #   #      #|  #
+#                  manifest, imports are        #   #\  #   #     /#   #
+#                  checked in a fresh process.  #    *= #   #    =+    #
+#  Rev:            1.1                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 The manifest matches the assets and generated modules   #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import unittest
+from tkinter_tools.resources import assets
+from tkinter_tools.resources._encoded_images import ASSET_NAMES
+
+# =============== #
+#   Definitions   #
+# =============== #
+MAIN_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+""" Directory holding the package and the assets folder """
+ENCODED_FOLDER = os.path.join(MAIN_DIRECTORY, "tkinter_tools", "resources", "_encoded_images")
+""" Folder of the modules generated by image_encoder.py """
+
+# =========== #
+#   Methods   #
+# =========== #
+def get_imported_assets(statement:str):
+    """
+    Run a statement in a fresh interpreter and get the asset modules it imported
+
+    :param statement: Python statement
+    :type statement: string
+    :return: Names of the imported asset modules
+    :rtype: list[string]
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(' '.join(sys.modules))"],
+        cwd=MAIN_DIRECTORY, capture_output=True, text=True, check=True
+    )
+    prefix = "tkinter_tools.resources._encoded_images."
+    return sorted(module[len(prefix):] for module in result.stdout.split() if module.startswith(prefix))
+
+#=============#
+#   Classes   #
+#=============#
+class TestAssetRegistry(unittest.TestCase):
+
+    def test_import_loads_no_assets(self):
+        self.assertEqual(get_imported_assets("import tkinter_tools.resources"), [])
+
+    def test_only_requested_assets(self):
+        self.assertEqual(
+            get_imported_assets("from tkinter_tools.resources import assets; assets.plus_icon_15px; assets.plus_icon_15px"),
+            ["plus_icon_15px"]
+        )
+
+    def test_access(self):
+        data = assets.minus_icon
+        self.assertIsInstance(data, bytes)
+        self.assertIs(assets.minus_icon, data)
+        self.assertEqual(sorted(dir(assets)), sorted(ASSET_NAMES))
+
+        with self.assertRaises(AttributeError):
+            assets.unknown_icon
+
+class TestManifest(unittest.TestCase):
+
+    def setUp(self):
+        with open(os.path.join(ENCODED_FOLDER, "_manifest.json"), "r") as manifestFile:
+            self.dManifest = json.load(manifestFile)
+
+    def test_hashes_match_assets(self):
+        lImages = sorted(name for name in os.listdir(os.path.join(MAIN_DIRECTORY, "assets")) if name.endswith(".png"))
+        self.assertEqual(sorted(self.dManifest), lImages)
+
+        # An outdated hash would make the encoder skip a changed image
+        for filename, dEntry in self.dManifest.items():
+            with open(os.path.join(MAIN_DIRECTORY, "assets", filename), "rb") as imageFile:
+                self.assertEqual(dEntry["sha256"], hashlib.sha256(imageFile.read()).hexdigest(), filename)
+
+    def test_modules_match_index(self):
+        lModules = [module for dEntry in self.dManifest.values() for module in dEntry["modules"]]
+        self.assertEqual(sorted(lModules), sorted(ASSET_NAMES))
+
+        lFiles = [name[:-3] for name in os.listdir(ENCODED_FOLDER) if name.endswith(".py") and name != "__init__.py"]
+        self.assertEqual(sorted(lFiles), sorted(ASSET_NAMES))
+
+    def test_deterministic_output(self):
+        # No dates and fixed line endings, so an unchanged build is byte identical
+        for name in ["__init__"] + list(ASSET_NAMES):
+            with open(os.path.join(ENCODED_FOLDER, name + ".py"), "rb") as moduleFile:
+                content = moduleFile.read()
+            self.assertNotIn(b"Date:", content, name)
+            self.assertEqual(content.count(b"\n"), content.count(b"\r\n"), name)
+
+if __name__ == "__main__":
+    unittest.main()
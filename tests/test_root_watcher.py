@@ -0,0 +1,80 @@
+# ==================================================================== #
+#  File name:      test_root_watcher.py         #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the cleanup of the  #  |#   #   $      #|  #
+#                  icon cache and async bridge  #  |#   #   #      #|  #
+#                  once a root is destroyed,    #   #\  #   #     /#   #
+#                  run against stub Tk commands.#    *= #   #    =+    #
+#  Rev:            1.0                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import unittest
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools import root_watcher
+from tkinter_tools.async_bridge import get_async_bridge, close_async_bridge
+from tkinter_tools.resources import icons
+
+#=============#
+#   Classes   #
+#=============#
+class TestRootWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.child = FakeWidget(self.interpreter, "child", self.root)
+
+        patcher = mock.patch.object(icons, "_create_icon", side_effect=lambda data, root, size: object())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(icons.release_icons, self.root)
+        self.addCleanup(close_async_bridge, self.root)
+
+        self.icon = icons.get_icon("plus_icon", self.child, scale=1)
+        self.bridge = get_async_bridge(self.child)
+
+    def test_single_bindtag(self):
+        self.assertEqual(self.root.bindtags().count(root_watcher.WATCHER_TAG), 1)
+        self.assertEqual(len(self.interpreter.get_bindings(root_watcher.WATCHER_TAG, "<Destroy>")), 1)
+        self.assertNotIn(root_watcher.WATCHER_TAG, self.child.bindtags())
+
+    def test_children_destroyed(self):
+        # Resetting a window by destroying all its children keeps the shared resources of the root
+        for widget in list(self.root.children.values()):
+            self.interpreter.eval(f"destroy {widget._w}")
+
+        self.assertIs(icons.get_icon("plus_icon", self.root, scale=1), self.icon)
+        self.assertIs(get_async_bridge(self.root), self.bridge)
+        self.assertFalse(self.bridge.loop.is_closed())
+
+    def test_root_destroyed(self):
+        self.interpreter.eval("destroy .")
+
+        self.assertEqual([key for key in icons._dIconCache if key[3] is self.root], [])
+        self.assertTrue(self.bridge.loop.is_closed())
+        self.assertNotIn(self.root, root_watcher._dWatchers)
+
+    def test_tag_removed_when_released(self):
+        icons.release_icons(self.root)
+        self.assertIn(root_watcher.WATCHER_TAG, self.root.bindtags())
+
+        close_async_bridge(self.root)
+        self.assertNotIn(root_watcher.WATCHER_TAG, self.root.bindtags())
+        self.assertEqual(self.interpreter.get_bindings(root_watcher.WATCHER_TAG, "<Destroy>"), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# ==================================================================== #
+#  File name:      test_tcl_batch.py            #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of recording widget    #  |#   #   $      #|  #
+#                  operations and running them  #  |#   #   #      #|  #
+#                  as a single Tcl script.      #   #\  #   #     /#   #
+#                                               #    *= #   #    =+    #
+#  Rev:            1.2                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Batched configure                                       #
+#  18-Oct-2026 Text read by the script                                 #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+import unittest
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools.tcl_batch import batch, get_active_batch, batched_configure, batched_configure_text, batched_grid, batched_grid_remove, get_batched_callback
+
+#=============#
+#   Classes   #
+#=============#
+class TestTclBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.lWidgets = [FakeWidget(self.interpreter, f"w{index}", self.root) for index in range(4)]
+        self.interpreter.reset()
+
+    def test_single_script(self):
+        label = tk.Label(self.root, name="label")
+        self.interpreter.reset()
+
+        with batch(self.root) as tclBatch:
+            tclBatch.grid(self.lWidgets[0], row=1, column=2)
+            tclBatch.configure(label, text="a b")
+            tclBatch.call("grid", "columnconfigure", self.root._w, 0, "-weight", 1)
+            self.assertEqual(self.interpreter.dCalls, {})
+
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertEqual(self.interpreter.get_log(), [("grid", "configure", ".w0", "-row", "1", "-column", "2"), ("grid", "columnconfigure", ".", "0", "-weight", "1")])
+        self.assertEqual(label.cget("text"), "a b")
+
+    def test_shown_and_hidden_collected(self):
+        with batch(self.root) as tclBatch:
+            for widget in self.lWidgets:
+                tclBatch.grid_remove(widget)
+            tclBatch.grid(self.lWidgets[0])
+            tclBatch.grid(self.lWidgets[2])
+
+        # The last change of each widget counts
+        self.assertEqual(self.interpreter.get_log(), [("grid", "configure", ".w0", ".w2"), ("grid", "remove", ".w1", ".w3")])
+
+    def test_order_kept(self):
+        with batch(self.root) as tclBatch:
+            tclBatch.grid_remove(self.lWidgets[0])
+            tclBatch.grid(self.lWidgets[1], row=0)
+            tclBatch.grid(self.lWidgets[0])
+
+        self.assertEqual(self.interpreter.get_log(), [("grid", "remove", ".w0"), ("grid", "configure", ".w1", "-row", "0"), ("grid", "configure", ".w0")])
+
+    def test_moves_merged(self):
+        with batch(self.root) as tclBatch:
+            for index, widget in enumerate(self.lWidgets):
+                tclBatch.move(widget, index, 0)
+            self.assertEqual(len(tclBatch.lCommands), 1)
+
+        lMoves = [command for command in self.interpreter.get_log() if command[1] == "configure"]
+        self.assertEqual(lMoves, [("grid", "configure", widget._w, "-row", str(index), "-column", "0") for index, widget in enumerate(self.lWidgets)])
+
+    def test_destroys_merged(self):
+        with batch(self.root) as tclBatch:
+            for widget in self.lWidgets:
+                tclBatch.destroy(widget)
+
+        self.assertEqual(self.interpreter.get_log(), [("destroy", ".w0", ".w1", ".w2", ".w3")])
+        self.assertEqual(self.root.children, {})
+
+    def test_nested_blocks(self):
+        with batch(self.root) as outerBatch:
+            with batch(self.lWidgets[0]) as innerBatch:
+                self.assertIs(innerBatch, outerBatch)
+                innerBatch.grid_remove(self.lWidgets[0])
+            self.assertEqual(self.interpreter.dCalls, {})
+            self.assertIs(get_active_batch(self.root), outerBatch)
+
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertIsNone(get_active_batch(self.root))
+
+    def test_flush_in_block(self):
+        with batch(self.root) as tclBatch:
+            tclBatch.grid_remove(self.lWidgets[0])
+            tclBatch.flush()
+            self.assertEqual(self.interpreter.get_log(), [("grid", "remove", ".w0")])
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+
+    def test_exception_only_runs_destroys(self):
+        with self.assertRaises(ValueError):
+            with batch(self.root) as tclBatch:
+                tclBatch.grid(self.lWidgets[0], row=0)
+                tclBatch.destroy(self.lWidgets[1])
+                raise ValueError()
+
+        self.assertEqual(self.interpreter.get_log(), [("destroy", ".w1")])
+        self.assertIsNone(get_active_batch(self.root))
+
+    def test_batched_functions(self):
+        # Without a batch they run right away
+        batched_grid(self.lWidgets[0], row=0)
+        batched_grid_remove(self.lWidgets[1])
+        self.assertEqual(len(self.interpreter.get_log()), 2)
+
+        self.interpreter.reset()
+        with batch(self.root):
+            batched_grid(self.lWidgets[0])
+            batched_grid_remove(self.lWidgets[1])
+            self.assertEqual(self.interpreter.get_log(), [])
+        self.assertEqual(self.interpreter.get_log(), [("grid", "configure", ".w0"), ("grid", "remove", ".w1")])
+
+    def test_batched_configure(self):
+        label = tk.Label(self.root, name="label")
+        batched_configure(label, text="a")
+        self.assertEqual(label.cget("text"), "a")
+
+        self.interpreter.reset()
+        with batch(self.root):
+            batched_configure(label, text="b")
+            self.assertEqual(label.cget("text"), "a")
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1, label._w: 1})
+        self.assertEqual(label.cget("text"), "b")
+
+    def test_batched_configure_text(self):
+        label = tk.Label(self.root, name="label")
+        entry = tk.Entry(self.root, name="entry")
+        entry.insert(0, "1 [x]")
+        unit = tk.StringVar(self.root, " m")
+        self.interpreter.reset()
+
+        with batch(self.root):
+            batched_configure_text(label, [entry, unit])
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertEqual(label.cget("text"), "1 [x] m")
+
+        unit.set(" s")
+        batched_configure_text(label, [entry, unit])
+        self.assertEqual(label.cget("text"), "1 [x] s")
+
+    def test_batched_callback(self):
+        widget = self.lWidgets[0]
+        self.assertIs(get_batched_callback(widget.grid).__func__, batched_grid)
+        self.assertIs(get_batched_callback(widget.grid_remove).__func__, batched_grid_remove)
+        self.assertIs(get_batched_callback(widget.grid).__self__, widget)
+
+        callback = widget.destroy
+        self.assertIs(get_batched_callback(callback), callback)
+
+    def test_composite_run_directly(self):
+        lCalls = list()
+        class Composite:
+            def grid(self, **kwargs):
+                lCalls.append(kwargs)
+
+        with batch(self.root) as tclBatch:
+            tclBatch.grid(Composite(), row=1)
+            self.assertEqual(lCalls, [{"row": 1}])
+
+    def test_batch_per_interpreter(self):
+        otherInterpreter = FakeInterpreter()
+        otherRoot = FakeRoot(otherInterpreter)
+        with batch(self.root) as tclBatch:
+            self.assertIsNone(get_active_batch(otherRoot))
+            self.assertIsNot(batch(otherRoot), tclBatch)
+
+if __name__ == "__main__":
+    unittest.main()
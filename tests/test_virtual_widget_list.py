@@ -0,0 +1,197 @@
+# ==================================================================== #
+#  File name:      test_virtual_widget_list.py  #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of binding the pooled  #  |#   #   $      #|  #
+#                  entries of a VirtualWidget-  #  |#   #   #      #|  #
+#                  List to the rows in view and #   #\  #   #     /#   #
+#                  of its scroll bindings.      #    *= #   #    =+    #
+#  Rev:            1.1                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Rows in view follow the height, buffer and scrollbar    #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools.widget_lists.virtual_widget_list import VirtualWidgetList, WHEEL_ROWS
+
+#=============#
+#   Classes   #
+#=============#
+class TestVirtualWidgetList(unittest.TestCase):
+
+    ROWS = 100
+    """ Amount of rows in the data model """
+    VISIBLE_ROWS = 5
+    """ Amount of rows in view """
+    BUFFER_ROWS = 2
+    """ Amount of hidden entries next to the rows in view """
+    ROW_HEIGHT = 20
+    """ Height of a row in pixels, as measured by the stub grid_bbox """
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.lBoundRows = list()
+
+        patcher = mock.patch("tkinter_tools.rate_limiter.monotonic", self.root.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.virtualList = VirtualWidgetList(self.root, self.fill_row, self.bind_row, self.ROWS, self.VISIBLE_ROWS, self.BUFFER_ROWS)
+        self.addCleanup(self.virtualList.destroy)
+
+        # The stub grid command does not measure, the rows have a fixed height below a title of the same height
+        patcher = mock.patch.object(self.virtualList.frame, "grid_bbox", return_value=(0, self.ROW_HEIGHT, 100, self.ROW_HEIGHT))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fill_row(self, entry):
+        entry.add_widget(tk.Label(entry.root))
+
+    def bind_row(self, entry, index):
+        self.lBoundRows.append(index)
+        entry.lWidgets[0].configure(text=str(index))
+
+    def get_text(self, index:int):
+        return self.virtualList.get_entry(index).lWidgets[0].cget("text")
+
+    def wheel(self, down:bool=True):
+        self.virtualList._on_mouse_wheel(SimpleNamespace(num=5 if down else 4, delta=0))
+
+    def resize(self, rows:float):
+        """ Resize the list to a height of an amount of rows below the title """
+        self.virtualList._on_configure(SimpleNamespace(height=int(self.ROW_HEIGHT * (rows + 1))))
+
+    def test_pooled_entries(self):
+        self.assertEqual(len(self.virtualList.lEntries), self.VISIBLE_ROWS + self.BUFFER_ROWS)
+        self.assertEqual([self.get_text(index) for index in range(self.VISIBLE_ROWS)], ["0", "1", "2", "3", "4"])
+        self.assertIsNone(self.virtualList.get_entry(self.VISIBLE_ROWS))
+
+        # The buffer entries are hidden and not bound
+        self.assertEqual(self.virtualList._lShown, [True] * self.VISIBLE_ROWS + [False] * self.BUFFER_ROWS)
+        self.assertEqual(self.lBoundRows, list(range(self.VISIBLE_ROWS)))
+
+    def test_resize_within_buffer(self):
+        lEntries = list(self.virtualList.lEntries)
+        self.resize(6.5) # The partly visible row counts as well
+        self.assertEqual(self.virtualList.visibleRows, 7)
+        self.assertEqual(self.virtualList.lEntries, lEntries)
+        self.assertEqual(self.get_text(6), "6")
+
+        # Shrinking keeps the entries as buffer
+        self.resize(3)
+        self.assertEqual(self.virtualList.visibleRows, 3)
+        self.assertEqual(self.virtualList.lEntries, lEntries)
+        self.assertIsNone(self.virtualList.get_entry(3))
+        self.assertEqual(self.virtualList._lShown, [True] * 3 + [False] * 4)
+
+    def test_resize_grows_and_trims_pool(self):
+        self.resize(10)
+        self.assertEqual(self.virtualList.visibleRows, 10)
+        self.assertEqual(len(self.virtualList.lEntries), 10 + self.BUFFER_ROWS)
+        self.assertEqual(self.get_text(9), "9")
+
+        # Entries beyond twice the buffer are destroyed
+        self.resize(2)
+        self.assertEqual(len(self.virtualList.lEntries), 2 + self.BUFFER_ROWS)
+        self.assertTrue(any(command[0] == "destroy" for command in self.interpreter.get_log()))
+
+    def test_resize_clamps_first_row(self):
+        self.virtualList.scroll_to(self.ROWS)
+        self.resize(10)
+        self.assertEqual(self.virtualList.firstRow, self.ROWS - 10)
+        self.assertEqual(self.get_text(self.ROWS - 1), str(self.ROWS - 1))
+
+    def test_scroll_bar_gridded_on_change(self):
+        def get_grid_commands():
+            return [command for command in self.interpreter.get_log() if command[0] == "grid" and self.virtualList.scrollBar._w in command]
+
+        self.interpreter.reset()
+        for _ in range(3):
+            self.wheel()
+            self.root.advance()
+        self.assertEqual(get_grid_commands(), [])
+
+        # All rows fit, the scrollbar is removed once
+        self.virtualList.set_row_count(2)
+        self.virtualList.set_row_count(3)
+        self.assertEqual(get_grid_commands(), [("grid", "remove", self.virtualList.scrollBar._w)])
+
+        self.virtualList.set_row_count(self.ROWS)
+        self.assertEqual(get_grid_commands()[1][:2], ("grid", "configure"))
+
+    def test_scroll_to_binds_right_away(self):
+        self.virtualList.scroll_to(50)
+        self.assertEqual(self.get_text(52), "52")
+        self.assertIsNone(self.virtualList.get_entry(0))
+
+    def test_scroll_to_clamped(self):
+        self.virtualList.scroll_to(self.ROWS)
+        self.assertEqual(self.virtualList.firstRow, self.ROWS - self.VISIBLE_ROWS)
+        self.virtualList.scroll(-self.ROWS)
+        self.assertEqual(self.virtualList.firstRow, 0)
+
+    def test_wheel_events_combined(self):
+        self.lBoundRows.clear()
+        for _ in range(4):
+            self.wheel()
+        self.assertEqual(self.lBoundRows, [])
+
+        self.root.advance()
+        self.assertEqual(self.virtualList.firstRow, 4 * WHEEL_ROWS)
+        self.assertEqual(self.lBoundRows, list(range(4 * WHEEL_ROWS, 4 * WHEEL_ROWS + self.VISIBLE_ROWS)))
+
+    def test_get_entry_after_wheel(self):
+        self.wheel()
+        self.assertEqual(self.get_text(WHEEL_ROWS), str(WHEEL_ROWS))
+
+    def test_scroll_bar(self):
+        self.virtualList._on_scroll_bar("moveto", "0.5")
+        self.virtualList._on_scroll_bar("scroll", "1", "pages")
+        self.root.advance()
+        self.assertEqual(self.virtualList.firstRow, 50 + self.VISIBLE_ROWS)
+
+    def test_rows_below_model_hidden(self):
+        self.virtualList.set_row_count(3)
+        self.assertFalse(any(self.virtualList._lShown[3:]))
+        self.assertIsNone(self.virtualList.get_entry(3))
+
+        self.virtualList.set_row_count(self.ROWS)
+        self.assertTrue(all(self.virtualList._lShown[:self.VISIBLE_ROWS]))
+
+    def test_bind_widget_keeps_other_bindings(self):
+        widget = FakeWidget(self.interpreter, "widget", self.root)
+        widget.bind("<MouseWheel>", "other")
+        self.virtualList.bind_widget(widget)
+        self.assertEqual(len(self.interpreter.get_bindings(widget._w, "<MouseWheel>")), 2)
+
+        # Destroying the list only removes its own binding
+        self.virtualList.destroy()
+        self.assertEqual(self.interpreter.get_bindings(widget._w, "<MouseWheel>"), ["other"])
+
+    def test_destroy_once(self):
+        self.virtualList.destroy()
+        lDestroyCommands = [command for command in self.interpreter.get_log() if command[0] == "destroy"]
+        self.assertEqual(len(lDestroyCommands), 1)
+        self.assertIn(self.virtualList.uberRoot._w, lDestroyCommands[0])
+
+        self.virtualList.__del__()
+        self.assertEqual(len([command for command in self.interpreter.get_log() if command[0] == "destroy"]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
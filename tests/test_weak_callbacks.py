@@ -0,0 +1,117 @@
+# ==================================================================== #
+#  File name:      test_weak_callbacks.py       #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of weakly referenced   #  |#   #   $      #|  #
+#                  callbacks, which are dropped #  |#   #   #      #|  #
+#                  once their object is gone,   #   #\  #   #     /#   #
+#                  and of the strong callbacks  #    *= #   #    =+    #
+#                  of the list buttons.         #     *++######++*     #
+#  Rev:            1.1                          #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Icon patch shared through _fakes.py                     #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import gc
+import unittest
+from weakref import ref
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget, patch_icons
+from tkinter_tools.fancy_callbacks import CallbackSet
+from tkinter_tools.widget_lists.list_entry import ListEntry
+from tkinter_tools.widget_lists.widget_list import WidgetList
+
+#=============#
+#   Classes   #
+#=============#
+class Target:
+    """ Object of which the bound method is used as callback """
+
+    def __init__(self, lCalls:list):
+        self.lCalls = lCalls
+
+    def call(self, argument=None):
+        self.lCalls.append(argument)
+
+class TestWeakCallbacks(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.lCalls = list()
+        self.callbackSet = CallbackSet()
+
+    def test_weak_method_dropped(self):
+        target = Target(self.lCalls)
+        self.callbackSet.add_callback("weak", target.call, "weak", weak=True)
+        self.callbackSet.add_callback("strong", self.lCalls.append, "strong")
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["weak", "strong"])
+
+        del target
+        gc.collect()
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["weak", "strong", "strong"])
+        self.assertEqual(self.callbackSet.get_keys(), ("strong",))
+
+    def test_strong_method_kept(self):
+        target = Target(self.lCalls)
+        self.callbackSet.add_callback("strong", target.call, "strong")
+        del target
+        gc.collect()
+
+        self.callbackSet.call_callbacks()
+        self.assertEqual(self.lCalls, ["strong"])
+
+    def test_weak_widget_dropped(self):
+        widget = FakeWidget(self.interpreter, "widget", self.root)
+        self.callbackSet.add_callback("grid", widget.grid, weak=True)
+        self.assertTrue(self.callbackSet.dCallbacks["grid"].is_alive())
+
+        # Tk destroys the widget while the python object is still referenced
+        self.interpreter.eval("destroy .widget")
+        self.assertFalse(self.callbackSet.dCallbacks["grid"].is_alive())
+        self.assertEqual(self.callbackSet.prune(), ["grid"])
+        self.assertEqual(self.callbackSet.get_keys(), ())
+
+    def test_set_not_kept_alive(self):
+        target = Target(self.lCalls)
+        self.callbackSet.add_callback("weak", target.call, weak=True)
+        callbackSetReference = ref(self.callbackSet)
+        del self.callbackSet
+        gc.collect()
+        self.assertIsNone(callbackSetReference())
+
+class TestListButtons(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.lCalls = list()
+
+        patch_icons(self, self.root)
+
+    def test_deletion_callback_strong(self):
+        entry = ListEntry(self.root, 3)
+        button = entry.add_deletion_button(Target(self.lCalls).call)
+        gc.collect()
+
+        button.call_callbacks()
+        self.assertEqual(self.lCalls, [3])
+
+    def test_add_button_strong(self):
+        widgetList = WidgetList(self.root)
+        callback = widgetList.addButton.dCallbackSets["default"].dCallbacks["addEntry"]
+        self.assertFalse(callback.weak)
+
+if __name__ == "__main__":
+    unittest.main()
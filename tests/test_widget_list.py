@@ -0,0 +1,246 @@
+# ==================================================================== #
+#  File name:      test_widget_list.py          #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of adding and removing #  |#   #   $      #|  #
+#                  blocks of entries of a       #  |#   #   #      #|  #
+#                  WidgetList.                  #   #\  #   #     /#   #
+#                                               #    *= #   #    =+    #
+#  Rev:            1.4                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Removing blocks of entries                              #
+#  18-Oct-2026 Plain row index callback arguments                      #
+#  18-Oct-2026 Moves don't convert callbacks                           #
+#  18-Oct-2026 Icon patch shared through _fakes.py                     #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import unittest
+from itertools import count
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget, patch_icons
+from tkinter_tools.composite_widgets import Button
+from tkinter_tools.composite_widgets.entry_label_pair import EntryLabelPair
+from tkinter_tools.tcl_batch import batch
+from tkinter_tools.widget_lists.list_entry import RowIndex
+from tkinter_tools.widget_pool import WidgetPool
+from tkinter_tools.widget_lists.widget_list import WidgetList
+
+#=============#
+#   Classes   #
+#=============#
+class WidgetListTestCase(unittest.TestCase):
+    """ Creates a WidgetList in edit mode of which each row holds a single widget """
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self._widgetNumbers = count()
+
+        patch_icons(self, self.root)
+
+        self.widgetList = WidgetList(self.root, editMode=True)
+
+    def fill_row(self, entry):
+        """ Row factory which adds a single widget """
+        entry.add_widget(FakeWidget(self.interpreter, f"w{next(self._widgetNumbers)}", self.root))
+
+    def get_widget_names(self):
+        return [entry.lWidgets[0]._w for entry in self.widgetList.lEntries]
+
+    def get_grid_rows(self):
+        """ Last row each widget was gridded in, read from the Tcl log """
+        dRows = dict()
+        for command in self.interpreter.get_log():
+            if command[:2] == ("grid", "configure") and "-row" in command:
+                dRows[command[2]] = int(command[command.index("-row") + 1])
+        return dRows
+
+    def assert_placed(self):
+        """ Check the row indices of the entries and the rows of their widgets and of the add button """
+        dRows = self.get_grid_rows()
+        for index, entry in enumerate(self.widgetList.lEntries):
+            self.assertEqual(entry.rowIndex, index)
+            self.assertEqual(dRows[entry.lWidgets[0]._w], index)
+        self.assertEqual(dRows[self.widgetList.addButton._w], len(self.widgetList.lEntries))
+
+class TestAddEntries(WidgetListTestCase):
+
+    def test_append(self):
+        lEntries = self.widgetList.add_entries([self.fill_row] * 3)
+        self.assertEqual(lEntries, self.widgetList.lEntries)
+        self.assertEqual(self.get_widget_names(), [".w0", ".w1", ".w2"])
+        self.assert_placed()
+
+    def test_insert_block(self):
+        self.widgetList.add_entries([self.fill_row] * 3)
+        evals = self.interpreter.dCalls.get("eval", 0)
+
+        lEntries = self.widgetList.add_entries([self.fill_row] * 2, 1)
+        self.assertEqual(self.widgetList.lEntries[1:3], lEntries)
+        self.assertEqual(self.get_widget_names(), [".w0", ".w3", ".w4", ".w1", ".w2"])
+        self.assert_placed()
+
+        # The following entries and the add button are moved with a single script
+        self.assertEqual(self.interpreter.dCalls["eval"], evals + 1)
+
+    def test_factory_gets_final_row(self):
+        self.widgetList.add_entries([self.fill_row] * 3)
+        lRows = list()
+        self.widgetList.add_entries([lambda entry: lRows.append(entry.rowIndex)] * 2, 2)
+        self.assertEqual(lRows, [2, 3])
+
+    def test_empty_entries(self):
+        lEntries = self.widgetList.add_entries(4)
+        self.assertEqual(len(self.widgetList.lEntries), 4)
+        self.assertTrue(all(len(entry.lWidgets) == 0 for entry in lEntries))
+        self.assertEqual(self.get_grid_rows()[self.widgetList.addButton._w], 4)
+
+    def test_index_past_end(self):
+        self.widgetList.add_entries([self.fill_row] * 2)
+        self.widgetList.add_entries([self.fill_row], 10)
+        self.assertEqual(self.get_widget_names(), [".w0", ".w1", ".w2"])
+        self.assert_placed()
+
+    def test_add_empty_entry(self):
+        self.widgetList.add_entries([self.fill_row] * 2)
+        entry = self.widgetList.add_empty_entry(0)
+        self.assertIs(self.widgetList.lEntries[0], entry)
+        self.assertEqual([entry.rowIndex for entry in self.widgetList.lEntries], [0, 1, 2])
+
+    def test_row_offset(self):
+        self.widgetList.set_row_offset(2)
+        self.widgetList.add_entries([self.fill_row] * 2)
+        dRows = self.get_grid_rows()
+        self.assertEqual([dRows[name] for name in self.get_widget_names()], [2, 3])
+        self.assertEqual(dRows[self.widgetList.addButton._w], 4)
+
+class TestRemoveEntries(WidgetListTestCase):
+
+    def setUp(self):
+        WidgetListTestCase.setUp(self)
+        self.widgetList.add_entries([self.fill_row] * 6)
+
+    def get_destroy_commands(self):
+        return [command for command in self.interpreter.get_log() if command[0] == "destroy"]
+
+    def test_remove_block(self):
+        lRemovedEntries = self.widgetList.lEntries[1:4]
+        evals = self.interpreter.dCalls.get("eval", 0)
+        self.widgetList.remove_entries(1, 4)
+
+        self.assertEqual(self.get_widget_names(), [".w0", ".w4", ".w5"])
+        self.assert_placed()
+        self.assertTrue(all(len(entry.lWidgets) == 0 for entry in lRemovedEntries))
+
+        # The destroys and the reindex run as a single script, with one destroy command
+        self.assertEqual(self.interpreter.dCalls["eval"], evals + 1)
+        self.assertEqual(self.get_destroy_commands(), [("destroy", ".w1", ".w2", ".w3")])
+
+    def test_remove_to_end(self):
+        self.widgetList.remove_entries(4)
+        self.assertEqual(self.get_widget_names(), [".w0", ".w1", ".w2", ".w3"])
+        self.assert_placed()
+
+    def test_start_past_end(self):
+        self.widgetList.remove_entries(6)
+        self.assertEqual(len(self.widgetList.lEntries), 6)
+        self.assertEqual(self.get_destroy_commands(), [])
+
+    def test_remove_entry(self):
+        self.widgetList.remove_entry(0)
+        self.assertEqual(self.get_widget_names(), [".w1", ".w2", ".w3", ".w4", ".w5"])
+        self.assert_placed()
+
+    def test_released_to_pool(self):
+        self.widgetList.pool = WidgetPool(self.root)
+        self.widgetList.remove_entries(0, 2)
+
+        self.assertEqual(len(self.widgetList.pool), 2)
+        self.assertEqual(self.get_destroy_commands(), [])
+        self.assert_placed()
+
+    def test_composite_widgets(self):
+        lPairs = list()
+        def fill_pair_row(entry):
+            lPairs.append(entry.add_widget(EntryLabelPair(self.root, "text")))
+
+        self.widgetList.add_entries([fill_pair_row] * 2)
+        self.widgetList.remove_entries(5)
+
+        # The parts of the pairs are destroyed in the same command as the other widgets
+        lDestroyCommands = self.get_destroy_commands()
+        self.assertEqual(len(lDestroyCommands), 1)
+        self.assertEqual(set(lDestroyCommands[0][1:]), {".w5"} | {widget._w for pair in lPairs for widget in pair.get_tk_widgets()})
+
+        # The destructor only destroys the parts once
+        for pair in lPairs:
+            pair.__del__()
+        self.assertEqual(len(self.get_destroy_commands()), 1)
+
+    def test_destroy_parts_in_batch(self):
+        pair = EntryLabelPair(self.root, "text")
+        with batch(self.root):
+            pair.__del__()
+            self.assertEqual(self.get_destroy_commands(), [])
+        self.assertEqual(self.get_destroy_commands(), [("destroy", pair.label._w, pair.entry._w)])
+
+class TestUpdateCallbacks(WidgetListTestCase):
+
+    def setUp(self):
+        WidgetListTestCase.setUp(self)
+        self.lCalls = list()
+
+    def fill_button_row(self, entry):
+        """ Row factory of which the button removes this row and the next one, passing plain row indices like older code does """
+        button = entry.add_widget(Button(self.root))
+        button.add_callback(callbackKey="removeEntry0", callback=self.lCalls.append, argument=entry.rowIndex)
+        button.add_callback(callbackKey="removeEntry1", callback=self.lCalls.append, argument=entry.rowIndex + 1)
+        button.add_callback(callbackKey="removeListEntry", callback=self.lCalls.append, argument=entry.rowIndex)
+
+    def test_plain_indices_converted(self):
+        self.widgetList.add_entries([self.fill_button_row] * 3)
+        callbackSet = self.widgetList.lEntries[1].lWidgets[-1].dCallbackSets["default"]
+        for key in ("removeEntry0", "removeEntry1", "removeListEntry"):
+            self.assertIsInstance(callbackSet.dCallbacks[key].argument, RowIndex)
+
+    def test_arguments_follow_entry(self):
+        self.widgetList.add_entries([self.fill_button_row] * 3)
+        button = self.widgetList.lEntries[2].lWidgets[-1]
+
+        # Inserting entries above the button moves it down, its callbacks get the new row
+        self.widgetList.add_entries(2, 0)
+        button.call_callbacks()
+        self.assertEqual(self.lCalls, [4, 5, 4])
+
+    def test_only_new_entries_converted(self):
+        self.widgetList.add_entries([self.fill_button_row] * 3)
+        with mock.patch.object(self.widgetList, "update_callbacks") as updateCallbacks:
+            self.widgetList.add_entries([self.fill_button_row] * 2, 1)
+            updateCallbacks.assert_called_once_with(1, 3)
+
+            # Moving and removing entries leaves the callbacks alone
+            updateCallbacks.reset_mock()
+            self.widgetList.remove_entry(0)
+            self.widgetList.remove_entries(0, 2)
+            self.widgetList.set_row_offset(2)
+            updateCallbacks.assert_not_called()
+
+    def test_added_later_converted_on_request(self):
+        entry = self.widgetList.add_empty_entry()
+        self.fill_button_row(entry)
+        self.widgetList.update_callbacks(0, 1)
+        self.assertIsInstance(entry.lWidgets[-1].dCallbackSets["default"].dCallbacks["removeEntry1"].argument, RowIndex)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,356 @@
+# ==================================================================== #
+#  File name:      test_widget_matrix.py        #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the cell order and  #  |#   #   $      #|  #
+#                  positions of a WidgetMatrix, #  |#   #   #      #|  #
+#                  run against stub Tk commands #   #\  #   #     /#   #
+#                  so no display is needed.     #    *= #   #    =+    #
+#  Rev:            1.4                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Layout of large matrices and the add button             #
+#  18-Oct-2026 Cached sorted values                                    #
+#  18-Oct-2026 Cached template options                                 #
+#  18-Oct-2026 Traced template, reset of pooled widgets                #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import random
+import tkinter as tk
+import unittest
+from itertools import count
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeWidget
+from tkinter_tools.tcl_batch import batched_grid, batched_grid_remove
+from tkinter_tools.widget_lists import widget_matrix
+from tkinter_tools.widget_lists.widget_matrix import WidgetMatrix
+from tkinter_tools.widget_pool import WidgetPool
+
+# =============== #
+#   Definitions   #
+# =============== #
+_cellNumbers = count()
+""" Numbers of the Tcl paths of the cells """
+
+#=============#
+#   Classes   #
+#=============#
+class FakeCell(FakeWidget):
+    """
+    Cell widget which can be cloned, it has no options which differ from their default
+    """
+
+    def __init__(self, parent, **kwargs):
+        FakeWidget.__init__(self, parent.tk, f"cell{next(_cellNumbers)}", parent)
+        self.text = None
+
+    def configure(self, cnf=None, **kwargs):
+        if cnf is None and len(kwargs) == 0:
+            return dict()
+        self.text = kwargs.get("text", self.text)
+
+    config = configure
+
+class FakeButton(FakeWidget):
+    """
+    Add button of the matrix, the real Button needs a display for its icons.
+    Like the real Button, its grid calls are recorded in the active batch.
+    """
+
+    def __init__(self, parent, *args, **kwargs):
+        FakeWidget.__init__(self, parent.tk, "add", parent)
+
+    def configure(self, cnf=None, **kwargs):
+        pass
+
+    def grid(self, **kwargs):
+        batched_grid(self, **kwargs)
+
+    def grid_remove(self):
+        batched_grid_remove(self)
+
+    def set_theme(self, mode:str):
+        pass
+
+class TestWidgetMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeWidget(self.interpreter, "")
+        self.random = random.Random(7)
+
+    def create(self, maxColumns:int, template=None, pool=None):
+        if template is None:
+            # The template gets a stub Tcl command, so it can be traced
+            template = FakeCell(self.root)
+            self.interpreter.tcl.eval(f"_widget {template._w}")
+
+        with mock.patch.object(widget_matrix, "get_icon"), mock.patch.object(widget_matrix, "Button", FakeButton):
+            matrix = WidgetMatrix(self.root, template, maxColumns=maxColumns, editMode=True, pool=pool)
+        self.interpreter.dCalls.clear()
+        return matrix
+
+    def count_reads(self):
+        """ Count how often the options of a template are read """
+        patcher = mock.patch.object(widget_matrix, "_get_widget_configs", wraps=widget_matrix._get_widget_configs)
+        reads = patcher.start()
+        self.addCleanup(patcher.stop)
+        return reads
+
+    def get_traces(self, widget):
+        return self.interpreter.tcl.tk.splitlist(self.interpreter.tcl.eval(f"trace info execution {widget._w}"))
+
+    def get_positions(self, start:int=0):
+        """ Last grid row and column of each widget, taken from the log of the stub grid command from index start on """
+        dPositions = dict()
+        for lWords in self.interpreter.get_log()[start:]:
+            if lWords[:2] == ("grid", "configure") and len(lWords) > 3:
+                dOptions = dict(zip(lWords[3::2], lWords[4::2]))
+                dPositions[lWords[2]] = (int(dOptions["-row"]), int(dOptions["-column"]))
+        return dPositions
+
+    def assertCells(self, matrix):
+        # The cells are sorted by value, dCells holds the first cell of each value
+        self.assertEqual(matrix.lValues, sorted(matrix.lValues))
+        self.assertEqual(matrix.lValues, [cell[0] for cell in matrix.llCells])
+        self.assertEqual(matrix.get_values(), matrix.lValues)
+        self.assertEqual(matrix.get_values_view(), tuple(matrix.lValues))
+        dFirstCells = dict()
+        for cell in matrix.llCells:
+            dFirstCells.setdefault(cell[0], cell)
+        self.assertEqual(set(matrix.dCells), set(dFirstCells))
+        for value, cell in dFirstCells.items():
+            self.assertIs(matrix.dCells[value], cell)
+            self.assertIs(matrix.get_widget(value), cell[1])
+
+        # Each widget was last placed at the row and column of its index
+        dPositions = self.get_positions()
+        for index, (value, widget) in enumerate(matrix.llCells):
+            if matrix.maxColumns > 0:
+                tExpected = divmod(index, matrix.maxColumns)
+            else:
+                tExpected = (index, 0)
+            self.assertEqual(dPositions[widget._w], tExpected)
+
+        # The add button follows the last cell
+        cellCount = len(matrix.llCells)
+        if matrix.maxColumns > 0:
+            self.assertEqual(dPositions[".add"], divmod(cellCount, matrix.maxColumns))
+        elif cellCount > 0:
+            self.assertEqual(dPositions[".add"], (cellCount - 1, 1))
+
+        # The matrix view is built from the same order
+        llMatrix = matrix.lllWidgets
+        self.assertEqual([cell for row in llMatrix for cell in row], matrix.llCells)
+        if matrix.maxColumns > 0:
+            self.assertTrue(all(len(row) <= matrix.maxColumns for row in llMatrix))
+
+    def test_add_widgets_sorted(self):
+        matrix = self.create(4)
+        matrix.get_template_config() # Adds the trace of the template
+        self.interpreter.dCalls.clear()
+        matrix.add_widgets([5, 1, 3, 3, 8])
+        self.assertEqual(matrix.get_values(), [1, 3, 3, 5, 8])
+        self.assertCells(matrix)
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+
+    def test_random_changes(self):
+        for maxColumns in (7, -1):
+            matrix = self.create(maxColumns)
+            for _ in range(100):
+                matrix.add_widget(self.random.randrange(50))
+            self.assertCells(matrix)
+
+            for _ in range(30):
+                matrix.remove_widget(self.random.randrange(50))
+                self.assertCells(matrix)
+
+            for _ in range(30):
+                matrix.set_value(self.random.choice(matrix.lValues), self.random.randrange(50))
+                self.assertCells(matrix)
+
+    def test_equal_values_keep_first_cell(self):
+        matrix = self.create(3)
+        firstCell, secondCell = matrix.add_widgets([2, 2])
+        self.assertIs(matrix.dCells[2], firstCell)
+
+        matrix.set_value(2, 9)
+        self.assertIs(matrix.dCells[2], secondCell)
+        self.assertIs(matrix.dCells[9], firstCell)
+        self.assertCells(matrix)
+
+    def test_set_value_moves_only_range(self):
+        matrix = self.create(5)
+        matrix.add_widgets(list(range(20)))
+        start = len(self.interpreter.get_log())
+
+        matrix.set_value(3, 6.5)
+        self.assertEqual(len(self.get_positions(start)), 4 + 1) # Cells 3 to 6 and the add button
+        self.assertCells(matrix)
+
+    def test_set_max_columns(self):
+        matrix = self.create(5)
+        matrix.add_widgets(list(range(12)))
+        matrix.set_max_columns(3)
+        self.assertCells(matrix)
+        self.assertEqual(len(matrix.lllWidgets), 4)
+
+    def test_clear_all(self):
+        matrix = self.create(3)
+        matrix.add_widgets([1, 2, 3])
+        matrix.clear_all()
+        self.assertEqual(matrix.get_values(), [])
+        self.assertIsNone(matrix.get_widget(1))
+        self.assertEqual(self.get_positions()[".add"], (0, 0))
+
+    def test_large_matrix_single_script(self):
+        matrix = self.create(32)
+        matrix.get_template_config()
+        self.interpreter.dCalls.clear()
+        matrix.add_widgets(list(range(1024)))
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+
+        self.interpreter.dCalls.clear()
+        matrix.set_all_positions()
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertCells(matrix)
+        self.assertEqual(self.get_positions()[matrix.get_widget(1023)._w], (31, 31))
+
+    def test_positions_from_index(self):
+        matrix = self.create(3)
+        self.assertEqual([matrix._get_position(index) for index in range(7)], [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (2, 0)])
+
+        matrix.maxColumns = -1
+        self.assertEqual([matrix._get_position(index) for index in range(3)], [(0, 0), (1, 0), (2, 0)])
+
+    def test_add_button_on_new_row(self):
+        matrix = self.create(3)
+        matrix.add_widgets([1, 2])
+        self.assertEqual(self.get_positions()[".add"], (0, 2))
+
+        matrix.add_widget(3)
+        self.assertEqual(self.get_positions()[".add"], (1, 0))
+
+    def test_add_button_without_column_limit(self):
+        matrix = self.create(-1)
+        matrix.add_widgets([1, 2, 3])
+        self.assertEqual(self.get_positions()[".add"], (2, 1))
+        self.assertCells(matrix)
+
+    def test_create_matrix(self):
+        matrix = self.create(2)
+        self.assertEqual(matrix.create_matrix([]), [[]])
+        self.assertEqual(matrix.create_matrix([1, 2, 3, 4, 5]), [[1, 2], [3, 4], [5]])
+
+        matrix.maxColumns = -1
+        self.assertEqual(matrix.create_matrix([1, 2]), [[1], [2]])
+
+    def test_values_view_cached(self):
+        matrix = self.create(3)
+        matrix.add_widgets([3, 1, 2])
+        tValues = matrix.get_values_view()
+        self.assertEqual(tValues, (1, 2, 3))
+        self.assertIs(matrix.get_values_view(), tValues)
+
+        # get_values still returns a new list, which callers are free to change
+        lValues = matrix.get_values()
+        lValues.append(4)
+        self.assertEqual(matrix.get_values(), [1, 2, 3])
+
+        for change in (lambda: matrix.add_widget(0), lambda: matrix.set_value(0, 5), lambda: matrix.remove_widget(5), matrix.clear_all):
+            change()
+            self.assertIsNot(matrix.get_values_view(), tValues)
+            self.assertEqual(matrix.get_values_view(), tuple(matrix.lValues))
+            tValues = matrix.get_values_view()
+
+    def test_template_read_once(self):
+        reads = self.count_reads()
+        template = tk.Label(self.root, relief="raised")
+        matrix = self.create(3, template)
+        for value in range(5):
+            matrix.add_widget(value)
+        matrix.add_widgets([5, 6])
+
+        # Reading options of the template keeps the cached options
+        template.cget("relief")
+        template.configure("relief")
+        template.configure()
+        matrix.add_widget(7)
+
+        self.assertEqual(reads.call_count, 1)
+        self.assertTrue(all(cell[1].cget("relief") == "raised" for cell in matrix.llCells))
+
+        # The template keeps its own configure method
+        self.assertNotIn("configure", vars(template))
+
+    def test_template_reconfigured(self):
+        reads = self.count_reads()
+        template = tk.Label(self.root, relief="raised")
+        matrix = self.create(3, template)
+        matrix.add_widget(1)
+
+        # Changing options in place is noticed by the trace
+        template.configure(relief="sunken")
+        self.assertEqual(matrix.add_widget(2)[1].cget("relief"), "sunken")
+        template["relief"] = "groove"
+        self.assertEqual(matrix.add_widget(3)[1].cget("relief"), "groove")
+        self.interpreter.eval(f"{template._w} configure -relief ridge")
+        self.assertEqual(matrix.add_widget(4)[1].cget("relief"), "ridge")
+        self.assertEqual(reads.call_count, 4)
+
+        matrix.refresh_template()
+        matrix.add_widget(5)
+        self.assertEqual(reads.call_count, 5)
+
+    def test_template_shared(self):
+        template = tk.Label(self.root, relief="raised")
+        lMatrices = [self.create(3, template) for _ in range(2)]
+        for matrix in lMatrices:
+            matrix.add_widget(1)
+        self.assertEqual(len(self.get_traces(template)), 2)
+
+        template.configure(relief="flat")
+        for matrix in lMatrices:
+            self.assertEqual(matrix.add_widget(2)[1].cget("relief"), "flat")
+
+        # Destroying one matrix removes only its own trace
+        lMatrices[0].__del__()
+        self.assertEqual(len(self.get_traces(template)), 1)
+
+    def test_template_replaced(self):
+        oldTemplate = tk.Label(self.root, relief="raised")
+        matrix = self.create(3, oldTemplate)
+        matrix.add_widget(1)
+
+        matrix.widgetType = tk.Label(self.root, relief="flat")
+        self.assertEqual(matrix.add_widget(2)[1].cget("relief"), "flat")
+
+        # The replaced template is no longer traced
+        self.assertEqual(self.get_traces(oldTemplate), ())
+        oldTemplate.configure(relief="sunken")
+        self.assertEqual(matrix.add_widget(3)[1].cget("relief"), "flat")
+
+    def test_pooled_widget_reset(self):
+        template = tk.Label(self.root, relief="raised", background="")
+        matrix = self.create(3, template, WidgetPool(self.root))
+        _, widget = matrix.add_widget(1)
+
+        # Options set during the last use are reset to those of the template, defaults included
+        widget.configure(background="red", relief="flat")
+        matrix.remove_widget(1)
+        self.assertIs(matrix.add_widget(2)[1], widget)
+        self.assertEqual(widget.cget("background"), "")
+        self.assertEqual(widget.cget("relief"), "raised")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# ==================================================================== #
+#  File name:      test_widget_pool.py          #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Tests of the reuse and       #  |#   #   $      #|  #
+#                  trimming of a WidgetPool,    #  |#   #   #      #|  #
+#                  run against stub Tk commands #   #\  #   #     /#   #
+#                  and a fake clock.            #    *= #   #    =+    #
+#  Rev:            1.1                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Released entries are cleared                            #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+import unittest
+from itertools import count
+from unittest import mock
+from tests._fakes import FakeInterpreter, FakeRoot, FakeWidget
+from tkinter_tools.widget_pool import WidgetPool
+
+# =============== #
+#   Definitions   #
+# =============== #
+_widgetNumbers = count()
+""" Numbers of the Tcl paths of the widgets """
+
+#=============#
+#   Classes   #
+#=============#
+class FakeLabel(FakeWidget):
+    """
+    Widget which is created like a tkinter widget, its options are kept in dOptions
+    """
+
+    def __init__(self, parent, **kwargs):
+        FakeWidget.__init__(self, parent.tk, f"label{next(_widgetNumbers)}", parent)
+        self.dOptions = dict(kwargs)
+
+    def configure(self, cnf=None, **kwargs):
+        self.dOptions.update(kwargs)
+
+class FakeFrame(FakeLabel):
+    """
+    Widget of another class, pooled separately
+    """
+
+class TestWidgetPool(unittest.TestCase):
+
+    def setUp(self):
+        self.interpreter = FakeInterpreter()
+        self.root = FakeRoot(self.interpreter)
+        self.parent = FakeWidget(self.interpreter, "parent", self.root)
+        self.pool = WidgetPool(self.parent, maxSize=3, trimDelay=1000, trimSize=1)
+
+        patcher = mock.patch("tkinter_tools.rate_limiter.monotonic", self.root.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_destroyed(self):
+        return [path for lWords in self.interpreter.get_log() if lWords[0] == "destroy" for path in lWords[1:]]
+
+    def test_release_hides_in_one_script(self):
+        lWidgets = [FakeLabel(self.parent) for _ in range(3)]
+        self.interpreter.reset()
+
+        self.pool.release_widgets(lWidgets)
+        self.assertEqual(len(self.pool), 3)
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertEqual(self.interpreter.get_log(), [("grid", "remove") + tuple(widget._w for widget in lWidgets)])
+
+    def test_full_pool_destroys(self):
+        lWidgets = [FakeLabel(self.parent) for _ in range(5)]
+        self.pool.release_widgets(lWidgets)
+
+        self.assertEqual(len(self.pool), 3)
+        self.assertEqual(self.get_destroyed(), [widget._w for widget in lWidgets[3:]])
+        self.assertNotIn(lWidgets[4]._name, self.parent.children)
+
+    def test_acquire_reuses_and_configures(self):
+        lWidgets = [FakeLabel(self.parent, text="old") for _ in range(2)]
+        self.pool.release_widgets(lWidgets)
+
+        widget = self.pool.acquire(FakeLabel, text="new")
+        self.assertIs(widget, lWidgets[1])
+        self.assertEqual(widget.dOptions, {"text": "new"})
+        self.assertEqual(len(self.pool), 1)
+
+        # Another class is not taken from the pool
+        frame = self.pool.acquire(FakeFrame, text="frame")
+        self.assertNotIn(frame, lWidgets)
+        self.assertIs(frame.master, self.parent)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_release_clears_entries(self):
+        entry = tk.Entry(self.parent)
+        label = FakeLabel(self.parent)
+        self.interpreter.reset()
+
+        # The text is deleted after all widgets are hidden, in the same script
+        self.pool.release_widgets([entry, label])
+        self.assertEqual(self.interpreter.dCalls, {"eval": 1})
+        self.assertEqual(self.interpreter.get_log(), [("grid", "remove", entry._w, label._w), (entry._w, "delete", "0", "end")])
+
+        self.assertIs(self.pool.acquire(tk.Entry), entry)
+
+    def test_trim_after_delay(self):
+        lWidgets = [FakeLabel(self.parent) for _ in range(3)]
+        self.pool.release_widgets(lWidgets)
+
+        # Using the pool postpones the trim
+        self.root.advance(900)
+        self.pool.acquire(FakeLabel)
+        self.root.advance(900)
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(self.get_destroyed(), [])
+
+        # The oldest widgets are destroyed, trimSize widgets are kept
+        self.root.advance(200)
+        self.assertEqual(len(self.pool), 1)
+        self.assertEqual(self.get_destroyed(), [lWidgets[0]._w])
+        self.assertIs(self.pool.acquire(FakeLabel), lWidgets[1])
+
+    def test_clear(self):
+        self.pool.release_widgets([FakeLabel(self.parent), FakeFrame(self.parent)])
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(len(self.get_destroyed()), 2)
+
+        # The pending trim was dropped
+        self.assertEqual(self.root.dScheduled, {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,67 @@
-from tkinter_tools.widget_lists import WidgetList, ListEntry, WidgetMatrix
-from tkinter_tools.tools import set_widget_position, is_widget_this, is_widget_this_list, WIDGET_LABEL, WIDGET_ENTRY, WIDGET_BUTTON, WIDGET_TKT_BUTTON, WIDGET_FRAME, WIDGET_CHECK_BUTTON, WIDGET_SELECTION_LABEL, WIDGET_ENTRY_LABEL, WIDGET_VALUE_UNIT
-from tkinter_tools.composite_widgets import EntryLabelPair, ValueUnitPair, SelectionLabelPair, Button, ScrollableFrame, ScrollableLabelFrame
-from tkinter_tools.fancy_callbacks import CallbackSet, FancyCallback
+# The public names are resolved on first access (PEP 562), so importing the package does not import tkinter.
+# A tool which only uses CallbackSet therefore only loads fancy_callbacks.
+import importlib
+
+_dLazyImports = {
+    "WidgetList": "tkinter_tools.widget_lists",
+    "ListEntry": "tkinter_tools.widget_lists",
+    "RowIndex": "tkinter_tools.widget_lists.list_entry",
+    "WidgetMatrix": "tkinter_tools.widget_lists",
+    "VirtualWidgetList": "tkinter_tools.widget_lists",
+    "set_widget_position": "tkinter_tools.tools",
+    "is_widget_this": "tkinter_tools.tools",
+    "is_widget_this_list": "tkinter_tools.tools",
+    "destroy_widgets": "tkinter_tools.tools",
+    "WIDGET_LABEL": "tkinter_tools.tools",
+    "WIDGET_ENTRY": "tkinter_tools.tools",
+    "WIDGET_BUTTON": "tkinter_tools.tools",
+    "WIDGET_TKT_BUTTON": "tkinter_tools.tools",
+    "WIDGET_FRAME": "tkinter_tools.tools",
+    "WIDGET_CHECK_BUTTON": "tkinter_tools.tools",
+    "WIDGET_SELECTION_LABEL": "tkinter_tools.tools",
+    "WIDGET_ENTRY_LABEL": "tkinter_tools.tools",
+    "WIDGET_VALUE_UNIT": "tkinter_tools.tools",
+    "EntryLabelPair": "tkinter_tools.composite_widgets",
+    "ValueUnitPair": "tkinter_tools.composite_widgets",
+    "SelectionLabelPair": "tkinter_tools.composite_widgets",
+    "Button": "tkinter_tools.composite_widgets",
+    "ScrollableFrame": "tkinter_tools.composite_widgets",
+    "ScrollableLabelFrame": "tkinter_tools.composite_widgets",
+    "CallbackSet": "tkinter_tools.fancy_callbacks",
+    "FancyCallback": "tkinter_tools.fancy_callbacks",
+    "LazyArgument": "tkinter_tools.fancy_callbacks",
+    "CallbackProfiler": "tkinter_tools.callback_profiler",
+    "gProfiler": "tkinter_tools.callback_profiler",
+    "run_in_background": "tkinter_tools.background_tasks",
+    "batch": "tkinter_tools.tcl_batch",
+    "TclBatch": "tkinter_tools.tcl_batch",
+    "WidgetPool": "tkinter_tools.widget_pool",
+}
+""" Public name: module which defines it """
+
+__all__ = list(_dLazyImports)
+
+def __getattr__(name:str):
+    """
+    Import a public name the first time it is accessed
+
+    :param name: Name of the attribute
+    :type name: string
+    :return: The requested class, method or definition
+    :rtype: any
+    """
+    if name in _dLazyImports:
+        value = getattr(importlib.import_module(_dLazyImports[name]), name)
+        globals()[name] = value # Following accesses won't reach __getattr__
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    """
+    List the attributes of the package, including the names which have not been imported yet
+
+    :return: Attribute names
+    :rtype: list[string]
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,235 @@
+# ==================================================================== #
+#  File name:      async_bridge.py              #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Runs an asyncio event loop   #  |#   #   $      #|  #
+#                  inside the Tk event loop,    #  |#   #   #      #|  #
+#                  allowing CallbackSets to run #   #\  #   #     /#   #
+#                  coroutine callbacks without  #    *= #   #    =+    #
+#                  blocking the GUI.            #     *++######++*     #
+#  Rev:            1.3                          #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Watch roots through root_watcher.py                     #
+#  18-Oct-2026 Back off idle steps, finish a close from a coroutine    #
+#  18-Oct-2026 Back off on a plain timer, without asyncio internals    #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import asyncio
+import inspect
+import sys
+import tkinter as tk
+from tkinter_tools.root_watcher import on_root_destroyed, cancel_on_root_destroyed
+
+# =============== #
+#   Definitions   #
+# =============== #
+_dBridges = dict()
+""" Bridge of each Tk root """
+
+#=============#
+#   Classes   #
+#=============#
+class AsyncBridge:
+    """
+    Steps an asyncio event loop from the Tk event loop using after().
+    The loop is only stepped while tasks are pending, so an idle bridge costs nothing.
+    The time between steps doubles up to maxInterval while tasks are pending, scheduling a coroutine steps the loop at the interval again.
+    A coroutine which waits (asyncio.sleep etc.) therefore resumes up to maxInterval late, lower it when tasks need to poll faster.
+    Since the loop runs in the Tk thread, coroutines are allowed to use tkinter widgets.
+    """
+
+    def __init__(self, root, interval:int=10, maxInterval:int=200):
+        """
+        Constructor
+
+        :param root: Root of the Tk interpreter which steps the asyncio loop
+        :type root: tkinter.Tk
+        :param interval: Time between steps of the asyncio loop in milliseconds while callbacks are ready, defaults to 10
+        :type interval: integer, optional
+        :param maxInterval: Longest time between steps in milliseconds, defaults to 200
+        :type maxInterval: integer, optional
+        """
+        self.root=root
+        """ Root of the Tk interpreter which steps the asyncio loop """
+        self.interval=interval
+        """ Time between steps of the asyncio loop in milliseconds while callbacks are ready """
+        self.maxInterval=maxInterval
+        """ Longest time between steps in milliseconds """
+        self.loop=asyncio.new_event_loop()
+        """ The asyncio event loop """
+        self._afterId=None
+        """ Id of the scheduled step, None if the loop is not being stepped """
+        self._delay=interval
+        """ Time until the scheduled step in milliseconds """
+        self._closing=False
+        """ If close was called from inside a coroutine, the loop is then closed once the running step returns """
+
+    def schedule(self, coroutine):
+        """
+        Run a coroutine on the asyncio loop, exceptions are reported through the Tk root like any other callback exception
+
+        :param coroutine: Coroutine to run
+        :type coroutine: coroutine
+        :return: Task running the coroutine
+        :rtype: asyncio.Task
+        """
+        task=self.loop.create_task(self._run_reported(coroutine))
+        # A task cancelled before its first step never awaits the coroutine, closing it prevents a "never awaited" warning
+        task.add_done_callback(lambda task, coroutine=coroutine: coroutine.close())
+
+        # A backed off step could be far away, the new coroutine starts right away
+        if self._afterId is not None and self._delay > self.interval:
+            self.root.after_cancel(self._afterId)
+            self._afterId=None
+
+        self._delay=self.interval
+        if self._afterId is None:
+            self._afterId=self.root.after(0, self._step)
+
+        return task
+
+    def _step(self):
+        """
+        Run everything which is ready on the asyncio loop, and schedule the next step if tasks are still pending
+        """
+        self._afterId=None
+
+        # run_forever returns as soon as the stop callback is reached, which is after all ready callbacks
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+        if self._closing:
+            self._close_loop()
+        elif len(asyncio.all_tasks(self.loop)) > 0:
+            self._afterId=self.root.after(self._get_delay(), self._step)
+
+    def _get_delay(self):
+        """
+        Get the time until the next step, it starts at the interval after schedule and doubles each step up to maxInterval
+
+        :return: Delay in milliseconds
+        :rtype: integer
+        """
+        # asyncio has no public way to see if callbacks are ready or when the next timer is due, so the loop is polled
+        delay=self._delay
+        self._delay=min(delay * 2, self.maxInterval)
+        return delay
+
+    async def _run_reported(self, coroutine):
+        """
+        Run a coroutine and report its exception through the Tk root, the same way tkinter reports exceptions of callbacks
+
+        :param coroutine: Coroutine to run
+        :type coroutine: coroutine
+        :return: Result of the coroutine, None if it raised an exception
+        :rtype: any
+        """
+        try:
+            return await coroutine
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+    def close(self):
+        """
+        Cancel all pending tasks and close the asyncio loop
+        """
+        if self._afterId is not None:
+            try:
+                self.root.after_cancel(self._afterId)
+            except tk.TclError:
+                pass # The root is already destroyed
+            self._afterId=None
+
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+
+        # A running loop can't be closed, when the close is requested from inside a coroutine the running step finishes it
+        if self.loop.is_running():
+            self._closing=True
+        else:
+            self._close_loop()
+
+    def _close_loop(self):
+        """
+        Let the cancelled tasks handle their cancellation and close the asyncio loop
+        """
+        lTasks=list(asyncio.all_tasks(self.loop))
+        if len(lTasks) > 0:
+            self.loop.run_until_complete(asyncio.gather(*lTasks, return_exceptions=True))
+        self.loop.close()
+
+    def __repr__(self):
+        """
+        Representation of this class when it is printed or viewed in debugger window
+
+        :return: String of how this object should be represented
+        :rtype: string
+        """
+        return f"root: {self.root}\ninterval: {self.interval}\npending tasks: {len(asyncio.all_tasks(self.loop))}"
+
+# =========== #
+#   Methods   #
+# =========== #
+def get_async_bridge(widget=None):
+    """
+    Get the bridge of a Tk interpreter, it is created when needed and closed when the root is destroyed
+
+    :param widget: Any widget of the Tk interpreter, if None the default root is used, defaults to None
+    :type widget: tkinter widget, optional
+    :return: The bridge of the Tk interpreter
+    :rtype: AsyncBridge
+    """
+    root=widget._root() if widget is not None else tk._default_root
+    if root is None:
+        raise RuntimeError("Coroutine callbacks need a Tk root, create one or attach a widget to the CallbackSet")
+
+    bridge=_dBridges.get(root)
+    if bridge is None:
+        bridge=_dBridges[root]=AsyncBridge(root)
+        on_root_destroyed(root, close_async_bridge)
+
+    return bridge
+
+def close_async_bridge(widget=None):
+    """
+    Close the bridge of a Tk interpreter, cancelling its pending coroutines
+
+    :param widget: Any widget of the Tk interpreter, if None the default root is used, defaults to None
+    :type widget: tkinter widget, optional
+    """
+    root=widget._root() if widget is not None else tk._default_root
+    bridge=_dBridges.pop(root, None)
+    if bridge is not None:
+        cancel_on_root_destroyed(root, close_async_bridge)
+        bridge.close()
+
+async def run_in_order(previousTask, tCalls:tuple):
+    """
+    Run callables in order, awaiting the ones which return a coroutine.
+    Used by CallbackSet for the part of its call chain starting at the first coroutine callback.
+
+    :param previousTask: Task of the previous run of the same CallbackSet, which has to finish first, can be None
+    :type previousTask: asyncio.Task
+    :param tCalls: Callables which need no arguments
+    :type tCalls: tuple
+    """
+    # Runs of the same set are not allowed to overlap, wait() does not raise the exceptions of the previous run
+    if previousTask is not None and not previousTask.done():
+        await asyncio.wait([previousTask])
+
+    for call in tCalls:
+        result=call()
+        if inspect.isawaitable(result):
+            await result
@@ -0,0 +1,147 @@
+# ==================================================================== #
+#  File name:      background_tasks.py          #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Runs functions on a bounded  #  |#   #   $      #|  #
+#                  thread pool and delivers the #  |#   #   #      #|  #
+#                  results on the Tk thread, so #   #\  #   #     /#   #
+#                  heavy callbacks don't freeze #    *= #   #    =+    #
+#                  the GUI.                     #     *++######++*     #
+#  Rev:            1.2                          #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Drop the pending tasks of a destroyed root              #
+#  18-Oct-2026 Check each task once per poll, cancel tasks by hand     #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+from concurrent.futures import ThreadPoolExecutor
+from tkinter_tools.root_watcher import on_root_destroyed, cancel_on_root_destroyed
+
+# =============== #
+#   Definitions   #
+# =============== #
+MAX_WORKERS = 4
+""" Amount of threads in the pool, changes only apply before the first task is submitted """
+POLL_INTERVAL = 20
+""" Time in milliseconds between checks for finished tasks """
+
+_executor = None
+""" The thread pool, created when the first task is submitted """
+_dPendingTasks = dict()
+""" Unfinished tasks of each Tk root, as lists of (future, onDone, onError), dropped when the root is destroyed """
+
+# =========== #
+#   Methods   #
+# =========== #
+def run_in_background(widget, function, onDone=None, onError=None):
+    """
+    Run a function on the thread pool.
+    The function is not allowed to use tkinter, since Tk may only be used from its own thread.
+    onDone and onError are called on the Tk thread, so they are free to update widgets.
+
+    :param widget: Any widget of the Tk interpreter which delivers the result
+    :type widget: tkinter widget
+    :param function: Function which needs no arguments
+    :type function: function
+    :param onDone: Called with the return value of the function, defaults to None
+    :type onDone: function, optional
+    :param onError: Called with the exception raised by the function, if None the exception is reported like any other callback exception, defaults to None
+    :type onError: function, optional
+    :return: Future of the function
+    :rtype: concurrent.futures.Future
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="tkinter_tools")
+
+    root = widget._root()
+    future = _executor.submit(function)
+
+    # The results are collected by polling, since only the Tk thread is allowed to call after()
+    lPending = _dPendingTasks.get(root)
+    if lPending is None:
+        lPending = _dPendingTasks[root] = []
+        root.after(POLL_INTERVAL, _deliver_results, root)
+        on_root_destroyed(root, _drop_pending_tasks)
+    lPending.append((future, onDone, onError))
+
+    return future
+
+def shutdown_background_tasks(wait:bool=True):
+    """
+    Stop the thread pool, tasks which have not started yet are cancelled.
+    A new pool is created when a task is submitted afterwards.
+
+    :param wait: Wait until the running tasks are finished, defaults to True
+    :type wait: boolean, optional
+    """
+    global _executor
+    if _executor is not None:
+        # Cancelled by hand, shutdown only accepts cancel_futures since Python 3.9
+        for lPending in _dPendingTasks.values():
+            for future, _, _ in lPending:
+                future.cancel()
+        _executor.shutdown(wait=wait)
+        _executor = None
+
+def _deliver_results(root):
+    """
+    Call onDone or onError of the finished tasks of a root, keeps polling while tasks are unfinished
+
+    :param root: Root of the Tk interpreter
+    :type root: tkinter.Tk
+    """
+    lPending = _dPendingTasks.get(root)
+    if lPending is None:
+        return # The root was destroyed
+
+    # Each task is checked once, a task which finishes during the split stays pending until the next poll
+    lFinished = list()
+    lStillPending = list()
+    for task in lPending:
+        (lFinished if task[0].done() else lStillPending).append(task)
+    lPending[:] = lStillPending
+
+    # Polling stops when nothing is pending, run_in_background restarts it
+    if len(lPending) > 0:
+        root.after(POLL_INTERVAL, _deliver_results, root)
+    else:
+        del _dPendingTasks[root]
+        cancel_on_root_destroyed(root, _drop_pending_tasks)
+
+    for future, onDone, onError in lFinished:
+        try:
+            if future.cancelled():
+                continue
+
+            exception = future.exception()
+            if exception is None:
+                if onDone is not None:
+                    onDone(future.result())
+            elif onError is not None:
+                onError(exception)
+            else:
+                raise exception
+        except Exception as exception:
+            # The other results still need to be delivered
+            root.report_callback_exception(type(exception), exception, exception.__traceback__)
+
+def _drop_pending_tasks(root):
+    """
+    Forget the unfinished tasks of a destroyed root, their results are no longer delivered.
+    The tasks keep running, but are cancelled if they have not started yet.
+
+    :param root: Root of the Tk interpreter
+    :type root: tkinter.Tk
+    """
+    for future, _, _ in _dPendingTasks.pop(root, ()):
+        future.cancel()
@@ -0,0 +1,297 @@
+# ==================================================================== #
+#  File name:      callback_profiler.py         #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Opt-in timing of the         #  |#   #   $      #|  #
+#                  callbacks run by a           #  |#   #   #      #|  #
+#                  CallbackSet. Statistics are  #   #\  #   #     /#   #
+#                  kept per set and key in the  #    *= #   #    =+    #
+#                  global gProfiler.            #     *++######++*     #
+#  Rev:            1.2                          #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Statistics of unnamed sets are dropped with the set     #
+#  18-Oct-2026 Coroutine callbacks are timed until they finish         #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+from collections import deque
+from time import perf_counter
+from weakref import finalize, WeakSet
+
+#=============#
+#   Classes   #
+#=============#
+class CallbackStatistics:
+    """
+    Timing statistics of a single callback
+    """
+
+    def __init__(self, sampleSize:int=1000):
+        """
+        Constructor
+
+        :param sampleSize: Amount of most recent call durations kept to calculate the 95th percentile, defaults to 1000
+        :type sampleSize: integer, optional
+        """
+        self.count=0
+        """ Amount of calls """
+        self.total=0.0
+        """ Summed duration of all calls in seconds """
+        self.max=0.0
+        """ Longest call in seconds """
+        self.samples=deque(maxlen=sampleSize)
+        """ Durations of the most recent calls in seconds """
+        self.isAsync=False
+        """ If the callback is a coroutine, its durations then include the time spent waiting in awaits """
+
+    def add(self, duration:float):
+        """
+        Add the duration of a call
+
+        :param duration: Duration of the call in seconds
+        :type duration: float
+        """
+        self.count+=1
+        self.total+=duration
+        if duration > self.max:
+            self.max=duration
+        self.samples.append(duration)
+
+    def get_p95(self):
+        """
+        Get the 95th percentile of the recent call durations
+
+        :return: Duration in seconds, 0 when no calls were made
+        :rtype: float
+        """
+        if len(self.samples) == 0:
+            return 0.0
+
+        lSorted=sorted(self.samples)
+        return lSorted[min(len(lSorted) - 1, int(0.95 * len(lSorted)))]
+
+    def to_dict(self):
+        """
+        Convert the statistics into a dictionary, durations are in milliseconds
+
+        :return: Dictionary with count, total_ms, max_ms, mean_ms, p95_ms and async
+        :rtype: dict
+        """
+        return {
+            "async": self.isAsync,
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "max_ms": self.max * 1000,
+            "mean_ms": self.total * 1000 / self.count if self.count > 0 else 0.0,
+            "p95_ms": self.get_p95() * 1000
+        }
+
+class CallbackProfiler:
+    """
+    Registry of callback timings, keyed by (CallbackSet name, callback key).
+    While disabled the callback sets run their callbacks directly, so profiling costs nothing.
+    Enabling or disabling recompiles the call chain of every set, to add or remove the timing wrappers.
+    """
+
+    def __init__(self, sampleSize:int=1000):
+        """
+        Constructor
+
+        :param sampleSize: Amount of most recent call durations kept per callback, defaults to 1000
+        :type sampleSize: integer, optional
+        """
+        self.enabled=False
+        """ If new call chains are timed """
+        self.sampleSize=sampleSize
+        """ Amount of most recent call durations kept per callback """
+        self.dStatistics=dict()
+        """ Statistics of each callback, keyed by (CallbackSet name, callback key) """
+        self._sCallbackSets=WeakSet()
+        """ All callback sets, used to recompile their call chains """
+        self._sUnnamedSets=WeakSet()
+        """ Callback sets without a name of their own, their statistics are dropped once the set is finalized """
+        self._dUnnamedKeys=dict()
+        """ Profiled callback keys of each unnamed set, as set name: set[key] """
+
+    def register(self, callbackSet, unnamed:bool=False):
+        """
+        Register a callback set, done by the CallbackSet constructor
+
+        :param callbackSet: Set of which the call chain needs to be recompiled when profiling is turned on or off
+        :type callbackSet: CallbackSet
+        :param unnamed: If the set has a generated name, its statistics are then dropped once the set is finalized, defaults to False
+        :type unnamed: boolean, optional
+        """
+        self._sCallbackSets.add(callbackSet)
+        if unnamed:
+            self._sUnnamedSets.add(callbackSet)
+
+    def enable(self):
+        """
+        Start timing all callbacks
+        """
+        self.enabled=True
+        self._invalidate_all()
+
+    def disable(self):
+        """
+        Stop timing callbacks, the collected statistics are kept
+        """
+        self.enabled=False
+        self._invalidate_all()
+
+    def reset(self):
+        """
+        Remove all collected statistics
+        """
+        self.dStatistics.clear()
+        self._invalidate_all() # Running chains hold on to the old statistics objects
+
+    def _invalidate_all(self):
+        """
+        Make all callback sets recompile their call chain when they are called next
+        """
+        for callbackSet in list(self._sCallbackSets):
+            callbackSet._tCallChain=None
+
+    def wrap(self, callbackSet, key:str, call):
+        """
+        Wrap a callable so the duration of each call is recorded.
+        When the callable returns a coroutine, the time until the coroutine finishes is recorded instead of the time it took to create it
+
+        :param callbackSet: CallbackSet which runs the callable, its statistics are kept under its name
+        :type callbackSet: CallbackSet
+        :param key: Key of the callback in the set
+        :type key: string
+        :param call: Callable which needs no arguments
+        :type call: function
+        :return: Callable which times and runs the callable
+        :rtype: function
+        """
+        statistics=self.dStatistics.get((callbackSet.name, key))
+        if statistics is None:
+            statistics=self.dStatistics[(callbackSet.name, key)]=CallbackStatistics(self.sampleSize)
+            if callbackSet in self._sUnnamedSets:
+                self._track_unnamed(callbackSet, key)
+
+        def timed_call():
+            start=perf_counter()
+            try:
+                result=call()
+            except BaseException:
+                statistics.add(perf_counter() - start)
+                raise
+
+            if hasattr(result, "__await__"):
+                return _await_timed(result, statistics, start)
+
+            statistics.add(perf_counter() - start)
+            return result
+
+        return timed_call
+
+    def _track_unnamed(self, callbackSet, key:str):
+        """
+        Remember a profiled key of an unnamed set, the first key also registers the finalizer which drops the statistics of the set
+
+        :param callbackSet: Unnamed CallbackSet
+        :type callbackSet: CallbackSet
+        :param key: Key of the callback in the set
+        :type key: string
+        """
+        sKeys=self._dUnnamedKeys.get(callbackSet.name)
+        if sKeys is None:
+            sKeys=self._dUnnamedKeys[callbackSet.name]=set()
+            finalize(callbackSet, self._forget_set, callbackSet.name)
+        sKeys.add(key)
+
+    def _forget_set(self, setName:str):
+        """
+        Drop the statistics of an unnamed set, called once the set is finalized
+
+        :param setName: Generated name of the set
+        :type setName: string
+        """
+        for key in self._dUnnamedKeys.pop(setName, ()):
+            self.dStatistics.pop((setName, key), None)
+
+    def get_report(self):
+        """
+        Get the statistics of all callbacks, the slowest (highest total) first.
+        Sets with the same name are combined into one entry per key. For example the mode callbacks of all rows of all lists
+        are reported as "ListEntry.editCallbacks" and "ListEntry.viewCallbacks", rename a set (before its first call) to time it separately.
+        For coroutine callbacks ("async" is True) the durations run until the coroutine finished, so they include waiting in awaits
+
+        :return: List of dictionaries holding the set name, key and statistics (see CallbackStatistics.to_dict)
+        :rtype: list[dict]
+        """
+        lReport=[
+            dict(set=setName, key=key, **statistics.to_dict())
+            for (setName, key), statistics in self.dStatistics.items()
+        ]
+        lReport.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return lReport
+
+    def export_json(self, filePath:str=None):
+        """
+        Export the report as JSON
+
+        :param filePath: File to write the JSON to, if None it is only returned, defaults to None
+        :type filePath: string, optional
+        :return: The report in JSON form
+        :rtype: string
+        """
+        import json
+
+        sJson=json.dumps(self.get_report(), indent=4)
+        if filePath is not None:
+            with open(filePath, "w") as outputFile:
+                outputFile.write(sJson)
+
+        return sJson
+
+    def __repr__(self):
+        """
+        Representation of this class when it is printed or viewed in debugger window
+
+        :return: String of how this object should be represented
+        :rtype: string
+        """
+        return f"enabled: {self.enabled}\ncallbacks: {len(self.dStatistics)}"
+
+# =========== #
+#   Methods   #
+# =========== #
+async def _await_timed(awaitable, statistics:CallbackStatistics, start:float):
+    """
+    Await the coroutine of a coroutine callback and record the time from the call until it finished
+
+    :param awaitable: Coroutine returned by the callback
+    :type awaitable: coroutine
+    :param statistics: Statistics of the callback
+    :type statistics: CallbackStatistics
+    :param start: perf_counter() at the moment the callback was called
+    :type start: float
+    :return: Result of the coroutine
+    :rtype: any
+    """
+    statistics.isAsync=True
+    try:
+        return await awaitable
+    finally:
+        statistics.add(perf_counter() - start)
+
+# =============== #
+#   Definitions   #
+# =============== #
+gProfiler = CallbackProfiler()
+""" Global profiler used by all callback sets """
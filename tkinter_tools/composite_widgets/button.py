@@ -5,7 +5,7 @@
 # ============================================= #   #/  #         \#   #
 #  Description:    Custom composite button      #  |#   #   $      #|  #
 #                  widgets                      #  |#   #   #      #|  #
-#  Rev:            3.0                          #   #\  #   #     /#   #
+#  Rev:            3.3                          #   #\  #   #     /#   #
 #                                               #    *= #   #    =+    #
 #                                               #     *++######++*     #
 #                                               #        *-==-*        #
@@ -16,6 +16,13 @@
 #  03-Mar-2023 Commented all methods                                   #
 #  06-Mar-2023 Bug fixes for complete overhaul                         #
 #  13-Mar-2023 First release                                           #
+#  18-Oct-2026 Name the callback sets for the callback profiler        #
+#  18-Oct-2026 Run coroutine callbacks in this button's Tk interpreter #
+#  18-Oct-2026 Background modes which run on a thread pool             #
+#  18-Oct-2026 Optional weak references to callbacks                   #
+#  18-Oct-2026 Grid operations are recorded in an active Tcl batch     #
+#  18-Oct-2026 Background modes reject callbacks needing the Tk thread #
+#  18-Oct-2026 Theme images are configured in an active Tcl batch      #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
@@ -25,7 +32,9 @@
 #   Imports   #
 # =========== #
 import tkinter as tk
+from functools import partial
 from tkinter_tools.fancy_callbacks import CallbackSet
+from tkinter_tools.tcl_batch import batched_configure, batched_grid, batched_grid_remove
 
 # =========== #
 #   Classes   #
@@ -38,6 +47,8 @@ class Button(tk.Button):
         Each mode can have multiple callbacks (together with arguments) attached.
         The callbacks are sorted using their key, and are run in the order added.
         This order can be altered. (see fancy_callbacks.py)
+        A mode can be run in the background (see set_background_mode),
+        the button is then busy until its callbacks have finished.
     """
 
     def __init__(self, parent=None, lightImage=None, darkImage=None, **kwargs):
@@ -67,6 +78,12 @@ class Button(tk.Button):
         self.dCallbackSets = dict()
         """Dictionary of callback sets"""
 
+        self.dBackgroundModes = dict()
+        """Modes which run on the thread pool, with their (onDone, onError) callbacks"""
+
+        self._dIdleConfig = None
+        """State and cursor to restore when the background callbacks are done, None if the button is not busy"""
+
     def __del__(self):
         """Class destructor"""
         try:
@@ -76,40 +93,128 @@ class Button(tk.Button):
             pass
 
     def set_theme(self, mode:str="light"):
-        """set_theme Set color mode of this object
+        """set_theme Set color mode of this object, the image is configured in the active Tcl batch if there is one
 
         :param mode: Name of mode, "dark" and "light" are supported, defaults to "light"
         :type mode: string, optional
         """
         if mode == "dark" and self.darkImage is not None:
-            super().configure(image=self.darkImage)
+            batched_configure(self, image=self.darkImage)
         elif self.lightImage is not None:
-            super().configure(image=self.lightImage)
+            batched_configure(self, image=self.lightImage)
 
     def call_callbacks(self):
-        """ Call all callbacks in this mode """
+        """ Call all callbacks in this mode, background modes are started on the thread pool """
         if self.currentMode in self.dCallbackSets:
-            self.dCallbackSets[self.currentMode].call_callbacks()
+            if self.currentMode in self.dBackgroundModes:
+                self._start_background(self.currentMode)
+            else:
+                self.dCallbackSets[self.currentMode].call_callbacks()
+
+    def set_background_mode(self, modeKey:str="default", background:bool=True, onDone=None, onError=None):
+        """set_background_mode Run the callbacks of a mode on a thread pool (see background_tasks.py), so they don't freeze the window.
+        The callbacks of a background mode are not allowed to use tkinter, be weak, be coroutines or have a rate limit policy, 
+        the click raises a ValueError otherwise (see CallbackSet.get_background_call).
+        onDone and onError are called on the Tk thread and can be used to show the results.
+        The button is disabled and shows a busy cursor while the callbacks are running.
+
+        :param modeKey: Name of the mode, defaults to "default"
+        :type modeKey: string, optional
+        :param background: True to run the mode in the background, False to run it directly again, defaults to True
+        :type background: boolean, optional
+        :param onDone: Called without arguments after all callbacks have finished, defaults to None
+        :type onDone: function, optional
+        :param onError: Called with the exception which stopped the callbacks, if None the exception is reported like any other callback exception, defaults to None
+        :type onError: function, optional
+        """
+        if background:
+            self.dBackgroundModes[modeKey] = (onDone, onError)
+        else:
+            self.dBackgroundModes.pop(modeKey, None)
+
+    def is_busy(self):
+        """is_busy Check if callbacks of a background mode are running
+
+        :return: True if the button is waiting for its background callbacks
+        :rtype: boolean
+        """
+        return self._dIdleConfig is not None
+
+    def _start_background(self, modeKey:str):
+        """_start_background Run the callbacks of a background mode on the thread pool and make the button busy
 
-    def add_callback(self, modeKey:str="default", callbackKey:str="default", callback=None, argument=None):
+        :param modeKey: Name of the mode
+        :type modeKey: string
+        """
+        if self.is_busy():
+            return # A click which came in before the button was disabled
+
+        # Imported here, so the thread pool module is only loaded when a background mode is used
+        from tkinter_tools.background_tasks import run_in_background
+
+        # Checked before the button is made busy, a set which needs the Tk thread raises here
+        backgroundCall = self.dCallbackSets[modeKey].get_background_call()
+
+        onDone, onError = self.dBackgroundModes[modeKey]
+        self._dIdleConfig = {"state": self.cget("state"), "cursor": self.cget("cursor")}
+        super().configure(state="disabled", cursor="watch")
+
+        run_in_background(
+            self, backgroundCall,
+            partial(self._finish_background, onDone),
+            partial(self._finish_background, onError, reportError=True)
+        )
+
+    def _finish_background(self, callback, result=None, reportError:bool=False):
+        """_finish_background Restore the button after the background callbacks are done, called on the Tk thread
+
+        :param callback: onDone or onError of the mode, can be None
+        :type callback: function
+        :param result: Return value of the callbacks, or the exception when reportError is True, defaults to None
+        :type result: any, optional
+        :param reportError: True if result is an exception, defaults to False
+        :type reportError: boolean, optional
+        """
+        if self.is_busy() and self.winfo_exists():
+            super().configure(**self._dIdleConfig)
+        self._dIdleConfig = None
+
+        if reportError:
+            if callback is None:
+                raise result
+            callback(result)
+        elif callback is not None:
+            callback()
+
+    def add_callback(self, modeKey:str="default", callbackKey:str="default", callback=None, argument=None, weak:bool=False):
         """add_callback Add a callback to the button
 
         :param modeKey: Name of the mode too which the callback needs to be added, defaults to "default"
         :type modeKey: string, optional
         :param callbackKey: Descriptive name of the callback, defaults to "default"
         :type callbackKey: string, optional
-        :param callback: The callback to add, defaults to None
+        :param callback: The callback to add, coroutine functions are run on the asyncio loop of the Tk interpreter (see async_bridge.py), defaults to None
         :type callback: function, optional
         :param argument: Arguments to enter when running the callback, defaults to None
         :type argument: any, optional
+        :param weak: Reference a bound method weakly, so the button does not keep its object alive (see FancyCallback), defaults to False
+        :type weak: boolean, optional
         """
         # Add new mode if it's not already present
         if modeKey not in self.dCallbackSets:
-            self.dCallbackSets[modeKey] = CallbackSet()
+            self.dCallbackSets[modeKey] = CallbackSet(f"Button{self}:{modeKey}", self)
 
         # Add the callback to the calback set
         self.dCallbackSets[modeKey].add_callback(
-            callbackKey, callback, argument)
+            callbackKey, callback, argument, weak)
+
+    def grid(self, cnf={}, **kwargs):
+        """Position the button in the parent widget in a grid, recorded in an active Tcl batch (see tcl_batch.py)"""
+        batched_grid(self, **cnf, **kwargs)
+
+    def grid_remove(self):
+        """Unmap the button but remember the grid options, recorded in an active Tcl batch (see tcl_batch.py)"""
+        batched_grid_remove(self)
 
     def set_mode(self, modeKey:str="default"):
         """set_mode Set the current callback mode
@@ -5,7 +5,7 @@
 # ============================================= #   #/  #         \#   #
 #  Description:    Custom composite entry label #  |#   #   $      #|  #
 #                  widget                       #  |#   #   #      #|  #
-#  Rev:            1.0                          #   #\  #   #     /#   #
+#  Rev:            1.4                          #   #\  #   #     /#   #
 #                                               #    *= #   #    =+    #
 #                                               #     *++######++*     #
 #                                               #        *-==-*        #
@@ -18,6 +18,10 @@
 #  13-Mar-2023 First release                                           #
 #  11-May-2023 Cleaned up code and added comments                      #
 #  26-May-2023 Migrate from shared composite_widgets file              #
+#  18-Oct-2026 Grid operations are recorded in an active Tcl batch     #
+#  18-Oct-2026 Explicit list of tkinter parts, batched destroy         #
+#  18-Oct-2026 Destructor shared through tcl_batch.py                  #
+#  18-Oct-2026 show_label sets the text in an active Tcl batch         #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
@@ -28,6 +32,7 @@
 # =========== #
 import tkinter as tk
 from tkinter import ttk
+from tkinter_tools.tcl_batch import batched_configure_text, batched_grid, batched_grid_remove, batched_destroy_parts
 
 # =========== #
 #   Classes   #
@@ -46,6 +51,8 @@ class EntryLabelPair:
         :param text: Text to enter into the entry and label, defaults to ""
         :type text: str, optional
         """
+        self._destroyed = False
+        """ If the destructor already destroyed the tkinter widgets """
         self.root = parent
         self.entry = ttk.Entry(self.root)
         """ Tkinter entry """
@@ -60,13 +67,20 @@ class EntryLabelPair:
         self.label.grid(**kwargs)
 
     def __del__(self):
-        """Destructor"""
+        """Destructor, the destroys are recorded in an active Tcl batch"""
         try:
-            self.label.destroy()
-            self.entry.destroy()
+            batched_destroy_parts(self, self.get_tk_widgets())
         except:
             pass
 
+    def get_tk_widgets(self):
+        """get_tk_widgets Get the tkinter widgets which are placed in the parent, destroying these destroys the whole widget
+
+        :return: The tkinter widgets
+        :rtype: list[tkinter widget]
+        """
+        return [self.label, self.entry]
+
     def grid_info(self):
         """Return information about the options for positioning this widget in a grid"""
         return self.label.grid_info()
@@ -86,25 +100,25 @@ class EntryLabelPair:
         sticky=NSEW - if cell is larger on which sides will this
                       widget stick to the cell boundary
         """
-        self.label.grid(**kwargs)
-        self.entry.grid(**kwargs)
+        batched_grid(self.label, **kwargs)
+        batched_grid(self.entry, **kwargs)
 
     def grid_remove(self):
         """Unmap this widget but remember the grid options"""
-        self.label.grid_remove()
-        self.entry.grid_remove()
+        batched_grid_remove(self.label)
+        batched_grid_remove(self.entry)
 
     def show_label(self):
         """Hide the entry widget and show the label widget"""
-        self.entry.grid_remove()
-        # Update the text when switching
-        self.label.configure(text=self.entry.get())
-        self.label.grid()
+        batched_grid_remove(self.entry)
+        # Update the text when switching, in a batch the script reads the entry itself
+        batched_configure_text(self.label, [self.entry])
+        batched_grid(self.label)
 
     def show_entry(self):
         """Hide the label widget and show the entry widget"""
-        self.label.grid_remove()
-        self.entry.grid()
+        batched_grid_remove(self.label)
+        batched_grid(self.entry)
 
     def set(self, text:str=""):
         """set Set the text for both the entry and label
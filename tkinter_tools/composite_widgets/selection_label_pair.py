@@ -5,7 +5,7 @@
 # ============================================= #   #/  #         \#   #
 #  Description:    Custom composite dropdown    #  |#   #   $      #|  #
 #                  label widget.                #  |#   #   #      #|  #
-#  Rev:            1.0                          #   #\  #   #     /#   #
+#  Rev:            1.3                          #   #\  #   #     /#   #
 #                                               #    *= #   #    =+    #
 #                                               #     *++######++*     #
 #                                               #        *-==-*        #
@@ -18,6 +18,9 @@
 #  13-Mar-2023 First release                                           #
 #  11-May-2023 Cleaned up code and added comments                      #
 #  26-May-2023 Migrate from shared composite_widgets file              #
+#  18-Oct-2026 Grid operations are recorded in an active Tcl batch     #
+#  18-Oct-2026 Explicit list of tkinter parts, batched destroy         #
+#  18-Oct-2026 Destructor shared through tcl_batch.py                  #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
@@ -28,6 +31,7 @@
 # =========== #
 import tkinter as tk
 from tkinter import ttk
+from tkinter_tools.tcl_batch import batched_grid, batched_grid_remove, batched_destroy_parts
 
 # =========== #
 #   Classes   #
@@ -52,6 +56,8 @@ class SelectionLabelPair:
         :type command: function, optional
         """
 
+        self._destroyed = False
+        """ If the destructor already destroyed the tkinter widgets """
         self.value = tk.StringVar(parent)
         """ Tkinter variable for holding the selected value """
 
@@ -71,13 +77,20 @@ class SelectionLabelPair:
         self.selectionMenu.grid(**kwargs)
 
     def __del__(self):
-        """Destructor"""
+        """Destructor, the destroys are recorded in an active Tcl batch"""
         try:
-            self.label.destroy()
-            self.selectionMenu.destroy()
+            batched_destroy_parts(self, self.get_tk_widgets())
         except:
             pass
 
+    def get_tk_widgets(self):
+        """get_tk_widgets Get the tkinter widgets which are placed in the parent, destroying these destroys the whole widget
+
+        :return: The tkinter widgets
+        :rtype: list[tkinter widget]
+        """
+        return [self.label, self.selectionMenu]
+
     def grid_info(self):
         """Return information about the options for positioning this widget in a grid"""
         return self.label.grid_info()
@@ -97,23 +110,23 @@ class SelectionLabelPair:
         sticky=NSEW - if cell is larger on which sides will this
                       widget stick to the cell boundary
         """
-        self.label.grid(**kwargs)
-        self.selectionMenu.grid(**kwargs)
+        batched_grid(self.label, **kwargs)
+        batched_grid(self.selectionMenu, **kwargs)
 
     def grid_remove(self):
         """Unmap this widget but remember the grid options"""
-        self.label.grid_remove()
-        self.selectionMenu.grid_remove()
+        batched_grid_remove(self.label)
+        batched_grid_remove(self.selectionMenu)
 
     def show_label(self):
         """Show label and hide the selectionMenu"""
-        self.selectionMenu.grid_remove()
-        self.label.grid()
+        batched_grid_remove(self.selectionMenu)
+        batched_grid(self.label)
 
     def show_input(self):
         """Show selectionMenu and hide the label"""
-        self.selectionMenu.grid()
-        self.label.grid_remove()
+        batched_grid(self.selectionMenu)
+        batched_grid_remove(self.label)
         
     def set_options(self, lNewOptions:list[str], value:str=None):
         """
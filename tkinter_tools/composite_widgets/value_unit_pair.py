@@ -5,7 +5,7 @@
 # ============================================= #   #/  #         \#   #
 #  Description:    Custom composite value unit  #  |#   #   $      #|  #
 #                  pair widget.                 #  |#   #   #      #|  #
-#  Rev:            1.0                          #   #\  #   #     /#   #
+#  Rev:            1.4                          #   #\  #   #     /#   #
 #                                               #    *= #   #    =+    #
 #                                               #     *++######++*     #
 #                                               #        *-==-*        #
@@ -18,6 +18,10 @@
 #  13-Mar-2023 First release                                           #
 #  11-May-2023 Cleaned up code and added comments                      #
 #  26-May-2023 Migrate from shared composite_widgets file              #
+#  18-Oct-2026 Grid operations are recorded in an active Tcl batch     #
+#  18-Oct-2026 Explicit list of tkinter parts, batched destroy         #
+#  18-Oct-2026 Destructor shared through tcl_batch.py                  #
+#  18-Oct-2026 set_label sets the text in an active Tcl batch          #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
@@ -28,6 +32,7 @@
 # =========== #
 import tkinter as tk
 from tkinter import ttk
+from tkinter_tools.tcl_batch import batched_configure_text, batched_grid, batched_grid_remove, batched_destroy_parts
 
 # =========== #
 #   Classes   #
@@ -52,6 +57,8 @@ class ValueUnitPair:
         :param lOptions: list of options available when selecting the units, defaults to list()
         :type lOptions: list[str], optional
         """
+        self._destroyed = False
+        """ If the destructor already destroyed the tkinter widgets """
         self.label = ttk.Label(parent)
         """ Tkinter label """
         self.label.grid(**kwargs)
@@ -76,13 +83,20 @@ class ValueUnitPair:
         self.set(value, unit)
 
     def __del__(self):
-        """Destructor"""
+        """Destructor, the destroys are recorded in an active Tcl batch"""
         try:
-            self.label.destroy()
-            self.inputFrame.destroy()
+            batched_destroy_parts(self, self.get_tk_widgets())
         except:
             pass
 
+    def get_tk_widgets(self):
+        """get_tk_widgets Get the tkinter widgets which are placed in the parent, destroying these destroys the whole widget
+
+        :return: The tkinter widgets
+        :rtype: list[tkinter widget]
+        """
+        return [self.label, self.inputFrame]
+
     def grid_info(self):
         """Return information about the options for positioning this widget in a grid"""
         return self.label.grid_info()
@@ -102,19 +116,19 @@ class ValueUnitPair:
         sticky=NSEW - if cell is larger on which sides will this
                       widget stick to the cell boundary
         """
-        self.label.grid(**kwargs)
-        self.inputFrame.grid(**kwargs)
+        batched_grid(self.label, **kwargs)
+        batched_grid(self.inputFrame, **kwargs)
 
         # Don't change the location of the widgets inside the input frame
-        self.entry.grid()
-        self.optionMenu.grid()
+        batched_grid(self.entry)
+        batched_grid(self.optionMenu)
 
     def grid_remove(self):
         """Unmap this widget but remember the grid options"""
-        self.label.grid_remove()
-        self.entry.grid_remove()
-        self.optionMenu.grid_remove()
-        self.inputFrame.grid_remove()
+        batched_grid_remove(self.label)
+        batched_grid_remove(self.entry)
+        batched_grid_remove(self.optionMenu)
+        batched_grid_remove(self.inputFrame)
 
     def set_label(self, value=None):
         """set_label Update the label text, which is a combination of the text in the entry and the selected value in the selectionMenu
@@ -122,20 +136,21 @@ class ValueUnitPair:
         :param value: string received by the OptionMenu callback. Data enter is not used, defaults to None
         :type value: Nothing, optional
         """
-        self.label.configure(text=self.entry.get() + self.unit.get())
+        # In a batch the script reads the entry and unit itself
+        batched_configure_text(self.label, [self.entry, self.unit])
 
     def show_label(self):
         """show_label Show the label showing the value and unit, hide the entry and selectionMenu
         """
         self.set_label()
-        self.inputFrame.grid_remove()
-        self.label.grid()
+        batched_grid_remove(self.inputFrame)
+        batched_grid(self.label)
 
     def show_input(self):
         """show_label Show the entry and selectionMenu, hide the label
         """
-        self.inputFrame.grid()
-        self.label.grid_remove()
+        batched_grid(self.inputFrame)
+        batched_grid_remove(self.label)
 
     def set(self, value, unit:str):
         """set Set the widget to a specific value unit value
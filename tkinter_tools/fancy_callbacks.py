@@ -12,42 +12,128 @@
 #                  arguments. The CallbackSet   # ==================== #
 #                  group callbacks, making it easier to call many      #
 #                  callbacks in a specific order.                      #
-#  Rev:            2.1                                                 #
+#  Rev:            2.14                                                #
 # ==================================================================== #
 #  Revision history:                                                   #
 #  Date        Description                                             #
 #  13-Mar-2023 Migrated from composite_widgets to own file             #
 #  10-May-2023 Cleaned code and added comments                         #
 #  22-Aug-2023 Added representation to classes                         #
+#  18-Oct-2026 Precompile callbacks into a flat chain of callables     #
+#  18-Oct-2026 Keep the callback order as a linked list of keys        #
+#  18-Oct-2026 Named sets and optional profiling of the call chain     #
+#  18-Oct-2026 Support coroutine callbacks through async_bridge.py     #
+#  18-Oct-2026 Debounce and throttle policies (see rate_limiter.py)    #
+#  18-Oct-2026 Weak callbacks which are dropped once their target dies #
+#  18-Oct-2026 Lazy arguments which are resolved when called           #
+#  18-Oct-2026 Weak widget callbacks die through a <Destroy> binding   #
+#  18-Oct-2026 Read only callback order, kept as tuple until changed   #
+#  18-Oct-2026 LazyArgument is an abstract base class                  #
+#  18-Oct-2026 Checked call chain for runs on another thread           #
+#  18-Oct-2026 Counted default names, profile deferred rate limit runs #
+#  18-Oct-2026 lCallbackOrder is a list like view which can be changed #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
 # ==================================================================== #
 
+# =========== #
+#   Imports   #
+# =========== #
+from abc import ABC, abstractmethod
+from collections.abc import MutableSequence
+from functools import partial
+from itertools import count
+from weakref import ref, WeakMethod, WeakKeyDictionary, WeakSet
+from tkinter_tools.callback_profiler import gProfiler
+from tkinter_tools.rate_limiter import RateLimiter, DEBOUNCE, THROTTLE
+
+# =============== #
+#   Definitions   #
+# =============== #
+_ORDER_ROOT = object()
+""" Marks the start and end of the linked callback order of a CallbackSet """
+_CO_COROUTINE = 0x80
+""" Code flag of functions defined with "async def", equal to inspect.CO_COROUTINE (inspect is not imported to keep the import light) """
+_dWatchedWidgets = WeakKeyDictionary()
+""" Weak callbacks of each widget with a <Destroy> binding, as widget: WeakSet[FancyCallback] """
+_setNumbers = count()
+""" Numbers of the default CallbackSet names, unlike id() a number is never reused """
+
 #=============#
 #   Classes   #
 #=============#
+class LazyArgument(ABC):
+    """
+    Argument of which the value is only looked up when the callback is run, 
+    so callbacks don't need to be updated when the value changes.
+    Subclasses implement resolve.
+    """
+
+    @abstractmethod
+    def resolve(self):
+        """
+        Get the current value of the argument
+
+        :return: The value entered in the callback
+        :rtype: any
+        """
+
 class CallbackSet:
     """
      A grouping of callbacks, allowing them to be called in a predefined order by just running the call_callbacks method.
+     The order is kept as a linked list of keys, so adding, removing, renaming and inserting callbacks does not depend on the size of the set.
     """    
 
-    def __init__(self):
+    def __init__(self, name:str=None, widget=None):
         """
         __init__ Constructor
+
+        :param name: Name under which the callbacks are reported by the profiler (see callback_profiler.py), sets with the same name are combined, defaults to None
+        :type name: string, optional
+        :param widget: Widget of which the Tk interpreter runs coroutine callbacks (see async_bridge.py), if None the default root is used, defaults to None
+        :type widget: tkinter widget, optional
         """ 
                 
+        self.name=name if name is not None else f"CallbackSet_{next(_setNumbers)}"
+        """ Name of the set, used when profiling """
+        self.widget=widget
+        """ Widget of which the Tk interpreter runs coroutine callbacks, None for the default root """
         self.dCallbacks=dict()
         """ Dictionary of callback argument pairs """
-        self.lCallbackOrder=list()
-        """ List of dictionary keys in the order in which the callbacks are run """
+        self._dNextKey={_ORDER_ROOT: _ORDER_ROOT}
+        """ Key of the callback run after each key, _ORDER_ROOT marks the start and end of the order """
+        self._dPreviousKey={_ORDER_ROOT: _ORDER_ROOT}
+        """ Key of the callback run before each key, _ORDER_ROOT marks the start and end of the order """
+        self._tKeys=None
+        """ Tuple of the keys in the order in which the callbacks are run, None when the order has changed """
+        self._tCallChain=None
+        """ Tuple of ready to call callables in the order of lCallbackOrder, None when it needs to be recompiled """
+        self._asyncTask=None
+        """ Task running the coroutine part of the most recent call, None if no coroutine callbacks were run """
+        self._rateLimiter=None
+        """ Debounce or throttle policy of the whole set, None if every call runs the callbacks """
+
+        gProfiler.register(self, unnamed=name is None)
+
+    @property
+    def lCallbackOrder(self):
+        """ List like view of the keys in the order in which the callbacks are run (see CallbackOrder), it can be changed in place like the list it used to be, assigning a list calls set_callback_order """
+        return CallbackOrder(self)
+
+    @lCallbackOrder.setter
+    def lCallbackOrder(self, lKeys:list):
+        self.set_callback_order(lKeys)
 
     def clear_all(self):
         """
         Remove all callbacks
         """        
-        self.lCallbackOrder.clear()
+        self._dNextKey={_ORDER_ROOT: _ORDER_ROOT}
+        self._dPreviousKey={_ORDER_ROOT: _ORDER_ROOT}
         self.dCallbacks.clear()
+        self._tKeys=None
+        self._tCallChain=None
 
     def update_callback_argument(self, key:str, newArguments):
         """
@@ -59,6 +145,7 @@ class CallbackSet:
         :type newArguments: any
         """        
         self.dCallbacks[key].set_argument(newArguments)
+        self._tCallChain=None
 
     def update_callback_key(self, oldKey:str, newKey:str):
         """
@@ -69,25 +156,29 @@ class CallbackSet:
         :param newKey: New key
         :type newKey: string
         """        
-        if oldKey in self.dCallbacks:
-            # Create a new callback argument with the old callback and arguments
-            self.dCallbacks[newKey]=FancyCallback(
-                callback=self.dCallbacks[oldKey].callback, 
-                argument=self.dCallbacks[oldKey].argument
-            )
+        if oldKey in self.dCallbacks and oldKey != newKey:
+            # A callback already using the new key is replaced
+            if newKey in self.dCallbacks:
+                self.remove_callback(newKey)
+
+            self.dCallbacks[newKey]=self.dCallbacks.pop(oldKey)
 
             # Place the new key in the old key's spot
-            self.lCallbackOrder.insert(
-                self.lCallbackOrder.index(oldKey), 
-                newKey
-            )
-            
-            # Delete the old callback
-            self.remove_callback(oldKey)
+            if oldKey in self._dNextKey:
+                previousKey=self._dPreviousKey.pop(oldKey)
+                nextKey=self._dNextKey.pop(oldKey)
+                self._dNextKey[previousKey]=newKey
+                self._dPreviousKey[nextKey]=newKey
+                self._dPreviousKey[newKey]=previousKey
+                self._dNextKey[newKey]=nextKey
+                self._tKeys=None
 
-    def add_callback(self, key:str, callback, arguments=None):
+            self._tCallChain=None
+
+    def add_callback(self, key:str, callback, arguments=None, weak:bool=False):
         """
-        add_callback Add a new callback to the set, it will be run after all other callbacks
+        add_callback Add a new callback to the set, it will be run after all other callbacks.
+        If the key is already used, that callback is replaced.
 
         :param key: Key for the new callback
         :type key: string
@@ -95,9 +186,82 @@ class CallbackSet:
         :type callback: function
         :param arguments: arguments to run in the callback, lists will be in the order of the argument added, defaults to None
         :type arguments: any, optional
+        :param weak: Reference a bound method weakly, it is removed once its object is collected or its widget destroyed, defaults to False
+        :type weak: boolean, optional
+        """
+        self._add(key, FancyCallback(callback, arguments, weak), _ORDER_ROOT)
+
+    def insert_callback(self, key:str, callback, arguments=None, beforeKey:str=None, afterKey:str=None, weak:bool=False):
+        """
+        insert_callback Add a new callback to the set, placed directly before or after an existing callback.
+        If the key is already used, that callback is replaced.
+
+        :param key: Key for the new callback
+        :type key: string
+        :param callback: Callback to attach
+        :type callback: function
+        :param arguments: arguments to run in the callback, lists will be in the order of the argument added, defaults to None
+        :type arguments: any, optional
+        :param beforeKey: Key of the callback before which the new callback is run, defaults to None
+        :type beforeKey: string, optional
+        :param afterKey: Key of the callback after which the new callback is run, only used if beforeKey is None, defaults to None
+        :type afterKey: string, optional
+        :param weak: Reference a bound method weakly, it is removed once its object is collected or its widget destroyed, defaults to False
+        :type weak: boolean, optional
         """
-        self.dCallbacks[key]=FancyCallback(callback, arguments)
-        self.lCallbackOrder.append(key)
+        if beforeKey is not None:
+            nextKey=beforeKey
+        elif afterKey is not None:
+            nextKey=self._dNextKey[afterKey]
+        else:
+            nextKey=_ORDER_ROOT
+
+        if nextKey != _ORDER_ROOT and nextKey not in self._dNextKey:
+            raise KeyError(nextKey)
+
+        self._add(key, FancyCallback(callback, arguments, weak), nextKey)
+
+    def _add(self, key:str, fancyCallback, nextKey):
+        """
+        _add Add a callback to the dictionary and link it into the order
+
+        :param key: Key for the callback
+        :type key: string
+        :param fancyCallback: The callback together with its arguments
+        :type fancyCallback: FancyCallback
+        :param nextKey: Key of the callback which needs to run after the new one, _ORDER_ROOT places it at the end
+        :type nextKey: string
+        """
+        if key in self._dNextKey:
+            if key == nextKey: # Placed before itself, so the position does not change
+                nextKey=self._dNextKey[key]
+            self._unlink(key)
+
+        self.dCallbacks[key]=fancyCallback
+        if fancyCallback.weak:
+            # The set is referenced weakly as well, so the callback does not keep it alive
+            fancyCallback.onDead=partial(_invalidate_call_chain, ref(self))
+
+        previousKey=self._dPreviousKey[nextKey]
+        self._dNextKey[previousKey]=key
+        self._dPreviousKey[key]=previousKey
+        self._dNextKey[key]=nextKey
+        self._dPreviousKey[nextKey]=key
+        self._tKeys=None
+        self._tCallChain=None
+
+    def _unlink(self, key:str):
+        """
+        _unlink Remove a key from the order, the callback itself stays in dCallbacks
+
+        :param key: Key to remove from the order
+        :type key: string
+        """
+        previousKey=self._dPreviousKey.pop(key)
+        nextKey=self._dNextKey.pop(key)
+        self._dNextKey[previousKey]=nextKey
+        self._dPreviousKey[nextKey]=previousKey
+        self._tKeys=None
 
     def remove_callback(self, key:str):
         """
@@ -107,36 +271,234 @@ class CallbackSet:
         :type key: string
         """        
         self.dCallbacks.pop(key)
-        self.lCallbackOrder.remove(key)
+        if key in self._dNextKey:
+            self._unlink(key)
+        self._tCallChain=None
 
     def call_callbacks(self):
         """
-        call_callbacks Run all callbacks in the order of lCallbackOrder
+        call_callbacks Run all callbacks in the order of lCallbackOrder, 
+        with a debounce or throttle policy the run is scheduled instead (see set_debounce and set_throttle)
         """        
-        for key in self.lCallbackOrder:
-            self.dCallbacks[key].call_callback()
+        if self._rateLimiter is not None:
+            self._rateLimiter.request()
+            return
 
-    def get_keys(self):
+        callChain = self._tCallChain
+        if callChain is None:
+            callChain = self.compile()
+
+        for call in callChain:
+            call()
+
+    def call_now(self):
+        """
+        call_now Run all callbacks in the order of lCallbackOrder, ignoring the debounce or throttle policy of the set
+        """
+        callChain = self._tCallChain
+        if callChain is None:
+            callChain = self.compile()
+
+        for call in callChain:
+            call()
+
+    def compile(self):
+        """
+        compile Create the flat chain of callables run by call_callbacks.
+        This happens automatically after the set is changed through its methods, 
+        changes made directly to dCallbacks require a call to this method.
+        Starting at the first coroutine callback, the callbacks are combined into a single task which runs on the asyncio loop of the Tk interpreter.
+
+        Weak callbacks of which the target is gone are removed first.
+
+        :return: Tuple of callables which need no arguments, in the order of lCallbackOrder
+        :rtype: tuple
+        """
+        self.prune()
+
+        tKeys = self.get_keys()
+        if gProfiler.enabled:
+            lCalls = [self.dCallbacks[key].get_call(partial(gProfiler.wrap, self, key)) for key in tKeys]
+        else:
+            lCalls = [self.dCallbacks[key].get_call() for key in tKeys]
+
+        # Callbacks before the first coroutine are run directly, the rest is run in order by a task
+        for index, key in enumerate(tKeys):
+            if self.dCallbacks[key].is_coroutine():
+                lCalls[index:] = [partial(self._run_async, tuple(lCalls[index:]))]
+                break
+
+        self._tCallChain = tuple(lCalls)
+        return self._tCallChain
+
+    def get_background_call(self):
         """
-        get_keys Get the keys of the callbacks in the order in which they're called
+        get_background_call Get a callable which runs the callbacks in the order of lCallbackOrder on another thread (see background_tasks.py).
+        Weak callbacks, rate limit policies and coroutine callbacks rely on the Tk event loop, so a set which uses them is rejected.
 
-        :return: List of keys
+        :raises ValueError: If the set, or one of its callbacks, can only be run on the Tk thread
+        :return: Callable which needs no arguments
+        :rtype: function
+        """
+        if self._rateLimiter is not None:
+            raise ValueError(f"{self.name} has a debounce or throttle policy, which can't be used on another thread")
+
+        for key in self.get_keys():
+            if self.dCallbacks[key].needs_tk_thread():
+                raise ValueError(f"{self.name}: callback {key!r} is weak, rate limited or a coroutine, which can't be used on another thread")
+
+        return partial(_call_in_order, tuple(self.dCallbacks[key].get_call() for key in self.get_keys()))
+
+    def prune(self):
+        """
+        prune Remove the weak callbacks of which the object was collected or the widget destroyed
+
+        :return: Keys of the removed callbacks
         :rtype: list[string]
+        """
+        lDeadKeys = [key for key in self._iterate_keys() if not self.dCallbacks[key].is_alive()]
+        for key in lDeadKeys:
+            self.remove_callback(key)
+
+        return lDeadKeys
+
+    def _run_async(self, tCalls:tuple):
+        """
+        _run_async Schedule the coroutine part of the call chain, it starts after the coroutine part of the previous call has finished
+
+        :param tCalls: Callables which need no arguments, coroutines returned by them are awaited
+        :type tCalls: tuple
+        """
+        # Imported here, asyncio is only loaded once a coroutine callback is used
+        from tkinter_tools.async_bridge import get_async_bridge, run_in_order
+
+        self._asyncTask = get_async_bridge(self.widget).schedule(run_in_order(self._asyncTask, tCalls))
+
+    def set_debounce(self, widget, delay:int, key:str=None):
+        """
+        set_debounce Only run once the calls have stopped for the delay, a burst of calls results in a single run.
+        The run is scheduled in the Tk event loop of the widget.
+
+        :param widget: Widget of which the Tk interpreter schedules the run, runs are dropped once it is destroyed
+        :type widget: tkinter widget
+        :param delay: Quiet time in milliseconds, 0 combines all calls made before Tk becomes idle
+        :type delay: integer
+        :param key: Key of a single callback which needs the policy, if None it applies to the whole set, defaults to None
+        :type key: string, optional
+        """
+        self._set_rate_limit(widget, delay, DEBOUNCE, key)
+
+    def set_throttle(self, widget, interval:int, key:str=None):
+        """
+        set_throttle Run at most once per interval, calls in between are combined into the next run.
+        The run is scheduled in the Tk event loop of the widget.
+
+        :param widget: Widget of which the Tk interpreter schedules the run, runs are dropped once it is destroyed
+        :type widget: tkinter widget
+        :param interval: Minimum time in milliseconds between the start of two runs
+        :type interval: integer
+        :param key: Key of a single callback which needs the policy, if None it applies to the whole set, defaults to None
+        :type key: string, optional
+        """
+        self._set_rate_limit(widget, interval, THROTTLE, key)
+
+    def clear_rate_limit(self, key:str=None):
+        """
+        clear_rate_limit Remove the debounce or throttle policy, a scheduled run is dropped
+
+        :param key: Key of the callback of which the policy needs to be removed, if None the policy of the set is removed, defaults to None
+        :type key: string, optional
+        """
+        if key is not None:
+            self.dCallbacks[key].clear_rate_limit()
+            self._tCallChain=None
+        elif self._rateLimiter is not None:
+            self._rateLimiter.cancel()
+            self._rateLimiter=None
+
+    def _set_rate_limit(self, widget, delay:int, policy:str, key:str):
+        """
+        _set_rate_limit Give the set, or one of its callbacks, a rate limit policy
+
+        :param widget: Widget of which the Tk interpreter schedules the run
+        :type widget: tkinter widget
+        :param delay: Window of the policy in milliseconds
+        :type delay: integer
+        :param policy: DEBOUNCE or THROTTLE (see rate_limiter.py)
+        :type policy: string
+        :param key: Key of a single callback, if None the policy applies to the whole set
+        :type key: string
+        """
+        if key is not None:
+            self.dCallbacks[key].set_rate_limit(widget, delay, policy)
+            self._tCallChain=None
+        else:
+            self.clear_rate_limit()
+            self._rateLimiter=RateLimiter(self.call_now, widget, delay, policy)
+
+    def _iterate_keys(self):
+        """
+        _iterate_keys Walk through the keys in the order in which the callbacks are run
+
+        :return: Generator of keys
+        :rtype: generator
+        """
+        key=self._dNextKey[_ORDER_ROOT]
+        while key is not _ORDER_ROOT:
+            yield key
+            key=self._dNextKey[key]
+
+    def get_keys(self):
+        """
+        get_keys Get the keys of the callbacks in the order in which they're called, 
+        the tuple is kept until the order changes, so repeated calls don't walk the order again
+
+        :return: Tuple of keys
+        :rtype: tuple[string]
         """        
-        return self.lCallbackOrder
+        tKeys=self._tKeys
+        if tKeys is None:
+            tKeys=self._tKeys=tuple(self._iterate_keys())
+        return tKeys
 
     def set_callback_order(self, lKeys:list):
         """
-        set_callback_order Set the callbacks into a new order, if the key provided is not in the dictionary it will be omitted
+        set_callback_order Set the callbacks into a new order, if the key provided is not in the dictionary it will be omitted.
+        Callbacks of which the key is not in lKeys stay in the set, but are not run.
 
         :param lKeys: List of keys in the correct order
         :type lKeys: list
         """        
-        # Clear the list to save the new callback order
-        self.lCallbackOrder.clear()
+        # Clear the order to save the new callback order
+        self._dNextKey={_ORDER_ROOT: _ORDER_ROOT}
+        self._dPreviousKey={_ORDER_ROOT: _ORDER_ROOT}
+        self._tKeys=None
 
         # Create new callback order if the callbacks are present
-        self.lCallbackOrder = [key for key in lKeys if key in self.dCallbacks.keys()]
+        for key in lKeys:
+            if key in self.dCallbacks and key not in self._dNextKey:
+                self._add(key, self.dCallbacks[key], _ORDER_ROOT)
+        self._tCallChain=None
+
+    def __contains__(self, key:str):
+        """
+        Check if a key is in the callback order, so "key in callbackSet" does not need to build a list of keys
+
+        :param key: Key to look for
+        :type key: string
+        :return: If a callback with this key is run by call_callbacks
+        :rtype: boolean
+        """
+        return key in self._dNextKey and key is not _ORDER_ROOT
+
+    def __len__(self):
+        """
+        Amount of callbacks which are run by call_callbacks
+
+        :return: Amount of callbacks
+        :rtype: integer
+        """
+        return len(self._dNextKey) - 1
     
     def __repr__(self):
         """
@@ -147,37 +509,302 @@ class CallbackSet:
         """        
         return "\n".join([f"{index}: {key}-{self.dCallbacks[key]}" for index, key in enumerate(self.lCallbackOrder)])
 
+class CallbackOrder(MutableSequence):
+    """
+    List like view of the callback order of a CallbackSet, changes are made in the linked order of the set.
+    Removing a key (remove, pop, del) only takes the callback out of the order, it stays in dCallbacks, like it did with the old list.
+    Adding a key (append, insert) requires a callback with that key in dCallbacks, a key which is already in the order is moved.
+    Reading goes through the cached tuple of CallbackSet.get_keys, use that in code which only reads the order.
+    """
+
+    def __init__(self, callbackSet:CallbackSet):
+        """
+        Constructor
+
+        :param callbackSet: Set of which the order is viewed
+        :type callbackSet: CallbackSet
+        """
+        self.callbackSet = callbackSet
+        """ Set of which the order is viewed """
+
+    def __getitem__(self, index):
+        tKeys = self.callbackSet.get_keys()
+        return list(tKeys[index]) if isinstance(index, slice) else tKeys[index]
+
+    def __setitem__(self, index, value):
+        lKeys = list(self.callbackSet.get_keys())
+        lKeys[index] = value
+        self.callbackSet.set_callback_order(lKeys)
+
+    def __delitem__(self, index):
+        tKeys = self.callbackSet.get_keys()
+        for key in (tKeys[index] if isinstance(index, slice) else (tKeys[index],)):
+            self.callbackSet._unlink(key)
+        self.callbackSet._tCallChain = None
+
+    def __len__(self):
+        return len(self.callbackSet)
+
+    def __iter__(self):
+        return iter(self.callbackSet.get_keys())
+
+    def __contains__(self, key):
+        return key in self.callbackSet
+
+    def insert(self, index:int, key:str):
+        """
+        insert Place the callback of a key in the order before index, the same as list.insert
+
+        :param index: Position in the order
+        :type index: integer
+        :param key: Key of a callback in dCallbacks
+        :type key: string
+        """
+        callbackSet = self.callbackSet
+        tKeys = callbackSet.get_keys()
+        index = index + len(tKeys) if index < 0 else index
+        nextKey = tKeys[max(0, index)] if index < len(tKeys) else _ORDER_ROOT
+        callbackSet._add(key, callbackSet.dCallbacks[key], nextKey)
+
+    def reverse(self):
+        """
+        reverse Reverse the order in a single step
+        """
+        self.callbackSet.set_callback_order(self.callbackSet.get_keys()[::-1])
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, CallbackOrder)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self.callbackSet.get_keys()))
+
 class FancyCallback:
     """
     Class holding both the callback and arguments which need to be placed in the callback at runtime
     """    
 
-    def __init__(self, callback, argument=None):
+    def __init__(self, callback, argument=None, weak:bool=False):
         """
         Constructor
 
         :param callback: The callback
         :type callback: function
-        :param argument: Arguments, if the arguments are in a list, the order of the items will be the order in which they are entered, defaults to None
+        :param argument: Arguments, if the arguments are in a list, the order of the items will be the order in which they are entered.
+            LazyArgument objects are resolved each time the callback is run, defaults to None
         :type argument: any, optional
+        :param weak: Reference a bound method weakly, so the callback does not keep its object alive.
+            The callback dies once the object is collected or, for a widget, once the widget is destroyed.
+            Functions are always referenced normally, defaults to False
+        :type weak: boolean, optional
         """        
         
+        self.weak=weak
+        """ If a bound method callback is referenced weakly """
+        self.onDead=None
+        """ Called without arguments once the target of a weak callback is gone, set by the CallbackSet holding this callback """
+        self._argument=argument
+        self._rateLimiter=None
         self.callback=callback
-        """ The callback which is run at call_callback() """
-        self.argument=argument
+
+    @property
+    def callback(self):
+        """ The callback which is run at call_callback(), None if the target of a weak callback is gone """
+        if self._reference is not None:
+            return self._reference()
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback):
+        self._dead=False
+        if self.weak and hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            self._callback=None
+            self._reference=WeakMethod(callback, self._on_collected)
+            _watch_widget(callback.__self__, self)
+        else:
+            self._callback=callback
+            self._reference=None
+        self._call=self._create_call()
+        self._isCoroutine=_is_coroutine_function(callback)
+
+    @property
+    def argument(self):
         """ The arguments, this can contain no arguments, 1 argument or a list """
+        return self._argument
+
+    @argument.setter
+    def argument(self, argument):
+        self._argument=argument
+        self._call=self._create_call()
+
+    def _create_call(self):
+        """
+        Bind the arguments to the callback, so the way the arguments are entered is only decided once.
+        Lists are exploded at this moment, later changes made to the same list object are not seen by the callback.
+
+        With a rate limit policy the callable requests a call from the rate limiter instead.
+
+        :return: Callable which needs no arguments
+        :rtype: function
+        """
+        if isinstance(self._argument, list):
+            self._tArguments = tuple(self._argument)
+        elif self._argument is not None:
+            self._tArguments = (self._argument,)
+        else:
+            self._tArguments = ()
+
+        self._hasLazyArguments = any(isinstance(argument, LazyArgument) for argument in self._tArguments)
+
+        if self._reference is not None:
+            call = self._call_weak
+        elif self._hasLazyArguments:
+            call = partial(_call_with_lazy_arguments, self._callback, self._tArguments)
+        elif len(self._tArguments) > 0:
+            call = partial(self._callback, *self._tArguments)
+        else:
+            call = self._callback
+
+        self._directCall = call
+        if self._rateLimiter is not None:
+            self._rateLimiter.call = call
+            return self._rateLimiter.request
+
+        return call
+
+    def get_call(self, wrap=None):
+        """
+        Get the callback with its arguments already bound to it
+
+        :param wrap: Function which wraps the run of the callback, for example to time it (see CallbackProfiler.wrap).
+            With a rate limit policy the deferred run made by the rate limiter is wrapped, not the request, defaults to None
+        :type wrap: function, optional
+        :return: Callable which needs no arguments
+        :rtype: function
+        """
+        if self._rateLimiter is not None:
+            self._rateLimiter.call = self._directCall if wrap is None else wrap(self._directCall)
+            return self._call
+
+        return self._call if wrap is None else wrap(self._call)
+
+    def is_coroutine(self):
+        """
+        Check if the callback is a coroutine function (defined with "async def")
+
+        :return: If calling the callback returns a coroutine, False with a rate limit policy since the rate limiter schedules the coroutine
+        :rtype: boolean
+        """
+        return self._isCoroutine and self._rateLimiter is None
+
+    def needs_tk_thread(self):
+        """
+        Check if the callback relies on the Tk event loop, so it can't be run on another thread
+
+        :return: True for a weak callback, a callback with a rate limit policy or a coroutine callback
+        :rtype: boolean
+        """
+        return self._reference is not None or self._rateLimiter is not None or self._isCoroutine
+
+    def is_alive(self):
+        """
+        Check if the callback can still be run, only weak callbacks can die
+
+        :return: False if the object of a weak callback was collected or its widget destroyed
+        :rtype: boolean
+        """
+        return not self._dead
+
+    def _call_weak(self):
+        """
+        Run a weak callback if its target is still alive
+
+        :return: Result of the callback, None if the target is gone
+        :rtype: any
+        """
+        if self._dead:
+            return None
+
+        callback = self._reference()
+        if callback is None: # Collected, the finalizer of the reference marks the callback as dead
+            return None
+
+        if self._hasLazyArguments:
+            return _call_with_lazy_arguments(callback, self._tArguments)
+        return callback(*self._tArguments)
+
+    def _on_collected(self, reference):
+        """
+        Called by the weak reference when the object of the callback is collected
+
+        :param reference: The dead weak reference
+        :type reference: weakref.WeakMethod
+        """
+        self._mark_dead()
+
+    def _mark_dead(self):
+        """
+        Mark the callback as dead and inform its owner
+        """
+        self._dead = True
+        if self.onDead is not None:
+            self.onDead()
 
     def call_callback(self):
         """
-        Run the callback saved in this object, together with the provided arguments
+        Run the callback saved in this object, together with the provided arguments.
+        For a coroutine callback this returns the coroutine, which still needs to be awaited or scheduled
         """        
-        
-        if isinstance(self.argument, list):
-            self.callback(*self.argument)
-        elif self.argument is not None:
-            self.callback(self.argument)
-        else:
-            self.callback()
+        return self._call()
+
+    def set_debounce(self, widget, delay:int):
+        """
+        Only run once the calls have stopped for the delay, the run is scheduled in the Tk event loop of the widget.
+        A CallbackSet holding this callback needs to be compiled afterwards, CallbackSet.set_debounce does this automatically.
+
+        :param widget: Widget of which the Tk interpreter schedules the run, runs are dropped once it is destroyed
+        :type widget: tkinter widget
+        :param delay: Quiet time in milliseconds, 0 combines all calls made before Tk becomes idle
+        :type delay: integer
+        """
+        self.set_rate_limit(widget, delay, DEBOUNCE)
+
+    def set_throttle(self, widget, interval:int):
+        """
+        Run at most once per interval, the run is scheduled in the Tk event loop of the widget.
+        A CallbackSet holding this callback needs to be compiled afterwards, CallbackSet.set_throttle does this automatically.
+
+        :param widget: Widget of which the Tk interpreter schedules the run, runs are dropped once it is destroyed
+        :type widget: tkinter widget
+        :param interval: Minimum time in milliseconds between the start of two runs
+        :type interval: integer
+        """
+        self.set_rate_limit(widget, interval, THROTTLE)
+
+    def set_rate_limit(self, widget, delay:int, policy:str=DEBOUNCE):
+        """
+        Give the callback a rate limit policy, replacing the current one
+
+        :param widget: Widget of which the Tk interpreter schedules the run
+        :type widget: tkinter widget
+        :param delay: Window of the policy in milliseconds
+        :type delay: integer
+        :param policy: DEBOUNCE or THROTTLE (see rate_limiter.py), defaults to DEBOUNCE
+        :type policy: string, optional
+        """
+        self.clear_rate_limit()
+        self._rateLimiter=RateLimiter(None, widget, delay, policy)
+        self._call=self._create_call()
+
+    def clear_rate_limit(self):
+        """
+        Remove the rate limit policy, a scheduled run is dropped
+        """
+        if self._rateLimiter is not None:
+            self._rateLimiter.cancel()
+            self._rateLimiter=None
+            self._call=self._create_call()
 
     def set_argument(self, argument=None):
         """
@@ -195,4 +822,101 @@ class FancyCallback:
         :return: String of how this object should be represented
         :rtype: string
         """        
-        return f"{self.callback.__name__}(" + ", ".join(self.argument) if isinstance(self.argument, list) else str(self.argument) + ")"
\ No newline at end of file
+        return f"{self.callback.__name__}(" + ", ".join(self.argument) if isinstance(self.argument, list) else str(self.argument) + ")"
+
+# =========== #
+#   Methods   #
+# =========== #
+def _invalidate_call_chain(callbackSetReference):
+    """
+    Make a CallbackSet recompile, so its dead weak callbacks are removed.
+    This can run during garbage collection, so the set itself is not changed here.
+
+    :param callbackSetReference: Weak reference to the set
+    :type callbackSetReference: weakref.ref
+    """
+    callbackSet=callbackSetReference()
+    if callbackSet is not None:
+        callbackSet._tCallChain=None
+
+def _call_in_order(tCalls:tuple):
+    """
+    Run callables in order, used for runs on another thread
+
+    :param tCalls: Callables which need no arguments
+    :type tCalls: tuple
+    """
+    for call in tCalls:
+        call()
+
+def _call_with_lazy_arguments(callback, tArguments:tuple):
+    """
+    Run a callback after resolving its lazy arguments
+
+    :param callback: The callback
+    :type callback: function
+    :param tArguments: Arguments, LazyArgument objects are replaced by their current value
+    :type tArguments: tuple
+    :return: Result of the callback
+    :rtype: any
+    """
+    return callback(*[argument.resolve() if isinstance(argument, LazyArgument) else argument for argument in tArguments])
+
+def _watch_widget(target, fancyCallback):
+    """
+    Mark a weak callback as dead once its widget is destroyed, each widget gets a single <Destroy> binding for all its weak callbacks.
+    Objects which are not widgets only die when they are collected.
+
+    :param target: Object to which the bound method belongs
+    :type target: any
+    :param fancyCallback: Weak callback of the object
+    :type fancyCallback: FancyCallback
+    """
+    if not hasattr(target, "winfo_exists") or not hasattr(target, "bind"):
+        return
+
+    weakCallbacks = _dWatchedWidgets.get(target)
+    if weakCallbacks is None:
+        try:
+            target.bind("<Destroy>", partial(_on_widget_destroyed, ref(target)), add="+")
+        except Exception: # tkinter is not imported, TclError is raised for a destroyed widget or once the interpreter is gone
+            fancyCallback._dead = True
+            return
+        weakCallbacks = _dWatchedWidgets[target] = WeakSet()
+    weakCallbacks.add(fancyCallback)
+
+def _on_widget_destroyed(widgetReference, event):
+    """
+    Mark the weak callbacks of a destroyed widget as dead, bound to <Destroy> by _watch_widget
+
+    :param widgetReference: Weak reference to the widget
+    :type widgetReference: weakref.ref
+    :param event: Destroy event, for a toplevel it is also received when one of its children is destroyed
+    :type event: tkinter.Event
+    """
+    widget = widgetReference()
+    if widget is None or str(event.widget) != str(widget):
+        return
+
+    for fancyCallback in list(_dWatchedWidgets.pop(widget, ())):
+        fancyCallback._mark_dead()
+
+def _is_coroutine_function(callback):
+    """
+    Check if a callback is a coroutine function, also looks through bound methods and functools.partial objects
+
+    :param callback: The callback to check
+    :type callback: function
+    :return: If calling the callback returns a coroutine
+    :rtype: boolean
+    """
+    while True:
+        if isinstance(callback, partial):
+            callback=callback.func
+        elif hasattr(callback, "__func__"):
+            callback=callback.__func__
+        else:
+            break
+
+    code=getattr(callback, "__code__", None)
+    return code is not None and bool(code.co_flags & _CO_COROUTINE)
\ No newline at end of file
@@ -0,0 +1,160 @@
+# ==================================================================== #
+#  File name:      rate_limiter.py              #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Debounce and throttle        #  |#   #   $      #|  #
+#                  policies, collapsing bursts  #  |#   #   #      #|  #
+#                  of calls into a single call  #   #\  #   #     /#   #
+#                  scheduled in the Tk event    #    *= #   #    =+    #
+#                  loop.                        #     *++######++*     #
+#  Rev:            1.0                          #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+from time import monotonic
+
+# =============== #
+#   Definitions   #
+# =============== #
+DEBOUNCE = "debounce"
+""" Call once the requests have stopped for the delay """
+THROTTLE = "throttle"
+""" Call at most once per delay, requests in between are combined into the next call """
+
+#=============#
+#   Classes   #
+#=============#
+class RateLimiter:
+    """
+    Collapses repeated requests into a single call, scheduled with after() or after_idle() of the Tk interpreter.
+    Only one call is scheduled at a time, so a burst of requests costs a time lookup per request instead of a run of the callbacks.
+    tkinter is not imported, the widget provides access to the Tk interpreter.
+    """
+
+    def __init__(self, call, widget, delay:int, policy:str=DEBOUNCE):
+        """
+        Constructor
+
+        :param call: Callable which needs no arguments, a returned coroutine is run on the asyncio loop of the Tk interpreter
+        :type call: function
+        :param widget: Widget of which the Tk interpreter schedules the call, requests are ignored once it is destroyed
+        :type widget: tkinter widget
+        :param delay: Window in milliseconds, 0 collapses all requests made before Tk becomes idle
+        :type delay: integer
+        :param policy: DEBOUNCE or THROTTLE, defaults to DEBOUNCE
+        :type policy: string, optional
+        """
+        if policy not in (DEBOUNCE, THROTTLE):
+            raise ValueError(f"Unknown rate limit policy '{policy}', use '{DEBOUNCE}' or '{THROTTLE}'")
+
+        self.call=call
+        """ Callable which needs no arguments """
+        self.widget=widget
+        """ Widget of which the Tk interpreter schedules the call """
+        self.delay=delay
+        """ Window in milliseconds """
+        self.policy=policy
+        """ DEBOUNCE or THROTTLE """
+        self._afterId=None
+        """ Id of the scheduled call, None if no call is pending """
+        self._lastRequest=0.0
+        """ Time of the most recent request, in seconds of time.monotonic() """
+        self._lastCall=float("-inf")
+        """ Time of the most recent call, in seconds of time.monotonic() """
+
+    def request(self):
+        """
+        Request a call, it is made once the window of the policy has passed
+        """
+        self._lastRequest=monotonic()
+
+        if self._afterId is None:
+            if self.policy == DEBOUNCE:
+                self._schedule(self.delay)
+            else:
+                self._schedule(int(max(0.0, self.delay - (self._lastRequest - self._lastCall) * 1000)))
+
+    def is_pending(self):
+        """
+        Check if a call is scheduled
+
+        :return: True if a call is scheduled
+        :rtype: boolean
+        """
+        return self._afterId is not None
+
+    def flush(self):
+        """
+        Make the scheduled call right away, does nothing if no call is pending
+        """
+        if self._afterId is not None:
+            self.cancel()
+            self._call()
+
+    def cancel(self):
+        """
+        Drop the scheduled call
+        """
+        if self._afterId is not None:
+            self.widget._root().after_cancel(self._afterId)
+            self._afterId=None
+
+    def _schedule(self, delay:int):
+        """
+        Schedule _fire, on the root so the call is not lost when the widget's Tcl commands are removed
+
+        :param delay: Time in milliseconds, at most 0 schedules it for when Tk is idle
+        :type delay: integer
+        """
+        root=self.widget._root()
+        if delay > 0:
+            self._afterId=root.after(delay, self._fire)
+        else:
+            self._afterId=root.after_idle(self._fire)
+
+    def _fire(self):
+        """
+        Make the call, unless a debounce window was extended by later requests
+        """
+        self._afterId=None
+
+        # Instead of rescheduling at every request, the call checks once if it came too early
+        if self.policy == DEBOUNCE:
+            remaining=self.delay - int((monotonic() - self._lastRequest) * 1000)
+            if remaining > 0:
+                self._schedule(remaining)
+                return
+
+        if self.widget.winfo_exists():
+            self._call()
+
+    def _call(self):
+        """
+        Run the callable, coroutines are handed to the asyncio loop since nobody awaits the result
+        """
+        self._lastCall=monotonic()
+        result=self.call()
+
+        if hasattr(result, "__await__"):
+            # Imported here, asyncio is only loaded once a coroutine callback is used
+            from tkinter_tools.async_bridge import get_async_bridge
+            get_async_bridge(self.widget).schedule(result)
+
+    def __repr__(self):
+        """
+        Representation of this class when it is printed or viewed in debugger window
+
+        :return: String of how this object should be represented
+        :rtype: string
+        """
+        return f"{self.policy} {self.delay} ms, pending: {self.is_pending()}"
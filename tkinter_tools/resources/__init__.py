@@ -1,8 +1,45 @@
 import base64
+import importlib
 from io import BytesIO
-import tkinter_tools.resources._encoded_images as assets
+from tkinter_tools.resources._encoded_images import ASSET_NAMES
+
+class _AssetRegistry:
+    """
+    Lazily resolved embedded assets, accessed as attributes (assets.plus_icon).
+    Each asset is stored in its own module, which is only imported when the asset is requested.
+    """
+
+    def __getattr__(self, name:str):
+        """
+        Import the requested asset, only called the first time an asset is requested
+
+        :param name: Name of the asset
+        :type name: string
+        :return: Base64 encoded image data
+        :rtype: bytes
+        """
+        if name not in ASSET_NAMES:
+            raise AttributeError(f"No embedded asset named '{name}'")
+
+        data = importlib.import_module(f"tkinter_tools.resources._encoded_images.{name}").data
+        setattr(self, name, data) # Following requests won't reach __getattr__
+        return data
+
+    def __dir__(self):
+        """
+        List the names of all embedded assets, without importing them
+
+        :return: Names of the assets
+        :rtype: list[string]
+        """
+        return list(ASSET_NAMES)
+
+assets = _AssetRegistry()
+""" All embedded assets, resolved on first access """
 
 def decode_image(data):
     """Return texture object from base64 encoded data"""
     im_bytes = base64.b64decode(data) # im_bytes is a binary image
-    return BytesIO(im_bytes)          # convert image to file-like object
\ No newline at end of file
+    return BytesIO(im_bytes)          # convert image to file-like object
+
+from tkinter_tools.resources.icons import get_icon, get_display_scale, release_icons, DEFAULT_ICON_SIZE
\ No newline at end of file
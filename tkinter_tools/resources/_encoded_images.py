@@ -1,30 +0,0 @@
-# ==================================================================== #
-#  File name:      _encoded_images.py           #        _.==._        #
-#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
-#  Date:           2023-08-22 11:22:09.596448  #    *= #        =*    #
-# ============================================= #   #/  #         \#   #
-#  Description:    Embedded data for images in  #  |#   #   $      #|  #
-#                  ./assets/                    #  |#   #   #      #|  #
-#                  This file is automatically   #   #\  #   #     /#   #
-#                  generated using the          #    *= #   #    =+    #
-#                  _image_encoder.py script.    #     *++######++*     #
-#                                               #        *-==-*        #
-# ==================================================================== #
-
-
-eye_icon = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAWiElEQVR42u2de4yX1ZnHPwyIAjtyEStZK9gBISxFgoDsApo4oAgWYxVlzWo1a1FLBdFmK4qtjW3XVWlBXAl2pepSFmFVoqz1hpvIJWKjgKYKCFSgtOKNckeG2/5xntkMUwYGfue87znv7/tJTkKGmfd9z3Oe570857mAEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCFEflQC5wADgRHADcBdwCTgP4A5wMvAImAp8A7wno137GeL7Hfm2N9MsmPcYMccaOeolLiFyIfTgfOBkcBEYJYZ7zrgc6AGOBRo1Ng51tk5Z9k1jLRrOl3LI4Q/WgJ9geuBXwILgY3A7oBGfqJjt13bQrvW6+3aW2oZhWgcpwD9gTHAbGA1sCtCY2/s2GVzmG1z6m9zFEIYHYFrgOnAh8CehA3+WGOPzXG6zbmjll+UI92Bm4EXgc0FNvhjjc0mg9EmEyEKS5Up+qvAljI2+obGFpPNaJOVEMnTBuchfxb4TEbe6PGZyWykyVCIpOgLPAiskTGXPNaYLPtKrUTMVNoT6yXS9tzHvKPwkslYgUgiGjriouU+kJFmNj4wmWsXQeRGD1yo7CcyyNzGJ7YGPaSOIivOA2YAW2WA0YyttibnST1FSMfeU8BOGVy0Y6etkRyGwhu9gKfl2EvOYfi0rZ0QJ0Q34DFge0GN5GC9UcQ5brc17CZ1Fo2lA/Bz4IsEFX43LlV3MS6QZjpwH3ArMAq4FBgA9AZ6mmF0s3/3tv8bZr97q/3tdDvWYjv27gTl8oWtaQept2iIlsAtwNpElHoTsAB4HBgHXIQLoW0PNA8gn+Z27Co71zg79wK7lhRkttbWWCnK4jCG2hMuVsWtAX4PzATG4tJqzwAqIpBdhV1Lf7u2mXatNRHLc7GtuShzzjGvcYzKugl43ozqXKB1QnJtbdc81uawKdKb6lOmA6LMaAXcSXypuCuBacBwe6oWhTNsTtNsjrGlJN9pOiHKgAtwZatiUcCPgEeBasoj862NzfVRm3ss67DQdEMUlPbAw8RRcedzXEHNK4C2ZbwmbU0Gs0wmMVQseth0RRSI4cD7ESjY28APgE5akr+ik8nm7QjW6X3TGZE4pwOP5Ozk2w7Mxe3Bt9CSHJMWJqu55BuEVWO6o1LniXIJsIJ8vfgPo0y1UuhhMsxzF2GF6ZJIhErgAWBvTgqzGrgbOFNL4Y0zTaarc1rTvcC/okIk0dMbeJP8tvDGAe20DMFoZzLOayvxTdMxERkVuMYTW3Iy/LGoeGWWtDGZ53Ej2GK6VqFliIMOuPDTrBVhA64sVVstQW60tTXYkMP6z0TJRblzAa67bdaZZQ/oGz86H8EDZJ/B+R4KHsrtlf92YAfZbgv9hmJ49SuAZvVGEV5pe9gaZbntu8N0UZ8EGXEa8CTZh4lenJicKnEVca40BZ0MzAHeAJbZ9/M6GyvtZ2/Y70y2v7nSjpGa9/tisg/3ftJ0UwTkXFxf+iy/878HnJyAbFoDg3HbZfNxrbp9vCHtsGPNt2MPJo3MxJNt7bL0Dyw1HRUBuIbssvf24opdxF53vh0uln4GsB7Yn4Fs9tu5Zti5Y9/27GhrmVVcyGbTVeGJZsC9wL6MFnAZ8ReL6Ierh/8x+cfNf2zX0i9ymQ21tc1CJvtMZ5vJfEt/wj2d0aJtA+6P+Hu3wpR4HnHW5dtt1zY0YodYpa3xtoxk8jQKDDthupJdma7FuIKYsTIEeBk4EKHh1x8H7FqHRCzPARnrVleZ8/FxIc47nUWm3o+Jt0hkT+CZjL7tQ/gKnrE5xEhLW/ssMg7XmU6LRnAt2YT0/g4YFPGr6kSK0X5sq80l1k+rQaYLWYQQXyvzbpgmwA8zcPbV4Pa5T43YwbekAIZffyyJ2FF4qulE6ACifabjTWTuh3MKMCUDJVwLXB6xk29chg6qPMY2m2OsTsLLyaYvxBTTeYFL6JidgdDnAWdHKoM8ohvzHDFHzZ1tuhJaBrNRIhlnAq8TPlZ7AtA0UhlUFfSVvzGfBFWRrklT05nQuSavU8ZJZV2BdwMLeDWuBHWs9CW/KjcxjNXE3cq7OoP1eZcy3CbsDawKLNgXiTuUdxDp9NQLXTtxUMTr1NF0KaQMVlFGlYYuIGyCRg3wM8I0yPTFQOLrSpR3d56BEa9Xc9OpkLsEGyiD2gLDgE8DK9KoyGXQJ4In/z7gK1wjjD32733k/ybQJ/K1GxX4xv2p2UghuYqwgS0rElCgzsCaDI3qgBnWb3FbT2OAy+y7uwtwlo0u9rPL7Hem2N9sItvw4zUmo9hv4CsIGzh1VdGM/9rAHtXniL8+W9uMvP0HgeXAQ+bEaseJBZ40sb+ttmMtt2NnsTsQ+/ZYB9O5kDtXhYkavJFw2WsHcamozSOXQVPC7/NvxRWqHEKY3IaWduyZhA9RfpJ4t23r+gUmBbwp7jbbSZqbCVeIYSdwWyJyGBfY8B8Dumc4n+52zpA3gnGJrO1tpouhCtPcnKrx3xLQa/on4FuJyKEf4cJ7nyff7aPedg2hwob7JbLG3zKdDLWrdYue/IfvmfZJRA6tgLcCyGAjcD1xJJU0sWvZGGCeb5kMU6AP4WJbalJ6Exgd0PgXEW/46JG4J4AMXiXOyLGudm2+53tPQutdZToa6nNgdOwC+G5A43+OtMou9wjwjfwIcbcYb2HX6NvHkVIvhtMIt0Ow12wsSr6DCygJMfFfRa749anA1df3WV1nQkLzn4DfKkZzSKvxRgvT2RC28JXZWlRcE9AT+iDpdV0Z4tEBuh8Yn6ATeLzHm0ANcdcYbOgh8CDhdsCiKT1+OWG83PsSe+rV0gx4zaMcUpRB3TcBX3J4jTTLbE8gTJj1NiIobnMJ8GWg15wxiSr9UI9Pvqmkz1SPb0JDE5XBmECfx1+aDebCAMIkRuwg3QioJsALHp94LQtwA2jp8Y3oBdKtp3cjYcLhN5NDSftzce2hfE/mL8DVCSt7H1x2nY/MuM4Uh874yYDcQzoxIEfiatNx33azngx7ElYRJuDhS2BE4oo+yYMcDgDXUTyuw09m4aTE5TAi0GfzKjKIkflb4J0AF/8F6edBt/X0VjSP+BNhToSm+Cm2uZ70i2kOM533bUfvmI0GU/AFAS760zwdGR65gtIzw7YDvSguvSi9E89Bk3XqXEKY4jgLQtwgW+DaPIUw/uqCKPevPchjGsVnmgc5/bogsqgOdBN4Bo+BcxX428qpOz4nveCOhjiV0uscbgW6lcENoBulh0ivJ97OTsfLELMF3/Y1FU8BdD8K9M0/tEBKXU3pwR4zKR9mUnqQWHWB5DE0kE/gR6Ve2HfxXxPuS2B4wRT6bkoPcqkuoxtANaUHS91dMJkMx//uwAFKSB4ajv/AhW0FceDUZ36JcllOWslOPnxKy0uU2fwCyuUK/IfV7ziRB+55wJ89X8guitkeuZLSi2E8RPnxUIky20i8LcdL4VqzFZ+292ez6UbREfgQ/7H9NxVUkXtRWibkAeCiMrwBXFTi5+VOirtlehP+cwc+pBGdstoA/+v5xPuBsQVW5G9TethvuzK8AbSj9PDgbxdYPmPxW1OhNkbgqLsn0/Dviby34Io8vkT5vEwxI/+ORVObeymyG19wGd0bwB5/1tDJLsZ/Fd9JZaDIk0uU0RTKlyklym5yGchokmeb3Ap8s/5JmgGveD7RE8BJZbBAc0uU05gyvgGMKVF2c8tARieZLfm0zSlHcmT57N7zPOmUcy6VUvMjLivjG8BlHr5py4FW+O2/sMr8ff/P9z0efBHQvkwWpgJYRmkRbX3K+AbQh9IiKJeRXr3IE6U9/kqO1wD96x58hqcDfwB0KjNH1kpK2x7tUsY3gC6Utt21kvJyoHYyG/Nhq4fF5Pj4/v8jadVv9/V9tq4Eme0Bvl7GN4CvU1oFpXVl4meqSw+zNa+9FxfoBqAbgG4A5XsDmIs+AfQJoE+Asv0EuF9OwNycgH3L+AbQV07AOJyAQ/G7z6htQG0DNgZtAzaO4NuArfFf6VeBQAoEOhYKBGqcnyl4IBDAv+A/7lihwAoFPhpTUCjwscgkFBh7JXgXJQMdL+NRMtCJoGSgY5NpMhDAP+C/NpnSgZUOfCSUDnx0ckkHBhiF/2IEKgiigiD1UUGQhsmtIEgtdwR49VBJMJUEq4tKgh2Z3EuC1fJwgJuAioKqKCioKGhDXEEkRUEBTgZmBbgJqCy4yoIPRmXB6xNdWXAI1w9QjUHUGKTUSDY1BsmgMQi4bqPLAlxc0VqDraf0/Vm1BlNrsOhagwF0BdYGuEg1B1VzUDUHjbw5aC398N8sRO3B1R5c7cETaA9e91vlL4F8AsMSX9C2Hj4DDgHzKGZkYFObW6nyWR9SwTNiWKBv/nfskz0oV+N/n7J2d2BE4gvrI277AHBdAW8A1+Gn0Wzq+SUj8O/tr83wq8pqEv+M/x4Ch+zt4uqEF7cPpVW4qRse3LlAxt+Z0sN+aysopVxE9epAb9DrgXOznsztHr55GwpcuDHRBW4CvOBJDq8BLQtg/C1tLj5k8oLJOEVuxH+37UPAZmBAXpOaGGBCtbkDqebJD8VfEsfUAtwApuIvqSzV2JEx+I/tr/1szt2B/tNAN4F9wIQEF7uZxyfeoURlUMsEj3J4zWSbogz2ESas/vJYXnsfDHQTOGTHTq3u2xCPPpL9pJn3Pt7jm1AN6QWNVQS0i53ANTFNtimlV3c52vgVaSXLVABzPM5/f2JvAhPwm8s+J7GHQAvT2VCfx9+JcdInEaa9eO14DjgtISXoQekhr/XHI5HfCFvYNfouYZVSv4nTTFdD2MBeIq+r0TzwTWARGe51euCeADJ4FReaHRtd7dp8z/eehNa7Cn+lu49k/KNTEEJz4LGAN4FVpLMX3Ap4K4AMNgLXE8eWWBO7lo0B5vkW6ZSX74P/ytp1jf/mlBwgzYF/D3gT+BPp1NPvh/8iD3X7L/TOcW698Vuvvr6Xu18ia3yZ6WQIOdQAtyToBKY5/vaAG/KE3paILMYFlMNWe+PqnuF8uts5twac17hE1vY2SqsJWagnf32aEaa0WN3MsEl2s4mZpsCTAeVQeyOYidsuCxFB2NKOPTOw4R8yWcWeENXcdO9gIBnsJt2I2MOoIFywUN0dgg6Ry6EtsCSwHGpvistxRTerceW3T8RX0MT+ttqOtTygstcdS4g/268D4Tz9teHwhSugOzGw4qxIwDnYGViTgRHVzSzcBPwWF6cxBld7rg+uM+9ZNrrYz4bb70yxv9mEnwy+xo41xJ8E1cd0LeSb3FUUlDvw3+ygfmLEqAQUaFOGRtVQmPVXuOy6PfbvfTlf06YEbuCjTMdCyeBT0q+LcUxuIkw9gbpe059G7hcYGFiRUhubTSYxf+//lDAp8LVjA3ABZcJIYEtgpXqR4+iEkgODIngTiGFsMlnESkfTpZAyWEW+27m5cAlhagzWHauJu+hoX7vGcjX+1SaDWKnOYH3eJc7IzswMYGVgAe/AJafEuq1UldHuQGxjCfGGdTc1ndkRWAavA2dS5lQBSzNQuHnA2ZHK4DTCxwnENJ4k3sSus/FTvPRYYzbpFzf1xtcovb9eY8ZaIimicAQqcNFv2wps+NtsjrGm9l5OmP4X9ccU4BSZ/eH8DTA9A+HXAJOJt7NMv4J+Eiwh3tj+U00nagi//fpD0q1rmMlT8G7CxgrUjt9F7H2uxAVObS2A4W+1ucTaynuQ6UJoOWyhgNF9ofgnwpRPPlInnh8Tb/Xdnrg2T/sTNPz9du09I5VtS1v77RnIYh1wocz6+LgQ+CgjZV1MjqWVG8EQ4GWyDcstJfz4ZeKu4TfA1jwr3eoqcz4xqoA3MnRQ3R/xq2oFriz2PFymWGyGv9uubWjETr5KW+OsHK1P4xKqRIkOmukZKvIy4q8/3w+XivpxBIb/sV1L7MU7hhKmzX1Dzr57SbOMeZQ0wZWZ3pXRAu4FHifuUGLs6XIFMAPXHioLX8F+O9cMO3fsT7iOtpZ7M9KdzURWsrtIXEy26bQbgO8Rf8ERgNbAYNwuynxcjT4fkWw77Fjz7diD7Vyx09zWbkOG+rKUHHr0lRvfMCdTlq+5b9rNJyUqgV7Albg+jpNx9fXfsFfhlTjv9Dr79zL7vzn2u7fb3/aK2C9ytAfFmyi6sbC0BP6NbHPYa4DfkFaN+qM5FJvVGxUFmFcPW6OaDPVih90sK2SW2XNlxq94h4AvgAdQEkdMnGlr8kXGuvAeZZTDHytdcvgkqPUP3IUSOvKkra3BhhzWfybx16EsG1oAP8GVt8paEVYCY4E2WobMaGMyX5nDem/B1U3UK3+EDLbXskM53QjGocCPkLQzGa/MaY3fBM7TMsTN13D7vnmFza7GbZfJR+D3G/9u8quetNd8DJVainQYBfyB/CLkNuGaovTQUpwwPUyGedZOXIErXycSpCPwn2TT0OJoGYdzgUuJu7V3TP6cS01m23Nctxpcq/PTtSTp8485vw3UjreBHwCdtCR/RSeTzdsRrNP7uCYpokCcZb6BmggU7HNgFi6Wvpy3EduaDGaZTPJelz32ydFe5lJchuFKMceSRvsR8CiuBHWbMpB/G5vro2RX76ExYyEK6imrJ89PyKbq0PFuJU6z188zCiTvM2xO08hvC+9o2Xt3Aq1kFuXHN4H/Js5KO5uA53EBL+eSRgZeLa3tmsfaHGLsgFQDPAWcIzMQV0b2WXAkZf09Lvx0LNDfnqoxRKNV2LX0t2ubaddaE7E8FxN/0ReRw1PrDuCPEStu/TeEBebYHAdchCuh1p4w9Qua27Gr7Fzj7NwLSKfH4VrgFuItAisioCMuHz7FBh27cfn9i4FncaXU7jOlH4XbXx+Aa0TZE+hmo6f9bID9zij7m/vsGM/aMdcRZz3CxmRw/hwl74jjoCeu7NWuBBW+MeNgvVHEOW43x2M3qbM4Ufrh6tvvKaiRFHHswlXk7SX1Fb4YgGvouFsGFu3YifPs95W6ilCcb57u7TK4qNqPzUCpuiJDegFTgc9kgLmNT4BfoIxLkSPfwDWBWC2DzGx8gCsF1lHqJ2KhNS7r8FU5DIM59l4CRqLCHCJy+uPaZf1BhlvyWAM8KMeeSJF2uKCaecSR7prK+AwXfDQSFVsVBaELLrrudeLLQoxhbLHPp9G4cGMhCsvfAbcC/wN8WsZGvxnXc/BmoLvUQpQjZ9tnwuO4XPkiOxD3AB/i8guuQV58IQ6jBfD3wPdx4ccfkXYuwi7c9uhsXDON/sApWmYhGkcrnPf7elyG4kJcq+4Y3xJ227UtBH5p19wXpd4K4ZXT7Uk6EpgI/Beuku463E5DyEIcNXaOdcBSXDHPiXYt56MS2kLkRiWuvNVAYARwAy5a7hfAE8Ac4BVgkRnvu7g2au/Zv5fa/71iv/uE/e1ddqwRduxzUCCOEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCFy5P8A7DVxHLyfU58AAAAASUVORK5CYII='
-
-eye_icon_inv = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAA8xSURBVHhe7d1Zs9vGEYZhS7K1WrvkSLErSdlVzv//R7mIXZV4kexYshYv6Saa5+BQPCQATvf0DN7nwgBUZQn4pnsIkiDwEQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADbpiSzTuT2GrIa4IW0XDGMTGRDf6XEwMbWGwEsve7FMxKeTFwORyU3r+V1vvkswFt2TxZthCbUwAlfXyKr8UZwd1EX4Fa2/6yzAZxCPwIDT9PEwGMQjZEU1fBpOBH4J1QOP7YCIo76otcbq72vjKtlGYxav53h3+BKdiRj2RFSQq4azgNIS3EI2fCxPBMoQ2E42fGxPBPIQ1EY3fFiaCaQjpCBq/bUwEhxHOJWj8vjAR7EcoO2j8vjERXEQY525L77+y9aZJjd+Qxbthq5jrks9bW2+a5HNHFq+HrXVjAhCtvupLIV+TxR/DVjVXJb7fbb0pnA2sfAJoqfGlVh/I4qdhK737Eu1LW09vzRPBWg/8jhToL7aeVi+F2cJEK1F/Kosu3gLOsboJIHMxShE+lEUzr5wLPZAheGHr6fQy6U61poN9IoX3na2nsrai28o6GctwPJXF98NW31ZReBkLba1NfxnGqI7efw78NFNhST3d1qJS9kcwFou6bX9UndWOng10q9tCTNb4NPwCjKG/Hs8ANjfmsPWqtGiUbWImiy9FflZT3d2IpKvizNT4toqCGN/yejkD0KvRqhaH1MRDLQxlf4TCLF6lX5dWY7XWRe/0cBDPZDyqXYoqxfhIK1JWe//+PpOXmrl4ZNvhrOaeDVvtavrVymbiarQCbRUVUQfLtbrjVX+A0kHj65mfZvheN+RwPpGF/qio9g+LTlJzIpAMM/wwa7YWC/mxjHOVq7RaavzSzbDmY59KInoiix+GrTY0NQFUHNibskj9W/jobBqYEG5IJFWeQtxANmeY1Y/IPJi1MtlFRh/KnMlYCzv5sYzh5r1qJIp6PjK7SOLQz1Z+G7Zyyv414KPo5pdBu5e0kDfXOijbTsd2T/cvXV3pmIp7thlCotDarfZV5RTM2CNaIbaaSo0sSiDPc1mzSHkGED1AMjZ3Mg6Q5qBsszm2++n2X8da6I1Bw2TMQaWbAKKD0kqQRbY7xKb5QVMJdizZfkjz2sY+TMYxzfSqd0XyCbuQQsb+vix+HrbyyFgkJUU33UT3JPawG65KBPrCm2KcswzGTRmAX23dXdIibPb22nNJ/CmvmoucfCWDW7Kocp3CWIa3AA9p/s3VjatofmXH+njYyiOyNqzmq/6qUdVuhs8liH/buisZ249lka7J5Pi7PuU/JumEfE2GJeT7ezn8L2TxzbAVr+YZwNeBza9FRvMnlDSD36MmJuuBr4eteFVm38hBjxrIuZIWfjWMU50Mws8AogKVLG9QVO3ImonWkNCHrbqrkUFog0QdoI6YraZTY5BbwtjFZhD2D/UY3lxRGbSOMYzLIOQtQERoktfzzIUjqn3lI7Fc1WxmqvkBcfWvxy5j2Ty3TTdhE40t3QQ1v75HezdspRT2tZKSPPQ699KXN9+WYwh7eq4cQ8qvbUeuSx7uN4nR2cZWXbj+5UHNn/lVfyMiBxWVRW/Hc4qILDxzcPuLWw+mlJ5zYIwHLefg8j6Pwjjj+pNTiWDz3t42w+m/Lbw/Kwj92e4SGoKtuvHqqeKD5938kvVXEYGXIFH8YqvFWQbuE+0Ef3qOh2eGJWkG4ivbdOHRW0UHzmMHxyTgZm677JWFZKCPzw778dRMt+SwXe6toN1lq9m537a+ZBbF/iKvgt9KXvi7XH7a20oTeNSCHHpLD95wmwi3StVCkb/EY8DHGht8rwZoovm3yMD//g4l8jj5MwCPgR6zg2zpkUv6/XVRJQY6mtM+F8/W0R/e41ai907awaDmb0rpTFrMYIw8cvfJ4jOAzAdVUdF9lgjSfwV2jMMxNFcX3rV8Si8u2jGaf7/SubSawy5yGZTOYdeSXJacAXxpSxetDm5pPeXAmA4Ccpjdm3N36K8yibndv6zlQik5u0sM2X8Is0TRH0RRK/tJLJ/L4tth67g5Ierde3+09eJaHlBVclBbz+IyZHSuZBa7JBp9HuGLYeuwqSG6XtjQQ8GXGtAesjiEnM6VymIfiWfShXNTQnS9oIGBvKiHPA4hq4tK5rFL4jl6Ad3RDwFl/2j+IGvIgzG/yDOPKb17cAJwnp0oBEA4TwIHe/jSCYDmjyWR6Hu2VVjTsU7l2ROHennvP0rzT1cqq95yOYbc9iuVyz77stp3BvA3WxbX22ABpTn3yAe9vfuPPZAJaNL3h3P12vy8ki1DboeVymeXxHVfFj8PWzsTgOM/2m1xl8hM4unxyr9jilwZSG3NN87s7C1AxD+GS62t+dUaj3kWr94Z9/p2AnC50YLs/3VbBbCAdw9tJgCZEN5vtgqSHf9UFsX/XmBl3lsvlfZA/3PpdQCnkB1+Kouwx0hV5JIfZlnDGLyynipGXvQ3H/YXD0929B+ycL0tciJ8vlHfWsbge+utojbhjT8UOJXs5GqaolRua8psjPzmK5WZ0tw4hQVWzGMC+LstuycTaEu3qe7SysageG8VnwDkDOVfstBHeK1BsdMxLLaWMXhivVWUy1sA2dHvZNH8La0naOmBJb1awxjcsZ4qRs6cHupyMwHIxuY7wZJkh/Wprp8MWwAW+sR6qbSX+p+zT0/lH3E5lZLJpetPaEvk1ntGlyG740pktM82t7O3ALK9OSUozesAOqP3blubNR7zLN7Nr8afAWxOCTwwCRwm8RS7X34r1njMc3j1jPS+/hz4zIUPAcczQ2leBwT0xrH59WvEs3sBqL0N79msnpNMDaWy6i2XY8htv1K57LMvq71fA3qG6nmANRTM6pYt16DIsXrWaQ3Rza8OBXhD9ueNrRfX0+CVGrieMjmEvD5UKpN9DuW09wzAvJX/T58x5sLzgIGW1Gp+dWgCUC/k/9enjbpgErhoDXkw5hd55iG9e/Sr1kmnUN6DdmyWakGpjHrI4hByOlcqi30knkkPBz12BrDhHbZnEK3pOQvG+ZxnFtKu+tb9aPOrSROAYhII1eNVclz5Z5ybX9+yT362x+QJQDEJXK5kNhJDd1fJlTwm7zr05FnjEstXsvh22JpmUZCeB6FaHeDSubRc6GPkMiidw64lucw6A9jyHgDvoLxILIvyPKCHp+gWPQaHjENkbH51UiNnPaiaSmfSYgZj5JG7T06aTb0Hwzs4DxJJ0ZugtJjBVul9L51tBO/xO7UHTz6dkn/f9ZTMAmzptK/4B3jeReTBaZ9b+nD0qve4ndr8qkRj/Sn74XpnVslRHyTZzI9lJI/iX3l5F1NJHvvqkamjW1azbko0vyr1yvq77I/rQwwl0NeyeDxspedyo0prrMwToRa+10TVys0/H1utuinV/KrkqbU+xPCGrbuQYPWRY18OW7mVHKQxLS7HJltM90m4FL5Xlg6+lAxcH4tXOguPYK9LCG9t3U0jRaG3c/a4o+uGRKATeO3J4Ioco9ursxyjPhk3/YNmJQP3cfCoea8mYhIwrRbGFD0f2xwt5+AZLpOAiSgQFZVFb8dziogsPHPw/Hrtney3+/e2NgCuH0CeSnIIeX6dZqFk1eMKwtv210c1f/Zn/ukLXNPNrzwnAPWb7L/71zcyDnqm8WzYSkm/JXG7u9IuyeOVFueW/NGSItL39mNh78MtK9ev0U70TPLo4uw27BRLK8hWXUWEtlRUBq1jDOMyCA26t/CWiMqgVYxdbAbebwEuiDowG6iUnwtEDm5rEmcT8n5fRWdQJfCoMFXWoorMoAWMU50MQs8AtiIPNGuj1RjsrLJmEVU7cvj/rJVB1eAjm1Py1a+V0n2yHJlBRrUK/4hrMiwhvzyUw/9CFt8MW/GqnAFs6eALvY+ZOx3QjM1mGTyxzdXQY9YDt800tEZEVPPr153Vml9lGYDPJPT/2Lq7jIUn9Pfjmb/7Lkbi12tD0v26TzvfVt1JBvqrTrdH701V9Qxg5L8SyF1bd2cDfW/YSuOPpBNTUXaM2Zr/XnDza99Vb36VreDCXwWTNt1dyeHCc9xbJzHrhPu/YSuPyMZX2eot5StOhUG5IwvXmzgsEZ2Dl2xFb/S3DaE/M86YQ8oJQNUo/qSF2uxEQJ7nsmaR5TOAD9QIzAoj7LOIqTQL0cw98XRfdYdtMxN9axXa/BLD46RZbKTdsRH9gOYnWw+TedCii3gqMrtI4tCfw6e+k3ELE4Byve3UIRT1cWT0ocyZjLUyAWxUHEy92em7YSun6GwaKPCQO1Lt00rzq6YmAFVrElAtDWzpnNZ87FNJRHpF5w/DVhuamwBM+Fc4Yy01wyX0w1+95uK9bsjh6HtVfYuV7uq8OWo1vpIMU17deEzThVxzwFUHE0EXqIPl0n4NOEXt4K3wHg5bqOBhzeaX8nvecvOrXl7B9JFUVa/kkzrQieDlsAVnD2S8X9h6FTLeTZ7y7+rqFLbmq8FY668KWTG+5TX9FmCXDoz4i21Wo4WqbBMnsjir5ym1dU8LzDa70O0rVYaC2eqtaKIwhv66OgMYyzRgWshKVjM/2juLzSPGlW1XJWX0Wa/Nr1bxypSlmMZ6LqolGKM6VlOEGQtsa62TQdYxkeF4KgvX5/xnsbrCSz4RrOGrxOpf4R2ytsl4la88Qi8g+dHW0+qlGDNPulsS9aeyqHZ5eS1rnQA2WijMLSnQB7IIvy/CQvcl2mbOZHqZaJdY9QSw1dJEMCZ1m+FqtGZvZ77mxt9iAjjX1KvWIVLXHvcvqPb7+tIkn5Q3ga2BCWBHq2cDmIZX/YsI4xJMBH2h8fcjlCOYCNpG4x9GOBMxEbSFxp+GkGZiIsiNxp+HsBZiIsiFxl+G0E7ERFAXjX+abn8OHEULUNkmAkjcmxtzKPsjLESADjgr8EHDl0egjpgIyqDx/RBsECaDeWj6GIRcAZPBfjR9PAKvbO2TAU1fF+HnUv0BJ96k3/XGqG+GLdTGBJBYL2cHvMrnxcA0JvukQLO3hcHqRPTEQKMDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIA6Pvro/6e9xRUBLDRyAAAAAElFTkSuQmCC'
-
-minus_icon = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAABrYSURBVHhe7Z15rK1VfYZvmcJwQUBE5vEqQ8Agg1YaGklLwKJGrVpiDYpjApiQUCEIkqg0/FEJJMYY/a8aIyiKgBaMIlIUEWQwGAQEyhAGmYcyhKl9n7P3Pp5z7u/cs7+11vftb3if5HHve6/hnP2t37v2N6zhb1aZPrDl2NfJzeUOcje5/dg3Sv5t4sZyA7mRhJfkK/JF+fQC/yIfGnuPfFA+K/m3p8aaDuMOoDsQ8Emg95RrxvJn/m0rSbg3kXXygqQDeFLSAdA53Dn2rvGf0Z1DB3AH0E7eIPkG30seJPeXfKtPwt5mJp0CZwu3yBvk7ZIziEelaRHuANrBHnJveag8RPINv6vkNL0PcHlxr+QM4Xp5jbxN3i3NDHEHMBv4Jt9PHi4Pk2+SXKcPCe4v/FleLa+Uf5ScOZgGcQfQHPtKvuH/SR4o+YY3f4UzhBvlf0nOEG6VpmbcAdQHx5Zr9yPke+QBkpt0ZmW4yXizvFT+XHIv4f+kKYw7gPJw4+5I+QF5sNxMmnSek7+XP5I/k9xQNKZVvF5+SFKkj0u+rWx5ObYcY441x9yYmcIp/tnyDhkVrK1PjjnHnjYwpjEYRfdueZF8RkbFaZuTNqAtaBPaxpha4JTzs/I6GRWinb20DW3kywNTDEbgnSK5+RQVnW2ftBVtRtsZkwTFc4bk+XRUZLb90na0oTsCMzXbyi/I+2RUVLZ70pa0KW1rTAjTaE+UDE+Nish2X9qWNqatjfBAoFWr1pfvk6dJZt51kdckz8ifGMtIukcks+8m03b5u+cl03mZ9//qWOAYIHfRmU68qWTU4mSaMbMT+fbk77Yey4229WQXYYYijxB/LCfHYJAMvQNgpN4X5Xvn/tR+CC6ns0y1ZWbdnyTz8O+XhHwS9LqKmk5i0jHgzpI1CfaRzGDkWnsX2ZXHcZfIr0hGGg6SoXYA28mT5WfkFvxFC+FbnemyBJxJMnxrcQrLjLnHZBvZRjLTkdmNnE0x6YkOgunObT1bYBzBt+Q58mH+wvQXOrxjZFsf6TFH/vuS61TWBeDUu+vwGfgsfCY+G58x+uyzlpqgNnxZ3FP4Vjpf8s0aFcAs5PqcufA8qmKq8BAGsPAZ+ax8Zj47xyA6NrOQ2qBGqBXTE1hVh1N9Tp2jRm9aFsLg2vOT0oU2OgYcC44JxyY6Zk1LrVAzfVmRabBw7XmhjBq5Sbkxd5n8lNxdmhiODceIY8Uxi45lk1I71JDpIB+R3B2PGrYpuXl3uuQuuakGx4xjxzGMjm1TUkPUkukIPKP+huRRWNSgdcs1LdeRR0kvBpIPx5BjyTGd1f0CaomaorZMi3m7nNVsPZ7LnyVZEcjUA8eWY8yxjtqgbqktasy0EK4dGQUXNVydsl7d5+TQVvWdJRxrjvlkrcAmpcaoNdMSGMjzddn04z0G5nxCeqHP2cGxpw1oi6iN6pJao+baOohsMDD89BcyaqS6ZLXa4+RqadoBbUGb0DZRm9UltUcNmhnAphoMk40apg4ZhnuCdK/fXmgb2qjJGZ3UILVoGuRYycSXqEFKy6y6L8k+DMsdCrQVbUbbRW1aWmqRmjQ1w4QSng2/LKOGKCk/4zuSPftMN6HtaMOm6oXa7OoU6dbDPPWvyejgl5bpoUdL0w9oS9o0auvSUqN1b9E+OLjby0yy6ICXlIEmZ0pf5/cP2pS2bWIwEbXqp0OF4HqOLaGiA13SKyTTVk2/oY1p66gGSkrN+r5RJjtJto+ODnApuYFzqvRp23CgrWnzum8kU7vUsEmA7bN/J6MDW8rfyndIM0xoe2ogqo1SUsPeCr4iTAutc3QXd2zPlV4d1lAD1EKdTwqoZU8DnxJ6yzrDz4KaH5bGLISaoDaimikhNe0zgRXYUdY5m+8quZ80JoLaoEai2ikhtU2NmwDumP5aRgeuhN+UfrxnVoIaoVaiGiohNe6nA0vgmenlMjpguT4nT5Je7dVMC7VCzVA7UU3lSq17nMAYHslcIKMDlStjwdn1x5gUqJ265hNQ84N/9MxOM3UN771D+hGfyYUaopaiGsuV2icDg4XJE9GByfU30ktum1JQS9RUVGu5koFB8lH5iowOSo6XSt9kMaWhpqitqOZyJANkYVC8U9YxKYNJGL7Tb+qC2qpjUhpZIBODgI0W6ljJ59uSba2NqRNqjFqLajBHMtH7TUgYdvlLGR2AHHluu5E0pgmotTrGCpCN3g5P59kqK6lGHzxHGsJ7uJmmoebq6ATISC/HrLABZOmlu1nuyd/8ZlZQe9RgVJupkhGy0iveJh+X0QdOlZsxvuY3s4Ya/IGMajRVskJmesGWsvTsPh7H+G6/aQvUYulHhGSG7HQarmXYVDH6gKkyIMPP+U3boCZLDxYiO52+H3CMLHndz5DMNdKYNkJtlhw2THbIUCfhmeZ9MvpgKT4qvTOraTvUKLUa1XCKZKhz4wM2lD+U0QdKkWmZntVnugK1WnIqMVkiU52B7ZOjD5Iqc7ON6RLUbFTLqXZmS3JmTpVcW43BFr0cGGF6DTVbcqAQmWr9DFfmNpecLMG66l45xXQVarfkvhZkq9XrB7Cyaqm7/vR4+0hjugw1XOqMmGy1dkXrbWWpfdlfkl662/QFapmajmq9qmSMrLWOr8roF07xPGlMn6Cmo1pPkay1ioPl0zL6Zat6rfR1v+kb1DS1HdV8VckamWsFPJ/8iYx+0ao+Iz3Yx/QVarvUFyWZa8XYgPfLUjf+TpHG9BlqPKr9qpI5sjdTVstSM/2ulN6i2/Qdpg9T61EGqkr2yODMOF5Gv1hVOS06SBozBKj1UpcCZHAmbCNLPfY7UxozJKj5KAtVJYNksXFOk9EvVNVeLHxgTEVKLpRDFhtle1liqi+DI94ljRki1H6JAUJkkUw2Rqktvb4rjRkyZCDKRlUb22KMnuZeGf0SVXxM7iWNGTJkgCxEGakimWzkLODzMvoFqvplaYwZZSHKSFXJZq1sLW+X0Q+vIncuvbCnMSPIQoknamSTjNbGp2X0g6s6s2eXxrSUUmNqyGgtMErvOhn90Cr+QXpNf2MWQybIRpSZKpLRWkbUHi1LjPn/mDTGrA3ZiDJTRTJKVovC+mYXy+gHVvFGOdOxy8a0GLJBRqLsVJGsFl1Hc3/JVN3oh1Xx49IYszxkJMpOFckqmS3G2TL6QVW8Rfra35h1Q0bISpShKpLZIvBYocQjihOlMWZlyEqUoSqS2SKPBD8oox9Qxbuln/sbMx1khcxEWaoi2V0n641f18W/jl9z+J5kvzRjzMqQFTKTS3Z22YnkSRn1LtP6lPSYf2OqQWbITpSpaSW769xNaKUzgKNk7lz9yyVDFI0x00NmyE4OZJcMJ8GKo1fJqGeZ1lflkdIYUx2yQ4aibE0rGU5aPfgt8n9l9B+d1pvkZtIYUx2yQ4aibE0rGSbLIeu6BDhC5ob3Qsk+6caY6pCdH4zeJkOGyXIlNpC/klGPMq2serq3NMakQ4ZyR+GSZTI9Nexomrts8WVymseMxpjlIUNkKcrYtJLlcKft5QL6dzJ32C6n/8xMMsakQ4bIUg5kmUxPzUUy6kmm9RG5qzTG5EOWyFSUtWkl01Oxncxd8rv4dERjBkyJ6fhkmmwvIroEYBrhTqO3yVwi+aHGmHzIEpnKgUyvNUU46gAOlznf3gxf/O/RW2NMIcgU2UqFTJPtRSztANaXh43eJsPAhf8ZvTXGFIJMka0cyDYZn2dpB7CzfPPobTJXyFdGb40xhSBTZCsHsk3G51naAewrtx29TYJxy+x9bowpD9kiY6mQbTI+z9IO4NDxayosYnDb6K0xpjBki4zlsCjjSzuAQ8avqdwsnxi9NcYUhmyRsRwWZXxhB8AyROtcPGAKrh6/GmPqITdjZHx+eb6FHcBucsfR2yRelteO3hpjaoKMkbVUyDhZn2NhB8Cso41Gb5NgpJEf/xlTL2SMrKVCxudn6S7sAA4cv6bCMsTsc26MqQ8yRtZymM/6wg4gdyeRG8avxph6yc3afNYnHcDrZM71P7CnmTGmfnKzRtbJ/HwHsINca6ZQBV6Ud4zeGmNqhqyRuVTIOplf1AHkLP99v3xo9NYYUzNkjcylQtYXdQB7jF9TeUB6AJAxzUDWyFwOc5mfdAB7jl9TuVN6/r8xzUDWyFwOc5mfdABrxq+pePy/Mc2Sm7m5zNMB4Nz1QAa5vZExphq5mSPz6xH+zeVW/E0izFPOuSFhjKkOmctZd4PMb04HwJucJwDsQJqzVJExpjpkjuylQua3ogPgzdyggES4I+kOwJhmIXM5T97I/JZ0AKvlJvxNIvRC7DxijGkOMpdzBkDmV9MB5A4BpifKWabIGFMdMpd75r0jHcD83OBE2LHEGNM8udnbjbXCz5Unzf0xjXPkv43eDhIuoehITfOwbx773w+Vr8qTR2+TOI8O4Hz5L3N/TOMM+e+jt4NjQ3m9XLTUsmkMHoWxxl3OCjld5nR51uhtEhfwPyw1zNDCVI+XQ4UOIHcfRZsux542GConyOi4TOuVk8eAOTwzfh0q3gJ9dgz92Oc+fZt7DMje4Tk8P341xjRLbva2oAPIGQQEL4xfjTHNkpu919EBbDx6n0zOyiTGmHRys7cxHcAGo/fJeBCQMbMhN3sb0AHk3kX1TsDGzIbc7G1IB2CM6SaM48mCDiB3EEXuJYQxJo31x6+pvEwHkHsakftLGGPSyM3eK3QA2XcSx6/GmGbJfoJHB5A7mihnLQFjTDq52Xu6RAew6fjVGNMsudmb6wByFxXIHUnYdTiGZjYM/djnZu8pTwfOw9OBZ4unA2dOB/aCIPl4QZDZ4QVBMhcE4X9OldFc4Wn9T2mMaR6yF2VyWk/lm+semcO241djTLPkZu8eOoDcXUZZUMSDgYxpFjKXu5jPA3QAXEPlzCtmZ6GhPwkwpmnIXM6WfmT+WToAHgPmjAXYWub2RMaYapA5spcKmZ8bB8DuIjk7jOTuLWiMqQ6ZyzkDmMs9HcCzMmcwELMB/RzcmGYhczkzccn83CUAz1If5G8yWDN+NcY0Q27myPxrdABw1/g1lb3Hr8aYZsjN3FzmJx3AnePXVOiNslcnMcZMBVnLPQOYy3ypMwB2GM65I2mMmR6ylrur96IzgIdkzo1AbkhsP3prjKkZspZz452sk/n5DoAbAg+P3ibByiRvHr01xtQMWctZDYisz934n3QADArIHRJ84PjVGFMvuVkj63OD/yYdANwyfk3loPGrMaZecrM2n/WFHcCN49dU3iS3Gb01xtTEGyRZy2E+6ws7gNvkS6O3Sewidx+9NcbUxG6SrKVCxsn6HAs7ANYFyLkPwPJYfzt6a4ypCTKWs50fGZ9fA2RhB/Co/PPobTKHjV+NMfWQmzEyTtbnWNgBAAtc5nCA9IAgY+qBbJGxHBZlfGkHcM34NZU9pOcFGFMPZIuM5bAo40s7gFvlI6O3SbBM0eGjt8aYwpCtnOX3yDYZn2dpB8A663eM3ibzD9I7BhtTFjJFtnIg22R8nqUdwKvy6tHbZN4q/TjQmLKQKbKVA9km4/Ms7QDgSsma4amwVNHfj94aYwpBpnKW3iPTZHtFtpP3yYUbCFT1Yun1AYwpA1kiU1HWppVMk+2puEhG/5Fp5WbDrtIYkw9ZIlNR1qaVTK9FdAkAPx2/psJ45X8cvTXGZEKWyFQOlTK9j2S6YNSTTOtlcrkOxhgzHWSILEUZm1ayTKanhkcOv5LRf2xan5EeFGRMHmSILEUZm1ayHD6aX+4b+hV56ehtMpvLfx69NcYkQobIUg5kmUxX4i2SfQOjHmVab5KbSWNMdcgOGYqyNa1kmCxXhimHV8noPzqtDDo4UhpjqkN2yFCUrWklw8tOH17XTbqX5YWjt8nw3z9u9NYYUxGyk3sjnQyT5SRYeohNBKOeZVpZgngvaYyZHjJDdqJMTSvZXefyYSv1LiwewB3EHNjH/NjRW2PMlJAZspMD2c1d5GfVB2XUu1Txbpk7kMGYoUBWyEyUpSoWeQrHKiT0ItEPqOKJ0hizMmQlylAVyWyx1bnOltEPqSJrkW8hjTHLQ0bISpShKpLZYuwvc0cj4celMWZ5yEiUnSqSVTJbjBLTEZENCVZLY8zakA0yEmWnirVMxz9aviajH1jFj0ljzNqQjSgzVSSjZLU4m8jrZPRDq/gH6XsBxiyGTJCNKDNVJKNktRY+LaMfWtXjpTHmr5CJKCtVJaO1wWOF22X0g6vIIwqPCzBmBFko8aidbNa+Mc/nZfTDq/plaYwZZSHKSFXJZu1sL++V0S9Qxcek5wiYoUMGyEKUkSqSSbLZCKfL6Jeo6nelMUOGDETZqCqZbAx6mtylw5G9yt8ljRki1D4ZiLJRRbLY2Lf/hNNk9MtU9QaZs+GBMV2Emqf2o0xUlSw2zjayxJ1LPFMaMySo+SgLVSWDZHEmlHp2ybLFB0ljhgC1nrvs/sSZjqlh7HKp0xj2LdtUGtNnqPHJ/pu5kr2Zz615vywxRwBPkcb0GWo8qv2qkjmyN3NYcfQnMvolq8pp0dulMX2E2i516k/mll3tt2kOlqU+2G9l7lpoxrQNavpaGdV8VckamWsV/yGjXzbF86QxfYKajmo9RbLWOraVpR4LMjjiw9KYPkAtlxjwg2SMrLUSPmipG4IPyko7mhrTQqhhajmq8aqSrVZ/Ma4vvy+jXz7Fq6XvB5iuQu1Sw1Ftp0i2yFirYSeSUj0eflMWX9/MmJqhZqndqKZTJFPr3OWnTXxKRh8i1ZOkMV2Cmo1qOVUy1Rl4PvlDGX2QFJ+T75PGdAFqlZqNajlFstSaZ/7TsocsMWV44qPSg4RM26FGqdWohlMkQ2SpkxwjSz0VwDvkGmlMG6E2qdGodlMkO2Sos3Aj5Bsy+nCp/kZ6QVHTNqhJajOq2VTJTudvgJdc+GDipdJ7C5i2QC1Sk1GtptqrhXLeJh+X0QdNlWeinj5sZg01WHLsC5IVMtMrPilL3g/A78iNpDGzgNqjBqPaTJWMkJXewbXM12X0oXNksMUG0pgmoeZKDvSZSEZ6O/Btc/lLGX3wHGkInwmYpqDW6gg/2SAjvYZnmnfK6ADk+G3pewKmbqgxai2qwRzJRGef91flnfJJGR2IHLkZ46cDpi6ordI3/JAskIlB8VH5iowOSI48jvE4AVMaaqr0oz4kA2RhkJTaYmypDMjozMwp03qopdKDfCY2uqVX22Bu89dkdGByZUjmO6QxOVBDJYf3LpTab/38/rrZRF4gowOU6yPSswhNKtQONRTVVq7UPLVvBCunXC6jA5Ur0zKZm93bZ6umONQKNVNySu9CqXWvdLUEbrL8WkYHrIQ8t/UTArMS1Egdz/gnUuO+Sb0MO8rrZHTgSniV3E8aE0FtUCNR7ZSQ2qbGzTrYVZaePbhQ1lbzkuNmKdREybUsl0pNU9tmCnaXdXYCL8tzZe+HXZoVoQaoBWoiqpUSUsvUtKkAveXvZHRAS3mN9KPC4ULbsxVdVBulpIb9zZ/ITrLkuuqRT8lTpR/JDAfamjan7aOaKCW1Sw2bDLhj+jMZHeCSXiEPkabf0Ma0dVQDJaVmfbe/EDwzrWMSxlKZlHGm9OPC/kGb0rZ1TEJbKrXq5/yF4bStrmHDS/29PFqafkBb0qZRW5eWGvXlZE2sJ5k8Uecd24n8DJZ72luabkLb0YZN1Qu1SY2amjlW1n0DZyJjwb8kfT3XHWgr2qyucfxLpRapSdMgh8s6VhZaTvZlP0H6/kB7oW1oI9oqasM6pAapRTMD9pS/kFHD1OXN8ji5Wpp2QFvQJrRN1GZ1Se1Rg2aG0OuzkmrpJcdXktFdn5C+2zs7OPa0QZ2jRiOpNWrOZ4Mtgu2Tn5BRg9XpLfJz8o3SNAPHmmPOsY/apE6psU5t1T0k2Jm1ztmE6/IueZbcS5p64NhyjDnWURvULbXlHapbztaSTRVflVEj1i0DTc6XR8nNpMmDY8ix5Jg2MYgnklqipqgt0xE+Iu+XUYM25Y2SZ8P7SFMNjhnHjmMYHdumpIaoJdNB2GjhQhk1bJM+LS+TXDt6WujycGw4Rhwrjll0LJuU2hnMZh19hT3cPiMfklEjN+1f5MWSDSC9dPnoGHAsOCYcm+iYNS21Qs14z8keQaFxHdn048J1yTXtlfIMeah8vew7fEY+K5+Zzz6r6/pIaoMaccfcU1jt9Rh5u4wKYNbeJplJdqJk2mofhh/zGfgsfCY+G58x+uyzlpqgNga1evRQl8reTp4sOc1r62AOvo3ulgw15UYYg10Y4srp6WOyjWwjt5d8gx4kD5RrJNfRbZ0k84z8ljxHPsxfDImhr5V/sPyifO/cn9rPi/I+yeKVPAv/k6SD4E41E1KQm2c8tqoDdrFh9N2WY3eWBJw79gyJ3UHuIjeWXeAS+RXJVOFBMvQOAChqdoA5TfKt1UU4W3hcMkoN6QSYCfeo5Bp70jE8L1+QdCR0EmxMCdzs4jgQXOayswX2JOhbSU7jtx3/Hc/CkWv5rk595WzqbPljWVdnaToGq8NyndrkTDLbrLQtbezVoM2y8E33BcmpdlREtnvSlrQpbWvMVLCDC/cH7pVRUdn2S9vRht6NxyTDja1TZFsfHdq1pa1oM9rOmCJw0+uzclazDe3K0ja00RAGVJkZwZ3yd8uLJM+Qo0K0zUkb0Ba0SVceP5qesL/kcdIdMipOW58cc449bWDMTOGU80OSbyKex0cFa/Pl2HKMOdY+zS+ABwKVh1VrjpQfkIw09KIgeTwnGan3I8l2W9zgM4VwB1AfHFtOT4+Q75EHSC8gOh2MWmSF30vlz+Vk7T9TGHcAzbGvZBos21S9VXrL6MXwzP4m+VPJtu23SlMz7gBmAzPm9pNsKHGYZPbc0FYVZvEPhuayhTbrAvxRMtPRNIg7gHbAdFn2seMMgbnzzKzjDKEvK9Iw6YhveGYwXi/5hmddAKY7mxniDqCdMGadDoAbisxQ5F4Co9o4c2CGXpth5iHf5ExZ5tqdmXfcuKMDYIaiaRHuALoDwacDQM4QmIePk06BabvcZKx7a2qmE3OTbjLNmLCzJgHyDc+fkX8zLccdQD+YdACsbsRUVya/cAbBWQOrH3F/gf8P/04nwYg5Li82kvCS5DSddQIIN6PrCDDX6aySw7c53+APyGcl/z7pAExnWbXq/wG/nrhKixzvCgAAAABJRU5ErkJggg=='
-
-minus_icon_inv = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAA6kSURBVHhe7d1rc9RWEsZxbGPCxeYSFt4kW0n2+3+oUBXehE0FFgK7YPB2Wz3ENjMezai7z+3/q9qSRG1sz1E/rSONZnRwCz14fH5+/qetpzg4OHgii9fTFlpFA2hHesj3RXNoBw2gQhL0c1vtijQG6q0y7JAK9Br4bWgI5bEDChg18NvQEPIx4EkI/W5oBjkY5DgHkvkvto4FpBccyoIGGoAG4IwjfSxmBr4YTAeEvgyawXIM4AIEvw40gv3puRV2c1eDr2wbhdnu0P1xd/oXzEXnnMkKDI1gVjAPg7QFwW8bjeBmDM4GBL8vNIL1GJRrCH7faARXcRHwb6eEv3+2j0+nLdANb906kpo4s3UMRCYDt2Xxedoa09ANoLcjvhT0U1m8kf9FFfWR/O+RDNsf02YfRj4tGPKFtx78WguWcW3PaC+4uQ/otF6UrTUFGe6hPng0TANooRCl+P4hi66m12s8lV3xb1uvVuuNd64RXuRtKbhPtl6dUQptk5obs+yaY1l0fYG46+KrtbhGD/0m7K983b6w2oqJ0O+G/ZejxxuBvq+leKRmTrRwlP0TZrJhUyf2T0VZTX0/bfWjq8KsKPgEPgD71183L6SG4iD4OdjXfno4BXhYsiCkDh5rMSj7JwSz4VaP7Z/SWc09nLba1XTRFg6+fqDk3bSFwk6kFN7aejrtRLbanGb/8FLhl339SBb/mbZQGZ0N6mch0rXaBJr8owuGv+kZ0yioj/la+4MPZd+mf3yT4LepRCOQUtFPTDbzeZOWLgLeyw6/Bl/ZJhpjuy91/1mN3pu26tdKA9DPoL+39XBSM4+yCwdxdF8KvXaTwmo17fct0UKRP5MB/d3Ww2ml2Co6JLWUdlogpfRcFq+mrTrVPgP4MSv8srPuE/7+6T4W920zlNXuj9NWnWou+J9kAH+19VBaEbaKgWTNBqS8fpbFi2mrLrXOAH7JCL/smIeEf1y670X43XxWy79MW3WpsfhTjvy6520VSJkNSMlVNxOoLQQ/yH74zdbDEH6sk9QE9JrAy2mrvJpOAfRqf2j4ZfB5ew8baW2I0LfvrMafTVvl1RIGfZ//ta2HkB2rzS79zjA0Kfzbo6Ue9ZOMRT63cFkNDUDv8Au9yUfbuq0Cs0ldhh4wpCz17cgP01YZpYMR/lguwo8lEppA0ceTFQ1HwuASfizWc50WuwgYOagyns8JP7xoLQm9rTdEdIO5SZGQBIefL+xAlNAvHNEuY6tp0n9hcPgfyCLtU4MY0n0p4b9s3V12E8g+BdDv0Qsh4/adLAg/or23WosSlpF1MrtN2HurskO6f4YbqhP2zEmp57R7VtJmAIHh125M+JHtLGomEJWVdVIagLygkG4mO0DP+T9OW0C6j1aD7qIyc11GAwh5eIMMvF7t55wfpek1gajPD4Q/+CT6GkDIeb8MePVftYThhHx1ndR66PWA0AYQNY2RQUl/+xLYpsV6D/vBhB8jaq3uo64B6Nty7gg/ahdYozGZsqWriC5I+NGSVjLgPgMIeuEpb1cCXiJqNiJb3n+kPhfNlQykvhUScl4FBDq32vXmmjHXKUXQ0Z+pP5pVeybcfhDhB9arORvVnlsTfvSi5lp2aQDeHU7GK/wWSCCTd017Zc6jMx3L3+L6gZyaOyawr4AD5R1ZLPpI8uKgBbwowo9u1ZaXpacAJ7Z0Ia8l5bHNQClS494fH16UwUXdg6M/sLuacrP3f0j4gf3Vkp8q3gaUv/2JrQJDqKXm9+oaHP2B5WrIUfEZAOHHqGqo/Z0bgHfXAuBjn2wWnQFw9MfoSmdgpwbA0R+o264ZLTYD4OgPTEpmYZcGcM+Wi8nrjfoedaBJzpmYndXZncdz+l+y4wG1KpGxuTMAt8DK35X69FOgFc7ZmJXZWf8njv5AjuyspV4ElL+Hc3/gBtkZ2dohOPoDuTIzV+xtQADlpTUAjv7APJlZubEBeE5FAOTbluGUGQBHf2A3WZm5qQGEPI0UQLqNWd7YAGTm4PJV39LIXL84FBiFV3ZuyvLGaca2c4e5sqYyQI+ic7hpBnDblgD6sDbTa7uCY9fRRxl/mbYA7OFQ4vjZ1hdZNwuIfheA8APLhGYo5W1AAHX6pgE4Tv9pLoADryyty3ZkSF0aCYC4LHGUBgZ2vQHoVfvFZMrCXYSAI8dMXcn4lbcFHM//ufkHcBaRT04BgIHRAICBuTcApv9AjIhsfW0AXucXAOp2OeucAgADowEAA3NtAJz/A7G8M8YMABjYqgHwxB5gLBeZv5hOeL0DwCkAEM8zr5wCAANzawA0EyCHZ9Y8Q8uNREAOt6xx1AYGpg2AJgCM6VDDfzqtAxjM6QFvAQLt8cqty/Rfsv/UVgEk8MqcywxA/hh97JDL00sAzHIk0T2z9b15XQAk/EAul8zxDgAwMK9TgJEvAJ7IEL61dSSSstN3sN5NW+NxyS4NYJFjGb6Pto4CpPTuyOLTtDUWj+xyCrAA4S+PfbAMDQAYGA0AGBgNABgYDQAYGA0AGBgNABgYDQAYGA0AGBgNABgYDQAYGA0AGBgNABgYDQAYGA1gAfsoKgpiHyxDA1jmkxQgX6teiI39kN8F4IUvBAEa5ZFdZgDAwLwawJEtAeRwyZxXA3hkSwA5XDLHo8GABnnl9lBy+9jWAQxEs69H7UNpJoufMsIMAMjjMQOQyB7pNYAv0yaAwXzhbUBgYJ4NgFMAIIdb1twagJyScCoBJPDMGqcAwMAuGgBvBQJjWWX+67mE09sKXAcAgnlmlVMAYGCuDcCjMwHYzDtjzACAgdEAgIF9bQBcwAPGcDnr7jMArgMAMSKyxSkAMDAaADCwKw1ATg1u2+pSXj8HwMQlU9cz/s2FP6/zjMsXGgAsE5VLTgGAgUU2AGYAgI+wLK39wZwGAPWIzCOnAMDAohsADQZYJjRDa3+4zBSObXURmbks/rpxYGReGdqU6U3d5cyWAPqwNtMZU/QHtgSwm/Ds3HSV/limHx9tfZF1Vx8B3Mzx6v8dWXyatq66aQaw9j8A0JyNWc44BXDrZMAosjJzYwNg6g60bVuGU2YAilkAME9mVtIaAID6bG0AzqcBD20JYD23jMzJ7qxwe05JnBsK0JXsrM06BZCf43mqcGJLAFe5ZWNuZmcfjZkFALFKZGz2kV1+3n1b9cC1AOAqz3P/2Vnd6UjMLACIUSpbnuf2O/F8wUDLSmZhpwbAURuo264ZLTYDUMwCMLrSGdi5ATALAOq0TzaLzgAUswCMqoba36sBBMwCHtsSGIVrze+byb2D7N29ApoKUK1a8rModDQBYHc15WbRNQD5vae26sXzbkOgRq41vjSDi4+4zAKA+WrLy+J3AeT36zeOuvEeIKAWAeFfnD2PtwEjvj34kS2BXkTU9OLsuU23A7obpwLoRq35KH4j0CbeAwaUUnMtux5lI14oMwG0rPZMuM4A5O+6baueuB6AVrnXrnfG3I+uQR1PGxWnBGjJgUThi6278Tz6q5Dpde3THiBaKxkIuQgof6frvQEqYkCBCEHhd8+UCjuqRgU2ogsCXlqr+9Aw0QQwkhbrPfQ+APm7o37+M1sCtQipycAMXQj94eJcXsATW3cjjfZ3WfBsAdTiodWkK8tOyKxiJWUqHTg1eiCL99MWUMR9Ke+/bN2V1Hd4PtPOpQObwHey+DhtAanuSFn/z9ZdZYRfpTUAEXJjhJKxOpbF2bQFpLgt9RzxSVitZz01D536r0RfA7hMrweEnLfbjgh5nxRYQ4/8UeHXjKSEX2XOAC7IwIW9OBk8rgkgWtg5v5IaTs1k5gzgQuQLtB3DuwOIolf7uwm/Sm8AKrgJvJEF9wnA2zOrrRAlwq+K/NIVGdDQc51Sg4q+9FynRWYAK/K6I74/4KvoHYf+JYQ/NAPbFG0A4rMMQOizAGgC2FdC+LX2P09bZZRuAOqDDEToswFtR3I6gLn0npXo8GvNf5i2yqmhAag3MiDPbT2E7E+9CYl3CLCNXukPuWFtxWo97ILiLmo7Kv4gg/+brYeRHcBsAN+IPuorKb0fZfFy2iqvlhnAyksZoJ9tPUzGjkZbksKvtV1N+FVtDUC9kIH6l62HsR3u/XBTtOc0Kfxa0y+mrXrUPBX+SfbLr7YeSnYOpwQDygi+siN/deFXNc4AVnQm8E9bD2WFcG/awgDuJYZfa7jK8KsWjnx6C6b7t61swmygb1nBV1JKerX/1bRVp5pnACuvZCBD7xO4zAqEtwv7o2/vZYZfa7bq8KuWjnY6bUv9qC+zgT5kBl9J2egdfsVv8pmjtQI/lH2ZfuskjaBN2cFXUipHsgi9kchTk4VdYscqGkEbqI/5WrgG8I1SA22FxfWBeqWe51/WYvhV00e0Ujtbyf7Wm4jeTVso7ERK4a2tp2s1/KrJGcCKDrxwfwb7HFpw1oCK/H5ceKT7QBQJv9aeFqBtNqnpP/4yrQJbLab1YmgF+9pPVwVbQ2EoGkEM9q+/pk8BrtMdI57aZjFaqEpW9WvKscwDG84ajvpPtcBsswvdHqlqKJjLeiucaOy/HF0XZW1FtEIzWI/9lW+EQgx7hpuH0ZtBraFXsmu6f+ZkV9cANjirOWQagBXZLH79IsFTe7kX7N+qYzXT/QNnRzv6hD2hOErNzWuOmkO+jgy3HhSb+puXGHL62VpRXldrU2Bc2zNkA1hpvWCvk/rVUwj9uumoT0zqJ9307rs/ps0+jBj8laEbgDmSgu7+XA/fktzrY7mKPpmntBEuAm6jjydTfMpvELqvdYfL6tDhV8wArunttABXWfBhGIwNaAR9IfjrMShb0AjaRvBvxuDMRCNoC8Gfh0Ha3V3pBU184+toJPP6cJf/TluYgwawALOCOnC03x8D54BGUAbBX44BdEYziEXofTGYcZr74FGtJPNDfUAnEw0gCTOD3XCkz8EgF0AzWI/Q52PAKzBqQyDw5bEDKtRrQyDw9WGHtOOx9IU/bb1qkvMnsng9baFmNIA+pDcHQt6DW7f+D9bXS9lb1I0wAAAAAElFTkSuQmCC'
-
-plus_icon = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAMAAABrrFhUAAACW1BMVEUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABBQeqIAAAAyHRSTlMADu0D3f4VAc3ve9sP8RIMtyUiqr+o6jX7KWT92o8Jc9nKE5nc9BDDUlyvBOJjJ4TwsVbGOuznzh83bQJl7kEZuQ288i12wEls+tgF5gprFBsgjL4hFtZqBlCtzM+hTzJ+4Xf4PixLPPcLh0rpNIashZPTWJf29cFwxRijRd45KC7H/JWzQnyJGpDXi1dTL3piXirQgUxaySO9bmbgqQhVnK5nouPouGGlJOtfSDbftFHEM3kcdYLR+WCbQEddF8gwVDt9sohDq6OyxrAAAAzRSURBVHgB7d2FetvI+8Xx4zhmO2g7zMzMpTBDmZmZmbndbbvMzMzMvHvu6vdnEDl2YpBkfa4gz7dNK41m5kXUlS99sLt5MM/n7UhsK9tusWwva0vs8PryBpt3P1haDh0rz7q54Pa6llXtJ6ngZPuqlnW3F9zM0l0Ha0ZVXt8qB4PkWNWXV5VhhT6k7W9YUprJkGWWLmnYnwZtW3zhUMVbnIe3Kg5dWAyNejz7tRcZBi++lv04tMZ2pWCokWHTOFRwxQbtqH9+qIxhVjb0fD00ofiV1xIYEQmvvVIMtRvYl8sIyt03ABV7+anqfkZYf/VTL0Odil8vYlQUvV4M9bkzWMioKRy8A3W5c2sro2rrLTUlWPlILaOu9pGVUIfeERdjwjXSi9gz31/PkOT4x1pSNi5zTlVVDi/a8fvvOxYNV1ZNOZdtTGkZ8+cwJOvvmxFjB5sYtD2F3lcLNm1OSzJDljkpbfOmgle9hXsYtKaDiKVzD3sYlBxXypHKgWkEZXqg8kiKK4dB8Tx8DrFiO17IYIylj2RYQ19DGUkfYzAKj9sQE6k+C2fl8N5qLcYcFbfe8jo4K4svFdFX80I7Z3Pgz7rUeWeu+/MAZ9P+Qg2iLO0wZ+FJyV6BsFiRneLhLA6nIaqefpOBdTizEEZZzg4G9ubTiJ6kEzkMxOH7cC/CbO+HPgcDyTmRhCjpKmIgiQ31iIj6hkQGUtSFqMheyACOdf+MiPm5+xgDWJiNyDNdt1CZ/VE3Isr9qJ3KLNdNiLBn+6jsiXeSEXHJ7zxBZX3PIqIWlVKRa8qEqDBNuaiodBEi6LFGKvE/aUXUWJ/0U0njY4iUHmcmFWSev4younxe+Wdx9iAi8o9SyfpdiLpd66nkaD4iwJ1OBY4tJsSAaYuDCtLdCDvrEip4LgMxkvEcFSyxIsy+rKC8xm35iJn8bY2UV/ElwqrzGcq7egkxdekq5T3TiTBaYaeszLxexFhvXiZl2VcgbDrtlDXRDBVonqAseyfCZKaIsk7vhCrsPE1ZRTMIC+tnlFVigkqYSijrMyvCwP025Zw6Y4Nq2M6copy33Zi3/Jcox78WqrLWTzkv5WOezEcpJ/cSVOZSLuUcNWN+nJRzNhWqk3qWcpyYl6prlHHDChWy3qCMa1WYhx8clJFugiqZ0inD8QPmLK2UMt6YhEpNvkEZpWmYo97llFGyBqq1poQylvdiTmzXKaOkBipWI1vgug1zUWeh1Pk1ULU15yllqcMcfJRAqfRJqNzkP5RK+AghK7dT6oYJqme6QSl7OUJkO0Gps1ZogPUspU7YEJrjFkrkvgdNeC+XEpbjCElaLSXe74JGdL1Pido0hGB8HSVOrYVmrD1FiXXjCF42pc5AQ85QKhtBS52gRIkNGmIrocREKoJkTqdEhRua4q6gRLoZwWm2SOtlQWOyJihmaUZQVrooNtoMzWkepZhrJYKxjBJ3oUF3KbEMQTjoodgvbmiQ+xeKeQ5iVuOfUKy/C5rU5aHYJ+OYzacWig1CowYpZvkUs0i2U8ybD42a9FLMnozAVlPM8zk063MPxVYjoGkXxbZAw7ZQzDWNQL6QW0rQKvllnS8QwOJaiowOQ9OGRylSuzikD2HvIkLMIoiQd0P5WLZ4K0Xa6hEZyfZEAXsyIqO+jSJbF0PJVxT7GhFi8lDAY0KEfE2xr6AgqZAiLisixJRAgQQTIsTqokhhEuQtkP9PU8sB5B9tFkBWfhFFvjHpIYDpG4oU5UPOLgtFPoAeAuADilh2QYatiSIdyfoIkNxBkSYbpAb6KfId9BEA31GkfwBS+yhyzKSXAKZjFNkHiSQXRUaglwAYoYgrCWK/UeSiVT8BrBcp8hvEqilyBPoJgCMUqYZIqoNCjfV6ClDfSCFHKoS6KeKDngLAR5FuCIyfplDOj/oK8GMOhU6P4/+7UkahDXv1FWDvBgqVXcH/V0ARJ/QVAI9QpAD/T80QhTyX9Rbgcj+Fhmrwf7I8FErp0VuAnhQKebIC7Qipg94CoI4i2QGegvyd+gvQ6Vd+FjpXK3ld1F0A6et+7Tn8jwsWCtVBfwFQRyHLBfyPQ5LnRB0GkD7tH8J/M1dQaHmNHgPULKdQhRn/ZekBCjmhxwBwUujAUvyX/RS61qrPAK3XKLQf/6WBQrlJ+gyQlEuhBvyXJRRKhz4DIJ1CSxTWi7r1GqBbftUv41sKjGboNUDGKAW+zcB/+IlCpdN6DTBdSqGf8B/yKJQCvQZACoXy8B/6KNSg3wANFOoDAPdDFKrUb4BKCj3kBpDloMCenfoNsHMPBRxZAP6mUG6xfgMU51Lob5l9IV6bfgPYvDJ7Rf6i0PfQbwB8T6G/ABymUIGeAxRQ6DDQ00KhTXoOsIlCLT2S/wUzN+s5wOZMyf+DS9sp4E/Tc4A0PwXal+LXkxQYS9JzgKQxCpz8FbspdNWs5wDmqxTajXsUSoGeAyCFQvewjUIbERXJ4gDJiIqNFNqGPAotw9wkm0Iys5ACC2dMIZlrr2UUyoMvPEviZntCSBZaKGBZmBASuzk8S+M+eMOzQdz8MaPq4zkGmKKQFxsoVDXHAImMqsQ5Bqii0AYkUqhS3wEqKZSINgoN6zvAMIXaUEahRfoOsIhCZdhOoR36DrCDQtuRQ6FWfQdopVBOvAX4XRIg3n8FjH8E4/2/QeNBqCO+H4U7sJxCU/H1MrTceB2O9wURY0ks3hdFjWXxOP8w8sD4NOZeFc8fR1e54/7zuLFBArfjeYvMbcDYJHUznrfJ3TQ2ShpbZY3N0sZ2+fg5MGGVHJgwjswYh6aMY3NxfXDSODprHJ42js8bFygYV2gYl6gY1+gYFykZV2lJLlPrj7PL1OLgOj0nRQqMCxWNKzWNS1WNa3WNi5Xj9mrt+8bl6sb1+saABWPEhjFkxRizYwxaMkZtGcPWjHF7xsBFY+SmMXTVGLtrDF4OOHp7Mo5GbxvD1+XG73viavw+DnoodtUNDXL/QjHPQQThYUrchQbdpcTDCMZKF8VGm6E5zaMUc61EUJotFJvIgsZkTVDM0ozgmNMpUeGGprgrKJFuRpBSJyhRYoOG2EooMZGKoGVT6gw05AylshG88XWUOLUWmrH2FCXWjSMEabWUeL8LGtH1PiVq0xCS4xZK5L4HTXgvlxKW4wiN7QSlzlqhAdazlDphC8NSAnnDBNUz3SDDsqzzUQKl0iehcpPplEr4CHNQZ6HU+TVQtTXnKWWpw1zYrlNGSQ1UrKaEMq7bMCe9y2ULrIFqrSmhjOW9mKO0Usp4YxIqNfkGZZSmYc5+cFBGugmqZEqnDMcPmIeqa5RxwwoVst6gjGtVmBcn5ZxNheqknqUcJ+bHfJRyci9BZS7lUs5RM+Yp/yXK8a+Fqqz1U85L+Zg399uUc+qMDaphO3OKct52Iwysn1FWiQkqYSqhrM+sCIuZIso6vROqsPM0ZRXNIEw67ZQ10QwVaJ6gLHsnwmaFnbIy83oRY715mZRlX4Ew6nyG8louIaYuXaW8ZzoRVl9WUF7jtnzETP62Rsqr+BJhZl1CBc9lIEYynqOCJVaEnTudChxbTIgB0xYHFaS7EQH5R6lk/S5E3a71VHI0HxHR48ykgszzlxFVl88r/yzOHkTKY41U4n/SiqixPumnksbHEEGLSqnINWVCVJimXFRUuggR9WwflT3xTjIiLvmdJ6is71lEmOm6hcrsj7oRUe5H7VRmuW5C5GUvZADHun9GxPzcfYwBLMxGVHQVMZDEhnpERH1DIgMp6kKUJJ3IYSAO34d7EWZ7P/Q5GEjOiSREz9NvMrAOZxbCKMvZwcDefBpRlXaYs/CkZK9AWKzITvFwFofTEGU1L7RzNgea6lIxT6l1TQc4m/YXahB9qT4LZ+Xw3motxhwVt97yOjgriy8VMWE7XshgjKWPZFgRImvGSPoYg1F43IZYOfewh0HJcaUcqRyYRlCmByqPpLhyGBTPw+cQSwebGLQ9hd5XCzZtTksyQ5Y5KW3zpoJXvYV7GLSmg4gx8/31DEmOf6wlZeMy51RV5fCiHa2tOxYNV1ZNOZdtTGkZ8+cwJOvvmxF7vSMuxoRrpBfqsPKRWkZd7SMroR4zf2xlVG39YwbqcmewkFFTOHgH6lP8ehGjouj1YqjTy09V9zPC+qufehkqNrAvlxGUu28Aalf8SnUCIyKh+pViaEL980NlDLOyoefroR22KwVDjQybxqGCKzZozePZ1S8yDF6szn4cGrX4wqGKtzgPb1UcurAY2pa2v2FJaSZDllm6pGF/GvRhZUZVXt8qB4PkWNWXV5WxEjpTnnVzwe11LavaT1LByfZVLetuL7iZVQ4dK1/xYPe9wbs+74bEtrLtFsv2srbEDV7f3cF7ux+sKEe0/Rt193rNUPwr5gAAAABJRU5ErkJggg=='
-
-plus_icon_inv = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAA8VSURBVHhe7d1rc9RWEsZxjCHhYm5h4U3YSrLf/0OFqvAmbCqw3HYJ4O22eohtZsYaqbvP7f+r2pJEbWyPTj+tI41mdHQNPXh4enr6p62nODo6eiSLV9MWWkUDaEd6yJeiObSDBlAhCfqprXZFGgP1VhkGpAK9Bv4qNITyGIACRg38VWgI+djhSQj9YWgGOdjJcY4k819sHStIL7guCxpoABqAM470sZgZ+GJnOiD0ZdAM1mMHrkDw60AjWE7PrXCYWxp8ZdsozIZDx+PW9C+Yi845kxUYGsGsYB520hUIfttoBPuxc3Yg+H2hEWzHTrmE4PeNRnARFwH/do/w98/G+N60BbrhtWvHUhOfbB0DkcnADVl8nrbGNHQD6O2ILwX9WBav5X9RRX0s/3sgu+2PabMPI58WDPnCWw9+rQXLfm3PaC+4uQ/otF6UrTUF2d1DffBomAbQQiFK8f1DFl1Nr7d4LEPxb1uvVuuNd64RXuQNKbi/bL06oxTaLjU3Zhmam7Lo+gJx18VXa3GNHvpdGK983b6w2oqJ0B+G8cvR441AP9RSPFIzJ1o4yv4JM9luUyf2T0VZTf0wbfWjq8KsKPgEPgDj66+bF1JDcRD8HIy1nx5OAe6XLAipg4daDMr+CcFsd6uH9k/prObuT1vtarpoCwdfP1DydtpCYSdSCm9sPZ12IlttTrN/eKnwy1g/kMV/pi1URmeD+lmIdK02gSb/6ILhb3rGNArqY77W/uDrMrbpH98k+G0q0QikVPQTk8183qSli4C3s8OvwVe2icbY8KWOn9Xo7Wmrfq00AP0M+ntbDyc18yC7cBBHx1LotZsUVqtpv2+NFor8iezQ3209nFaKraJDUktppwVSSk9l8XLaqlPtM4BnWeGXwbpD+PunYyzu2GYoq91n01adai74n2QH/mrrobQibBUDyZoNSHn9LIvn01Zdap0B/JIRfhmY+4R/XDr2IvxuPqvlX6atutRY/ClHfh15WwVSZgNSctXNBGoLwY8yDr/ZehjCj22SmoBeE3gxbZVX0ymAXu0PDb/sfN7ew05aGyL07Tur8SfTVnm1hEHf539l6yFkYLXZpd8ZhiaFf3u01KN+krHI5xbOq6EB6B1+oTf5aFu3VWA2qcvQA4aUpb4d+WHaKqN0MMIfy0X4sUZCEyj6eLKi4UjYuYQfq/Vcp8UuAkbuVNmfTwk/vGgtCb2tN0R0g9mnSEiCw88XdiBK6BeOaJex1TTpvzA4/HdlkfapQQzpjpTwO1t3l90Esk8B9Hv0Qsh++14WhB/R3lutRQnLyDaZ3SbsvVUZkO6f4YbqhD1zUuo57Z6VtBlAYPi1GxN+ZPsUNROIyso2KQ1AXlBIN5MB0HP+j9MWkO6j1aC7qMxcltEAQh7eIDter/Zzzo/S9JpA1OcHwh98En0NIOS8X3Z49V+1hOGEfHWd1Hro9YDQBhA1jZGdkv72JXCVFus97AcTfoyotbqPugagb8u5I/yoXWCNxmTKlq4iuiDhR0tayYD7DCDohae8XQl4iajZiGx5/5H6XDRXsiP1rZCQ8yog0KnVrjfXjLlOKYKO/kz90azaM+H2gwg/sF3N2aj23Jrwoxc117JLA/DucLK/wm+BBDJ517RX5jw60035W1w/kFNzxwSWCjhQfieLVR9JXh20gBdF+NGt2vKy9hTgxJYu5LWkPLYZKEVq3Pvjw6syuKp7cPQHDldTbhb/h4QfWK6W/FTxNqD87Y9sFRhCLTW/qGtw9AfWqyFHxRsA4Q+3+PmLMjRFn1s3gtJZOvgUwPMPRriTpeFX9t+6vtODOEuyeXDHWPJLduHoH8trrBinWCUzddAMwPMPBeDv0IwWexeAowowKZmFQxrAbVuuJq836nvUgSY5Z2J2Vmd3Hs/pf8mONxKvMWO8cpTI2NwZgFsByN+V+vRToBXO2ZiV2Vn/pxKdCet5jRtjlic7a6kXAeXv4dwf2CM7I1d2iOyOBD9eY8e45crMXLG3AQGUl9YAOIoA82RmZW8D8JyKAMh3VYZTZgAc/YHDZGVmXwMIeRopgHQ7s7yzAcjMweWrvqWR8XFSYAGv7OzLcsYpwDtbAjhMeHZ2NQD9JhgA/dia6a0NQKYMq542siFTGPfHhQMj8crQrkxHnwJ8sSWAZUIzlHENAEClvmkAMlXwun+c5gI48MrStmxHhpS7CAEfYVniKA0M7HIDcLniKFMW7iIEHDlm6kLGLzQAOUVY/BCJS7x+DoCJS6YuZ5xTAGBgNABgYO4NQM5V+OgvECAiW18bwLb3CAH053zWOQUABkYDAAbm2gA4/wdieWeMGQAwsE0D4Ik9wFjOMn82nfB6B4BTgLowrn3yHFdOAYCBuTUAmgmQwzNrnqHlRiIgh1vWOGoDA9MGQBMAxnRdw39vWgcwmHtHvFXUL8a2X15j6zL9l/p4bKsAEnhlzuv8/7UtAeRwyZxXA/hsSwA5XDLHOwDAwFwuAnZ+kehEdtEbW0dDpCz1Ha6301Z/XLJLA9jrWHYPX3HeMClNfSx2l6eoHtnlFGAPwt8+xnA/GgAwMBoAMDAaADAwGgAwMBoAMDAaADAwGgAwMBoAMDAaADAwGgAwMBoAMDAaADAwGgAwMBrAHvZRUjSMMdyPBrDfZykgvja9UTZ2fF3dHnwhSMc8xlYxvnXyGF9mAMDAvBrAsS0B5HDJnFcDeGBLADlcMsejwTrG2PbLa2yvy9g+tHUAA9Hs6ykA33kPjOmNNoAv0zqAwXzhbUBgYJ4NgAtFQA63rLk1gNPTU04lgASeWeMUABjYWQPgrUBgLJvMfz2X8LixQH4o1wEq4jGminGti2dWOQUABubaALyOOAC2884YMwBgYDQAYGBfGwAXeoAxnM+6+wyA6wBAjIhscQoADIwGAAzsQgOQUwOv71Dnu9gBXy6ZupzxyzMAl+9Ql1OVv2wVgAPHTF3IOKcAwMAiGwBvKwI+wrL0TQM4/x7hGjJl4fsBAAdeWdqWbU4BgIFFNwAaDLBOaIa2/nCZKdy01VVk6sKTWYEVvDK0K9O7ussnWwLow9ZMZ0zR79oSwGHCs7Pviv9NmX58tPVVtl19RDwZP5cPjzB+ZTiO33ey2Hoj0b4ZAHfzAX3YmeWMUwC3TgaMIiszexsAUz+gbVdlOGUGoJgFAPNkZiWtAQCoz5UNwPk04L4tAWznlpE52Z0Vbs8piXNDwR5e48aY5cnO2qxTAPk5nqcKJ7YEcJFbNuZmdnZnz+5MWM9rzBivHCUyNvvILj/vjq164FoAcJHnuf/srB7U2Ut0KCznNV6MVbxS2fI8tz+I5wsGWlYyCwc1AI4EQN0OzWixGYBiFhBLauGerS7m8TOwW+kMLDqie/7Rh3YsHOxYhmvRF7zI0OhDJPhWp0Cls1S8ASiaAEZUQ44WnQIEBPahLYFRuNb80kwuDjKzAGC5WvKzKnQ0AeBwNeVm1bsA8nu9rxB73m0I1Mi1xtdmcPURl1kAMF9teVl9H4D8fv3GUTfeOwioRUD4V2fP40agiG8PfmBLoBcRNb06e27T7YDuxqkAulFrPoreCryP9w4DSqm5ll2PshEvlJkAWlZ7JlxnAPJ36b3j3rgegFa51653xtyPrkEdTxsVpwRoyZFE4Yutu/E8+quQ6XXt0x4gWisZCLkIKH+n670BKmKHAhGCwu+eKRV2VI0KbEQXBLy0VvehYaIJYCQt1nvofQDyd0f9/Ce2BGoRUpOBGToT+sPFqbyAR7buRhrt77Lg2QKoxX2rSVeWnZBZxUbKVDpwanRXFu+nLaCIO1Le72zdldR3eD7TzqUDm8D3svg4bQGpvpOy/p+tu8oIv0prACLkxggl++qmLBZ98y2w0A2p54hPwmo966l56NR/I/oawHl6PSDkvN0GIuR9UmALPfJHhV8zkhJ+lTkDOCM7LuzFyc7jmgCihZ3zK6nh1ExmzgDORL5AGxjeHUAUvdrfTfhVegNQwU3gtSy4TwDenlhthSgRflXkl27IDg091ym1U9GXnuu0yAxgQ153xPcHfBU9cOhfQvhDM3CVog1AfJYdEPosAJoAlkoIv9Z+0Yevlm4A6oPsiNBnA9pAcjqAufSelejwa81/mLbKqaEBqNeyQ57aeggZT70JiXcIcBW90h9yw9qG1XrYBcVD1HZU/FF2/m+2HkYGgNkAvhF91FdSes9k8WLaKq+WGcDGC9lBP9t6mIyBRluSwq+1XU34VW0NQD2XHfUvWw9jA+79cFO0515S+LWmn09b9ah5KvyTjMuvth5KBodTggFlBF/Zkb+68KsaZwAbOhP4p62HskK4PW1hALcTw681XGX4VQtHPr0F0/3bVnZhNtC3rOArKSW92v9y2qpTzTOAjZeyI0PvEzjPCoS3C/ujb+9lhl9rturwq5aOdjptS/2oL7OBPmQGX0nZ6B1+xW/ymaO1Ar8uY5l+6ySNoE3ZwVdSKseyCL2RyFOThV1iYBWNoA3Ux3wtXAP4RqkdbYXF9YF6pZ7nn9di+FXTR7RSg61kvPUmorfTFgo7kVJ4Y+vpWg2/anIGsKE7Xrg/g30OLThrQEV+P8480DEQRcKvtacFaJtNavqPP0+rwFaLab0YWsFY++mqYGsoDEUjiMH4+mv6FOAyHRjx2DaL0UJVsqpfU4517trurOGo/1gLzDa70O2RqoaCOa+3wonG+OXouihrK6INmsF2jFe+EQox7BluHkZvBrWGXsnQdP/Mya6uAezwqeaQaQA2ZLP49YsEj+3lnrF/q47VTPcPnB3t6BP2hOIoNTevOWoO+Tayu/Wg2NTfvMaQ08/WivKyWpsC+7U9QzaAjdYL9jKpXz2F0K+bjvrEpH7STe+++2Pa7MOIwd8YugGYYyno7s/18C3JvT6Wq+iTeUob4SLgVfTxZIpP+Q1Cx1oHXFaHDr9iBnBJb6cFuMiCD8PO2IFG0BeCvx075Qo0grYR/P3YOTPRCNpC8OdhJx3ulvSCJr7xdTSSeX24y3+nLcxBA1iBWUEdONovx45zQCMog+Cvxw50RjOIReh9sTPjNPfBo1pJ5of6gE4mGkASZgaH4Uifg51cAM1gO0Kfjx1egVEbAoEvjwGoUK8NgcDXhwFpx0PpC3/aetUk549k8WraQs1oAH1Ibw6EvAfXrv0fd2qZfH+vFzQAAAAASUVORK5CYII='
-
-trash_icon = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAACXBIWXMAAAsTAAALEwEAmpwYAABCQWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMwMTQgNzkuMTU2Nzk3LCAyMDE0LzA4LzIwLTA5OjUzOjAyICAgICAgICAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iCiAgICAgICAgICAgIHhtbG5zOmRjPSJodHRwOi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIKICAgICAgICAgICAgeG1sbnM6eG1wTU09Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iCiAgICAgICAgICAgIHhtbG5zOnN0RXZ0PSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VFdmVudCMiCiAgICAgICAgICAgIHhtbG5zOnN0UmVmPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VSZWYjIgogICAgICAgICAgICB4bWxuczpwaG90b3Nob3A9Imh0dHA6Ly9ucy5hZG9iZS5jb20vcGhvdG9zaG9wLzEuMC8iCiAgICAgICAgICAgIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlmZi8xLjAvIgogICAgICAgICAgICB4bWxuczpleGlmPSJodHRwOi8vbnMuYWRvYmUuY29tL2V4aWYvMS4wLyI+CiAgICAgICAgIDx4bXA6Q3JlYXRlRGF0ZT4yMDE1LTExLTIxVDE1OjI5OjQzWjwveG1wOkNyZWF0ZURhdGU+CiAgICAgICAgIDx4bXA6TW9kaWZ5RGF0ZT4yMDE1LTExLTIyVDEwOjQzOjI3KzA1OjMwPC94bXA6TW9kaWZ5RGF0ZT4KICAgICAgICAgPHhtcDpNZXRhZGF0YURhdGU+MjAxNS0xMS0yMlQxMDo0MzoyNyswNTozMDwveG1wOk1ldGFkYXRhRGF0ZT4KICAgICAgICAgPHhtcDpDcmVhdG9yVG9vbD5BZG9iZSBQaG90b3Nob3AgQ0MgMjAxNCAoTWFjaW50b3NoKTwveG1wOkNyZWF0b3JUb29sPgogICAgICAgICA8ZGM6Zm9ybWF0PmltYWdlL3BuZzwvZGM6Zm9ybWF0PgogICAgICAgICA8eG1wTU06SGlzdG9yeT4KICAgICAgICAgICAgPHJkZjpTZXE+CiAgICAgICAgICAgICAgIDxyZGY6bGkgcmRmOnBhcnNlVHlwZT0iUmVzb3VyY2UiPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6YWN0aW9uPmNvbnZlcnRlZDwvc3RFdnQ6YWN0aW9uPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6cGFyYW1ldGVycz5mcm9tIGltYWdlL3BuZyB0byBhcHBsaWNhdGlvbi92bmQuYWRvYmUucGhvdG9zaG9wPC9zdEV2dDpwYXJhbWV0ZXJzPgogICAgICAgICAgICAgICA8L3JkZjpsaT4KICAgICAgICAgICAgICAgPHJkZjpsaSByZGY6cGFyc2VUeXBlPSJSZXNvdXJjZSI+CiAgICAgICAgICAgICAgICAgIDxzdEV2dDphY3Rpb24+c2F2ZWQ8L3N0RXZ0OmFjdGlvbj4KICAgICAgICAgICAgICAgICAgPHN0RXZ0Omluc3RhbmNlSUQ+eG1wLmlpZDoxQjVFRDdBOTA4MjA2ODExODIyQURDNzU2MTc0RDdBNjwvc3RFdnQ6aW5zdGFuY2VJRD4KICAgICAgICAgICAgICAgICAgPHN0RXZ0OndoZW4+MjAxNS0xMS0yMVQyMTozNjoxMyswNTozMDwvc3RFdnQ6d2hlbj4KICAgICAgICAgICAgICAgICAgPHN0RXZ0OmNoYW5nZWQ+Lzwvc3RFdnQ6Y2hhbmdlZD4KICAgICAgICAgICAgICAgPC9yZGY6bGk+CiAgICAgICAgICAgICAgIDxyZGY6bGkgcmRmOnBhcnNlVHlwZT0iUmVzb3VyY2UiPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6YWN0aW9uPmNvbnZlcnRlZDwvc3RFdnQ6YWN0aW9uPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6cGFyYW1ldGVycz5mcm9tIGltYWdlL3BuZyB0byBhcHBsaWNhdGlvbi92bmQuYWRvYmUucGhvdG9zaG9wPC9zdEV2dDpwYXJhbWV0ZXJzPgogICAgICAgICAgICAgICA8L3JkZjpsaT4KICAgICAgICAgICAgICAgPHJkZjpsaSByZGY6cGFyc2VUeXBlPSJSZXNvdXJjZSI+CiAgICAgICAgICAgICAgICAgIDxzdEV2dDphY3Rpb24+c2F2ZWQ8L3N0RXZ0OmFjdGlvbj4KICAgICAgICAgICAgICAgICAgPHN0RXZ0Omluc3RhbmNlSUQ+eG1wLmlpZDoxQzVFRDdBOTA4MjA2ODExODIyQURDNzU2MTc0RDdBNjwvc3RFdnQ6aW5zdGFuY2VJRD4KICAgICAgICAgICAgICAgICAgPHN0RXZ0OndoZW4+MjAxNS0xMS0yMVQyMTozNjoxMyswNTozMDwvc3RFdnQ6d2hlbj4KICAgICAgICAgICAgICAgICAgPHN0RXZ0OmNoYW5nZWQ+Lzwvc3RFdnQ6Y2hhbmdlZD4KICAgICAgICAgICAgICAgPC9yZGY6bGk+CiAgICAgICAgICAgICAgIDxyZGY6bGkgcmRmOnBhcnNlVHlwZT0iUmVzb3VyY2UiPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6YWN0aW9uPnNhdmVkPC9zdEV2dDphY3Rpb24+CiAgICAgICAgICAgICAgICAgIDxzdEV2dDppbnN0YW5jZUlEPnhtcC5paWQ6ODJlYTM3NTUtYzlkZC00MTEyLWI2OGMtOWY0N2Y5NDg5YzNkPC9zdEV2dDppbnN0YW5jZUlEPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6d2hlbj4yMDE1LTExLTIyVDEwOjQzOjI3KzA1OjMwPC9zdEV2dDp3aGVuPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6c29mdHdhcmVBZ2VudD5BZG9iZSBQaG90b3Nob3AgQ0MgMjAxNCAoTWFjaW50b3NoKTwvc3RFdnQ6c29mdHdhcmVBZ2VudD4KICAgICAgICAgICAgICAgICAgPHN0RXZ0OmNoYW5nZWQ+Lzwvc3RFdnQ6Y2hhbmdlZD4KICAgICAgICAgICAgICAgPC9yZGY6bGk+CiAgICAgICAgICAgICAgIDxyZGY6bGkgcmRmOnBhcnNlVHlwZT0iUmVzb3VyY2UiPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6YWN0aW9uPmNvbnZlcnRlZDwvc3RFdnQ6YWN0aW9uPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6cGFyYW1ldGVycz5mcm9tIGFwcGxpY2F0aW9uL3ZuZC5hZG9iZS5waG90b3Nob3AgdG8gaW1hZ2UvcG5nPC9zdEV2dDpwYXJhbWV0ZXJzPgogICAgICAgICAgICAgICA8L3JkZjpsaT4KICAgICAgICAgICAgICAgPHJkZjpsaSByZGY6cGFyc2VUeXBlPSJSZXNvdXJjZSI+CiAgICAgICAgICAgICAgICAgIDxzdEV2dDphY3Rpb24+ZGVyaXZlZDwvc3RFdnQ6YWN0aW9uPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6cGFyYW1ldGVycz5jb252ZXJ0ZWQgZnJvbSBhcHBsaWNhdGlvbi92bmQuYWRvYmUucGhvdG9zaG9wIHRvIGltYWdlL3BuZzwvc3RFdnQ6cGFyYW1ldGVycz4KICAgICAgICAgICAgICAgPC9yZGY6bGk+CiAgICAgICAgICAgICAgIDxyZGY6bGkgcmRmOnBhcnNlVHlwZT0iUmVzb3VyY2UiPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6YWN0aW9uPnNhdmVkPC9zdEV2dDphY3Rpb24+CiAgICAgICAgICAgICAgICAgIDxzdEV2dDppbnN0YW5jZUlEPnhtcC5paWQ6ZTA4Nzc5MzAtMjA0Ni00NmIzLWFlNDMtYmIzMThiZWJiOTIxPC9zdEV2dDppbnN0YW5jZUlEPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6d2hlbj4yMDE1LTExLTIyVDEwOjQzOjI3KzA1OjMwPC9zdEV2dDp3aGVuPgogICAgICAgICAgICAgICAgICA8c3RFdnQ6c29mdHdhcmVBZ2VudD5BZG9iZSBQaG90b3Nob3AgQ0MgMjAxNCAoTWFjaW50b3NoKTwvc3RFdnQ6c29mdHdhcmVBZ2VudD4KICAgICAgICAgICAgICAgICAgPHN0RXZ0OmNoYW5nZWQ+Lzwvc3RFdnQ6Y2hhbmdlZD4KICAgICAgICAgICAgICAgPC9yZGY6bGk+CiAgICAgICAgICAgIDwvcmRmOlNlcT4KICAgICAgICAgPC94bXBNTTpIaXN0b3J5PgogICAgICAgICA8eG1wTU06RGVyaXZlZEZyb20gcmRmOnBhcnNlVHlwZT0iUmVzb3VyY2UiPgogICAgICAgICAgICA8c3RSZWY6aW5zdGFuY2VJRD54bXAuaWlkOjgyZWEzNzU1LWM5ZGQtNDExMi1iNjhjLTlmNDdmOTQ4OWMzZDwvc3RSZWY6aW5zdGFuY2VJRD4KICAgICAgICAgICAgPHN0UmVmOmRvY3VtZW50SUQ+eG1wLmRpZDoxQjVFRDdBOTA4MjA2ODExODIyQURDNzU2MTc0RDdBNjwvc3RSZWY6ZG9jdW1lbnRJRD4KICAgICAgICAgICAgPHN0UmVmOm9yaWdpbmFsRG9jdW1lbnRJRD54bXAuZGlkOjFCNUVEN0E5MDgyMDY4MTE4MjJBREM3NTYxNzREN0E2PC9zdFJlZjpvcmlnaW5hbERvY3VtZW50SUQ+CiAgICAgICAgIDwveG1wTU06RGVyaXZlZEZyb20+CiAgICAgICAgIDx4bXBNTTpEb2N1bWVudElEPmFkb2JlOmRvY2lkOnBob3Rvc2hvcDplYTM4Y2FiMC1kMTA4LTExNzgtOTU1NC1jMDUwNTIwYjZmMzE8L3htcE1NOkRvY3VtZW50SUQ+CiAgICAgICAgIDx4bXBNTTpJbnN0YW5jZUlEPnhtcC5paWQ6ZTA4Nzc5MzAtMjA0Ni00NmIzLWFlNDMtYmIzMThiZWJiOTIxPC94bXBNTTpJbnN0YW5jZUlEPgogICAgICAgICA8eG1wTU06T3JpZ2luYWxEb2N1bWVudElEPnhtcC5kaWQ6MUI1RUQ3QTkwODIwNjgxMTgyMkFEQzc1NjE3NEQ3QTY8L3htcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD4KICAgICAgICAgPHBob3Rvc2hvcDpDb2xvck1vZGU+MzwvcGhvdG9zaG9wOkNvbG9yTW9kZT4KICAgICAgICAgPHRpZmY6T3JpZW50YXRpb24+MTwvdGlmZjpPcmllbnRhdGlvbj4KICAgICAgICAgPHRpZmY6WFJlc29sdXRpb24+NzIwMDAwLzEwMDAwPC90aWZmOlhSZXNvbHV0aW9uPgogICAgICAgICA8dGlmZjpZUmVzb2x1dGlvbj43MjAwMDAvMTAwMDA8L3RpZmY6WVJlc29sdXRpb24+CiAgICAgICAgIDx0aWZmOlJlc29sdXRpb25Vbml0PjI8L3RpZmY6UmVzb2x1dGlvblVuaXQ+CiAgICAgICAgIDxleGlmOkNvbG9yU3BhY2U+NjU1MzU8L2V4aWY6Q29sb3JTcGFjZT4KICAgICAgICAgPGV4aWY6UGl4ZWxYRGltZW5zaW9uPjI1NjwvZXhpZjpQaXhlbFhEaW1lbnNpb24+CiAgICAgICAgIDxleGlmOlBpeGVsWURpbWVuc2lvbj4yNTY8L2V4aWY6UGl4ZWxZRGltZW5zaW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAKPD94cGFja2V0IGVuZD0idyI/PnJWVd0AAAAgY0hSTQAAeiUAAICDAAD5/wAAgOkAAHUwAADqYAAAOpgAABdvkl/FRgAADINJREFUeNrsnVuIXVcZgL8zyUwnTCbTTmZGg02xadAIXiqNSn3SgniDilpveAOfxIfSPklBKPrSp4rY4qMvFqyXWggqiA+lDyLFUooRWzGtxVhrM5mJ6Vwyl+QcH/aOZZI0mTn7ti7fB4e0KWlmr/Wv7/z/uuzVGwwGNEmv10OuyQhwFLgDuA14G3AjMAFcF/mzrQMrwL+AvwNPA08AfwL6dv3VaXx8KoBOeQvwLeArwE2ZPfs/gUeAHwEvGwrdCIDBYNDoR67IDPAQsAYMMv+slW0xY1h0MD4VQOvcBZx24F/2OV22jbQogBGbuDV2AT8EfgHstzkuY3/ZNg8Bu22OdnAOoB32AI8Cd9oU2+LXwBeAVTMAJwFT+Ob/lYN/xxwDPgNcUADNYQnQPN938A/FnWXbiRlAtHwO+LlhVonPl3MDZgAKICr2A88Bs47hSiwCR4B5BWAJEBPfdfDXwjTwPZvBDCAmbgJOAKOGWC1sAocpdg+aAZgBBM83Hfy1Mlq2qZgBBM8I8BJw0PCqlZPAW8nsAJEZQHwcdfA3wsGybUUBBM0dNoFtqwDy5TabwLZVAPlyxCawbRVAvhywCWxbBZAvkzaBbRsLLgPWj29BaThmswomlwFFRAGIiAIQkfrw3WvWwLWXrXaRGYCIKAARUQAiogBERAGIiAIQEQUgIp0R0j6AvcAngQ8DtwI3A1PAdXbTFgY+f1SsA2eBfwDPAk8AvwGWQ/jhQjgMdAi4D/hiKQGR1FmmuCvyAeDFq9ou4YtBxinenX8PMGZMSIZsAD8A7gfWchLAIeCxMtUXyZ1ngc9eKRtIUQDvBH4PvNl+F/k//wE+AvwlZQEcBv4AzNnfIpcxD3yQ4lapVgTQ5jLgOMVNuQ5+kSszS3ET8nhbf2GbArgfeK99LHJVbi3HSiu0VQLcQnFVtvfliVybTeAdwAuplADfdvCLbJvRcswkkQFMAq8AE/aryLZZAQ4MBoOl2DOATzj4RXbMRDl2oi8BvNBRJNCx04YA3mM/igzFu1MQwC32o8hQHE5BAPvsR5Ewx04bqwC+J15kSAaDQaP3QPhGIJGMUQAiCkBEFICIKAARUQAiogBERAGIiAIQEQUgIgpARBSAiCgAEVEAIqIAREQBiIgCEBEFICIKQEQUgIgoABFRACKiAEREAYiIAhARBSAiCkBEFICIKAARUQAiogBEJEQB9Cp+7rWbJFLurSH+s88AzhhHEinBx64CEFEAQbNoHEmkLCoABSAKQAFYAoglgAJQAGIGoAB2xBpwzliSyFgF1hWAWYCY/isABSCm/wpgWBaMJ1EA+QrApUCxBLAEEFEACkDEmFUAIsasAhAxZhMXgKsAEhsLCsAMQMwAFIACEAWgABSAKAAFoABEAYRCbzAYNPsX9Gp5r+Eu4LwxJRGxC+hX/Z80PT5jyQAuAGeNKYno278fww+6O6JGXQSmIvg5+6WsNoCV8rNR/t4m8FHHx1X5HTBa9vUYMFF+xsrf8yU2GQvg5gB+jk9RvOzhTDmglyleWLIGvFZmK1djuQzo1sq8qlloiz/rCvCxbaTW+4BxYA+wtxTGDeW/H1MAaQoglEZ9Cni1wp8/FYjIQmR+m+XgG8XCm4zVNOcAQmrU/RX/vLsam2ubaWNVATTNXA2ljDQjgDljNV0BhDJwqn7LzDvO35DTHWdnqcWqAgiwBDjtOFcACiDetGrWEiDYEmDWWFUAZgBmAMaqAghWAM4BNNc2CkABBF8CuAzYXHk0Y6wqgKaZUQDBzgGEIgAnAQMMjrpwGbA5TiVSAiwogPpZIowjwWYA4X5zhiCAi+dDFECiZcD1FIdPhmWd4tCLbGWF4kDVsOymOBBkjCYsgFR2A55yvNdeGrkCYAbQGh4ICq9uVgAKoDU8EBSeADwIlIEAQvnmdDNQeCXAtDFqBhDLHIDbgetvE0sABRBNCeAcQP1lkQeBFEA0JYAZgBmAArAEkBrnABSAAmgNDwSFVwJ4ECgDAYSyfOZ24PpJ5WUgiwog/cb1QFD9nOq4TxSAJYAlQMQZgEeBhyCWy0EvMk5xC08IjFGc/BqWtm4IiuFmoBWKG36GZZTi+rUQGKc48FULXg66lTWKa7lCoOqs86tIaun/ap2D3xIg7DKgqgA8D1Bf+u8SYEYCCGXgOA8QTp/OGZsKILYMwJWA+trCFQBLgNapGnRmAK/jNmAFEF0jeyDIEkABZNzIHggKpwQwA1AA0ZUACqC+tpg2NhWAJUC8eCmoAohu4FgChNOnM8amGUBsAnAZsL62sARQAK1T9VvHnYDpZQAKIKNGnqL6DUHLjn1WqLZ/fpTitiZjUwFEVwZ4Q1A6B4GizOrcCtytACwD0kn/zQBaoo8vBkmJlF4H3lcAeZnWlYDuSwB3ASqAaAVgBlC9DVwCVACd4W7A7gXgQSAF0Bm+Hbg6HgVWANmWAG4H9iCQAhiCVF4L5jKgF4IogIgb2wygewF4H4AlQLQCcA7Al4EogIgb2wNBZgAKIOPGnqK4IWhYcj8QtEz1g0BTxqQC6JKqs9A5HwhKZRegAogsbQypDMh5M9BiQgJYUADxBE6duBTY3aCZNSbzFMAy1W7mtQQIg1RWADaJdC5nJOLg8UCQGYC7ABVA51Q9jGIJ0F3bKwAF0HkJkPNmIA8CKYDsS4CctwO7C1ABRF87uwrQ3bPPGotmAF1TdR9AzhmAJYACcA7AEkABKIB4G903A3dXAngQSAF0zj6qHQjaAJYyHPweBFIAyTS6ZcDO8SCQAkgmdfZAUPvp//6EnkUBRN7oLgW2L725hJ5FAWReAuR4IGi+4za3BFAAlgAdksoeAAXQEevAqiVAtiVcKCXAKtVWMxRAAuat+m1kCRBvCXAm5k6IXQChfHNWDUZLgHhLgEUFYON7SWj7feeNQArAI8FmAMagAoi/BMhRAB4EUgDJNL4HgvItARSAje+BoB2yRLWls7GyzY1BBRAMXhTa3rO6C1ABBFc7uxuwvWedSehZFEAi9lUA+dX/ZgA2fm0lQE67Aas+qyWAAkhOADmdB1jouK1DymYUQCICcCmwvUEzZwwqgNQyAFcBLAEUwA7pk85uwJwygJS2AfcVgAauIy21BIivBDgTe0cogHBKgJzOA3gOQAEogIwFUPVZfRmIAgiuE1wFaO9ZPQikAILrhEmqHwh6LYPBv1Q+67B4EEgBbCGkjRguBTb/jNPGngIItRNmcg+oFtL/GWNPAaQqgBzmATwIpACS7QQPBDX/jF4IogCSFYAlgAJQABF3grsBm3/GkEoA5wDshC1UnaF2FSCuDEAB2Am1BmcOuwGrZgAuAyqALSwDm4mUAM4BNN/GdbFZxp4CcB7AEqDFLMeDQAog2M6wBGj+GT0IVCO7FUCtbGeGugdcT7GnfaL8jAFT5T+nzlFgBThLcSZgpfxsAP8FBpGUAApAAVzGJPBbYBS4ofx1L7AHGKc4xLKr5Z9pEFhfHbvGf79AcShqDTjH63M8Z8pfJ405BXApIa2ffxypwq5SnsaccwB52ViMOQUwHIvGoygAMwARY04BiBhzCkDEmMtCAAvGoxhzZgAibbGoABSAWAIoADtDFIAC6JJ1YNWYlJZYLWNOAWhk8dtfAYSAuwHFWFMAIsaaJYCIsWYGIKIAzABEjDUFIGKsWQKIKAAFIDIkCwpAK0u+uAyoAMQSQAHYKaIAFICdIgogRnqDQbP3RvR6vTZldp7i5h2RphhQ3KfRb+Uva3h8ppQB9Mnjck3plvm2Br8lwM55yfgUYyxfARw3PsUYy1cAfzQ+xRjLVwBPGp9ijOUrgBPAn41RaTD9P6EAwuZnxqk0xKOpPVBK+wAuMgO8DIwZr1IjG8CNtLzU7D6AnXMa+InxKjXzCAnuM0kxAwA4CPwN2GPcSg2cA94OnGz7LzYDGI6TwIPGrdTEg10MfjOAaowBTwPvMn6lAseBo+UcQOuYAQzPBvBlvDJMhme1jKGNVB9wJPEOPA58jeIEl8iOvnyBr5P49vKRDDryMeBuJSA7HPx3A79M/UFHMunQh4F7SOgYpzRGv4yVh3N42JQnAa/Epyn2CEwY53IFVoCvAo8Hk4o4CVgrjwPvA54x1uUSngHeH9LgtwRohueA24HvAMvGffYsl7FwO/DX3B4+txLgUg4A9wHfsCzIMt3/MfAA8EqoP2Tj4zNzAVxkuqz9vgR8wLGRNE8BP6WYCwr+gg8F0E1W8KEyJTwCHCoFMUnxNlgJn/PAUjnAXwSep3iTz5PAv2N6kKbH5/8GAHTYH9pwH4y2AAAAAElFTkSuQmCC'
-
-trash_icon_inv = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAWHSURBVHhe7dvZkhs1AEDRDFBFwv//LVDBqnGKISGb3VIv95yXsZ/GllvX6nbr5R27+3hzf5jycnN/yE58ADuqTvzPCcF+DPwOTPz/JwTrGfDFTP5vE4G1frn/Zb5fTf7vu4/Rb6/PmE0A1vhwO67/uj/mO25j9eftzx+vz5jJcmu+8c1v8j/gdjYwVgJ/vz5jBgGY7L6k5UGuCcxlcCcy+bchAvMY2ElM/m2JwBwuAkKYqk7g238Oq4DtWQFAmKJuzLf/XFYB27ICgDABgDABgDABgDAXVDbkAuAaLgRuxwoAwgQAwgQAwgQAwgQAwgQAwvycsqFVPwMe9Wew+vs/IysACBMACBMACBMACBMACDvs1dRVV5RhhaP+cnGYF2XCU3KUIOz+Ikx8yvYOwZ7XAN6b/NTd58D712fr7VIfEx++tMdqYPk/NPnh61ZHYOk/M/nh+1ZGYOU1gN3Oc+Bkls2VZaXx7Q8/btUqYMk/Mfnh562IgFuBIWx6YXz7w+NmrwKsACBMACBMACBs6vmF83943szrAFYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAEPZy/zvNx5v7Q+AnvdzcH04xPQDPEhDObPYEfpZTAAgTAAgTAAgTAAgTAAgTAAgTAAg7/H0Ag3sBOKOj3wMwWAFAmABAmABAmABAmABAmABAmABAmABAmABAmABAmABAmABAmABAmABA2Cm2Aw9n3RL8dkuobc0/5gpj9vY9HJkAPODRD3ev9+D1rvfoe1jNKcBCZzko9mSM1hIACBMACBMACBMACBMACBMACBMACBMACBOABxzpjjNe+UweIwAQJgAQdpoAuEecszjTsWoFsJiQfZ2xWU8AIEwAIEwAIEwAIEwAIEwAIEwAIEwAIEwAHmTzyXH4LB4nABAmABAmABAmADuw6eVLxmQfpwqAg4SjO9sxagUAYQIAYQIAYQIAYQIAYQIAYQIAYQLwBJtQ9uczeI4AQJgAQJgAQJgA7MS+hn8Zi/0IAIQJAISdLgCWixzVGY9NKwAIEwAIEwAIEwAIEwAIE4An2YyyH2P/PAGAMAGAMAGAMAHYkbsajcHeBADCBADCBADCThkA540czVmPSSsACBMACBMACBMACBOADdiUsp4x34YAQJgAQJgAQJgA7Kx8U1P5vR+FAECYAECYAECYAECYAEDYaQPgCjJHceZj0QoAwgQAwgRgIzanrGOstyMAECYAECYAECYAB1D8SbP4no9IACBMACBMACBMACBMACBMACBMACDs1AHwWzJ7O/sxaAWwIZtU5jPG2xIACBMACBMACBOAgyhd0Cy916MTAAgTAAgTAAgTAAgTAAgTAAgTAAgTAAg7fQCOdlOJzSrzHG1sr3BD0yXuyDrygXG013Y2Rx7Lt6/trAQAHnSFALgGAGECAGECAGECAGECAGECAGECAGECAGECAGECAGECAGECAGGX2Aw02BDESlfYCDRYAUCYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAEDYZXYDDnYEssJVdgIOVgAQJgAQJgAQdqlrAIPrAMx0pfP/wQoAwgQAwi53CjA4DWCGqy3/BysACLvkCmCwCmBLV/z2Hy67Arh9Xr/fH8JTrnwsXXYFMFgFsIWrfvsPlw7AIAI848qTf7h8AAYR4BFXn/xDIgCDCPAzCpN/yARgEAF+RGXyD6kADCLAt5Qm/5C7EWh8wDd+IuQ/xjExDoz704zcG37LaoChOPE/SQfgEyFoKk/8TwTgM2JwbSb9W+/e/QNz0ydo+FsDyAAAAABJRU5ErkJggg=='
-
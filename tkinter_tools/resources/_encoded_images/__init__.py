@@ -0,0 +1,14 @@
+# ==================================================================== #
+#  File name:      _encoded_images/__init__.py  #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Source hash:    eda70e160208                 #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Index of the embedded data   #  |#   #   $      #|  #
+#                  for images in ./assets/,     #  |#   #   #      #|  #
+#                  each image is stored in its  #   #\  #   #     /#   #
+#                  own module. This file is     #    *= #   #    =+    #
+#                  automatically generated      #     *++######++*     #
+#                  using image_encoder.py.      #        *-==-*        #
+# ==================================================================== #
+
+ASSET_NAMES = ('eye_icon', 'eye_icon_15px', 'eye_icon_23px', 'eye_icon_30px', 'eye_icon_inv', 'eye_icon_inv_15px', 'eye_icon_inv_23px', 'eye_icon_inv_30px', 'minus_icon', 'minus_icon_15px', 'minus_icon_23px', 'minus_icon_30px', 'minus_icon_inv', 'minus_icon_inv_15px', 'minus_icon_inv_23px', 'minus_icon_inv_30px', 'plus_icon', 'plus_icon_15px', 'plus_icon_23px', 'plus_icon_30px', 'plus_icon_inv', 'plus_icon_inv_15px', 'plus_icon_inv_23px', 'plus_icon_inv_30px', 'trash_icon', 'trash_icon_15px', 'trash_icon_23px', 'trash_icon_30px', 'trash_icon_inv', 'trash_icon_inv_15px', 'trash_icon_inv_23px', 'trash_icon_inv_30px')
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAWiElEQVR42u2de4yX1ZnHPwyIAjtyEStZK9gBISxFgoDsApo4oAgWYxVlzWo1a1FLBdFmK4qtjW3XVWlBXAl2pepSFmFVoqz1hpvIJWKjgKYKCFSgtOKNckeG2/5xntkMUwYGfue87znv7/tJTkKGmfd9z3Oe570857mAEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCFEflQC5wADgRHADcBdwCTgP4A5wMvAImAp8A7wno137GeL7Hfm2N9MsmPcYMccaOeolLiFyIfTgfOBkcBEYJYZ7zrgc6AGOBRo1Ng51tk5Z9k1jLRrOl3LI4Q/WgJ9geuBXwILgY3A7oBGfqJjt13bQrvW6+3aW2oZhWgcpwD9gTHAbGA1sCtCY2/s2GVzmG1z6m9zFEIYHYFrgOnAh8CehA3+WGOPzXG6zbmjll+UI92Bm4EXgc0FNvhjjc0mg9EmEyEKS5Up+qvAljI2+obGFpPNaJOVEMnTBuchfxb4TEbe6PGZyWykyVCIpOgLPAiskTGXPNaYLPtKrUTMVNoT6yXS9tzHvKPwkslYgUgiGjriouU+kJFmNj4wmWsXQeRGD1yo7CcyyNzGJ7YGPaSOIivOA2YAW2WA0YyttibnST1FSMfeU8BOGVy0Y6etkRyGwhu9gKfl2EvOYfi0rZ0QJ0Q34DFge0GN5GC9UcQ5brc17CZ1Fo2lA/Bz4IsEFX43LlV3MS6QZjpwH3ArMAq4FBgA9AZ6mmF0s3/3tv8bZr97q/3tdDvWYjv27gTl8oWtaQept2iIlsAtwNpElHoTsAB4HBgHXIQLoW0PNA8gn+Z27Co71zg79wK7lhRkttbWWCnK4jCG2hMuVsWtAX4PzATG4tJqzwAqIpBdhV1Lf7u2mXatNRHLc7GtuShzzjGvcYzKugl43ozqXKB1QnJtbdc81uawKdKb6lOmA6LMaAXcSXypuCuBacBwe6oWhTNsTtNsjrGlJN9pOiHKgAtwZatiUcCPgEeBasoj862NzfVRm3ss67DQdEMUlPbAw8RRcedzXEHNK4C2ZbwmbU0Gs0wmMVQseth0RRSI4cD7ESjY28APgE5akr+ik8nm7QjW6X3TGZE4pwOP5Ozk2w7Mxe3Bt9CSHJMWJqu55BuEVWO6o1LniXIJsIJ8vfgPo0y1UuhhMsxzF2GF6ZJIhErgAWBvTgqzGrgbOFNL4Y0zTaarc1rTvcC/okIk0dMbeJP8tvDGAe20DMFoZzLOayvxTdMxERkVuMYTW3Iy/LGoeGWWtDGZ53Ej2GK6VqFliIMOuPDTrBVhA64sVVstQW60tTXYkMP6z0TJRblzAa67bdaZZQ/oGz86H8EDZJ/B+R4KHsrtlf92YAfZbgv9hmJ49SuAZvVGEV5pe9gaZbntu8N0UZ8EGXEa8CTZh4lenJicKnEVca40BZ0MzAHeAJbZ9/M6GyvtZ2/Y70y2v7nSjpGa9/tisg/3ftJ0UwTkXFxf+iy/878HnJyAbFoDg3HbZfNxrbp9vCHtsGPNt2MPJo3MxJNt7bL0Dyw1HRUBuIbssvf24opdxF53vh0uln4GsB7Yn4Fs9tu5Zti5Y9/27GhrmVVcyGbTVeGJZsC9wL6MFnAZ8ReL6Ierh/8x+cfNf2zX0i9ymQ21tc1CJvtMZ5vJfEt/wj2d0aJtA+6P+Hu3wpR4HnHW5dtt1zY0YodYpa3xtoxk8jQKDDthupJdma7FuIKYsTIEeBk4EKHh1x8H7FqHRCzPARnrVleZ8/FxIc47nUWm3o+Jt0hkT+CZjL7tQ/gKnrE5xEhLW/ssMg7XmU6LRnAt2YT0/g4YFPGr6kSK0X5sq80l1k+rQaYLWYQQXyvzbpgmwA8zcPbV4Pa5T43YwbekAIZffyyJ2FF4qulE6ACifabjTWTuh3MKMCUDJVwLXB6xk29chg6qPMY2m2OsTsLLyaYvxBTTeYFL6JidgdDnAWdHKoM8ohvzHDFHzZ1tuhJaBrNRIhlnAq8TPlZ7AtA0UhlUFfSVvzGfBFWRrklT05nQuSavU8ZJZV2BdwMLeDWuBHWs9CW/KjcxjNXE3cq7OoP1eZcy3CbsDawKLNgXiTuUdxDp9NQLXTtxUMTr1NF0KaQMVlFGlYYuIGyCRg3wM8I0yPTFQOLrSpR3d56BEa9Xc9OpkLsEGyiD2gLDgE8DK9KoyGXQJ4In/z7gK1wjjD32733k/ybQJ/K1GxX4xv2p2UghuYqwgS0rElCgzsCaDI3qgBnWb3FbT2OAy+y7uwtwlo0u9rPL7Hem2N9sItvw4zUmo9hv4CsIGzh1VdGM/9rAHtXniL8+W9uMvP0HgeXAQ+bEaseJBZ40sb+ttmMtt2NnsTsQ+/ZYB9O5kDtXhYkavJFw2WsHcamozSOXQVPC7/NvxRWqHEKY3IaWduyZhA9RfpJ4t23r+gUmBbwp7jbbSZqbCVeIYSdwWyJyGBfY8B8Dumc4n+52zpA3gnGJrO1tpouhCtPcnKrx3xLQa/on4FuJyKEf4cJ7nyff7aPedg2hwob7JbLG3zKdDLWrdYue/IfvmfZJRA6tgLcCyGAjcD1xJJU0sWvZGGCeb5kMU6AP4WJbalJ6Exgd0PgXEW/46JG4J4AMXiXOyLGudm2+53tPQutdZToa6nNgdOwC+G5A43+OtMou9wjwjfwIcbcYb2HX6NvHkVIvhtMIt0Ow12wsSr6DCygJMfFfRa749anA1df3WV1nQkLzn4DfKkZzSKvxRgvT2RC28JXZWlRcE9AT+iDpdV0Z4tEBuh8Yn6ATeLzHm0ANcdcYbOgh8CDhdsCiKT1+OWG83PsSe+rV0gx4zaMcUpRB3TcBX3J4jTTLbE8gTJj1NiIobnMJ8GWg15wxiSr9UI9Pvqmkz1SPb0JDE5XBmECfx1+aDebCAMIkRuwg3QioJsALHp94LQtwA2jp8Y3oBdKtp3cjYcLhN5NDSftzce2hfE/mL8DVCSt7H1x2nY/MuM4Uh874yYDcQzoxIEfiatNx33azngx7ElYRJuDhS2BE4oo+yYMcDgDXUTyuw09m4aTE5TAi0GfzKjKIkflb4J0AF/8F6edBt/X0VjSP+BNhToSm+Cm2uZ70i2kOM533bUfvmI0GU/AFAS760zwdGR65gtIzw7YDvSguvSi9E89Bk3XqXEKY4jgLQtwgW+DaPIUw/uqCKPevPchjGsVnmgc5/bogsqgOdBN4Bo+BcxX428qpOz4nveCOhjiV0uscbgW6lcENoBulh0ivJ97OTsfLELMF3/Y1FU8BdD8K9M0/tEBKXU3pwR4zKR9mUnqQWHWB5DE0kE/gR6Ve2HfxXxPuS2B4wRT6bkoPcqkuoxtANaUHS91dMJkMx//uwAFKSB4ajv/AhW0FceDUZ36JcllOWslOPnxKy0uU2fwCyuUK/IfV7ziRB+55wJ89X8guitkeuZLSi2E8RPnxUIky20i8LcdL4VqzFZ+292ez6UbREfgQ/7H9NxVUkXtRWibkAeCiMrwBXFTi5+VOirtlehP+cwc+pBGdstoA/+v5xPuBsQVW5G9TethvuzK8AbSj9PDgbxdYPmPxW1OhNkbgqLsn0/Dviby34Io8vkT5vEwxI/+ORVObeymyG19wGd0bwB5/1tDJLsZ/Fd9JZaDIk0uU0RTKlyklym5yGchokmeb3Ap8s/5JmgGveD7RE8BJZbBAc0uU05gyvgGMKVF2c8tARieZLfm0zSlHcmT57N7zPOmUcy6VUvMjLivjG8BlHr5py4FW+O2/sMr8ff/P9z0efBHQvkwWpgJYRmkRbX3K+AbQh9IiKJeRXr3IE6U9/kqO1wD96x58hqcDfwB0KjNH1kpK2x7tUsY3gC6Utt21kvJyoHYyG/Nhq4fF5Pj4/v8jadVv9/V9tq4Eme0Bvl7GN4CvU1oFpXVl4meqSw+zNa+9FxfoBqAbgG4A5XsDmIs+AfQJoE+Asv0EuF9OwNycgH3L+AbQV07AOJyAQ/G7z6htQG0DNgZtAzaO4NuArfFf6VeBQAoEOhYKBGqcnyl4IBDAv+A/7lihwAoFPhpTUCjwscgkFBh7JXgXJQMdL+NRMtCJoGSgY5NpMhDAP+C/NpnSgZUOfCSUDnx0ckkHBhiF/2IEKgiigiD1UUGQhsmtIEgtdwR49VBJMJUEq4tKgh2Z3EuC1fJwgJuAioKqKCioKGhDXEEkRUEBTgZmBbgJqCy4yoIPRmXB6xNdWXAI1w9QjUHUGKTUSDY1BsmgMQi4bqPLAlxc0VqDraf0/Vm1BlNrsOhagwF0BdYGuEg1B1VzUDUHjbw5aC398N8sRO3B1R5c7cETaA9e91vlL4F8AsMSX9C2Hj4DDgHzKGZkYFObW6nyWR9SwTNiWKBv/nfskz0oV+N/n7J2d2BE4gvrI277AHBdAW8A1+Gn0Wzq+SUj8O/tr83wq8pqEv+M/x4Ch+zt4uqEF7cPpVW4qRse3LlAxt+Z0sN+aysopVxE9epAb9DrgXOznsztHr55GwpcuDHRBW4CvOBJDq8BLQtg/C1tLj5k8oLJOEVuxH+37UPAZmBAXpOaGGBCtbkDqebJD8VfEsfUAtwApuIvqSzV2JEx+I/tr/1szt2B/tNAN4F9wIQEF7uZxyfeoURlUMsEj3J4zWSbogz2ESas/vJYXnsfDHQTOGTHTq3u2xCPPpL9pJn3Pt7jm1AN6QWNVQS0i53ANTFNtimlV3c52vgVaSXLVABzPM5/f2JvAhPwm8s+J7GHQAvT2VCfx9+JcdInEaa9eO14DjgtISXoQekhr/XHI5HfCFvYNfouYZVSv4nTTFdD2MBeIq+r0TzwTWARGe51euCeADJ4FReaHRtd7dp8z/eehNa7Cn+lu49k/KNTEEJz4LGAN4FVpLMX3Ap4K4AMNgLXE8eWWBO7lo0B5vkW6ZSX74P/ytp1jf/mlBwgzYF/D3gT+BPp1NPvh/8iD3X7L/TOcW698Vuvvr6Xu18ia3yZ6WQIOdQAtyToBKY5/vaAG/KE3paILMYFlMNWe+PqnuF8uts5twac17hE1vY2SqsJWagnf32aEaa0WN3MsEl2s4mZpsCTAeVQeyOYidsuCxFB2NKOPTOw4R8yWcWeENXcdO9gIBnsJt2I2MOoIFywUN0dgg6Ry6EtsCSwHGpvistxRTerceW3T8RX0MT+ttqOtTygstcdS4g/268D4Tz9teHwhSugOzGw4qxIwDnYGViTgRHVzSzcBPwWF6cxBld7rg+uM+9ZNrrYz4bb70yxv9mEnwy+xo41xJ8E1cd0LeSb3FUUlDvw3+ygfmLEqAQUaFOGRtVQmPVXuOy6PfbvfTlf06YEbuCjTMdCyeBT0q+LcUxuIkw9gbpe059G7hcYGFiRUhubTSYxf+//lDAp8LVjA3ABZcJIYEtgpXqR4+iEkgODIngTiGFsMlnESkfTpZAyWEW+27m5cAlhagzWHauJu+hoX7vGcjX+1SaDWKnOYH3eJc7IzswMYGVgAe/AJafEuq1UldHuQGxjCfGGdTc1ndkRWAavA2dS5lQBSzNQuHnA2ZHK4DTCxwnENJ4k3sSus/FTvPRYYzbpFzf1xtcovb9eY8ZaIimicAQqcNFv2wps+NtsjrGm9l5OmP4X9ccU4BSZ/eH8DTA9A+HXAJOJt7NMv4J+Eiwh3tj+U00nagi//fpD0q1rmMlT8G7CxgrUjt9F7H2uxAVObS2A4W+1ucTaynuQ6UJoOWyhgNF9ofgnwpRPPlInnh8Tb/Xdnrg2T/sTNPz9du09I5VtS1v77RnIYh1wocz6+LgQ+CgjZV1MjqWVG8EQ4GWyDcstJfz4ZeKu4TfA1jwr3eoqcz4xqoA3MnRQ3R/xq2oFriz2PFymWGyGv9uubWjETr5KW+OsHK1P4xKqRIkOmukZKvIy4q8/3w+XivpxBIb/sV1L7MU7hhKmzX1Dzr57SbOMeZQ0wZWZ3pXRAu4FHifuUGLs6XIFMAPXHioLX8F+O9cMO3fsT7iOtpZ7M9KdzURWsrtIXEy26bQbgO8Rf8ERgNbAYNwuynxcjT4fkWw77Fjz7diD7Vyx09zWbkOG+rKUHHr0lRvfMCdTlq+5b9rNJyUqgV7Albg+jpNx9fXfsFfhlTjv9Dr79zL7vzn2u7fb3/aK2C9ytAfFmyi6sbC0BP6NbHPYa4DfkFaN+qM5FJvVGxUFmFcPW6OaDPVih90sK2SW2XNlxq94h4AvgAdQEkdMnGlr8kXGuvAeZZTDHytdcvgkqPUP3IUSOvKkra3BhhzWfybx16EsG1oAP8GVt8paEVYCY4E2WobMaGMyX5nDem/B1U3UK3+EDLbXskM53QjGocCPkLQzGa/MaY3fBM7TMsTN13D7vnmFza7GbZfJR+D3G/9u8quetNd8DJVainQYBfyB/CLkNuGaovTQUpwwPUyGedZOXIErXycSpCPwn2TT0OJoGYdzgUuJu7V3TP6cS01m23Nctxpcq/PTtSTp8485vw3UjreBHwCdtCR/RSeTzdsRrNP7uCYpokCcZb6BmggU7HNgFi6Wvpy3EduaDGaZTPJelz32ydFe5lJchuFKMceSRvsR8CiuBHWbMpB/G5vro2RX76ExYyEK6imrJ89PyKbq0PFuJU6z188zCiTvM2xO08hvC+9o2Xt3Aq1kFuXHN4H/Js5KO5uA53EBL+eSRgZeLa3tmsfaHGLsgFQDPAWcIzMQV0b2WXAkZf09Lvx0LNDfnqoxRKNV2LX0t2ubaddaE7E8FxN/0ReRw1PrDuCPEStu/TeEBebYHAdchCuh1p4w9Qua27Gr7Fzj7NwLSKfH4VrgFuItAisioCMuHz7FBh27cfn9i4FncaXU7jOlH4XbXx+Aa0TZE+hmo6f9bID9zij7m/vsGM/aMdcRZz3CxmRw/hwl74jjoCeu7NWuBBW+MeNgvVHEOW43x2M3qbM4Ufrh6tvvKaiRFHHswlXk7SX1Fb4YgGvouFsGFu3YifPs95W6ilCcb57u7TK4qNqPzUCpuiJDegFTgc9kgLmNT4BfoIxLkSPfwDWBWC2DzGx8gCsF1lHqJ2KhNS7r8FU5DIM59l4CRqLCHCJy+uPaZf1BhlvyWAM8KMeeSJF2uKCaecSR7prK+AwXfDQSFVsVBaELLrrudeLLQoxhbLHPp9G4cGMhCsvfAbcC/wN8WsZGvxnXc/BmoLvUQpQjZ9tnwuO4XPkiOxD3AB/i8guuQV58IQ6jBfD3wPdx4ccfkXYuwi7c9uhsXDON/sApWmYhGkcrnPf7elyG4kJcq+4Y3xJ227UtBH5p19wXpd4K4ZXT7Uk6EpgI/Beuku463E5DyEIcNXaOdcBSXDHPiXYt56MS2kLkRiWuvNVAYARwAy5a7hfAE8Ac4BVgkRnvu7g2au/Zv5fa/71iv/uE/e1ddqwRduxzUCCOEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCGEEEIIIYQQQgghhBBCCCFy5P8A7DVxHLyfU58AAAAASUVORK5CYII='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAA8AAAAPCAYAAAA71pVKAAAA2klEQVR42qXTvUpDQRAF4O96JTZio3UeQIIXUupbaBHU0jq9j+C7BBR8FotY2CmC+NPYCP4158oaTMCbgWH2zJydYWZnK39LVehXoQulQj0nVif+y9HKykyFAbaxjofC3/J+MtX4wBpOsY9XPGEzCc5xhreCbzUJdjHFBRrs4CC2iX8aXnnPIZ5jYYwbXMaO5/CMcIthcIN79IP7wU3wMPyRNH+UQA8nmARvxE7i7wUf47093HWt3CZ46dJzO7U9XP9n2ku9czWzYZ8FHmALj7hawOu229Uyv+obfihDEwRRlscAAAAASUVORK5CYII='
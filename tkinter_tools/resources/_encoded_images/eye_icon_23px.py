@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAABcAAAAXCAYAAADgKtSgAAABRElEQVR42tWVz0oCURTGf9M44NLwHXQbPUMILiNBF4G7FiJBW5+hneBDuBMsCNpIWxEJaWOQC5dB0SokmjbfheMtsXQm6sDhXL7z/865Z+C/UvANmx0xQGx83sUbUbitXbCi0lgMsA8cAHtADngGxsA1MDJxgnWd2CqqwMQkmgO3kg6byG5tFxnJAjCQ8xA4BrKebVb4UHYD+dk4nwIfAgvgEagYfQnoA3eSJaOryH4h/6UE7tBQFZdA3jifC78HepKxcEd5+cWKs5SgKUXHu7+y8JbXaUt42bvnjvCmA+oC2mZaIp2vgKmZiMhM2FR6hLu30Fa8OsAr8GCqDb0AXWGRCRQKt4lD08UMeAE4SbNygLO07tx91VMpLpKeFnc4At6SnHM/QRG4SfKFfrUbatvulp9uxV3gadOtmPo+/5U/0d+mD8KvekEmnTw4AAAAAElFTkSuQmCC'
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAAB0ElEQVR42u2Wu0oDQRSGv2RFu4AYtRG8BFRwEcs8QSD6DDainWBtp41WClGxtFfBN7DwDaKkSSMGFAWLoJWNWZt/5DBsYnDN2uTAsDtn/nOfmTPQp5Qo8wuZrOScbKTR6oWDWWCgC9yAsIkjdtF9Gt4kMAWMav4KPAANgwmSZCEw/3PADlA1qfVHVZi5Njp+jNjVrwXMANvAmklhDbgDHjWfABaBUPMWcAbsA/eSc851TK2jTeBNAs+KJuwgGwrzLJk36YjTHZvaYeDS1GgPyBvcOLABnGpsiOcoL5mWdFxKZ2zqHaMA3ErgFih6uDVtJr++r1qzVPR0FXzjgUlVQ8BzICf+kL6rxtARsKJxZPirnkxOuiLpDn3js9osTqk9lwBjQBP4AMoxZSprrSks3rl3zj3K1veurGvhwHhkL411rR9rPihMoH+0FglrLxMX3YHW67LJjRgVI5DxvD7RZil5yqyTJWFOPNmM+a/I1nXW1CN1mtZBj4DDNFMNsAC8pL25HGAJeBLgoovjtKyR6DgFphnU0rpAfOMjwFVaV2ZcG9sC3nvVJH5qiwXTFjO9bIvtop8Hdnv9EOjm6TNt6v7nT59/fey1q39qz9s+JaYvuJO49UqLUXgAAAAASUVORK5CYII='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAA8xSURBVHhe7d1Zs9vGEYZhS7K1WrvkSLErSdlVzv//R7mIXZV4kexYshYv6Saa5+BQPCQATvf0DN7nwgBUZQn4pnsIkiDwEQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADbpiSzTuT2GrIa4IW0XDGMTGRDf6XEwMbWGwEsve7FMxKeTFwORyU3r+V1vvkswFt2TxZthCbUwAlfXyKr8UZwd1EX4Fa2/6yzAZxCPwIDT9PEwGMQjZEU1fBpOBH4J1QOP7YCIo76otcbq72vjKtlGYxav53h3+BKdiRj2RFSQq4azgNIS3EI2fCxPBMoQ2E42fGxPBPIQ1EY3fFiaCaQjpCBq/bUwEhxHOJWj8vjAR7EcoO2j8vjERXEQY525L77+y9aZJjd+Qxbthq5jrks9bW2+a5HNHFq+HrXVjAhCtvupLIV+TxR/DVjVXJb7fbb0pnA2sfAJoqfGlVh/I4qdhK737Eu1LW09vzRPBWg/8jhToL7aeVi+F2cJEK1F/Kosu3gLOsboJIHMxShE+lEUzr5wLPZAheGHr6fQy6U61poN9IoX3na2nsrai28o6GctwPJXF98NW31ZReBkLba1NfxnGqI7efw78NFNhST3d1qJS9kcwFou6bX9UndWOng10q9tCTNb4NPwCjKG/Hs8ANjfmsPWqtGiUbWImiy9FflZT3d2IpKvizNT4toqCGN/yejkD0KvRqhaH1MRDLQxlf4TCLF6lX5dWY7XWRe/0cBDPZDyqXYoqxfhIK1JWe//+PpOXmrl4ZNvhrOaeDVvtavrVymbiarQCbRUVUQfLtbrjVX+A0kHj65mfZvheN+RwPpGF/qio9g+LTlJzIpAMM/wwa7YWC/mxjHOVq7RaavzSzbDmY59KInoiix+GrTY0NQFUHNibskj9W/jobBqYEG5IJFWeQtxANmeY1Y/IPJi1MtlFRh/KnMlYCzv5sYzh5r1qJIp6PjK7SOLQz1Z+G7Zyyv414KPo5pdBu5e0kDfXOijbTsd2T/cvXV3pmIp7thlCotDarfZV5RTM2CNaIbaaSo0sSiDPc1mzSHkGED1AMjZ3Mg6Q5qBsszm2++n2X8da6I1Bw2TMQaWbAKKD0kqQRbY7xKb5QVMJdizZfkjz2sY+TMYxzfSqd0XyCbuQQsb+vix+HrbyyFgkJUU33UT3JPawG65KBPrCm2KcswzGTRmAX23dXdIibPb22nNJ/CmvmoucfCWDW7Kocp3CWIa3AA9p/s3VjatofmXH+njYyiOyNqzmq/6qUdVuhs8liH/buisZ249lka7J5Pi7PuU/JumEfE2GJeT7ezn8L2TxzbAVr+YZwNeBza9FRvMnlDSD36MmJuuBr4eteFVm38hBjxrIuZIWfjWMU50Mws8AogKVLG9QVO3ImonWkNCHrbqrkUFog0QdoI6YraZTY5BbwtjFZhD2D/UY3lxRGbSOMYzLIOQtQERoktfzzIUjqn3lI7Fc1WxmqvkBcfWvxy5j2Ty3TTdhE40t3QQ1v75HezdspRT2tZKSPPQ699KXN9+WYwh7eq4cQ8qvbUeuSx7uN4nR2cZWXbj+5UHNn/lVfyMiBxWVRW/Hc4qILDxzcPuLWw+mlJ5zYIwHLefg8j6Pwjjj+pNTiWDz3t42w+m/Lbw/Kwj92e4SGoKtuvHqqeKD5938kvVXEYGXIFH8YqvFWQbuE+0Ef3qOh2eGJWkG4ivbdOHRW0UHzmMHxyTgZm677JWFZKCPzw778dRMt+SwXe6toN1lq9m537a+ZBbF/iKvgt9KXvi7XH7a20oTeNSCHHpLD95wmwi3StVCkb/EY8DHGht8rwZoovm3yMD//g4l8jj5MwCPgR6zg2zpkUv6/XVRJQY6mtM+F8/W0R/e41ai907awaDmb0rpTFrMYIw8cvfJ4jOAzAdVUdF9lgjSfwV2jMMxNFcX3rV8Si8u2jGaf7/SubSawy5yGZTOYdeSXJacAXxpSxetDm5pPeXAmA4Ccpjdm3N36K8yibndv6zlQik5u0sM2X8Is0TRH0RRK/tJLJ/L4tth67g5Ierde3+09eJaHlBVclBbz+IyZHSuZBa7JBp9HuGLYeuwqSG6XtjQQ8GXGtAesjiEnM6VymIfiWfShXNTQnS9oIGBvKiHPA4hq4tK5rFL4jl6Ad3RDwFl/2j+IGvIgzG/yDOPKb17cAJwnp0oBEA4TwIHe/jSCYDmjyWR6Hu2VVjTsU7l2ROHennvP0rzT1cqq95yOYbc9iuVyz77stp3BvA3WxbX22ABpTn3yAe9vfuPPZAJaNL3h3P12vy8ki1DboeVymeXxHVfFj8PWzsTgOM/2m1xl8hM4unxyr9jilwZSG3NN87s7C1AxD+GS62t+dUaj3kWr94Z9/p2AnC50YLs/3VbBbCAdw9tJgCZEN5vtgqSHf9UFsX/XmBl3lsvlfZA/3PpdQCnkB1+Kouwx0hV5JIfZlnDGLyynipGXvQ3H/YXD0929B+ycL0tciJ8vlHfWsbge+utojbhjT8UOJXs5GqaolRua8psjPzmK5WZ0tw4hQVWzGMC+LstuycTaEu3qe7SysageG8VnwDkDOVfstBHeK1BsdMxLLaWMXhivVWUy1sA2dHvZNH8La0naOmBJb1awxjcsZ4qRs6cHupyMwHIxuY7wZJkh/Wprp8MWwAW+sR6qbSX+p+zT0/lH3E5lZLJpetPaEvk1ntGlyG740pktM82t7O3ALK9OSUozesAOqP3blubNR7zLN7Nr8afAWxOCTwwCRwm8RS7X34r1njMc3j1jPS+/hz4zIUPAcczQ2leBwT0xrH59WvEs3sBqL0N79msnpNMDaWy6i2XY8htv1K57LMvq71fA3qG6nmANRTM6pYt16DIsXrWaQ3Rza8OBXhD9ueNrRfX0+CVGrieMjmEvD5UKpN9DuW09wzAvJX/T58x5sLzgIGW1Gp+dWgCUC/k/9enjbpgErhoDXkw5hd55iG9e/Sr1kmnUN6DdmyWakGpjHrI4hByOlcqi30knkkPBz12BrDhHbZnEK3pOQvG+ZxnFtKu+tb9aPOrSROAYhII1eNVclz5Z5ybX9+yT362x+QJQDEJXK5kNhJDd1fJlTwm7zr05FnjEstXsvh22JpmUZCeB6FaHeDSubRc6GPkMiidw64lucw6A9jyHgDvoLxILIvyPKCHp+gWPQaHjENkbH51UiNnPaiaSmfSYgZj5JG7T06aTb0Hwzs4DxJJ0ZugtJjBVul9L51tBO/xO7UHTz6dkn/f9ZTMAmzptK/4B3jeReTBaZ9b+nD0qve4ndr8qkRj/Sn74XpnVslRHyTZzI9lJI/iX3l5F1NJHvvqkamjW1azbko0vyr1yvq77I/rQwwl0NeyeDxspedyo0prrMwToRa+10TVys0/H1utuinV/KrkqbU+xPCGrbuQYPWRY18OW7mVHKQxLS7HJltM90m4FL5Xlg6+lAxcH4tXOguPYK9LCG9t3U0jRaG3c/a4o+uGRKATeO3J4Ioco9ursxyjPhk3/YNmJQP3cfCoea8mYhIwrRbGFD0f2xwt5+AZLpOAiSgQFZVFb8dziogsPHPw/Hrtney3+/e2NgCuH0CeSnIIeX6dZqFk1eMKwtv210c1f/Zn/ukLXNPNrzwnAPWb7L/71zcyDnqm8WzYSkm/JXG7u9IuyeOVFueW/NGSItL39mNh78MtK9ev0U70TPLo4uw27BRLK8hWXUWEtlRUBq1jDOMyCA26t/CWiMqgVYxdbAbebwEuiDowG6iUnwtEDm5rEmcT8n5fRWdQJfCoMFXWoorMoAWMU50MQs8AtiIPNGuj1RjsrLJmEVU7cvj/rJVB1eAjm1Py1a+V0n2yHJlBRrUK/4hrMiwhvzyUw/9CFt8MW/GqnAFs6eALvY+ZOx3QjM1mGTyxzdXQY9YDt800tEZEVPPr153Vml9lGYDPJPT/2Lq7jIUn9Pfjmb/7Lkbi12tD0v26TzvfVt1JBvqrTrdH701V9Qxg5L8SyF1bd2cDfW/YSuOPpBNTUXaM2Zr/XnDza99Vb36VreDCXwWTNt1dyeHCc9xbJzHrhPu/YSuPyMZX2eot5StOhUG5IwvXmzgsEZ2Dl2xFb/S3DaE/M86YQ8oJQNUo/qSF2uxEQJ7nsmaR5TOAD9QIzAoj7LOIqTQL0cw98XRfdYdtMxN9axXa/BLD46RZbKTdsRH9gOYnWw+TedCii3gqMrtI4tCfw6e+k3ELE4Byve3UIRT1cWT0ocyZjLUyAWxUHEy92em7YSun6GwaKPCQO1Lt00rzq6YmAFVrElAtDWzpnNZ87FNJRHpF5w/DVhuamwBM+Fc4Yy01wyX0w1+95uK9bsjh6HtVfYuV7uq8OWo1vpIMU17deEzThVxzwFUHE0EXqIPl0n4NOEXt4K3wHg5bqOBhzeaX8nvecvOrXl7B9JFUVa/kkzrQieDlsAVnD2S8X9h6FTLeTZ7y7+rqFLbmq8FY668KWTG+5TX9FmCXDoz4i21Wo4WqbBMnsjir5ym1dU8LzDa70O0rVYaC2eqtaKIwhv66OgMYyzRgWshKVjM/2juLzSPGlW1XJWX0Wa/Nr1bxypSlmMZ6LqolGKM6VlOEGQtsa62TQdYxkeF4KgvX5/xnsbrCSz4RrOGrxOpf4R2ytsl4la88Qi8g+dHW0+qlGDNPulsS9aeyqHZ5eS1rnQA2WijMLSnQB7IIvy/CQvcl2mbOZHqZaJdY9QSw1dJEMCZ1m+FqtGZvZ77mxt9iAjjX1KvWIVLXHvcvqPb7+tIkn5Q3ga2BCWBHq2cDmIZX/YsI4xJMBH2h8fcjlCOYCNpG4x9GOBMxEbSFxp+GkGZiIsiNxp+HsBZiIsiFxl+G0E7ERFAXjX+abn8OHEULUNkmAkjcmxtzKPsjLESADjgr8EHDl0egjpgIyqDx/RBsECaDeWj6GIRcAZPBfjR9PAKvbO2TAU1fF+HnUv0BJ96k3/XGqG+GLdTGBJBYL2cHvMrnxcA0JvukQLO3hcHqRPTEQKMDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIA6Pvro/6e9xRUBLDRyAAAAAElFTkSuQmCC'
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAA8AAAAPCAYAAAA71pVKAAAA/0lEQVR42p2TO05DQQxFj0mUgk8DO8gGqPJSRuwBuigJLXVaKpbDAtJkE2wgoqFCIKFIVAOHAg96QgHxsDSyr+3xZ+wJdpAaQD0CRoT8Rmqo/R9s/Qz6RdEy7kXEe5WBU+AYeAbu2rYqR40aEUXdB66BC2ALPAEnwBFwC9xExGv1p5apTtSNulIbdaxOkzep36iTmrCWPFO36jzxUn1Q18mXqZ+n36xenKqP6jjxSH1Rh4mHiUeJx+k/xU9apGGgXqmrxIfJV6kfJF6oUkq5zEhN58wApZRFu5cuPdfXPlPvu7z29zkf5JzP/zLn9ob1IuKty4bt2u1e593+z6/6AP0vf6fn/4pBAAAAAElFTkSuQmCC'
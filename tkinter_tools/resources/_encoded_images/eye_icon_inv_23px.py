@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAABcAAAAXCAYAAADgKtSgAAABY0lEQVR42tWVvU5CQRCFz14viR0vwCuQ2GttT2FHQmNi6GxIiLVvQQLvQeE2hsLYGSqDiSillY3FXT6buTogwRjA6DS798yZmbN/c6X/amGdEwiSMuOxFIekeQiBH1cF9jblhRXkLIQwd8qPJB1Lqkval/Qm6U7SUNJ1qdzHrVUBBOAUmPBpL8CjjaVNjBfWrgLIbaynlG4seAycAdUlbtXwMYDx6z7PF8VFUTQt6SvQcv4GEFNK90AEGs7XMj5FUTQXVuAUd0xFBGplcEqpZwVnlnhmvJ4rULM4gM7CCoCuOQZAVjqBE8MvHZ7ZN+bPHT4wvCvbirYBfXeYFZuPgKlTWHHzKTAqcXeofduitizxU5k4xpgvJRiaqopLlBn+UTjGmLsCz0AScL4z5QZc7GTPnbM81Ktt35bcDrdlgdu55yte6AFwu7UXuqa3PGzSW77ripmkw610xZ3381/5E/15ewdtDAStqje2PgAAAABJRU5ErkJggg=='
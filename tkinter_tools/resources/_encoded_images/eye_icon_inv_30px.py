@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAACLElEQVR42u2WvWpUQRTH/3M3Kr6AgYAkiwQkBMRAcIW0eQGbFCl8gzTptnDFNwiiVYrspreUND6CiI1YZJWUUVyLwObO3Tv7szkDk3U3GtwPixwY7r0z//N97pkjXdOUyF0FDDjjyQaO+pJwzjFW64AMqPwFrgJk/+xxFOKc69v3LUn3Jd2TdNtg55Lakj475/wwvqt6WUne14GXwDGj6dgw68Nk/NFjsxbnHMADSc8kPUkgXyV9kvTNvu9IWpFUTTBvJL1wzn2MdXGp99FCwAF14BwghPAT2CuKYmMUb1EUG8CeYTHeuike7T0wZ88F4CgJ4StgMcFVTWDLVh2oJueLxhPpCFhIdfym1Hu/muSx3ev1NlNcWZa7wNmQ/J6VZbmbYnu93ibQjvn33q9eUJ54WgO+W2jfAvNJJassy51EUQt4aqsVN8uy3El5gHmThcmuXVDuvV8LIXQMcNBoNDID3LDnEtAFCmBrSJq27KwLLKW8jUYjAw7MoY73fk2SlOf5cgjhxJQ2k+LKkmjU7fwwCgXmbEXjDg1Tj16ZjFhcTVN+kuf5soAPtrGfdB83kIYm0Ae2U4MGFGwbpjnA62JFhxD2Tdf7TNLNmdwSeZ6vAKdTD7VtPorFFUJoTqW4oldFUTwGfpjV0/mdkpA+BL7EBgJMroEMdq9ut3sXeBclhhBeT6xlDrkkKsBzIDfmzrgvif/jWrxkEKhNfBCY+egz02Fv5uPtNY2DfgFQj3QeLoVFVAAAAABJRU5ErkJggg=='
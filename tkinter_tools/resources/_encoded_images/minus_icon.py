@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAABrYSURBVHhe7Z15rK1VfYZvmcJwQUBE5vEqQ8Agg1YaGklLwKJGrVpiDYpjApiQUCEIkqg0/FEJJMYY/a8aIyiKgBaMIlIUEWQwGAQEyhAGmYcyhKl9n7P3Pp5z7u/cs7+11vftb3if5HHve6/hnP2t37v2N6zhb1aZPrDl2NfJzeUOcje5/dg3Sv5t4sZyA7mRhJfkK/JF+fQC/yIfGnuPfFA+K/m3p8aaDuMOoDsQ8Emg95RrxvJn/m0rSbg3kXXygqQDeFLSAdA53Dn2rvGf0Z1DB3AH0E7eIPkG30seJPeXfKtPwt5mJp0CZwu3yBvk7ZIziEelaRHuANrBHnJveag8RPINv6vkNL0PcHlxr+QM4Xp5jbxN3i3NDHEHMBv4Jt9PHi4Pk2+SXKcPCe4v/FleLa+Uf5ScOZgGcQfQHPtKvuH/SR4o+YY3f4UzhBvlf0nOEG6VpmbcAdQHx5Zr9yPke+QBkpt0ZmW4yXizvFT+XHIv4f+kKYw7gPJw4+5I+QF5sNxMmnSek7+XP5I/k9xQNKZVvF5+SFKkj0u+rWx5ObYcY441x9yYmcIp/tnyDhkVrK1PjjnHnjYwpjEYRfdueZF8RkbFaZuTNqAtaBPaxpha4JTzs/I6GRWinb20DW3kywNTDEbgnSK5+RQVnW2ftBVtRtsZkwTFc4bk+XRUZLb90na0oTsCMzXbyi/I+2RUVLZ70pa0KW1rTAjTaE+UDE+Nish2X9qWNqatjfBAoFWr1pfvk6dJZt51kdckz8ifGMtIukcks+8m03b5u+cl03mZ9//qWOAYIHfRmU68qWTU4mSaMbMT+fbk77Yey4229WQXYYYijxB/LCfHYJAMvQNgpN4X5Xvn/tR+CC6ns0y1ZWbdnyTz8O+XhHwS9LqKmk5i0jHgzpI1CfaRzGDkWnsX2ZXHcZfIr0hGGg6SoXYA28mT5WfkFvxFC+FbnemyBJxJMnxrcQrLjLnHZBvZRjLTkdmNnE0x6YkOgunObT1bYBzBt+Q58mH+wvQXOrxjZFsf6TFH/vuS61TWBeDUu+vwGfgsfCY+G58x+uyzlpqgNnxZ3FP4Vjpf8s0aFcAs5PqcufA8qmKq8BAGsPAZ+ax8Zj47xyA6NrOQ2qBGqBXTE1hVh1N9Tp2jRm9aFsLg2vOT0oU2OgYcC44JxyY6Zk1LrVAzfVmRabBw7XmhjBq5Sbkxd5n8lNxdmhiODceIY8Uxi45lk1I71JDpIB+R3B2PGrYpuXl3uuQuuakGx4xjxzGMjm1TUkPUkukIPKP+huRRWNSgdcs1LdeRR0kvBpIPx5BjyTGd1f0CaomaorZMi3m7nNVsPZ7LnyVZEcjUA8eWY8yxjtqgbqktasy0EK4dGQUXNVydsl7d5+TQVvWdJRxrjvlkrcAmpcaoNdMSGMjzddn04z0G5nxCeqHP2cGxpw1oi6iN6pJao+baOohsMDD89BcyaqS6ZLXa4+RqadoBbUGb0DZRm9UltUcNmhnAphoMk40apg4ZhnuCdK/fXmgb2qjJGZ3UILVoGuRYycSXqEFKy6y6L8k+DMsdCrQVbUbbRW1aWmqRmjQ1w4QSng2/LKOGKCk/4zuSPftMN6HtaMOm6oXa7OoU6dbDPPWvyejgl5bpoUdL0w9oS9o0auvSUqN1b9E+OLjby0yy6ICXlIEmZ0pf5/cP2pS2bWIwEbXqp0OF4HqOLaGiA13SKyTTVk2/oY1p66gGSkrN+r5RJjtJto+ODnApuYFzqvRp23CgrWnzum8kU7vUsEmA7bN/J6MDW8rfyndIM0xoe2ogqo1SUsPeCr4iTAutc3QXd2zPlV4d1lAD1EKdTwqoZU8DnxJ6yzrDz4KaH5bGLISaoDaimikhNe0zgRXYUdY5m+8quZ80JoLaoEai2ikhtU2NmwDumP5aRgeuhN+UfrxnVoIaoVaiGiohNe6nA0vgmenlMjpguT4nT5Je7dVMC7VCzVA7UU3lSq17nMAYHslcIKMDlStjwdn1x5gUqJ265hNQ84N/9MxOM3UN771D+hGfyYUaopaiGsuV2icDg4XJE9GByfU30ktum1JQS9RUVGu5koFB8lH5iowOSo6XSt9kMaWhpqitqOZyJANkYVC8U9YxKYNJGL7Tb+qC2qpjUhpZIBODgI0W6ljJ59uSba2NqRNqjFqLajBHMtH7TUgYdvlLGR2AHHluu5E0pgmotTrGCpCN3g5P59kqK6lGHzxHGsJ7uJmmoebq6ATISC/HrLABZOmlu1nuyd/8ZlZQe9RgVJupkhGy0iveJh+X0QdOlZsxvuY3s4Ya/IGMajRVskJmesGWsvTsPh7H+G6/aQvUYulHhGSG7HQarmXYVDH6gKkyIMPP+U3boCZLDxYiO52+H3CMLHndz5DMNdKYNkJtlhw2THbIUCfhmeZ9MvpgKT4qvTOraTvUKLUa1XCKZKhz4wM2lD+U0QdKkWmZntVnugK1WnIqMVkiU52B7ZOjD5Iqc7ON6RLUbFTLqXZmS3JmTpVcW43BFr0cGGF6DTVbcqAQmWr9DFfmNpecLMG66l45xXQVarfkvhZkq9XrB7Cyaqm7/vR4+0hjugw1XOqMmGy1dkXrbWWpfdlfkl662/QFapmajmq9qmSMrLWOr8roF07xPGlMn6Cmo1pPkay1ioPl0zL6Zat6rfR1v+kb1DS1HdV8VckamWsFPJ/8iYx+0ao+Iz3Yx/QVarvUFyWZa8XYgPfLUjf+TpHG9BlqPKr9qpI5sjdTVstSM/2ulN6i2/Qdpg9T61EGqkr2yODMOF5Gv1hVOS06SBozBKj1UpcCZHAmbCNLPfY7UxozJKj5KAtVJYNksXFOk9EvVNVeLHxgTEVKLpRDFhtle1liqi+DI94ljRki1H6JAUJkkUw2Rqktvb4rjRkyZCDKRlUb22KMnuZeGf0SVXxM7iWNGTJkgCxEGakimWzkLODzMvoFqvplaYwZZSHKSFXJZq1sLW+X0Q+vIncuvbCnMSPIQoknamSTjNbGp2X0g6s6s2eXxrSUUmNqyGgtMErvOhn90Cr+QXpNf2MWQybIRpSZKpLRWkbUHi1LjPn/mDTGrA3ZiDJTRTJKVovC+mYXy+gHVvFGOdOxy8a0GLJBRqLsVJGsFl1Hc3/JVN3oh1Xx49IYszxkJMpOFckqmS3G2TL6QVW8Rfra35h1Q0bISpShKpLZIvBYocQjihOlMWZlyEqUoSqS2SKPBD8oox9Qxbuln/sbMx1khcxEWaoi2V0n641f18W/jl9z+J5kvzRjzMqQFTKTS3Z22YnkSRn1LtP6lPSYf2OqQWbITpSpaSW769xNaKUzgKNk7lz9yyVDFI0x00NmyE4OZJcMJ8GKo1fJqGeZ1lflkdIYUx2yQ4aibE0rGU5aPfgt8n9l9B+d1pvkZtIYUx2yQ4aibE0rGSbLIeu6BDhC5ob3Qsk+6caY6pCdH4zeJkOGyXIlNpC/klGPMq2serq3NMakQ4ZyR+GSZTI9Nexomrts8WVymseMxpjlIUNkKcrYtJLlcKft5QL6dzJ32C6n/8xMMsakQ4bIUg5kmUxPzUUy6kmm9RG5qzTG5EOWyFSUtWkl01Oxncxd8rv4dERjBkyJ6fhkmmwvIroEYBrhTqO3yVwi+aHGmHzIEpnKgUyvNUU46gAOlznf3gxf/O/RW2NMIcgU2UqFTJPtRSztANaXh43eJsPAhf8ZvTXGFIJMka0cyDYZn2dpB7CzfPPobTJXyFdGb40xhSBTZCsHsk3G51naAewrtx29TYJxy+x9bowpD9kiY6mQbTI+z9IO4NDxayosYnDb6K0xpjBki4zlsCjjSzuAQ8avqdwsnxi9NcYUhmyRsRwWZXxhB8AyROtcPGAKrh6/GmPqITdjZHx+eb6FHcBucsfR2yRelteO3hpjaoKMkbVUyDhZn2NhB8Cso41Gb5NgpJEf/xlTL2SMrKVCxudn6S7sAA4cv6bCMsTsc26MqQ8yRtZymM/6wg4gdyeRG8avxph6yc3afNYnHcDrZM71P7CnmTGmfnKzRtbJ/HwHsINca6ZQBV6Ud4zeGmNqhqyRuVTIOplf1AHkLP99v3xo9NYYUzNkjcylQtYXdQB7jF9TeUB6AJAxzUDWyFwOc5mfdAB7jl9TuVN6/r8xzUDWyFwOc5mfdABrxq+pePy/Mc2Sm7m5zNMB4Nz1QAa5vZExphq5mSPz6xH+zeVW/E0izFPOuSFhjKkOmctZd4PMb04HwJucJwDsQJqzVJExpjpkjuylQua3ogPgzdyggES4I+kOwJhmIXM5T97I/JZ0AKvlJvxNIvRC7DxijGkOMpdzBkDmV9MB5A4BpifKWabIGFMdMpd75r0jHcD83OBE2LHEGNM8udnbjbXCz5Unzf0xjXPkv43eDhIuoehITfOwbx773w+Vr8qTR2+TOI8O4Hz5L3N/TOMM+e+jt4NjQ3m9XLTUsmkMHoWxxl3OCjld5nR51uhtEhfwPyw1zNDCVI+XQ4UOIHcfRZsux542GConyOi4TOuVk8eAOTwzfh0q3gJ9dgz92Oc+fZt7DMje4Tk8P341xjRLbva2oAPIGQQEL4xfjTHNkpu919EBbDx6n0zOyiTGmHRys7cxHcAGo/fJeBCQMbMhN3sb0AHk3kX1TsDGzIbc7G1IB2CM6SaM48mCDiB3EEXuJYQxJo31x6+pvEwHkHsakftLGGPSyM3eK3QA2XcSx6/GmGbJfoJHB5A7mihnLQFjTDq52Xu6RAew6fjVGNMsudmb6wByFxXIHUnYdTiGZjYM/djnZu8pTwfOw9OBZ4unA2dOB/aCIPl4QZDZ4QVBMhcE4X9OldFc4Wn9T2mMaR6yF2VyWk/lm+semcO241djTLPkZu8eOoDcXUZZUMSDgYxpFjKXu5jPA3QAXEPlzCtmZ6GhPwkwpmnIXM6WfmT+WToAHgPmjAXYWub2RMaYapA5spcKmZ8bB8DuIjk7jOTuLWiMqQ6ZyzkDmMs9HcCzMmcwELMB/RzcmGYhczkzccn83CUAz1If5G8yWDN+NcY0Q27myPxrdABw1/g1lb3Hr8aYZsjN3FzmJx3AnePXVOiNslcnMcZMBVnLPQOYy3ypMwB2GM65I2mMmR6ylrur96IzgIdkzo1AbkhsP3prjKkZspZz452sk/n5DoAbAg+P3ibByiRvHr01xtQMWctZDYisz934n3QADArIHRJ84PjVGFMvuVkj63OD/yYdANwyfk3loPGrMaZecrM2n/WFHcCN49dU3iS3Gb01xtTEGyRZy2E+6ws7gNvkS6O3Sewidx+9NcbUxG6SrKVCxsn6HAs7ANYFyLkPwPJYfzt6a4ypCTKWs50fGZ9fA2RhB/Co/PPobTKHjV+NMfWQmzEyTtbnWNgBAAtc5nCA9IAgY+qBbJGxHBZlfGkHcM34NZU9pOcFGFMPZIuM5bAo40s7gFvlI6O3SbBM0eGjt8aYwpCtnOX3yDYZn2dpB8A663eM3ibzD9I7BhtTFjJFtnIg22R8nqUdwKvy6tHbZN4q/TjQmLKQKbKVA9km4/Ms7QDgSsma4amwVNHfj94aYwpBpnKW3iPTZHtFtpP3yYUbCFT1Yun1AYwpA1kiU1HWppVMk+2puEhG/5Fp5WbDrtIYkw9ZIlNR1qaVTK9FdAkAPx2/psJ45X8cvTXGZEKWyFQOlTK9j2S6YNSTTOtlcrkOxhgzHWSILEUZm1ayTKanhkcOv5LRf2xan5EeFGRMHmSILEUZm1ayHD6aX+4b+hV56ehtMpvLfx69NcYkQobIUg5kmUxX4i2SfQOjHmVab5KbSWNMdcgOGYqyNa1kmCxXhimHV8noPzqtDDo4UhpjqkN2yFCUrWklw8tOH17XTbqX5YWjt8nw3z9u9NYYUxGyk3sjnQyT5SRYeohNBKOeZVpZgngvaYyZHjJDdqJMTSvZXefyYSv1LiwewB3EHNjH/NjRW2PMlJAZspMD2c1d5GfVB2XUu1Txbpk7kMGYoUBWyEyUpSoWeQrHKiT0ItEPqOKJ0hizMmQlylAVyWyx1bnOltEPqSJrkW8hjTHLQ0bISpShKpLZYuwvc0cj4celMWZ5yEiUnSqSVTJbjBLTEZENCVZLY8zakA0yEmWnirVMxz9aviajH1jFj0ljzNqQjSgzVSSjZLU4m8jrZPRDq/gH6XsBxiyGTJCNKDNVJKNktRY+LaMfWtXjpTHmr5CJKCtVJaO1wWOF22X0g6vIIwqPCzBmBFko8aidbNa+Mc/nZfTDq/plaYwZZSHKSFXJZu1sL++V0S9Qxcek5wiYoUMGyEKUkSqSSbLZCKfL6Jeo6nelMUOGDETZqCqZbAx6mtylw5G9yt8ljRki1D4ZiLJRRbLY2Lf/hNNk9MtU9QaZs+GBMV2Emqf2o0xUlSw2zjayxJ1LPFMaMySo+SgLVSWDZHEmlHp2ybLFB0ljhgC1nrvs/sSZjqlh7HKp0xj2LdtUGtNnqPHJ/pu5kr2Zz615vywxRwBPkcb0GWo8qv2qkjmyN3NYcfQnMvolq8pp0dulMX2E2i516k/mll3tt2kOlqU+2G9l7lpoxrQNavpaGdV8VckamWsV/yGjXzbF86QxfYKajmo9RbLWOraVpR4LMjjiw9KYPkAtlxjwg2SMrLUSPmipG4IPyko7mhrTQqhhajmq8aqSrVZ/Ma4vvy+jXz7Fq6XvB5iuQu1Sw1Ftp0i2yFirYSeSUj0eflMWX9/MmJqhZqndqKZTJFPr3OWnTXxKRh8i1ZOkMV2Cmo1qOVUy1Rl4PvlDGX2QFJ+T75PGdAFqlZqNajlFstSaZ/7TsocsMWV44qPSg4RM26FGqdWohlMkQ2SpkxwjSz0VwDvkGmlMG6E2qdGodlMkO2Sos3Aj5Bsy+nCp/kZ6QVHTNqhJajOq2VTJTudvgJdc+GDipdJ7C5i2QC1Sk1GtptqrhXLeJh+X0QdNlWeinj5sZg01WHLsC5IVMtMrPilL3g/A78iNpDGzgNqjBqPaTJWMkJXewbXM12X0oXNksMUG0pgmoeZKDvSZSEZ6O/Btc/lLGX3wHGkInwmYpqDW6gg/2SAjvYZnmnfK6ADk+G3pewKmbqgxai2qwRzJRGef91flnfJJGR2IHLkZ46cDpi6ordI3/JAskIlB8VH5iowOSI48jvE4AVMaaqr0oz4kA2RhkJTaYmypDMjozMwp03qopdKDfCY2uqVX22Bu89dkdGByZUjmO6QxOVBDJYf3LpTab/38/rrZRF4gowOU6yPSswhNKtQONRTVVq7UPLVvBCunXC6jA5Ur0zKZm93bZ6umONQKNVNySu9CqXWvdLUEbrL8WkYHrIQ8t/UTArMS1Egdz/gnUuO+Sb0MO8rrZHTgSniV3E8aE0FtUCNR7ZSQ2qbGzTrYVZaePbhQ1lbzkuNmKdREybUsl0pNU9tmCnaXdXYCL8tzZe+HXZoVoQaoBWoiqpUSUsvUtKkAveXvZHRAS3mN9KPC4ULbsxVdVBulpIb9zZ/ITrLkuuqRT8lTpR/JDAfamjan7aOaKCW1Sw2bDLhj+jMZHeCSXiEPkabf0Ma0dVQDJaVmfbe/EDwzrWMSxlKZlHGm9OPC/kGb0rZ1TEJbKrXq5/yF4bStrmHDS/29PFqafkBb0qZRW5eWGvXlZE2sJ5k8Uecd24n8DJZ72luabkLb0YZN1Qu1SY2amjlW1n0DZyJjwb8kfT3XHWgr2qyucfxLpRapSdMgh8s6VhZaTvZlP0H6/kB7oW1oI9oqasM6pAapRTMD9pS/kFHD1OXN8ji5Wpp2QFvQJrRN1GZ1Se1Rg2aG0OuzkmrpJcdXktFdn5C+2zs7OPa0QZ2jRiOpNWrOZ4Mtgu2Tn5BRg9XpLfJz8o3SNAPHmmPOsY/apE6psU5t1T0k2Jm1ztmE6/IueZbcS5p64NhyjDnWURvULbXlHapbztaSTRVflVEj1i0DTc6XR8nNpMmDY8ix5Jg2MYgnklqipqgt0xE+Iu+XUYM25Y2SZ8P7SFMNjhnHjmMYHdumpIaoJdNB2GjhQhk1bJM+LS+TXDt6WujycGw4Rhwrjll0LJuU2hnMZh19hT3cPiMfklEjN+1f5MWSDSC9dPnoGHAsOCYcm+iYNS21Qs14z8keQaFxHdn048J1yTXtlfIMeah8vew7fEY+K5+Zzz6r6/pIaoMaccfcU1jt9Rh5u4wKYNbeJplJdqJk2mofhh/zGfgsfCY+G58x+uyzlpqgNga1evRQl8reTp4sOc1r62AOvo3ulgw15UYYg10Y4srp6WOyjWwjt5d8gx4kD5RrJNfRbZ0k84z8ljxHPsxfDImhr5V/sPyifO/cn9rPi/I+yeKVPAv/k6SD4E41E1KQm2c8tqoDdrFh9N2WY3eWBJw79gyJ3UHuIjeWXeAS+RXJVOFBMvQOAChqdoA5TfKt1UU4W3hcMkoN6QSYCfeo5Bp70jE8L1+QdCR0EmxMCdzs4jgQXOayswX2JOhbSU7jtx3/Hc/CkWv5rk595WzqbPljWVdnaToGq8NyndrkTDLbrLQtbezVoM2y8E33BcmpdlREtnvSlrQpbWvMVLCDC/cH7pVRUdn2S9vRht6NxyTDja1TZFsfHdq1pa1oM9rOmCJw0+uzclazDe3K0ja00RAGVJkZwZ3yd8uLJM+Qo0K0zUkb0Ba0SVceP5qesL/kcdIdMipOW58cc449bWDMTOGU80OSbyKex0cFa/Pl2HKMOdY+zS+ABwKVh1VrjpQfkIw09KIgeTwnGan3I8l2W9zgM4VwB1AfHFtOT4+Q75EHSC8gOh2MWmSF30vlz+Vk7T9TGHcAzbGvZBos21S9VXrL6MXwzP4m+VPJtu23SlMz7gBmAzPm9pNsKHGYZPbc0FYVZvEPhuayhTbrAvxRMtPRNIg7gHbAdFn2seMMgbnzzKzjDKEvK9Iw6YhveGYwXi/5hmddAKY7mxniDqCdMGadDoAbisxQ5F4Co9o4c2CGXpth5iHf5ExZ5tqdmXfcuKMDYIaiaRHuALoDwacDQM4QmIePk06BabvcZKx7a2qmE3OTbjLNmLCzJgHyDc+fkX8zLccdQD+YdACsbsRUVya/cAbBWQOrH3F/gf8P/04nwYg5Li82kvCS5DSddQIIN6PrCDDX6aySw7c53+APyGcl/z7pAExnWbXq/wG/nrhKixzvCgAAAABJRU5ErkJggg=='
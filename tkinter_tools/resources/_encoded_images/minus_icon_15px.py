@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAA8AAAAPCAYAAAA71pVKAAAA3UlEQVR42qXTPU7DQBAF4M/YpHOBcgGqHIGGhjNEyiWIBJyFy9CFiiJJEeUGEQVdhFA6/kzBs7AiBSQ80mo0b97b2dmd5dtKP3aDOTZ4jJ8Ht88/ih9hiTtMcIqT+EnwZXhdnRGeMfW7TcNrN3CMNS47cYmis8rgwlu38TVmSQz2RPtrEN4sOiuM00P5x7HL8MZYVRhigc/O7jWajqjADm/BFxhWSe7iG5zjFu+p9IEKV7jv8ltxjZdUeMDFgcpF8LoVb3GGpyRfgx3quQl/2/u2e71zrwnrPdv/+lVf3jA94Tb5A1gAAAAASUVORK5CYII='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAABcAAAAXCAYAAADgKtSgAAABVElEQVR42r2VMU4DMRBF32atdCAKxB0gQvR0UaQUKaDMSbKHoMklEBFdag5AHRJFOUGKoBQo9JjmGw2OLbSFGcmS1zPz/eevx4Zjq818CDwCW8CbsdX6MJMHQJWYeyU9ADfAHngFNsAHcAZcArfAOfAGNMBLhPELuKP5VM4FcAd0SVtX/oXip1rvWNKVKWmmwElCKmdGLMFEeTMTX1mtAuOxYVBH0sXV1qbicVTBD4G+HI0pOQea2iRI1winb51rYKlv1wLYYjjNl8KrAAbabRQFtbVAaiS8AcCTjltwWtZB99zoROwDub1w2QHzXCO0tJA/B3YOuJBGJLS+Bk6Ar8jnxfoTWCUacQ3cOwUeEj/IA8/qxpxtgCsTH+wA+KDzaZTkzdn9i/lRuwuvcsA70MsErVpqHvJ7wi17Woqe86IdWvRuKXorFr3Pi71E//KGFnn9vwGxJHBriB64IwAAAABJRU5ErkJggg=='
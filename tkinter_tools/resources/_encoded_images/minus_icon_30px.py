@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAABtElEQVR42sWXvU4CQRSFv+GnsAGfwAaJBGsKO1sCFr4Bz4APQUlvYUJNY2hs7ah4AIigWKDRBm1MjGZszpDJBHBRdG5yszs/95zdszN37hpWWxr41P0OcAxUgSNgH9jV2By4AfrAFXANvC3BSGRpXXPAGTAErOdz4E4+D8aGiskFWGvNACndnwJjD/ASaACHQB7IyvPqa2iOmz8WBsI0SUhbHsAFUN5ArbJiXHxrHbnxJDlXwCNQD+TPeAC+pzTmy1oXhhWmwzDLvql70xFwoL6Mp0QScw+BMEbBm6dD0hNNeACK6svyc3OxRWFacSw4jVbgVIPVLZCG5FVhT8W1kLupgc4WSUPyjjiaeMlhArwDhWB1b8PcYiyIYyLOhQy9TTb8huYwe+5zpoCaGl1ve6za50l8XWxXXDWAgRolT5ptm8MsiWtggBc19oBXPZkNAjNymyDlfsjDfqsVfe+UscCtt+lNQAjQBp6BGfC0wmea0w5ifcyMuOxfyJrIokodZXGlVDlYoPJN8vjNdnJJpCKufrQEEjVlRjskoh2L0QqBaKVP1GIvWnkbtaD/118YE+un7Quix7g9YsD/gQAAAABJRU5ErkJggg=='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAA6kSURBVHhe7d1rc9RWEsZxbGPCxeYSFt4kW0n2+3+oUBXehE0FFgK7YPB2Wz3ENjMezai7z+3/q9qSRG1sz1E/rSONZnRwCz14fH5+/qetpzg4OHgii9fTFlpFA2hHesj3RXNoBw2gQhL0c1vtijQG6q0y7JAK9Br4bWgI5bEDChg18NvQEPIx4EkI/W5oBjkY5DgHkvkvto4FpBccyoIGGoAG4IwjfSxmBr4YTAeEvgyawXIM4AIEvw40gv3puRV2c1eDr2wbhdnu0P1xd/oXzEXnnMkKDI1gVjAPg7QFwW8bjeBmDM4GBL8vNIL1GJRrCH7faARXcRHwb6eEv3+2j0+nLdANb906kpo4s3UMRCYDt2Xxedoa09ANoLcjvhT0U1m8kf9FFfWR/O+RDNsf02YfRj4tGPKFtx78WguWcW3PaC+4uQ/otF6UrTUFGe6hPng0TANooRCl+P4hi66m12s8lV3xb1uvVuuNd64RXuRtKbhPtl6dUQptk5obs+yaY1l0fYG46+KrtbhGD/0m7K983b6w2oqJ0O+G/ZejxxuBvq+leKRmTrRwlP0TZrJhUyf2T0VZTX0/bfWjq8KsKPgEPgD71183L6SG4iD4OdjXfno4BXhYsiCkDh5rMSj7JwSz4VaP7Z/SWc09nLba1XTRFg6+fqDk3bSFwk6kFN7aejrtRLbanGb/8FLhl339SBb/mbZQGZ0N6mch0rXaBJr8owuGv+kZ0yioj/la+4MPZd+mf3yT4LepRCOQUtFPTDbzeZOWLgLeyw6/Bl/ZJhpjuy91/1mN3pu26tdKA9DPoL+39XBSM4+yCwdxdF8KvXaTwmo17fct0UKRP5MB/d3Ww2ml2Co6JLWUdlogpfRcFq+mrTrVPgP4MSv8srPuE/7+6T4W920zlNXuj9NWnWou+J9kAH+19VBaEbaKgWTNBqS8fpbFi2mrLrXOAH7JCL/smIeEf1y670X43XxWy79MW3WpsfhTjvy6520VSJkNSMlVNxOoLQQ/yH74zdbDEH6sk9QE9JrAy2mrvJpOAfRqf2j4ZfB5ew8baW2I0LfvrMafTVvl1RIGfZ//ta2HkB2rzS79zjA0Kfzbo6Ue9ZOMRT63cFkNDUDv8Au9yUfbuq0Cs0ldhh4wpCz17cgP01YZpYMR/lguwo8lEppA0ceTFQ1HwuASfizWc50WuwgYOagyns8JP7xoLQm9rTdEdIO5SZGQBIefL+xAlNAvHNEuY6tp0n9hcPgfyCLtU4MY0n0p4b9s3V12E8g+BdDv0Qsh4/adLAg/or23WosSlpF1MrtN2HurskO6f4YbqhP2zEmp57R7VtJmAIHh125M+JHtLGomEJWVdVIagLygkG4mO0DP+T9OW0C6j1aD7qIyc11GAwh5eIMMvF7t55wfpek1gajPD4Q/+CT6GkDIeb8MePVftYThhHx1ndR66PWA0AYQNY2RQUl/+xLYpsV6D/vBhB8jaq3uo64B6Nty7gg/ahdYozGZsqWriC5I+NGSVjLgPgMIeuEpb1cCXiJqNiJb3n+kPhfNlQykvhUScl4FBDq32vXmmjHXKUXQ0Z+pP5pVeybcfhDhB9arORvVnlsTfvSi5lp2aQDeHU7GK/wWSCCTd017Zc6jMx3L3+L6gZyaOyawr4AD5R1ZLPpI8uKgBbwowo9u1ZaXpacAJ7Z0Ia8l5bHNQClS494fH16UwUXdg6M/sLuacrP3f0j4gf3Vkp8q3gaUv/2JrQJDqKXm9+oaHP2B5WrIUfEZAOHHqGqo/Z0bgHfXAuBjn2wWnQFw9MfoSmdgpwbA0R+o264ZLTYD4OgPTEpmYZcGcM+Wi8nrjfoedaBJzpmYndXZncdz+l+y4wG1KpGxuTMAt8DK35X69FOgFc7ZmJXZWf8njv5AjuyspV4ElL+Hc3/gBtkZ2dohOPoDuTIzV+xtQADlpTUAjv7APJlZubEBeE5FAOTbluGUGQBHf2A3WZm5qQGEPI0UQLqNWd7YAGTm4PJV39LIXL84FBiFV3ZuyvLGaca2c4e5sqYyQI+ic7hpBnDblgD6sDbTa7uCY9fRRxl/mbYA7OFQ4vjZ1hdZNwuIfheA8APLhGYo5W1AAHX6pgE4Tv9pLoADryyty3ZkSF0aCYC4LHGUBgZ2vQHoVfvFZMrCXYSAI8dMXcn4lbcFHM//ufkHcBaRT04BgIHRAICBuTcApv9AjIhsfW0AXucXAOp2OeucAgADowEAA3NtAJz/A7G8M8YMABjYqgHwxB5gLBeZv5hOeL0DwCkAEM8zr5wCAANzawA0EyCHZ9Y8Q8uNREAOt6xx1AYGpg2AJgCM6VDDfzqtAxjM6QFvAQLt8cqty/Rfsv/UVgEk8MqcywxA/hh97JDL00sAzHIk0T2z9b15XQAk/EAul8zxDgAwMK9TgJEvAJ7IEL61dSSSstN3sN5NW+NxyS4NYJFjGb6Pto4CpPTuyOLTtDUWj+xyCrAA4S+PfbAMDQAYGA0AGBgNABgYDQAYGA0AGBgNABgYDQAYGA0AGBgNABgYDQAYGA0AGBgNABgYDQAYGA1gAfsoKgpiHyxDA1jmkxQgX6teiI39kN8F4IUvBAEa5ZFdZgDAwLwawJEtAeRwyZxXA3hkSwA5XDLHo8GABnnl9lBy+9jWAQxEs69H7UNpJoufMsIMAMjjMQOQyB7pNYAv0yaAwXzhbUBgYJ4NgFMAIIdb1twagJyScCoBJPDMGqcAwMAuGgBvBQJjWWX+67mE09sKXAcAgnlmlVMAYGCuDcCjMwHYzDtjzACAgdEAgIF9bQBcwAPGcDnr7jMArgMAMSKyxSkAMDAaADCwKw1ATg1u2+pSXj8HwMQlU9cz/s2FP6/zjMsXGgAsE5VLTgGAgUU2AGYAgI+wLK39wZwGAPWIzCOnAMDAohsADQZYJjRDa3+4zBSObXURmbks/rpxYGReGdqU6U3d5cyWAPqwNtMZU/QHtgSwm/Ds3HSV/limHx9tfZF1Vx8B3Mzx6v8dWXyatq66aQaw9j8A0JyNWc44BXDrZMAosjJzYwNg6g60bVuGU2YAilkAME9mVtIaAID6bG0AzqcBD20JYD23jMzJ7qxwe05JnBsK0JXsrM06BZCf43mqcGJLAFe5ZWNuZmcfjZkFALFKZGz2kV1+3n1b9cC1AOAqz3P/2Vnd6UjMLACIUSpbnuf2O/F8wUDLSmZhpwbAURuo264ZLTYDUMwCMLrSGdi5ATALAOq0TzaLzgAUswCMqoba36sBBMwCHtsSGIVrze+byb2D7N29ApoKUK1a8rModDQBYHc15WbRNQD5vae26sXzbkOgRq41vjSDi4+4zAKA+WrLy+J3AeT36zeOuvEeIKAWAeFfnD2PtwEjvj34kS2BXkTU9OLsuU23A7obpwLoRq35KH4j0CbeAwaUUnMtux5lI14oMwG0rPZMuM4A5O+6baueuB6AVrnXrnfG3I+uQR1PGxWnBGjJgUThi6278Tz6q5Dpde3THiBaKxkIuQgof6frvQEqYkCBCEHhd8+UCjuqRgU2ogsCXlqr+9Aw0QQwkhbrPfQ+APm7o37+M1sCtQipycAMXQj94eJcXsATW3cjjfZ3WfBsAdTiodWkK8tOyKxiJWUqHTg1eiCL99MWUMR9Ke+/bN2V1Hd4PtPOpQObwHey+DhtAanuSFn/z9ZdZYRfpTUAEXJjhJKxOpbF2bQFpLgt9RzxSVitZz01D536r0RfA7hMrweEnLfbjgh5nxRYQ4/8UeHXjKSEX2XOAC7IwIW9OBk8rgkgWtg5v5IaTs1k5gzgQuQLtB3DuwOIolf7uwm/Sm8AKrgJvJEF9wnA2zOrrRAlwq+K/NIVGdDQc51Sg4q+9FynRWYAK/K6I74/4KvoHYf+JYQ/NAPbFG0A4rMMQOizAGgC2FdC+LX2P09bZZRuAOqDDEToswFtR3I6gLn0npXo8GvNf5i2yqmhAag3MiDPbT2E7E+9CYl3CLCNXukPuWFtxWo97ILiLmo7Kv4gg/+brYeRHcBsAN+IPuorKb0fZfFy2iqvlhnAyksZoJ9tPUzGjkZbksKvtV1N+FVtDUC9kIH6l62HsR3u/XBTtOc0Kfxa0y+mrXrUPBX+SfbLr7YeSnYOpwQDygi+siN/deFXNc4AVnQm8E9bD2WFcG/awgDuJYZfa7jK8KsWjnx6C6b7t61swmygb1nBV1JKerX/1bRVp5pnACuvZCBD7xO4zAqEtwv7o2/vZYZfa7bq8KuWjnY6bUv9qC+zgT5kBl9J2egdfsVv8pmjtQI/lH2ZfuskjaBN2cFXUipHsgi9kchTk4VdYscqGkEbqI/5WrgG8I1SA22FxfWBeqWe51/WYvhV00e0Ujtbyf7Wm4jeTVso7ERK4a2tp2s1/KrJGcCKDrxwfwb7HFpw1oCK/H5ceKT7QBQJv9aeFqBtNqnpP/4yrQJbLab1YmgF+9pPVwVbQ2EoGkEM9q+/pk8BrtMdI57aZjFaqEpW9WvKscwDG84ajvpPtcBsswvdHqlqKJjLeiucaOy/HF0XZW1FtEIzWI/9lW+EQgx7hpuH0ZtBraFXsmu6f+ZkV9cANjirOWQagBXZLH79IsFTe7kX7N+qYzXT/QNnRzv6hD2hOErNzWuOmkO+jgy3HhSb+puXGHL62VpRXldrU2Bc2zNkA1hpvWCvk/rVUwj9uumoT0zqJ9307rs/ps0+jBj8laEbgDmSgu7+XA/fktzrY7mKPpmntBEuAm6jjydTfMpvELqvdYfL6tDhV8wArunttABXWfBhGIwNaAR9IfjrMShb0AjaRvBvxuDMRCNoC8Gfh0Ha3V3pBU184+toJPP6cJf/TluYgwawALOCOnC03x8D54BGUAbBX44BdEYziEXofTGYcZr74FGtJPNDfUAnEw0gCTOD3XCkz8EgF0AzWI/Q52PAKzBqQyDw5bEDKtRrQyDw9WGHtOOx9IU/bb1qkvMnsng9baFmNIA+pDcHQt6DW7f+D9bXS9lb1I0wAAAAAElFTkSuQmCC'
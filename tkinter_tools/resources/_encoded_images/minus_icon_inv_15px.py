@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAA8AAAAPCAYAAAA71pVKAAABAklEQVR42qWTMU5CQRCGv308gpWJUHgCG07AOegMhyB0eDFbS+ihkkYLY0HEhGpj3vLZDMmLQQrYZPNnZ76ZnZ3dBUDtHFV9UtellK26DV2HvdPmUSuAnPNQXakv6kR9UO9DJ2Ff5ZyH7ThyzsNSyr5pmhlnRtM0s1LK/pgAtae+qtNY11F+pabQjlqHfxp8D3WuLsLRjYD/Zje4hTpH3aiP4azPlR1VpeA3NdAHlikl1YN6A9ydiP0GfoJbAn3UrTpoZR+rH+r7Hx23mIG6rYEKuAW+ov3PwOLUzmqVUjoEX9XADhipb0CVUsrA55kzC4yA3dXdvvyer31h173tS3/VLzyz3ffJGcnFAAAAAElFTkSuQmCC'
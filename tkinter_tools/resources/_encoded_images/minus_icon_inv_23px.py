@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAABcAAAAXCAYAAADgKtSgAAABkElEQVR42rWVQWpUQRCGv573XpiAI3gINx4gu2zcCiEYCO5yDZdm5xmSG4wQhOAyK3cus5ABFx4hMLoYmH5+Lqwe2iEZRemChn6vqv6q/ruqGipRk9rFvldP1Pfqnb/LXfw/Ufuw79RU46UaGCCl5Hq9ftn3/VvgKfAN+AR8BlbAFHgGHAAz4EvO+fUwDFc1xnbGaT6fd+pFZLdQX6kz7hF1FvpF2F+Ef9qcoFChduM4vgvDN4WesJkETWVNKl0X9oZ/t6Go4vhSNed8VgXtt3ncOu1Gn3M+i8QuS9BieBSK8/geHgJ9IMgQ+/PAOSrKPfWrugB2ZvuHAH34LwJvD/U46DgtJcg/SPHLOZ9G9seo1+pS3a9LsrqsnWu7lNX9wLsmNjelKvgPKf7qjbrsoxFuI/IE+FFlcgg83oG3BD5WTTNRBW6B5z0gsEopqaKmMO6AD8CjHeDfgSdArrtTXQG/bhiY3tO6I/DiLzIfK9By4imQmnLevFqa1nm7Dm09W9pNxabzvOVL1P4NbfX6/wQMZVYcc+W5fwAAAABJRU5ErkJggg=='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAACD0lEQVR42sWXz0ocQRDGq2Y2h0BiQAzRa55g8aBIXsEHEFYEn8BH2Os+gV49eVT2BQI+gA8QD0HwsoFIQv5I5k/nl8vXyeywq7PGpAua7umq+r7umqqeHrM5AuSN8QqwC5yEEN4BJX+k1NyJbFZmYXQSIFO/CoyAa6blFrhRu23pruWz2sS6j9CjYV3X+8CkAfgWOADeAGvAC7U1zR3IJsqkruv9SA74vaTAYfQOIZyWZbnRNVplWW6EEE4bCzicSy7S3MysqqpjOXwGBs3wAz0gHw6HmXxc41y6rGE/EAZVVR3Hdz5FHklDCEfa5VVRFOsN42yR/Ih4RVGshxCuhHk0lXBxAOxpp5+Avuae2AMl+gJ9YQLs/eZUyF4qQwF2/pZ0BvmOsG/E5dFgJMVYzz17JIlYwFgco6hYVtkEhcUXLvy7iXNh9sUxAZZj9gGcdy74xcljmZ6La5CZ2baZYWZnssvm1Xijn9X8joMiYp6Ja9uAS61i60Hna8dwq98S16UDhZnVZvba3T8A7u60HJ+b2bOOPN/c/Ws7Yu4O8MrM3ptZz7SCj8BSNJrxbsbAD+C7+lkt6sbtXImYwJK4Hj+RukrPzEoze6r2pal0958a7i4S6pZvUyJPmSy5MjO7UIpvxo3+g3KKc5viukh2gKQ7MlN+JNJ8FpNdBJJdfZJe9pJdb5Ne6JP+wvzPn7Zf044ic/S91MAAAAAASUVORK5CYII='
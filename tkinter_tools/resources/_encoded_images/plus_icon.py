@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAMAAABrrFhUAAACW1BMVEUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABBQeqIAAAAyHRSTlMADu0D3f4VAc3ve9sP8RIMtyUiqr+o6jX7KWT92o8Jc9nKE5nc9BDDUlyvBOJjJ4TwsVbGOuznzh83bQJl7kEZuQ288i12wEls+tgF5gprFBsgjL4hFtZqBlCtzM+hTzJ+4Xf4PixLPPcLh0rpNIashZPTWJf29cFwxRijRd45KC7H/JWzQnyJGpDXi1dTL3piXirQgUxaySO9bmbgqQhVnK5nouPouGGlJOtfSDbftFHEM3kcdYLR+WCbQEddF8gwVDt9sohDq6OyxrAAAAzRSURBVHgB7d2FetvI+8Xx4zhmO2g7zMzMpTBDmZmZmbndbbvMzMzMvHvu6vdnEDl2YpBkfa4gz7dNK41m5kXUlS99sLt5MM/n7UhsK9tusWwva0vs8PryBpt3P1haDh0rz7q54Pa6llXtJ6ngZPuqlnW3F9zM0l0Ha0ZVXt8qB4PkWNWXV5VhhT6k7W9YUprJkGWWLmnYnwZtW3zhUMVbnIe3Kg5dWAyNejz7tRcZBi++lv04tMZ2pWCokWHTOFRwxQbtqH9+qIxhVjb0fD00ofiV1xIYEQmvvVIMtRvYl8sIyt03ABV7+anqfkZYf/VTL0Odil8vYlQUvV4M9bkzWMioKRy8A3W5c2sro2rrLTUlWPlILaOu9pGVUIfeERdjwjXSi9gz31/PkOT4x1pSNi5zTlVVDi/a8fvvOxYNV1ZNOZdtTGkZ8+cwJOvvmxFjB5sYtD2F3lcLNm1OSzJDljkpbfOmgle9hXsYtKaDiKVzD3sYlBxXypHKgWkEZXqg8kiKK4dB8Tx8DrFiO17IYIylj2RYQ19DGUkfYzAKj9sQE6k+C2fl8N5qLcYcFbfe8jo4K4svFdFX80I7Z3Pgz7rUeWeu+/MAZ9P+Qg2iLO0wZ+FJyV6BsFiRneLhLA6nIaqefpOBdTizEEZZzg4G9ubTiJ6kEzkMxOH7cC/CbO+HPgcDyTmRhCjpKmIgiQ31iIj6hkQGUtSFqMheyACOdf+MiPm5+xgDWJiNyDNdt1CZ/VE3Isr9qJ3KLNdNiLBn+6jsiXeSEXHJ7zxBZX3PIqIWlVKRa8qEqDBNuaiodBEi6LFGKvE/aUXUWJ/0U0njY4iUHmcmFWSev4younxe+Wdx9iAi8o9SyfpdiLpd66nkaD4iwJ1OBY4tJsSAaYuDCtLdCDvrEip4LgMxkvEcFSyxIsy+rKC8xm35iJn8bY2UV/ElwqrzGcq7egkxdekq5T3TiTBaYaeszLxexFhvXiZl2VcgbDrtlDXRDBVonqAseyfCZKaIsk7vhCrsPE1ZRTMIC+tnlFVigkqYSijrMyvCwP025Zw6Y4Nq2M6copy33Zi3/Jcox78WqrLWTzkv5WOezEcpJ/cSVOZSLuUcNWN+nJRzNhWqk3qWcpyYl6prlHHDChWy3qCMa1WYhx8clJFugiqZ0inD8QPmLK2UMt6YhEpNvkEZpWmYo97llFGyBqq1poQylvdiTmzXKaOkBipWI1vgug1zUWeh1Pk1ULU15yllqcMcfJRAqfRJqNzkP5RK+AghK7dT6oYJqme6QSl7OUJkO0Gps1ZogPUspU7YEJrjFkrkvgdNeC+XEpbjCElaLSXe74JGdL1Pido0hGB8HSVOrYVmrD1FiXXjCF42pc5AQ85QKhtBS52gRIkNGmIrocREKoJkTqdEhRua4q6gRLoZwWm2SOtlQWOyJihmaUZQVrooNtoMzWkepZhrJYKxjBJ3oUF3KbEMQTjoodgvbmiQ+xeKeQ5iVuOfUKy/C5rU5aHYJ+OYzacWig1CowYpZvkUs0i2U8ybD42a9FLMnozAVlPM8zk063MPxVYjoGkXxbZAw7ZQzDWNQL6QW0rQKvllnS8QwOJaiowOQ9OGRylSuzikD2HvIkLMIoiQd0P5WLZ4K0Xa6hEZyfZEAXsyIqO+jSJbF0PJVxT7GhFi8lDAY0KEfE2xr6AgqZAiLisixJRAgQQTIsTqokhhEuQtkP9PU8sB5B9tFkBWfhFFvjHpIYDpG4oU5UPOLgtFPoAeAuADilh2QYatiSIdyfoIkNxBkSYbpAb6KfId9BEA31GkfwBS+yhyzKSXAKZjFNkHiSQXRUaglwAYoYgrCWK/UeSiVT8BrBcp8hvEqilyBPoJgCMUqYZIqoNCjfV6ClDfSCFHKoS6KeKDngLAR5FuCIyfplDOj/oK8GMOhU6P4/+7UkahDXv1FWDvBgqVXcH/V0ARJ/QVAI9QpAD/T80QhTyX9Rbgcj+Fhmrwf7I8FErp0VuAnhQKebIC7Qipg94CoI4i2QGegvyd+gvQ6Vd+FjpXK3ld1F0A6et+7Tn8jwsWCtVBfwFQRyHLBfyPQ5LnRB0GkD7tH8J/M1dQaHmNHgPULKdQhRn/ZekBCjmhxwBwUujAUvyX/RS61qrPAK3XKLQf/6WBQrlJ+gyQlEuhBvyXJRRKhz4DIJ1CSxTWi7r1GqBbftUv41sKjGboNUDGKAW+zcB/+IlCpdN6DTBdSqGf8B/yKJQCvQZACoXy8B/6KNSg3wANFOoDAPdDFKrUb4BKCj3kBpDloMCenfoNsHMPBRxZAP6mUG6xfgMU51Lob5l9IV6bfgPYvDJ7Rf6i0PfQbwB8T6G/ABymUIGeAxRQ6DDQ00KhTXoOsIlCLT2S/wUzN+s5wOZMyf+DS9sp4E/Tc4A0PwXal+LXkxQYS9JzgKQxCpz8FbspdNWs5wDmqxTajXsUSoGeAyCFQvewjUIbERXJ4gDJiIqNFNqGPAotw9wkm0Iys5ACC2dMIZlrr2UUyoMvPEviZntCSBZaKGBZmBASuzk8S+M+eMOzQdz8MaPq4zkGmKKQFxsoVDXHAImMqsQ5Bqii0AYkUqhS3wEqKZSINgoN6zvAMIXaUEahRfoOsIhCZdhOoR36DrCDQtuRQ6FWfQdopVBOvAX4XRIg3n8FjH8E4/2/QeNBqCO+H4U7sJxCU/H1MrTceB2O9wURY0ks3hdFjWXxOP8w8sD4NOZeFc8fR1e54/7zuLFBArfjeYvMbcDYJHUznrfJ3TQ2ShpbZY3N0sZ2+fg5MGGVHJgwjswYh6aMY3NxfXDSODprHJ42js8bFygYV2gYl6gY1+gYFykZV2lJLlPrj7PL1OLgOj0nRQqMCxWNKzWNS1WNa3WNi5Xj9mrt+8bl6sb1+saABWPEhjFkxRizYwxaMkZtGcPWjHF7xsBFY+SmMXTVGLtrDF4OOHp7Mo5GbxvD1+XG73viavw+DnoodtUNDXL/QjHPQQThYUrchQbdpcTDCMZKF8VGm6E5zaMUc61EUJotFJvIgsZkTVDM0ozgmNMpUeGGprgrKJFuRpBSJyhRYoOG2EooMZGKoGVT6gw05AylshG88XWUOLUWmrH2FCXWjSMEabWUeL8LGtH1PiVq0xCS4xZK5L4HTXgvlxKW4wiN7QSlzlqhAdazlDphC8NSAnnDBNUz3SDDsqzzUQKl0iehcpPplEr4CHNQZ6HU+TVQtTXnKWWpw1zYrlNGSQ1UrKaEMq7bMCe9y2ULrIFqrSmhjOW9mKO0Usp4YxIqNfkGZZSmYc5+cFBGugmqZEqnDMcPmIeqa5RxwwoVst6gjGtVmBcn5ZxNheqknqUcJ+bHfJRyci9BZS7lUs5RM+Yp/yXK8a+Fqqz1U85L+Zg399uUc+qMDaphO3OKct52Iwysn1FWiQkqYSqhrM+sCIuZIso6vROqsPM0ZRXNIEw67ZQ10QwVaJ6gLHsnwmaFnbIy83oRY715mZRlX4Ew6nyG8louIaYuXaW8ZzoRVl9WUF7jtnzETP62Rsqr+BJhZl1CBc9lIEYynqOCJVaEnTudChxbTIgB0xYHFaS7EQH5R6lk/S5E3a71VHI0HxHR48ykgszzlxFVl88r/yzOHkTKY41U4n/SiqixPumnksbHEEGLSqnINWVCVJimXFRUuggR9WwflT3xTjIiLvmdJ6is71lEmOm6hcrsj7oRUe5H7VRmuW5C5GUvZADHun9GxPzcfYwBLMxGVHQVMZDEhnpERH1DIgMp6kKUJJ3IYSAO34d7EWZ7P/Q5GEjOiSREz9NvMrAOZxbCKMvZwcDefBpRlXaYs/CkZK9AWKzITvFwFofTEGU1L7RzNgea6lIxT6l1TQc4m/YXahB9qT4LZ+Xw3motxhwVt97yOjgriy8VMWE7XshgjKWPZFgRImvGSPoYg1F43IZYOfewh0HJcaUcqRyYRlCmByqPpLhyGBTPw+cQSwebGLQ9hd5XCzZtTksyQ5Y5KW3zpoJXvYV7GLSmg4gx8/31DEmOf6wlZeMy51RV5fCiHa2tOxYNV1ZNOZdtTGkZ8+cwJOvvmxF7vSMuxoRrpBfqsPKRWkZd7SMroR4zf2xlVG39YwbqcmewkFFTOHgH6lP8ehGjouj1YqjTy09V9zPC+qufehkqNrAvlxGUu28Aalf8SnUCIyKh+pViaEL980NlDLOyoefroR22KwVDjQybxqGCKzZozePZ1S8yDF6szn4cGrX4wqGKtzgPb1UcurAY2pa2v2FJaSZDllm6pGF/GvRhZUZVXt8qB4PkWNWXV5WxEjpTnnVzwe11LavaT1LByfZVLetuL7iZVQ4dK1/xYPe9wbs+74bEtrLtFsv2srbEDV7f3cF7ux+sKEe0/Rt193rNUPwr5gAAAABJRU5ErkJggg=='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAA8AAAAPCAYAAAA71pVKAAABAElEQVR42qXTMU5CQRSF4e/xwMSKCJYWJhoWYMFCTOitwUS34g5cgp0dlQ2SSIythaGwkhi1sAItPMaJhYVMc3Lv/ee+O2fm8bVqP+sUEzxgHp0k7zffiPYwxSUG2EUnOkh+Gq7cp4dnjPy9RuG+G2jhFsMirlElrhK3Eg/Dt+AE4xQ2Mk6FNs6jVfIb4cbZZ4bDFEvj2riPlkY1ws+a6OIaq+KLNbbwju3ES7ziI3y3mY5v0Q+c4SCN9nGR/A2OfvHm2CnMaeeK9nAX7RRnF37exAJ9PKb4EmCJTTwVuTpT9LFoxNHjnLku3IarYqJvQ1fhz9e+57Ve2Npv+19/1Sc6NUI5NgVUJQAAAABJRU5ErkJggg=='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAABcAAAAXCAYAAADgKtSgAAABsklEQVR42r3VMWtUQRAH8N+7Ow5ECIJiJfYSwnUWISlC4IoUWuYb+A1y+QYWQgi2QjoxlZBaSGthFZXDPpgiIYVdCs2dzayMm3vB5jkwzL7ZmXn/+bM7y03pp/UYb3GGedKz8I9b8kCzYD2PpFcY4RIf8Q0/cA9PsIoH+IwJPlQ1/irci/V+bJ7gGYYWyzD2TyJ+P/y9DLpJLR1G4M4CqgZJawp2Iu8wxTeZq4J4OyHoJxRNFG4qUKXj7aqDPwA2YmOSWm78mzSJuknU2cibU3yJ70FVuCB7jJdhsz93JepMS43N+NtWFVQfsfWIW285egXUVsRtwrs4bmWz5nQYdhU/w2Z/ji/gLqOucxy1XYQko0A0uiWm5B/hfICHwVH++zy4fRT+GVZi/RR3EuffcVp1PcXzkribeCuc71VXvk33FuTuYlZ4XkqtXYd9jfcV8jd4ga8V8pJXaFlCM8AFltNMKHPhNLTIVdhPMU9qybnLuOjhGGvR0uyW03IXv8K2nZZZ1FnDcQ8HuJ/GZz8huU7aT3Ml++dV3jjqHXR+QzudLZ1OxU7neWcv0X95Qzt5/X8DWgCL/iB4E5kAAAAASUVORK5CYII='
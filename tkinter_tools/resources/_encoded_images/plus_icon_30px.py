@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAACTklEQVR42sWXMW/TUBDHf8921bIknTuwpBVS2ZA6dGONWgaG7v0M5QtkQOrKzIDUuQOoUsWKxNChn6BV01KGAGUJLARIbJb/Racn2zED+KSTnbt3/7/f+d35EqiWFJjp/h7wGOgD28A6sCrfGLgCzoC3wDvgRwlGI0l17QDPgAugcDoGPkjHke9CMZ0Iq1YCkOj+KTB0gG+AfeAh0AWWpF3Z9rXG1g+FgTBDE9JDB/AK2PyLbG0qxuIP68iDS8lLBXwGdqP0Zw7AayKfT+uuMAphGkYoe6e200vggWyZy0QTsYdAGJfRztOY9IkWfAI2ZFuqIcgcQZlY7IYwC3HMOYNO4K2c/QakTcUw+sK+Fdc83QdyHC0gDW63A2kW+arIj8RxgGsO18AvoBed7iriFeC3dGUBsR3GnjiuxTlPw0mDgjfwZWAkXV5A7DFP7HUmwI5+HLvyKCOM1Q5Xma8q/lhcO5l6bwDOZcxLAovo6vvvzDWLKsnlPxfXdqaG/01powTAdlYoKHfptfdt58LWTKXxg4/EtW7Gm5LTab8HwFcF3QFfdJ1JvW2ktYMIw2PeAEVCSxK09QK4D3yXrWiQ6qH8PeDnglQbZgf4CIREH/EusFZRFlNgIvCJanHi/N5ma6YVZbgmrqtEk0MBbNU0D/8VClGtp5Ev1DSRLXGdJcCpjHs1ZVGUqKWzzFcVvyeu09ZaZqqnTtU6V4HXOkx5DbHdv9dwl9cQZyq7F8Aj4Lni2vsstjYItDb6tDrstTbetjrQ/9e/MIvGlX/2p+0PrJHrlwSjkLYAAAAASUVORK5CYII='
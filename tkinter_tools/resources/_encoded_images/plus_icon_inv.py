@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAA8VSURBVHhe7d1rc9RWEsZxjCHhYm5h4U3YSrLf/0OFqvAmbCqw3HYJ4O22eohtZsYaqbvP7f+r2pJEbWyPTj+tI41mdHQNPXh4enr6p62nODo6eiSLV9MWWkUDaEd6yJeiObSDBlAhCfqprXZFGgP1VhkGpAK9Bv4qNITyGIACRg38VWgI+djhSQj9YWgGOdjJcY4k819sHStIL7guCxpoABqAM470sZgZ+GJnOiD0ZdAM1mMHrkDw60AjWE7PrXCYWxp8ZdsozIZDx+PW9C+Yi845kxUYGsGsYB520hUIfttoBPuxc3Yg+H2hEWzHTrmE4PeNRnARFwH/do/w98/G+N60BbrhtWvHUhOfbB0DkcnADVl8nrbGNHQD6O2ILwX9WBav5X9RRX0s/3sgu+2PabMPI58WDPnCWw9+rQXLfm3PaC+4uQ/otF6UrTUF2d1DffBomAbQQiFK8f1DFl1Nr7d4LEPxb1uvVuuNd64RXuQNKbi/bL06oxTaLjU3Zhmam7Lo+gJx18VXa3GNHvpdGK983b6w2oqJ0B+G8cvR441AP9RSPFIzJ1o4yv4JM9luUyf2T0VZTf0wbfWjq8KsKPgEPgDj66+bF1JDcRD8HIy1nx5OAe6XLAipg4daDMr+CcFsd6uH9k/prObuT1vtarpoCwdfP1DydtpCYSdSCm9sPZ12IlttTrN/eKnwy1g/kMV/pi1URmeD+lmIdK02gSb/6ILhb3rGNArqY77W/uDrMrbpH98k+G0q0QikVPQTk8183qSli4C3s8OvwVe2icbY8KWOn9Xo7Wmrfq00AP0M+ntbDyc18yC7cBBHx1LotZsUVqtpv2+NFor8iezQ3209nFaKraJDUktppwVSSk9l8XLaqlPtM4BnWeGXwbpD+PunYyzu2GYoq91n01adai74n2QH/mrrobQibBUDyZoNSHn9LIvn01Zdap0B/JIRfhmY+4R/XDr2IvxuPqvlX6atutRY/ClHfh15WwVSZgNSctXNBGoLwY8yDr/ZehjCj22SmoBeE3gxbZVX0ymAXu0PDb/sfN7ew05aGyL07Tur8SfTVnm1hEHf539l6yFkYLXZpd8ZhiaFf3u01KN+krHI5xbOq6EB6B1+oTf5aFu3VWA2qcvQA4aUpb4d+WHaKqN0MMIfy0X4sUZCEyj6eLKi4UjYuYQfq/Vcp8UuAkbuVNmfTwk/vGgtCb2tN0R0g9mnSEiCw88XdiBK6BeOaJex1TTpvzA4/HdlkfapQQzpjpTwO1t3l90Esk8B9Hv0Qsh++14WhB/R3lutRQnLyDaZ3SbsvVUZkO6f4YbqhD1zUuo57Z6VtBlAYPi1GxN+ZPsUNROIyso2KQ1AXlBIN5MB0HP+j9MWkO6j1aC7qMxcltEAQh7eIDter/Zzzo/S9JpA1OcHwh98En0NIOS8X3Z49V+1hOGEfHWd1Hro9YDQBhA1jZGdkv72JXCVFus97AcTfoyotbqPugagb8u5I/yoXWCNxmTKlq4iuiDhR0tayYD7DCDohae8XQl4iajZiGx5/5H6XDRXsiP1rZCQ8yog0KnVrjfXjLlOKYKO/kz90azaM+H2gwg/sF3N2aj23Jrwoxc117JLA/DucLK/wm+BBDJ517RX5jw60035W1w/kFNzxwSWCjhQfieLVR9JXh20gBdF+NGt2vKy9hTgxJYu5LWkPLYZKEVq3Pvjw6syuKp7cPQHDldTbhb/h4QfWK6W/FTxNqD87Y9sFRhCLTW/qGtw9AfWqyFHxRsA4Q+3+PmLMjRFn1s3gtJZOvgUwPMPRriTpeFX9t+6vtODOEuyeXDHWPJLduHoH8trrBinWCUzddAMwPMPBeDv0IwWexeAowowKZmFQxrAbVuuJq836nvUgSY5Z2J2Vmd3Hs/pf8mONxKvMWO8cpTI2NwZgFsByN+V+vRToBXO2ZiV2Vn/pxKdCet5jRtjlic7a6kXAeXv4dwf2CM7I1d2iOyOBD9eY8e45crMXLG3AQGUl9YAOIoA82RmZW8D8JyKAMh3VYZTZgAc/YHDZGVmXwMIeRopgHQ7s7yzAcjMweWrvqWR8XFSYAGv7OzLcsYpwDtbAjhMeHZ2NQD9JhgA/dia6a0NQKYMq542siFTGPfHhQMj8crQrkxHnwJ8sSWAZUIzlHENAEClvmkAMlXwun+c5gI48MrStmxHhpS7CAEfYVniKA0M7HIDcLniKFMW7iIEHDlm6kLGLzQAOUVY/BCJS7x+DoCJS6YuZ5xTAGBgNABgYO4NQM5V+OgvECAiW18bwLb3CAH053zWOQUABkYDAAbm2gA4/wdieWeMGQAwsE0D4Ik9wFjOMn82nfB6B4BTgLowrn3yHFdOAYCBuTUAmgmQwzNrnqHlRiIgh1vWOGoDA9MGQBMAxnRdw39vWgcwmHtHvFXUL8a2X15j6zL9l/p4bKsAEnhlzuv8/7UtAeRwyZxXA/hsSwA5XDLHOwDAwFwuAnZ+kehEdtEbW0dDpCz1Ha6301Z/XLJLA9jrWHYPX3HeMClNfSx2l6eoHtnlFGAPwt8+xnA/GgAwMBoAMDAaADAwGgAwMBoAMDAaADAwGgAwMBoAMDAaADAwGgAwMBoAMDAaADAwGgAwMBrAHvZRUjSMMdyPBrDfZykgvja9UTZ2fF3dHnwhSMc8xlYxvnXyGF9mAMDAvBrAsS0B5HDJnFcDeGBLADlcMsejwTrG2PbLa2yvy9g+tHUAA9Hs6ykA33kPjOmNNoAv0zqAwXzhbUBgYJ4NgAtFQA63rLk1gNPTU04lgASeWeMUABjYWQPgrUBgLJvMfz2X8LixQH4o1wEq4jGminGti2dWOQUABubaALyOOAC2884YMwBgYDQAYGBfGwAXeoAxnM+6+wyA6wBAjIhscQoADIwGAAzsQgOQUwOv71Dnu9gBXy6ZupzxyzMAl+9Ql1OVv2wVgAPHTF3IOKcAwMAiGwBvKwI+wrL0TQM4/x7hGjJl4fsBAAdeWdqWbU4BgIFFNwAaDLBOaIa2/nCZKdy01VVk6sKTWYEVvDK0K9O7ussnWwLow9ZMZ0zR79oSwGHCs7Pviv9NmX58tPVVtl19RDwZP5cPjzB+ZTiO33ey2Hoj0b4ZAHfzAX3YmeWMUwC3TgaMIiszexsAUz+gbVdlOGUGoJgFAPNkZiWtAQCoz5UNwPk04L4tAWznlpE52Z0Vbs8piXNDwR5e48aY5cnO2qxTAPk5nqcKJ7YEcJFbNuZmdnZnz+5MWM9rzBivHCUyNvvILj/vjq164FoAcJHnuf/srB7U2Ut0KCznNV6MVbxS2fI8tz+I5wsGWlYyCwc1AI4EQN0OzWixGYBiFhBLauGerS7m8TOwW+kMLDqie/7Rh3YsHOxYhmvRF7zI0OhDJPhWp0Cls1S8ASiaAEZUQ44WnQIEBPahLYFRuNb80kwuDjKzAGC5WvKzKnQ0AeBwNeVm1bsA8nu9rxB73m0I1Mi1xtdmcPURl1kAMF9teVl9H4D8fv3GUTfeOwioRUD4V2fP40agiG8PfmBLoBcRNb06e27T7YDuxqkAulFrPoreCryP9w4DSqm5ll2PshEvlJkAWlZ7JlxnAPJ36b3j3rgegFa51653xtyPrkEdTxsVpwRoyZFE4Yutu/E8+quQ6XXt0x4gWisZCLkIKH+n670BKmKHAhGCwu+eKRV2VI0KbEQXBLy0VvehYaIJYCQt1nvofQDyd0f9/Ce2BGoRUpOBGToT+sPFqbyAR7buRhrt77Lg2QKoxX2rSVeWnZBZxUbKVDpwanRXFu+nLaCIO1Le72zdldR3eD7TzqUDm8D3svg4bQGpvpOy/p+tu8oIv0prACLkxggl++qmLBZ98y2w0A2p54hPwmo966l56NR/I/oawHl6PSDkvN0GIuR9UmALPfJHhV8zkhJ+lTkDOCM7LuzFyc7jmgCihZ3zK6nh1ExmzgDORL5AGxjeHUAUvdrfTfhVegNQwU3gtSy4TwDenlhthSgRflXkl27IDg091ym1U9GXnuu0yAxgQ153xPcHfBU9cOhfQvhDM3CVog1AfJYdEPosAJoAlkoIv9Z+0Yevlm4A6oPsiNBnA9pAcjqAufSelejwa81/mLbKqaEBqNeyQ57aeggZT70JiXcIcBW90h9yw9qG1XrYBcVD1HZU/FF2/m+2HkYGgNkAvhF91FdSes9k8WLaKq+WGcDGC9lBP9t6mIyBRluSwq+1XU34VW0NQD2XHfUvWw9jA+79cFO0515S+LWmn09b9ah5KvyTjMuvth5KBodTggFlBF/Zkb+68KsaZwAbOhP4p62HskK4PW1hALcTw681XGX4VQtHPr0F0/3bVnZhNtC3rOArKSW92v9y2qpTzTOAjZeyI0PvEzjPCoS3C/ujb+9lhl9rturwq5aOdjptS/2oL7OBPmQGX0nZ6B1+xW/ymaO1Ar8uY5l+6ySNoE3ZwVdSKseyCL2RyFOThV1iYBWNoA3Ux3wtXAP4RqkdbYXF9YF6pZ7nn9di+FXTR7RSg61kvPUmorfTFgo7kVJ4Y+vpWg2/anIGsKE7Xrg/g30OLThrQEV+P8480DEQRcKvtacFaJtNavqPP0+rwFaLab0YWsFY++mqYGsoDEUjiMH4+mv6FOAyHRjx2DaL0UJVsqpfU4517trurOGo/1gLzDa70O2RqoaCOa+3wonG+OXouihrK6INmsF2jFe+EQox7BluHkZvBrWGXsnQdP/Mya6uAezwqeaQaQA2ZLP49YsEj+3lnrF/q47VTPcPnB3t6BP2hOIoNTevOWoO+Tayu/Wg2NTfvMaQ08/WivKyWpsC+7U9QzaAjdYL9jKpXz2F0K+bjvrEpH7STe+++2Pa7MOIwd8YugGYYyno7s/18C3JvT6Wq+iTeUob4SLgVfTxZIpP+Q1Cx1oHXFaHDr9iBnBJb6cFuMiCD8PO2IFG0BeCvx075Qo0grYR/P3YOTPRCNpC8OdhJx3ulvSCJr7xdTSSeX24y3+nLcxBA1iBWUEdONovx45zQCMog+Cvxw50RjOIReh9sTPjNPfBo1pJ5of6gE4mGkASZgaH4Uifg51cAM1gO0Kfjx1egVEbAoEvjwGoUK8NgcDXhwFpx0PpC3/aetUk549k8WraQs1oAH1Ibw6EvAfXrv0fd2qZfH+vFzQAAAAASUVORK5CYII='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAA8AAAAPCAYAAAA71pVKAAABOklEQVR42qWTPU4kMRCFv+pphEgI+NkNiEnmBJxhb4DYM4DI2MNwgTnAShMRgkQIESSbkNAwAclawuYjqZY6ImAsWc+v/OrHZRsAdTai+ke9b60N6pB4n/bZVI/aAZRS5uqdeqWeqIfqz8STtN+VUuZTP0op89baW631nC9GrfW8tfY2BkDdVB/Us+R9lh/JI3mf/Cz1m6gX6nVubCwWi1k67KvLxEj7Ruqu1QvUR/U4HfqxRHVPXal7E1ufumP1sQd2gJuIUP1Q94Ee+AH8Bw4yYwVeU3cD7KAO6u4k+lJ9ylkn6+VEs6sOPdAB28Brtv/3JPNf4BfwDFS1i4iP1Hc9sAKO1H9AFxFDRn8HtoCniHiZnFngCFh1wCVwGhECY1cDCOAWiLHbQKTuFLhc757XfWHrve3v/qpPwijRU1GoiigAAAAASUVORK5CYII='
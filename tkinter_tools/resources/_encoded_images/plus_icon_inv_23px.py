@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAABcAAAAXCAYAAADgKtSgAAACBElEQVR42rWVv05VQRCHv73n3ANE7kNY2GCtrcFeApIQOwpewsYoscBngGCskRgTawpaSxINiQWPQAKFcjnnfhbOXpcb/NOcSTZnd3Zm9re/MzMLhahJrWJeq+vqR/Xcm3Ie+nW1DvtKTWW8VAYGSCl5fX39tK7rN8A94BL4DHwFfgDzwBLwEBgB39q2fT4cDj+UMWYRp4ODg0rdDXSn6jN1xC2ijmL/NOx3wz9Nb5CpUKuu696H4atMT9gMgqY8BsVeFfaGfzWlqOB4T7Vt283i0Dqj+Ne6bdvNALaXD82nr8TGdqyHsz/nTxKHDGO+HXFW8majnqmnwA00mZL4Lqlv1aVSX94i/E8jXoO6GnRs5BScQZZpWwtUazeu/duuDno2wm61BraAy6qqPoVdVyBLQKUCtHlE4Kw3pTTJfhHnEthCvVCPZq96C7fLgWj5LzaZwiP1oo5COAmeB6opJa+uru43TXM30BtFA7Cs3sn68Xh8Njc396X0B06Ax6gTdaco+VzOh/6fHN7iu6NO6kAwX2RIBzAej182TfNuBvkL4HW0gynywi/3l3kg9c75MfBIXUgpff9FebLMlkC1GNmymLMl9KaUJuE3UReAB8DxANgHRl3XPQkAVXS2SUqpA7r41nmU+kjDqV/EGQH7/VZo372lv67Yaz/v8yXq/w3t6/X/CSrrrWrk6LEhAAAAAElFTkSuQmCC'
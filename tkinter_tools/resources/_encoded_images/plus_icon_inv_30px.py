@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAACjUlEQVR42sWXwUocQRRFb7WTuIgY0AQVCUK+QBQUyS+4cScYBL/AT3DrF+hWEFwqguuASxd+QFyI4EYhkhCi2DNdc7K5lZTDjDNCSBcU1VPvvXu7Xt3XVSP1aMBQ9vwO+AwcxBi/Ak3+tqbnDuzzrhvGQA0oPE4C28A1T9sDcOf+0GG7dsxkjtWPMCTHqqo2gJsM8AuwCXwCpoC37lOe27RPajdVVW0kciD0JQV2UnSM8bDZbC4Mmq1ms7kQYzzMXmCnJ7lJhySp1WrtOeAHsJanH2gAQ1tbW4Vjgp+HbCsy/zVj0Gq19tKePyFPpDHGXa/yqizLucy5eIk+El5ZlnMxxitj7j4RXHoA1r3S78Cs5149p/rnVJtigVljAqz/4XTK3luhAKv9SF+w+kS+auw7c4XksG3DsX83egnQ4wiw7z6S27rENDwem2M7GcZcNtFpCb1SmKl+OlPt9HP1mgRl7GiusaQ+gNN+BZ8RTwG/3KdeEHdqrrVC0rIkJB3Zr+hW305lYZAgqeGe6r/o8M1bwjwy13JD0ryBzhJXHhFCIJur/DJl5lKGENqS2t3iO+bOzDXfkDQj6UHSpY3tjhW/kTSavXlb0oQBJOkD8DqzSdLPEMJ9BpPmL801I+f8GzDaodxU3/vAI3Dv8REoM3GV2Xzy2e/ASJij5hr8i/SvW/B+VZI+hhBugeB97ZfqpIlFSbfPpTphAhNOd0PAhVO2NOjhDYxn6R0fwD+lfMlcF4Wkc6tuMWWhVzllJ9Bw5jKcnVy9yilk2UHSeSHpxIaVbqoOIRBCaDv9bZcO3p5KEqmcOnzVRdUr5jqp75NZ5yFRz7FY20WgtqtPrZe92q63tV7oa/0L8z//tP0GzkGL49M/Lm8AAAAASUVORK5CYII='
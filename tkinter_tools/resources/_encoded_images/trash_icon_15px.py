@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAA8AAAAPCAYAAAA71pVKAAABG0lEQVR42m2TPU7DQBBGnzdukOiSFIgOIdFSU1DChXIBDkCdknNQUuQGpEDQpKKygCA54MRemmc0mKxkffPz1jOzXsP/VQALIIdnYfzPKtUEnGofARfAPfAEnAHXwCXwKvMCdP1LZkAL7KzUAZ9ApXbGd3KzWPnc6rvQ+uGekTIwkicJPgAr7cz+lc2v5ItY/Vbgy9YysFVb41kOoOwrJ+DD4A0w175S58aRS0BRhgOqTH4Dz+FU0R9pV/IphZne1GNgrX2gro1Hjrj5XR0HO+bGA44UTrefeeq33drqVn864HLc3Lc6Edg420Z/MuBybP0EaIAaWFrxUV0ab+R+9xWhYj34IYZPHToo4uwFcOeFaMLlyPqt+f5e8ANnWGa6PZnVdAAAAABJRU5ErkJggg=='
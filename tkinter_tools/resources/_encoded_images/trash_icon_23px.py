@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAABcAAAAXCAYAAADgKtSgAAAB7UlEQVR42pWWQU4UURCGvzc9GBISA0Zg70YT1q7xCiYucMsZXHgAwooLcAM5iCsTExMXhgSXkoEFgyiRmZ5uNn+Z35oHjC+p1Kuqv6rr/dOveuDfNZA0knXgI9ABvUkn/7phI7e6SsW3q2IT4MZkIv/ufXWG5uyBZ8CS/DPgubr8DBzI3wLvgJeKv1DnLTAFvvuTGul9dTRVwc7oaIFfJq3REzJV/n6qC8CxEmaJ30Ul8o5rtPxWENMl0cYD/l515oovK6m/48ctD7wIkbecAQ2wBbw3jjvTvfHqtuN65W9lvsPYtuL/w3fgt73eIF2gie1/ADvAJ/m+AW+lkX9HuKgz8ZoD46sDxtJFwCPgizCnwAdp5D8SrqT8nsp1vdINBFjTDz6WHZdrSfZY9prsG+VT6zxex2vtV4BHwMgwrWFHiq/IvrbXsNq5A4bAqhXPa6T4sNJYtfN8tCfA2R3FzxSvUTrXeVyGn+Z7CpyneOhzxUl5JXfu+0vzbZrdmARu07CXuWZtuI9t/xg40b7TcOpknyhey5ubLXGcC+PtldkbwGtpgDeKx0y5uG8GxYP2lDBd8OoHbi83XKPlyo4eVJBmNomiLl+g2mcO4KseWtIRS5p2jfmL8vJ8n/v6N8Ah8GeBr9JMuEP7B/B33QJjwdfkrs4iqwAAAABJRU5ErkJggg=='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAACl0lEQVR42rWWzWoUQRSFv54pzUKHWSQKAUFEAoIEstONIAgudZ+38A2y8yXEhW+QheQVxLU/q+yyiZnMT36cZJx0uzklx0p3T3eMDUVXV517zr23blUXLH46er8G9oA58Etv7+8J4zaNnwzoWgtqK8ABUCxoB8JGO+fKXCgkwgVwUeJQX4QF8AP4akQF8Bi4K0wfGCyKMFikhTx7Cty0lBXAAyDX9xdgS1jk6BbwQpjnwH1x5sLMgE/CRi0yES4BOw3SedW2I41OzFb0fMNSXdYiQV4yl9t8nf2GtLq+xjdEkKWFUFKAWYNdkNZOLo1LxZXbmgSu97kwjUsC4T8Ipjp/+Ls2OQO+Ad+BZ0pP9o+CkeMt8B74DPysAq/ZmnhB5UmVNhmL/bWqFGCnS0dr0jWPs4oiqxuLthfiDH5AdZLimgMTYGpEA+AJsJksy0u1mY1vCjswJ6binHtxlXnbA/YtXUONr9p+PANuqZ1ZJKvCDs1+X5x/ZaRsz02BE/vuAfeAc8tEAdxWK8zuXNie2Z+YXelmjwRz4Mj2X9DBPwZOK/Y9mhsLG2zvHonTNS5FHL8nyYZfVv8oJbD+sTDLie2kTKtTsc7jhHTFvK96Jgm2SLiyNsJ5QjaqiXiUYPM2wiQkJGTDmoiHCbaKq1Y4Fbij92FNxIcVwsM2wqmXsWDqrjSDNhGHBcKZCYfE+25JZMGczNoIV1ViX3tx17CHie2uMP0FO6Q24nEy/wh4BzzU9xLwwfoAb4BXwrrtuMn/M675+jVe8tabHCDYKTSzFBVKo9+553YUxuN1bvj4Fztus8YTGQX7H4cFtt2Sy93MTrSiLuJCYyPgo13or3Ll6Yhj1JQnRrgMbOt/m7dY01w22+IovcH8Bis/JyY5ljc0AAAAAElFTkSuQmCC'
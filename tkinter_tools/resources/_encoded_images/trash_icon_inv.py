@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAWHSURBVHhe7dvZkhs1AEDRDFBFwv//LVDBqnGKISGb3VIv95yXsZ/GllvX6nbr5R27+3hzf5jycnN/yE58ADuqTvzPCcF+DPwOTPz/JwTrGfDFTP5vE4G1frn/Zb5fTf7vu4/Rb6/PmE0A1vhwO67/uj/mO25j9eftzx+vz5jJcmu+8c1v8j/gdjYwVgJ/vz5jBgGY7L6k5UGuCcxlcCcy+bchAvMY2ElM/m2JwBwuAkKYqk7g238Oq4DtWQFAmKJuzLf/XFYB27ICgDABgDABgDABgDAXVDbkAuAaLgRuxwoAwgQAwgQAwgQAwgQAwgQAwvycsqFVPwMe9Wew+vs/IysACBMACBMACBMACBMACDvs1dRVV5RhhaP+cnGYF2XCU3KUIOz+Ikx8yvYOwZ7XAN6b/NTd58D712fr7VIfEx++tMdqYPk/NPnh61ZHYOk/M/nh+1ZGYOU1gN3Oc+Bkls2VZaXx7Q8/btUqYMk/Mfnh562IgFuBIWx6YXz7w+NmrwKsACBMACBMACBs6vmF83943szrAFYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAEPZy/zvNx5v7Q+AnvdzcH04xPQDPEhDObPYEfpZTAAgTAAgTAAgTAAgTAAgTAAgTAAg7/H0Ag3sBOKOj3wMwWAFAmABAmABAmABAmABAmABAmABAmABAmABAmABAmABAmABAmABAmABA2Cm2Aw9n3RL8dkuobc0/5gpj9vY9HJkAPODRD3ev9+D1rvfoe1jNKcBCZzko9mSM1hIACBMACBMACBMACBMACBMACBMACBMACBOABxzpjjNe+UweIwAQJgAQdpoAuEecszjTsWoFsJiQfZ2xWU8AIEwAIEwAIEwAIEwAIEwAIEwAIEwAIEwAHmTzyXH4LB4nABAmABAmABAmADuw6eVLxmQfpwqAg4SjO9sxagUAYQIAYQIAYQIAYQIAYQIAYQIAYQLwBJtQ9uczeI4AQJgAQJgAQJgA7MS+hn8Zi/0IAIQJAISdLgCWixzVGY9NKwAIEwAIEwAIEwAIEwAIE4An2YyyH2P/PAGAMAGAMAGAMAHYkbsajcHeBADCBADCBADCThkA540czVmPSSsACBMACBMACBMACBOADdiUsp4x34YAQJgAQJgAQJgA7Kx8U1P5vR+FAECYAECYAECYAECYAEDYaQPgCjJHceZj0QoAwgQAwgRgIzanrGOstyMAECYAECYAECYAB1D8SbP4no9IACBMACBMACBMACBMACBMACBMACDs1AHwWzJ7O/sxaAWwIZtU5jPG2xIACBMACBMACBOAgyhd0Cy916MTAAgTAAgTAAgTAAgTAAgTAAgTAAgTAAg7fQCOdlOJzSrzHG1sr3BD0yXuyDrygXG013Y2Rx7Lt6/trAQAHnSFALgGAGECAGECAGECAGECAGECAGECAGECAGECAGECAGECAGECAGGX2Aw02BDESlfYCDRYAUCYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAECYAEDYZXYDDnYEssJVdgIOVgAQJgAQJgAQdqlrAIPrAMx0pfP/wQoAwgQAwi53CjA4DWCGqy3/BysACLvkCmCwCmBLV/z2Hy67Arh9Xr/fH8JTrnwsXXYFMFgFsIWrfvsPlw7AIAI848qTf7h8AAYR4BFXn/xDIgCDCPAzCpN/yARgEAF+RGXyD6kADCLAt5Qm/5C7EWh8wDd+IuQ/xjExDoz704zcG37LaoChOPE/SQfgEyFoKk/8TwTgM2JwbSb9W+/e/QNz0ydo+FsDyAAAAABJRU5ErkJggg=='
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAA8AAAAPCAYAAAA71pVKAAABLElEQVR42n2TPU4DMRSEP3uDhChDqu2gSoUQXIQLcJacgAOkS8s9UhMJiSJNECVFwk+IQEp2h4LxyrFQnrSat+N5nvXbZyhCUiVppv2YSapKbS8VABdAAM6AS+ABWADnwBVwI+kZEPAYQmiS26hwaiV9S/o0tsX6qHMGro1bcwE49tOdCNgBR0kfJQVgCrwCkcMRrZtKCkhK5x77k7b6PxI/tr4XnURg5d3vgInzW+PEPMDK+r/zhRBaSUsvfgHvzp+M86w/S+ur6EaQFdTA2vmJcW0+1ylv0JuxD3xkHcbv/UJHLAQAg8w5Zs6DQrfnnMhTYON/Xhk35nNd12kkDT1JP5IWkhpJL8aF+VbSsKvLimtJOx2OnaQ6N0VS9G269+5pIJpsQFqvV6nwF7iHVEWZqxXaAAAAAElFTkSuQmCC'
@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAABcAAAAXCAYAAADgKtSgAAACGUlEQVR42p2VzUpcQRCFv75eCS7yY4gQkJBnCOImu6zd+A4hZOMi4JsM7vIA4tNEFLJwG0IYBUWdOxJn7pwscmqo3PlBU9B0V9Wpc6u7q+tCEkkrHrWkummazbZtTyRNPBTrtm1PmqbZDGzE8lCRtG/Ce0ltGve27y+LryWVUopM9g5YA1aAFtgCBPwEvgIVMAE+AW+BLUnvE/6ulPLNXAVJlZUDLZaJs40xWYI9MF9VvHgC/AA2gLEzEVA8Fp5cwrVADVwAb0opv2uDCjD0lqsHkJLiAhdHNgxblYDPO/r/SGUeMvkY2AV6aYthVzqCeTrGF8fvJvvf+va840sZ6XES+J3MV3U+EF9cAa6APeC7bb+AL56xfc+4eDzjmYeUMt9O2fRtO7J+bP3Y+pH1forZnpd5nONNWq9LeurM4sHVLjeAK/vXE8dN5uuSD4A7r1f9WvvWJ6WUscsN29eMw3GDeeQhjes05AVwvqDszu0PGTqebilm8kHSX6bMS2fu20/a9Sx5NK5Sygi4Tf5Xfs7zyC/sD7l1/JQvl2KVLjXkNXAdpL7QIL+2nxyXeP45lhwU8gw4W3ChZ/bTiZv2pHoO+WW68Q/AyPqGpM/unAAf7Y+ueNklzw+p9tx7ZAsIXC/zsKALDtLWJ6kldBvXuIMbzPzm5pCfpo9WaV06+LpTdafLfsZFUiVpVdJh+hkvk8AcOq6SND3zP+dFTx3U2wiYAAAAAElFTkSuQmCC'
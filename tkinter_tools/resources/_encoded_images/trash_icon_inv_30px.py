@@ -0,0 +1,2 @@
+# Embedded data for an image in ./assets/, automatically generated using the image_encoder.py script.
+data = b'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAAC3klEQVR42rWXO2/VQBCFv/G9hEeEIBIIQdIgHhJIdJEoKOjoIxoK/gFNhETLr+BHQE9FS0NNARVCKaAh7+SGPGwfCmajYfD1TXiMtLI9e+ac9ex4dw0TTFIFUNf1Y0mbkmpJTWq1pM26rh/HmD6zJGJAFfwGCJgFPgKnJ/B9B24BX0Isfm3NrDwzjKLe0XS89ayLNsAu8ClBrgGnHDNrZktjslc0fgoXh6QzwAPgrGMHQAvc8VEPgK/Ai5AVAc+AG36/IOm6Z668xBbwxsx2DsUlmbdpSe/0/+yda5gkq4CBv/494C5wANSpxfSX6YhNob/piD9w7nuuNRiGgGlPa+Up7SvIvv6uvsa5p4sjln3tnQ3/3opw/VtVAyfT87+0qaBxKNz6/XvgOXAbeBTS/jdWOF4CH1yDoPnLtzbvVdiEiqzTc/HVydckX4mZzzpxARmm4rAJBdPlq8asjIPCb2Z1BrbuXPEiKEG7wENgMaXpibfoW3TsbhCugRXnbsduBpIuSxqFdO1JOiHpZkrfFW/Rd9OxeyF+JOly3jyGaWEoy9sWcMZ9U8B1YDul83xHir87dspjLfBFjc6q3Qd2wvcHMAOsOnH8Npu0M606NsbuOGd3MZRdw8z2w9uVOblgZiNg1PPpjBxzIcVuOydxW6y65hlYT6kpZJs9wpsJq8iVDwfjyj8LXPLrRo/wRsLmAdlRhL+lUV9Mmeiy9YRV4uoVJlR2tJK+5R7h5YQdx9UrvJxG+SfC1hcznDBfxWYkDfxzGTfoVcfMTODqFV5Loz5nZo2kzwGznWI+O+Zcil07irBSespGMCfpNXA1YF+l2KeSFoC5FLucV62u9Xrg1/sdW+NxrcTej9zj5qmMaiX1Kxxfxi2ZbTr4VYlLR5njbQcq/FkMJuzHVcfpwzpq4XewmbW+tC0Bb9Kh/LiHu8o5liRVZtZO/EnzQ/ecpLc+V+0x5rb1mLfOYV0/cT8Ae4Te0MWO7cAAAAAASUVORK5CYII='
@@ -0,0 +1,217 @@
+# ==================================================================== #
+#  File name:      icons.py                     #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Process wide cache for the   #  |#   #   $      #|  #
+#                  icons embedded in the        #  |#   #   #      #|  #
+#                  resources package. Each icon #   #\  #   #     /#   #
+#                  is only created once per Tk  #    *= #   #    =+    #
+#                  interpreter, size and theme. #     *++######++*     #
+#  Rev:            1.5                          #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Load icons with Tk's PNG support, Pillow as fallback    #
+#  18-Oct-2026 Use the pre-sized variants made by image_encoder.py     #
+#  18-Oct-2026 Read the assets through the lazy asset registry         #
+#  18-Oct-2026 Watch roots through root_watcher.py                     #
+#  18-Oct-2026 Detect the display scale when no scale is given         #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+from tkinter_tools.resources import assets, decode_image
+from tkinter_tools.root_watcher import on_root_destroyed, cancel_on_root_destroyed
+
+# =============== #
+#   Definitions   #
+# =============== #
+DEFAULT_ICON_SIZE = 15
+""" Width and height in pixels of the icons used by the widgets in this package """
+
+_dIconCache = dict()
+""" Created icons, keyed by (asset name, size, theme, Tk root) """
+
+_dDisplayScales = dict()
+""" Display scale factor of each Tk root with icons, it is looked up once (see get_display_scale) """
+
+# =========== #
+#   Methods   #
+# =========== #
+def get_icon(name:str, master, size:int=DEFAULT_ICON_SIZE, theme:str="light", scale:float=None):
+    """
+    Get an icon from the embedded assets, the icon is created once per Tk interpreter and shared afterwards.
+    If the encoder embedded a variant with the requested pixel size, that variant is used as is.
+    Otherwise the original image is scaled, which is noticeably slower.
+    The cached icons of a Tk interpreter are released when its root window is destroyed.
+
+    :param name: Name of the asset without theme suffix, for example "plus_icon"
+    :type name: string
+    :param master: Any widget of the Tk interpreter in which the icon will be used
+    :type master: tkinter widget
+    :param size: Width and height of the icon in pixels, defaults to DEFAULT_ICON_SIZE
+    :type size: integer, optional
+    :param theme: Theme of the icon, "dark" uses the inverted asset, defaults to "light"
+    :type theme: string, optional
+    :param scale: Display scale factor, the icon will be size * scale pixels large. 
+        If None the scale of the display is detected once per Tk interpreter (see get_display_scale), defaults to None
+    :type scale: float, optional
+    :return: The shared icon
+    :rtype: tkinter.PhotoImage or ImageTk.PhotoImage
+    """
+    root = master._root()
+    if scale is None:
+        scale = _dDisplayScales.get(root)
+        if scale is None:
+            scale = _dDisplayScales[root] = get_display_scale(root)
+
+    theme = "dark" if theme == "dark" else "light"
+    pixels = int(size * scale + 0.5) # Same rounding as the image encoder
+    key = (name, pixels, theme, root)
+
+    icon = _dIconCache.get(key)
+    if icon is None:
+        assetName = name + "_inv" if theme == "dark" else name
+
+        # Prefer the pre-sized variant, fall back on scaling the original image
+        data = getattr(assets, f"{assetName}_{pixels}px", None)
+        if data is None:
+            data = getattr(assets, assetName)
+
+        icon = _create_icon(data, root, pixels)
+        on_root_destroyed(root, release_icons)
+        _dIconCache[key] = icon
+
+    return icon
+
+def get_display_scale(master):
+    """
+    Get the scale factor of the display, rounded to the nearest half so it matches the variants embedded by image_encoder.py
+
+    :param master: Any widget of the Tk interpreter
+    :type master: tkinter widget
+    :return: Scale factor, 1 for a standard 96 DPI display
+    :rtype: float
+    """
+    # Tk reports its scaling in pixels per point, which is 96/72 at 96 DPI
+    return max(1, round(float(master.tk.call("tk", "scaling")) * 72 / 96 * 2) / 2)
+
+def release_icons(master=None):
+    """
+    Remove icons from the cache, icons still used by a widget stay valid until that widget drops them
+
+    :param master: Any widget of the Tk interpreter of which the icons need to be released, if None the icons of all interpreters are released, defaults to None
+    :type master: tkinter widget, optional
+    """
+    root = master._root() if master is not None else None
+
+    setRoots = set()
+    for key in [key for key in _dIconCache if root is None or key[3] is root]:
+        _dIconCache.pop(key)
+        setRoots.add(key[3])
+
+    # The roots are no longer watched until they get icons again, the display scale is looked up again as well
+    for releasedRoot in setRoots:
+        cancel_on_root_destroyed(releasedRoot, release_icons)
+        _dDisplayScales.pop(releasedRoot, None)
+
+def _create_icon(data, root, size:int):
+    """
+    Create an icon from base64 encoded PNG data.
+    Tk 8.6 can read PNG data itself and scale it by integer factors, Pillow is only imported when that is not possible.
+
+    :param data: Base64 encoded PNG data
+    :type data: bytes or string
+    :param root: Root of the Tk interpreter in which the icon will be used
+    :type root: tkinter.Tk
+    :param size: Width and height of the icon in pixels
+    :type size: integer
+    :return: The created icon
+    :rtype: tkinter.PhotoImage or ImageTk.PhotoImage
+    """
+    if tk.TkVersion >= 8.6:
+        try:
+            image = tk.PhotoImage(master=root, data=data.decode("ascii") if isinstance(data, bytes) else data)
+        except tk.TclError:
+            image = None
+
+        if image is not None:
+            icon = _scale_photo_image(image, size)
+            if icon is not None:
+                return icon
+
+    return _create_icon_with_pillow(data, root, size)
+
+def _scale_photo_image(image, size:int):
+    """
+    Scale a tkinter PhotoImage to the requested size using Tk's zoom and subsample
+
+    :param image: Image to scale
+    :type image: tkinter.PhotoImage
+    :param size: Width and height of the scaled image in pixels
+    :type size: integer
+    :return: The scaled image, None if the size can not be reached with integer factors
+    :rtype: tkinter.PhotoImage
+    """
+    columnScale = _get_scale_operation(image.width(), size)
+    rowScale = _get_scale_operation(image.height(), size)
+
+    if columnScale is None or rowScale is None:
+        return None
+
+    # Each axis is either zoomed or subsampled, a factor of 1 leaves the axis as is
+    lZoom = [factor if operation == "zoom" else 1 for operation, factor in (columnScale, rowScale)]
+    lSubsample = [factor if operation == "subsample" else 1 for operation, factor in (columnScale, rowScale)]
+
+    if lZoom != [1, 1]:
+        image = image.zoom(*lZoom)
+    if lSubsample != [1, 1]:
+        image = image.subsample(*lSubsample)
+
+    return image
+
+def _get_scale_operation(sourceSize:int, targetSize:int):
+    """
+    Find the integer zoom or subsample factor which changes the source size into the target size.
+    Tk rounds a subsampled size up, so a subsample factor n results in ceil(sourceSize / n) pixels.
+
+    :param sourceSize: Size in pixels of the original image
+    :type sourceSize: integer
+    :param targetSize: Requested size in pixels
+    :type targetSize: integer
+    :return: ("zoom", factor) or ("subsample", factor), None if no integer factor exists
+    :rtype: tuple
+    """
+    if sourceSize <= 0 or targetSize <= 0:
+        return None
+    elif targetSize >= sourceSize:
+        return ("zoom", targetSize // sourceSize) if targetSize % sourceSize == 0 else None
+
+    factor = -(-sourceSize // targetSize)
+    return ("subsample", factor) if -(-sourceSize // factor) == targetSize else None
+
+def _create_icon_with_pillow(data, root, size:int):
+    """
+    Create an icon using Pillow, only used when Tk can not read or scale the PNG data itself
+
+    :param data: Base64 encoded PNG data
+    :type data: bytes or string
+    :param root: Root of the Tk interpreter in which the icon will be used
+    :type root: tkinter.Tk
+    :param size: Width and height of the icon in pixels
+    :type size: integer
+    :return: The created icon
+    :rtype: ImageTk.PhotoImage
+    """
+    # Pillow is imported here, so that it is not loaded when Tk can handle the icons
+    import PIL.Image as Image
+    import PIL.ImageTk as ImageTk
+
+    return ImageTk.PhotoImage(Image.open(decode_image(data)).resize((size, size)), master=root)
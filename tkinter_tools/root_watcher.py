@@ -0,0 +1,92 @@
+# ==================================================================== #
+#  File name:      root_watcher.py              #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Calls cleanup functions when #  |#   #   $      #|  #
+#                  a Tk root is destroyed, all  #  |#   #   #      #|  #
+#                  functions of a root share a  #   #\  #   #     /#   #
+#                  single bindtag of the root.  #    *= #   #    =+    #
+#  Rev:            1.1                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Watch a bindtag of the root instead of a hidden frame   #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+
+# =============== #
+#   Definitions   #
+# =============== #
+WATCHER_TAG = "tkinter_tools_root_watcher"
+""" Bindtag added to each watched root, only the root has it so destroying its children does not trigger it """
+
+_dWatchers = dict()
+""" Binding id and cleanup functions of each watched Tk root, as root: (binding id, list[function]) """
+
+# =========== #
+#   Methods   #
+# =========== #
+def on_root_destroyed(root, callback):
+    """
+    Call a function once a Tk root is destroyed.
+    The root gets a bindtag of its own instead of a binding on the root itself, since the root also receives the destroy event of every child.
+    Destroying all children of the root (to reset a window) therefore does not call the function.
+
+    :param root: Root of the Tk interpreter
+    :type root: tkinter.Tk
+    :param callback: Called with the root as argument, a function which is already registered for the root is not added again
+    :type callback: function
+    """
+    watcher = _dWatchers.get(root)
+    if watcher is None:
+        bindingId = root.bind_class(WATCHER_TAG, "<Destroy>", lambda event, root=root: _call_callbacks(root))
+        root.bindtags(root.bindtags() + (WATCHER_TAG,))
+        watcher = _dWatchers[root] = (bindingId, list())
+
+    if callback not in watcher[1]:
+        watcher[1].append(callback)
+
+def cancel_on_root_destroyed(root, callback):
+    """
+    Stop watching a Tk root for a function, the bindtag is removed from the root once no functions are left
+
+    :param root: Root of the Tk interpreter
+    :type root: tkinter.Tk
+    :param callback: Function which was passed to on_root_destroyed
+    :type callback: function
+    """
+    watcher = _dWatchers.get(root)
+    if watcher is None or callback not in watcher[1]:
+        return
+
+    watcher[1].remove(callback)
+    if len(watcher[1]) == 0:
+        del _dWatchers[root] # Removed first, so a destroy event calls nothing
+        try:
+            root.bindtags(tuple(tag for tag in root.bindtags() if tag != WATCHER_TAG))
+            root.unbind_class(WATCHER_TAG, "<Destroy>")
+            root.deletecommand(watcher[0])
+        except tk.TclError:
+            pass # The interpreter is already gone
+
+def _call_callbacks(root):
+    """
+    Call the functions of a destroyed root, bound to <Destroy> of the bindtag of the root
+
+    :param root: Root of the Tk interpreter
+    :type root: tkinter.Tk
+    """
+    watcher = _dWatchers.pop(root, None)
+    if watcher is not None:
+        for callback in watcher[1]:
+            callback(root)
@@ -0,0 +1,420 @@
+# ==================================================================== #
+#  File name:      tcl_batch.py                 #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Records grid, configure and  #  |#   #   $      #|  #
+#                  destroy operations and runs  #  |#   #   #      #|  #
+#                  them as a single Tcl script, #   #\  #   #     /#   #
+#                  to limit the amount of       #    *= #   #    =+    #
+#                  Python to Tcl calls.         #     *++######++*     #
+#  Rev:            1.6                          #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Collect shown and hidden widgets into two grid commands #
+#  18-Oct-2026 Added batched_destroy for parts of composite widgets    #
+#  18-Oct-2026 Flush destroys on errors, keep subclass destroy methods #
+#  18-Oct-2026 Shared destructor of the parts of composite widgets     #
+#  18-Oct-2026 Added batched_configure for theme and label changes     #
+#  18-Oct-2026 Added batched_configure_text, text read by the script   #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+from types import MethodType
+from tkinter import _stringify # Converts Python values into Tcl words, the same way tkinter does
+
+# =============== #
+#   Definitions   #
+# =============== #
+_dActiveBatches = dict()
+""" Batch which is recording for each Tk interpreter """
+
+_MOVE_BODY = "{set m [winfo manager $w]; grid configure $w -row $r -column $c; if {$m ne \"grid\"} {grid remove $w}}"
+""" Tcl loop body of a move, a widget which was removed with grid remove stays hidden """
+
+#=============#
+#   Classes   #
+#=============#
+class TclBatch:
+    """
+    Records widget operations and runs them as a single Tcl script when the outer "with" block ends (or at flush).
+    Widgets which are shown (grid without options) or hidden (grid remove) one after another are collected,
+    and applied with one "grid" and one "grid remove" command for all of them, so switching modes costs two commands.
+    Consecutive moves and "destroy" commands are merged into one command with multiple widgets.
+    Composite widgets (EntryLabelPair etc.) are not tkinter widgets, their operations are run directly.
+    Recorded operations are not visible to Tk until the batch is flushed, so don't read back grid_info or cget in between.
+    When the "with" block ends with an exception, only the recorded destroys are run, the other operations are dropped.
+    """
+
+    def __init__(self, widget):
+        """
+        Constructor
+
+        :param widget: Any widget of the Tk interpreter which runs the script
+        :type widget: tkinter widget
+        """
+        self.tk = widget.tk
+        """ Tk interpreter which runs the script """
+        self.lCommands = list()
+        """ Recorded commands, each as a list of Tcl words """
+        self._dVisibility = dict()
+        """ Tcl path of each widget shown (True) or hidden (False) since the last other command, the last change of a widget counts """
+        self.lDestroyedWidgets = list()
+        """ Widgets of which the Python side needs to be cleaned up after the script ran """
+        self._depth = 0
+        """ Amount of "with" blocks using this batch, the script runs when the outer most one ends """
+
+    def grid(self, widget, **kwargs):
+        """
+        Grid a widget, the same as widget.grid(**kwargs)
+
+        :param widget: Widget to place
+        :type widget: tkinter, ttk, or composite_widgets widget
+        """
+        if not isinstance(widget, tk.BaseWidget):
+            widget.grid(**kwargs)
+        elif len(kwargs) == 0:
+            self._dVisibility[_stringify(widget._w)] = True
+        else:
+            self._add_command(["grid", "configure", _stringify(widget._w)] + _get_options(kwargs))
+
+    def grid_remove(self, widget):
+        """
+        Unmap a widget but remember its grid options, the same as widget.grid_remove()
+
+        :param widget: Widget to hide
+        :type widget: tkinter, ttk, or composite_widgets widget
+        """
+        if not isinstance(widget, tk.BaseWidget):
+            widget.grid_remove()
+        else:
+            self._dVisibility[_stringify(widget._w)] = False
+
+    def move(self, widget, row:int, column:int):
+        """
+        Change the grid cell of a tkinter widget without changing if it is shown.
+        widget.grid(row=row, column=column) would also show a widget which was hidden with grid_remove.
+
+        :param widget: Widget to move, it needs to have been placed with grid before
+        :type widget: tkinter widget
+        :param row: New row
+        :type row: integer
+        :param column: New column
+        :type column: integer
+        """
+        self._apply_visibility()
+        if len(self.lCommands) > 0 and self.lCommands[-1][0] == "foreach":
+            self.lCommands[-1][2].extend((widget._w, row, column))
+        else:
+            self.lCommands.append(["foreach", "{w r c}", [widget._w, row, column], _MOVE_BODY])
+
+    def configure(self, widget, **kwargs):
+        """
+        Configure a widget, the same as widget.configure(**kwargs).
+        Values are converted to Tcl words, so callbacks are not supported (use widget.configure for those)
+
+        :param widget: Widget to configure
+        :type widget: tkinter, ttk, or composite_widgets widget
+        """
+        if not isinstance(widget, tk.BaseWidget):
+            widget.configure(**kwargs)
+        elif len(kwargs) > 0:
+            self._add_command([_stringify(widget._w), "configure"] + _get_options(kwargs))
+
+    def destroy(self, widget):
+        """
+        Destroy a tkinter widget, the Python side is cleaned up after the script ran (see tools.destroy_widgets)
+
+        :param widget: Widget to destroy
+        :type widget: tkinter widget
+        """
+        self._add_merged(["destroy"], _stringify(widget._w))
+        self.lDestroyedWidgets.append(widget)
+
+    def call(self, *args):
+        """
+        Record any Tcl command, arguments are converted to Tcl words
+
+        :param args: Command and its arguments, the same as for widget.tk.call
+        """
+        self._add_command([_stringify(arg) for arg in args])
+
+    def flush(self):
+        """
+        Run the recorded commands as a single Tcl script, this can also be done before the "with" block ends
+        """
+        self._apply_visibility()
+        if len(self.lCommands) > 0:
+            lCommands, self.lCommands = self.lCommands, list()
+            self.tk.eval("\n".join(" ".join(word if isinstance(word, str) else _stringify(tuple(word)) for word in lWords) for lWords in lCommands))
+
+        lDestroyedWidgets, self.lDestroyedWidgets = self.lDestroyedWidgets, list()
+        for widget in lDestroyedWidgets:
+            _forget_widget(widget)
+
+    def flush_destroys(self):
+        """
+        Run only the recorded destroy commands and drop the other operations, used when the "with" block ends with an exception.
+        The widgets are already gone on the Python side (composite widgets mark themselves destroyed), so their Tk windows need to go as well.
+        """
+        self._dVisibility.clear()
+        lCommands, self.lCommands = self.lCommands, list()
+        lDestroys = [lWords for lWords in lCommands if lWords[0] == "destroy"]
+        if len(lDestroys) > 0:
+            self.tk.eval("\n".join(" ".join(lWords) for lWords in lDestroys))
+
+        lDestroyedWidgets, self.lDestroyedWidgets = self.lDestroyedWidgets, list()
+        for widget in lDestroyedWidgets:
+            _forget_widget(widget)
+
+    def _apply_visibility(self):
+        """
+        Turn the collected shown and hidden widgets into commands, this is done before any other command is recorded to keep the order
+        """
+        if len(self._dVisibility) > 0:
+            lShown = [path for path, shown in self._dVisibility.items() if shown]
+            lHidden = [path for path, shown in self._dVisibility.items() if not shown]
+            self._dVisibility.clear()
+
+            if len(lShown) > 0:
+                self.lCommands.append(["grid", "configure"] + lShown)
+            if len(lHidden) > 0:
+                self.lCommands.append(["grid", "remove"] + lHidden)
+
+    def _add_command(self, lWords:list):
+        """
+        Record a command after the collected shown and hidden widgets
+
+        :param lWords: Tcl words of the command
+        :type lWords: list[string]
+        """
+        self._apply_visibility()
+        self.lCommands.append(lWords)
+
+    def _add_merged(self, lCommand:list, path:str):
+        """
+        Add a widget to the previous command if it is the same command without options, otherwise start a new command
+
+        :param lCommand: Command words without the widget paths
+        :type lCommand: list[string]
+        :param path: Tcl path of the widget, as Tcl word
+        :type path: string
+        """
+        self._apply_visibility()
+        if len(self.lCommands) > 0:
+            lPrevious = self.lCommands[-1]
+            if lPrevious[:len(lCommand)] == lCommand and not any(word.startswith("-") for word in lPrevious[len(lCommand):]):
+                lPrevious.append(path)
+                return
+
+        self.lCommands.append(lCommand + [path])
+
+    def __enter__(self):
+        if self._depth == 0:
+            _dActiveBatches.setdefault(self.tk, self)
+        self._depth += 1
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self._depth -= 1
+        if self._depth == 0:
+            # The interpreter is released first, so a failing script does not leave a batch recording forever
+            if _dActiveBatches.get(self.tk) is self:
+                del _dActiveBatches[self.tk]
+            if excType is None:
+                self.flush()
+            else:
+                try:
+                    self.flush_destroys()
+                except tk.TclError:
+                    pass # The exception of the block is the one to report
+        return False
+
+    def __repr__(self):
+        """
+        Representation of this class when it is printed or viewed in debugger window
+
+        :return: String of how this object should be represented
+        :rtype: string
+        """
+        return f"recorded commands: {len(self.lCommands)}\nshown/hidden widgets: {len(self._dVisibility)}\ndepth: {self._depth}"
+
+# =========== #
+#   Methods   #
+# =========== #
+def batch(widget):
+    """
+    Get a batch for use in a "with" block, nested blocks share the batch of the outer most block.
+    While the block runs, the widgets of this package record their grid operations in the batch.
+    Example: with batch(root) as tclBatch: tclBatch.grid(label, row=1)
+
+    :param widget: Any widget of the Tk interpreter
+    :type widget: tkinter widget
+    :return: The recording batch, or a new one if none is recording
+    :rtype: TclBatch
+    """
+    tclBatch = _dActiveBatches.get(widget.tk)
+    return tclBatch if tclBatch is not None else TclBatch(widget)
+
+def get_active_batch(widget):
+    """
+    Get the batch which is recording for a Tk interpreter
+
+    :param widget: Any widget of the Tk interpreter
+    :type widget: tkinter widget
+    :return: The recording batch, None if no batch is recording
+    :rtype: TclBatch
+    """
+    return _dActiveBatches.get(widget.tk) if len(_dActiveBatches) > 0 else None
+
+def batched_grid(widget, **kwargs):
+    """
+    Grid a widget, recorded in the active batch if there is one
+
+    :param widget: Widget to place
+    :type widget: tkinter widget
+    """
+    tclBatch = get_active_batch(widget)
+    if tclBatch is not None:
+        tclBatch.grid(widget, **kwargs)
+    else:
+        tk.Grid.grid_configure(widget, **kwargs)
+
+def batched_grid_remove(widget):
+    """
+    Unmap a widget but remember its grid options, recorded in the active batch if there is one
+
+    :param widget: Widget to hide
+    :type widget: tkinter widget
+    """
+    tclBatch = get_active_batch(widget)
+    if tclBatch is not None:
+        tclBatch.grid_remove(widget)
+    else:
+        tk.Grid.grid_remove(widget)
+
+def batched_configure(widget, **kwargs):
+    """
+    Configure a widget, recorded in the active batch if there is one.
+    Values are converted to Tcl words, so callbacks are not supported
+
+    :param widget: Widget to configure
+    :type widget: tkinter widget
+    """
+    tclBatch = get_active_batch(widget)
+    if tclBatch is not None:
+        tclBatch.configure(widget, **kwargs)
+    else:
+        tk.Misc.configure(widget, **kwargs)
+
+def batched_configure_text(widget, lSources:list):
+    """
+    Set the text of a widget to the joined text of entries and tkinter variables, recorded in the active batch if there is one.
+    In a batch the text is read by the script itself, so switching a label to the text of its entry costs no Tcl call per widget
+
+    :param widget: Widget of which the text option is set, for example a label
+    :type widget: tkinter widget
+    :param lSources: Entries (read with get) and tkinter variables, in the order in which their text is joined
+    :type lSources: list[tkinter entry or tkinter.Variable]
+    """
+    tclBatch = get_active_batch(widget)
+    if tclBatch is None:
+        tk.Misc.configure(widget, text="".join(source.get() for source in lSources))
+        return
+
+    # Command substitutions, Tcl joins their results into a single word
+    lScripts = [f"[set {_stringify(str(source))}]" if isinstance(source, tk.Variable) else f"[{_stringify(source._w)} get]" for source in lSources]
+    tclBatch._add_command([_stringify(widget._w), "configure", "-text", "".join(lScripts) if len(lScripts) > 0 else "{}"])
+
+def get_batched_callback(callback):
+    """
+    Get a version of a mode callback which records in the active batch.
+    The bound grid and grid_remove methods of tkinter widgets are replaced by batched_grid and batched_grid_remove bound to the same widget,
+    so they can still be referenced weakly. Other callbacks are returned unchanged.
+
+    :param callback: Callback, for example label.grid_remove
+    :type callback: function
+    :return: The batched callback
+    :rtype: function
+    """
+    function = getattr(callback, "__func__", None)
+    if function is tk.Grid.grid_configure:
+        return MethodType(batched_grid, callback.__self__)
+    if function is tk.Grid.grid_remove:
+        return MethodType(batched_grid_remove, callback.__self__)
+    return callback
+
+def batched_destroy(widget):
+    """
+    Destroy a widget, recorded in the active batch if there is one
+
+    :param widget: Widget to destroy
+    :type widget: tkinter widget
+    """
+    tclBatch = get_active_batch(widget)
+    if tclBatch is not None:
+        tclBatch.destroy(widget)
+    else:
+        widget.destroy()
+
+def batched_destroy_parts(owner, lParts:list):
+    """
+    Destroy the tkinter parts of a composite widget, recorded in the active batch if there is one.
+    Used by the destructors of composite widgets, the parts are only destroyed by the first call.
+
+    :param owner: Composite widget, its _destroyed attribute is set once the parts are destroyed
+    :type owner: composite_widgets widget
+    :param lParts: Tkinter widgets of the composite widget (see get_tk_widgets)
+    :type lParts: list[tkinter widget]
+    """
+    # Only once, the destructor is called again when the object is collected
+    if not owner._destroyed:
+        owner._destroyed = True
+        for widget in lParts:
+            batched_destroy(widget)
+
+def _get_options(dOptions:dict):
+    """
+    Convert keyword arguments into Tcl options, a trailing underscore is removed like tkinter does (in_ becomes -in)
+
+    :param dOptions: Keyword arguments
+    :type dOptions: dict
+    :return: Tcl words
+    :rtype: list[string]
+    """
+    lWords = list()
+    for key, value in dOptions.items():
+        if value is not None:
+            lWords.append("-" + (key[:-1] if key.endswith("_") else key))
+            lWords.append(_stringify(value))
+    return lWords
+
+def _forget_widget(widget):
+    """
+    Do the Python side of destroy() for a widget of which the Tk window is already destroyed:
+    remove it from its parent and free the Tcl commands of it and its children.
+    Widgets of which the class overrides destroy (OptionMenu, LabeledScale etc.) are destroyed through it, so they clean up their own parts,
+    Tk ignores the destroy of a window which no longer exists.
+
+    :param widget: Destroyed widget
+    :type widget: tkinter widget
+    """
+    if type(widget).destroy is not tk.BaseWidget.destroy:
+        widget.destroy()
+        return
+
+    for child in list(widget.children.values()):
+        _forget_widget(child)
+
+    if widget.master is not None and widget.master.children.get(widget._name) is widget:
+        del widget.master.children[widget._name]
+
+    tk.Misc.destroy(widget) # Only deletes the Tcl commands, the Tk window is not touched
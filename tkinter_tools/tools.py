@@ -7,7 +7,7 @@
 #                  functionality for using      #  |#   #   #      #|  #
 #                  tkinter widgets and weird    #   #\  #   #     /#   #
 #                  widgets.                     #    *= #   #    =+    #
-#  Rev:            2.0                          #     *++######++*     #
+#  Rev:            2.4                          #     *++######++*     #
 #                                               #        *-==-*        #
 # ==================================================================== #
 #  Revision history:                                                   #
@@ -15,6 +15,10 @@
 #  22-Feb-2023 File created                                            #
 #  28-Feb-2023 Several methods added                                   #
 #  11-May-2023 Cleaned code and added comments                         #
+#  18-Oct-2026 Destroy many widgets with a single Tcl call             #
+#  18-Oct-2026 destroy_widgets is recorded in an active Tcl batch      #
+#  18-Oct-2026 Composite widgets list their own tkinter parts          #
+#  18-Oct-2026 Remove a single binding of an event                     #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
@@ -26,6 +30,7 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter_tools.composite_widgets import EntryLabelPair, Button, ValueUnitPair, SelectionLabelPair
+from tkinter_tools.tcl_batch import get_active_batch, _forget_widget
 
 # =============== #
 #   Definitions   #
@@ -118,4 +123,62 @@ def is_widget_this_list(widget, *lThis):
             return True
 
     # Non were found so return false
-    return False
\ No newline at end of file
+    return False
+
+def get_tk_widgets(widget):
+    """
+    Get the tkinter widgets which make up a widget, composite widgets (EntryLabelPair etc.) list their parts with their own get_tk_widgets method
+
+    :param widget: Widget to split up
+    :type widget: tkinter, ttk, or weird_widget widget
+    :return: The tkinter widgets placed in the parent of the widget, destroying these destroys the whole widget.
+        Empty for an object which is not a tkinter widget and has no get_tk_widgets method
+    :rtype: list[tkinter widget]
+    """
+    if isinstance(widget, tk.BaseWidget):
+        return [widget]
+
+    getTkWidgets = getattr(widget, "get_tk_widgets", None)
+    return getTkWidgets() if getTkWidgets is not None else []
+
+def destroy_widgets(lWidgets:list):
+    """
+    Destroy many tkinter widgets with a single Tcl destroy call.
+    Calling destroy() on each widget costs a Tcl call per widget and per child, which is slow for thousands of widgets.
+
+    :param lWidgets: The tkinter widgets to destroy, all from the same Tk interpreter (see get_tk_widgets for composite widgets)
+    :type lWidgets: list[tkinter widget]
+    """
+    if len(lWidgets) == 0:
+        return
+
+    # Inside a batch the widgets may still have recorded operations, so the destroy has to be recorded after them
+    tclBatch = get_active_batch(lWidgets[0])
+    if tclBatch is not None:
+        for widget in lWidgets:
+            tclBatch.destroy(widget)
+        return
+
+    lWidgets[0].tk.call("destroy", *[widget._w for widget in lWidgets])
+
+    for widget in lWidgets:
+        _forget_widget(widget)
+
+def remove_binding(widget, sequence:str, funcId:str):
+    """
+    Remove a single function which was bound with add="+" from an event, the other bindings of the event are kept.
+    widget.unbind(sequence, funcId) clears all bindings of the event in tkinter of Python 3.12 and older.
+
+    :param widget: Widget of which the event is bound
+    :type widget: tkinter widget
+    :param sequence: Event sequence, like "<MouseWheel>"
+    :type sequence: string
+    :param funcId: Binding id returned by widget.bind
+    :type funcId: string
+    """
+    # The command is deleted first, so it is also gone when the widget is already destroyed
+    widget.deletecommand(funcId)
+
+    # Each function bound by tkinter is a single line of the script of the event
+    lLines = [line for line in widget.bind(sequence).split("\n") if line != "" and funcId not in line]
+    widget.bind(sequence, "\n".join(lLines))
@@ -1,3 +1,4 @@
 from tkinter_tools.widget_lists.widget_list import WidgetList
 from tkinter_tools.widget_lists.list_entry import ListEntry
-from tkinter_tools.widget_lists.widget_matrix import WidgetMatrix
\ No newline at end of file
+from tkinter_tools.widget_lists.widget_matrix import WidgetMatrix
+from tkinter_tools.widget_lists.virtual_widget_list import VirtualWidgetList
\ No newline at end of file
@@ -7,7 +7,7 @@
 #                  which is used by the         #  |#   #   #      #|  #
 #                  WidgetList to control full   #   #\  #   #     /#   #
 #                  row of widget.               #    *= #   #    =+    #
-#  Rev:            5.0                          #     *++######++*     #
+#  Rev:            5.7                          #     *++######++*     #
 #                                               #        *-==-*        #
 # ==================================================================== #
 #  Revision history:                                                   #
@@ -19,6 +19,19 @@
 #  03-Feb-2023 Removed excess methods                                  #
 #  06-Feb-2023 Bug fixes for complete overhaul                         #
 #  08-May-2023 Cleaned up code and added comments                      #
+#  18-Oct-2026 Use the shared icon cache for the deletion button       #
+#  18-Oct-2026 Share profiler names between the callback sets of rows  #
+#  18-Oct-2026 Reference widget callbacks weakly                       #
+#  18-Oct-2026 Destroy the widgets of entries in a single Tcl call     #
+#  18-Oct-2026 Deletion callbacks look up the row index when called    #
+#  18-Oct-2026 Track widget positions and move widgets in one Tcl call #
+#  18-Oct-2026 Record widget moves in a Tcl batch                      #
+#  18-Oct-2026 Record the grid calls of mode switches in a Tcl batch   #
+#  18-Oct-2026 Hand the widgets of removed entries to a widget pool    #
+#  18-Oct-2026 Only reference the batched grid callbacks weakly        #
+#  18-Oct-2026 Composite widgets are destroyed by their own destructor #
+#  18-Oct-2026 RowIndex resolves to the model row of pooled entries    #
+#  18-Oct-2026 The deletion callback is referenced strongly again      #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
@@ -27,17 +40,58 @@
 # =========== #
 #   Imports   #
 # =========== #
-import os
-import PIL.Image as Image
-import PIL.ImageTk as ImageTk
-from tkinter_tools.fancy_callbacks import  CallbackSet
-from tkinter_tools.resources import decode_image, assets
-from tkinter_tools.tools import is_widget_this, WIDGET_TKT_BUTTON, set_widget_position, is_widget_this_list, WIDGET_ENTRY_LABEL, WIDGET_VALUE_UNIT, WIDGET_SELECTION_LABEL, Button
+from weakref import ref
+from tkinter_tools.fancy_callbacks import  CallbackSet, LazyArgument
+from tkinter_tools.resources import get_icon
+from tkinter_tools.tcl_batch import batch, get_batched_callback
+from tkinter_tools.tools import is_widget_this, WIDGET_TKT_BUTTON, is_widget_this_list, WIDGET_ENTRY_LABEL, WIDGET_VALUE_UNIT, WIDGET_SELECTION_LABEL, Button, get_tk_widgets, destroy_widgets
 
 
 # =========== #
 #   Classes   #
 # =========== #
+class RowIndex(LazyArgument):
+    """
+    Callback argument which is the current row index of a ListEntry (plus an offset) at the moment the callback is run.
+    Moving the entry therefore does not require the callback to be updated.
+    For a pooled entry of a VirtualWidgetList the index of the data model row it shows is used instead.
+    Use it instead of a plain row index in callbacks of the widgets of an entry, the WidgetList does not update those when entries move.
+    """
+
+    def __init__(self, entry, offset:int=0):
+        """
+        Constructor
+
+        :param entry: Entry of which the row index is used, it is referenced weakly
+        :type entry: ListEntry
+        :param offset: Added to the row index, defaults to 0
+        :type offset: integer, optional
+        """
+        self._entry = ref(entry)
+        self.offset = offset
+        """ Added to the row index """
+
+    def resolve(self):
+        """
+        Get the current row index of the entry plus the offset
+
+        :return: Row index (model row index of a pooled entry), None if the entry no longer exists
+        :rtype: integer
+        """
+        entry = self._entry()
+        if entry is None:
+            return None
+        return (entry.modelIndex if entry.modelIndex is not None else entry.rowIndex) + self.offset
+
+    def __repr__(self):
+        """
+        Representation of this class when it is printed or viewed in debugger window
+
+        :return: String of how this object should be represented
+        :rtype: string
+        """
+        return f"RowIndex({self.resolve()})"
+
 class ListEntry:
     """
     Entry to be placed in a widget list
@@ -67,31 +121,28 @@ class ListEntry:
         """Parent Frame where the entry is located"""
         self.rowIndex = rowIndex
         """Row location of the entry in the parent frame"""
+        self.modelIndex = None
+        """Index of the data model row shown by a pooled entry of a VirtualWidgetList (first row in view + slot), None for other entries"""
         self.editMode=editMode
         """Boolean defining if this object is in edit (True) or view mode (False)"""
         self.colorMode = colorMode
         """Color mode of this entry"""
         self.lWidgets = list()
-        """List of widget objects placed in the entry (From tkinter, tkk, or composite_widgets)"""
-        self.editCallbacks = CallbackSet()
-        """Callbacks which are called when entering edit mode (uses tkinter_tools.CallbackSet class)"""
-        self.viewCallbacks = CallbackSet()
-        """Callbacks which are called when entering view mode (uses tkinter_tools.CallbackSet class)"""
+        """List of widget objects placed in the entry (From tkinter, tkk, or composite_widgets), the index of a widget is its column"""
+        self.editCallbacks = CallbackSet("ListEntry.editCallbacks")
+        """Callbacks which are called when entering edit mode (uses tkinter_tools.CallbackSet class), the profiler reports the sets of all entries together"""
+        self.viewCallbacks = CallbackSet("ListEntry.viewCallbacks")
+        """Callbacks which are called when entering view mode (uses tkinter_tools.CallbackSet class), the profiler reports the sets of all entries together"""
         self.lVariables = list()
         """Used for all variable or data related to widgets in the entry (tkinter.StringVar for example)"""
         self.rowOffset = rowOffset
-        """Offset applied to the rows to shift the whole list to which this entry belongs"""
+        """Offset applied to the rows to shift the whole list to which this entry belongs, the widgets are placed in row rowIndex + rowOffset"""
 
     def __del__(self):
         """
         __del__ Destructor for the ListEntry class, deletes all widgets and variable related to this entry
         """
-        for widget in reversed(self.lWidgets):
-            self.remove_widget(self.lWidgets.index(widget))
-
-        # Remove all variables
-        for variable in reversed(self.lVariables):
-            self.lVariables.remove(variable)
+        destroy_entries([self])
 
     def add_widget( self, widget, editKey:str=None, editCallback=None, viewKey:str=None, viewCallback=None, rowOffset:int=0):
         """
@@ -121,12 +172,12 @@ class ListEntry:
             column=len(self.lWidgets) - 1, row=self.rowIndex + self.rowOffset
         )
 
-        # Attach callbacks
+        # Attach callbacks, grid callbacks of tkinter widgets are recorded in a Tcl batch, so a whole list switches mode with a few Tcl commands
         if editKey is not None and editCallback is not None:
-            self.editCallbacks.add_callback(editKey, editCallback)
+            _add_mode_callback(self.editCallbacks, editKey, editCallback)
 
         if viewKey is not None and viewCallback is not None:
-            self.viewCallbacks.add_callback(viewKey, viewCallback)
+            _add_mode_callback(self.viewCallbacks, viewKey, viewCallback)
 
         # Return widget for further setup
         return self.lWidgets[-1]
@@ -158,20 +209,18 @@ class ListEntry:
 
         self.rowOffset = rowOffset
 
-        # Place widget at the index of the entry
+        # Place widget at the index of the entry, all widgets to the right of the new widget move one column over
         self.lWidgets.insert(index, widget)
-        self.lWidgets[index].grid(column=index, row=self.rowIndex + rowOffset)
-        
-        # Move all widgets to the right of the new widget one column over
-        for widget in self.lWidgets[index + 1:]:
-            set_widget_position(widget, widget, 1, 0)
+        with batch(self.root) as tclBatch:
+            tclBatch.grid(widget, row=self.rowIndex + self.rowOffset, column=index)
+            self._place_widgets(index + 1)
 
-        # Add callback keys
+        # Add callback keys, grid callbacks are batched
         if editKey is not None and editCallback is not None:
-            self.editCallbacks.add_callback(editKey, editCallback)
+            _add_mode_callback(self.editCallbacks, editKey, editCallback)
 
         if viewKey is not None and viewCallback is not None:
-            self.viewCallbacks.add_callback(viewKey, viewCallback)
+            _add_mode_callback(self.viewCallbacks, viewKey, viewCallback)
 
         # Return the new Widget
         return self.lWidgets[index]
@@ -195,8 +244,24 @@ class ListEntry:
         self.lWidgets.pop(index)
 
         # Update location for following widgets
-        for widget in self.lWidgets[index:]:
-            set_widget_position(widget, widget, -1, 0)
+        self._place_widgets(index)
+
+    def _place_widgets(self, startIndex:int=0):
+        """
+        _place_widgets Move the widgets from startIndex onward to their own column and the row of the entry.
+        The positions follow from lWidgets, rowIndex and rowOffset, so nothing needs to be read back from Tk.
+        The moves are recorded in a Tcl batch, widgets hidden with grid_remove stay hidden.
+
+        :param startIndex: Index of the first widget to place, defaults to 0
+        :type startIndex: integer, optional
+        """
+        row = self.rowIndex + self.rowOffset
+
+        with batch(self.root) as tclBatch:
+            for column in range(startIndex, len(self.lWidgets)):
+                # Composite widgets are moved through their parts, since their own grid method would show all parts
+                for tkWidget in get_tk_widgets(self.lWidgets[column]):
+                    tclBatch.move(tkWidget, row, column)
 
     def replace_widget(self, index, newWidget, editKey:str=None, editCallback=None, viewKey:str=None, viewCallback=None):
         """
@@ -228,14 +293,16 @@ class ListEntry:
         Set this object to edit mode, to allow changing the user input fields
         """    
         self.editMode = True
-        self.editCallbacks.call_callbacks()
+        with batch(self.root):
+            self.editCallbacks.call_callbacks()
 
     def set_view_mode(self):
         """
         Set this object to view mode, to prevent changing the user input fields
         """    
         self.editMode = False
-        self.viewCallbacks.call_callbacks()
+        with batch(self.root):
+            self.viewCallbacks.call_callbacks()
 
     def set_theme(self, mode:str="light"):
         """set_theme Set color mode of this object
@@ -262,17 +329,16 @@ class ListEntry:
         """ 
         remove_widget Add a deletion button at the far most right of the entry
 
-        :param deleteCallback: Callback of a method which deletes this entry "removeEntry0"
+        :param deleteCallback: Callback of a method which deletes this entry "removeEntry0", it is called with the current row index of this entry
         :type deleteCallback: method
         :param visibleInViewMode: Show the delete button in view mode instead of edit mode, defaults to False
         :type visibleInViewMode: boolean, optional
         :return: Newly created deletion button
         :rtype: weird_widget.Button
         """
-        # Configure deletion button
-        baseDir =  os.path.abspath('./assets') + "\\"
-        self.minus_icon_light=ImageTk.PhotoImage(Image.open(decode_image(assets.minus_icon)).resize((15, 15)), master=self.root)
-        self.minus_icon_dark=ImageTk.PhotoImage(Image.open(decode_image(assets.minus_icon_inv)).resize((15, 15)), master=self.root)
+        # Configure deletion button, the icons are shared between all entries of the same Tk interpreter
+        self.minus_icon_light=get_icon("minus_icon", self.root)
+        self.minus_icon_dark=get_icon("minus_icon", self.root, theme="dark")
 
         deletionButton = Button(
             parent=self.root, 
@@ -289,11 +355,11 @@ class ListEntry:
             sticky= "news"
             )
         
-        # Attach callback
+        # Attach callback, the row index is looked up when the button is clicked, so the callback stays valid when the entry moves
         deletionButton.add_callback(
             callbackKey="removeEntry0",
             callback=deleteCallback,
-            argument=self.rowIndex
+            argument=RowIndex(self)
         )
 
         # Append button to the entry
@@ -315,18 +381,18 @@ class ListEntry:
         :param baseRow: new base row off with which the new row index needs to be offset, if left as None it will keep the current base row, defaults to None
         :type baseRow: integer, optional
         """
-        if baseRow is None:  # Get the current base row if the base row is left as None
-            baseRow = self.lWidgets[0].grid_info()["column"] - self.rowIndex
+        if baseRow is not None:
+            self.rowOffset = baseRow
 
         self.rowIndex = newIndex
 
-        # Update the row value of each widget on this entry
-        newRow = self.rowIndex + baseRow
-        for widget in self.lWidgets:
-            widget.grid(row=newRow)
+        # The moves and mode callbacks run as a single Tcl script, or as part of the batch of the caller
+        with batch(self.root):
+            # Update the row value of each widget on this entry
+            self._place_widgets()
 
-        # Correct widgets which were shown due to the result of calling grid
-        self.reset_mode()
+            # Hide the widgets of a new entry which don't belong to the current mode
+            self.reset_mode()
 
         
     def __repr__(self): 
@@ -337,4 +403,65 @@ class ListEntry:
         :rtype: string
         """   
         
-        return f"root: {self.root}\nrowOffset: {self.rowOffset}\nrowIndex: {self.rowIndex}\nlWidgets: {self.lWidgets}"
\ No newline at end of file
+        return f"root: {self.root}\nrowOffset: {self.rowOffset}\nrowIndex: {self.rowIndex}\nlWidgets: {self.lWidgets}"
+
+# =========== #
+#   Methods   #
+# =========== #
+def destroy_entries(lEntries:list):
+    """
+    destroy_entries Destroy all widgets of the entries with a single Tcl script and clear their widgets and variables.
+    Composite widgets are destroyed through their own destructor, which records its destroys in the same script.
+    The remaining widgets are not moved, since the entries are removed as a whole.
+
+    :param lEntries: Entries to clear, all from the same Tk interpreter
+    :type lEntries: list[ListEntry]
+    """
+    if len(lEntries) == 0:
+        return
+
+    with batch(lEntries[0].root):
+        lTkWidgets = list()
+        for entry in lEntries:
+            for widget in entry.lWidgets:
+                if is_widget_this_list(widget, WIDGET_SELECTION_LABEL, WIDGET_ENTRY_LABEL, WIDGET_VALUE_UNIT):
+                    widget.__del__()
+                else:
+                    lTkWidgets += get_tk_widgets(widget)
+
+        destroy_widgets(lTkWidgets)
+
+    for entry in lEntries:
+        entry.lWidgets.clear()
+        entry.lVariables.clear()
+
+def release_entries(lEntries:list, pool):
+    """
+    release_entries Hide all widgets of the entries and hand them to a pool for reuse, instead of destroying them.
+    The entries are cleared the same as by destroy_entries.
+
+    :param lEntries: Entries to clear, all with the same parent as the pool
+    :type lEntries: list[ListEntry]
+    :param pool: Pool which keeps the widgets, widgets which can't be pooled (like the deletion button) are destroyed
+    :type pool: WidgetPool
+    """
+    pool.release_widgets([widget for entry in lEntries for widget in entry.lWidgets])
+
+    for entry in lEntries:
+        entry.lWidgets.clear()
+        entry.lVariables.clear()
+
+def _add_mode_callback(callbackSet:CallbackSet, key:str, callback):
+    """
+    Add an edit or view mode callback to a set, grid and grid_remove of tkinter widgets are replaced by their batched versions.
+    Only the batched versions are referenced weakly, so a widget which is destroyed is dropped from the set, user callbacks are kept alive.
+
+    :param callbackSet: editCallbacks or viewCallbacks of an entry
+    :type callbackSet: CallbackSet
+    :param key: Key of the callback
+    :type key: string
+    :param callback: The callback
+    :type callback: function
+    """
+    batchedCallback = get_batched_callback(callback)
+    callbackSet.add_callback(key, batchedCallback, weak=batchedCallback is not callback)
\ No newline at end of file
@@ -0,0 +1,454 @@
+# ==================================================================== #
+#  File name:      virtual_widget_list.py       #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Defines the VirtualWidgetList#  |#   #   $      #|  #
+#                  class, a list of rows of     #  |#   #   #      #|  #
+#                  which only the visible rows  #   #\  #   #     /#   #
+#                  have widgets.                #    *= #   #    =+    #
+#  Rev:            1.4                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Show, hide and switch the mode of rows in a Tcl batch   #
+#  18-Oct-2026 Model row RowIndex and a destructor like the WidgetList #
+#  18-Oct-2026 Keep other wheel bindings, scroll_to refreshes directly #
+#  18-Oct-2026 Rows in view follow the height of the list, plus buffer #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+from math import ceil
+from tkinter import ttk
+from .list_entry import ListEntry, destroy_entries
+from tkinter_tools.rate_limiter import RateLimiter
+from tkinter_tools.tcl_batch import batch, batched_destroy
+from tkinter_tools.tools import get_tk_widgets, remove_binding
+
+# =============== #
+#   Definitions   #
+# =============== #
+WHEEL_ROWS = 3
+""" Amount of rows scrolled per step of the mouse wheel """
+_tWheelSequences = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+""" Mouse wheel events of Windows and Linux (up and down) """
+
+# =========== #
+#   Classes   #
+# =========== #
+class VirtualWidgetList:
+    """
+    A list of rows which come from a data model, only the rows in view have widgets.
+    A pool of ListEntry objects is filled once by the row factory,
+    scrolling binds these entries to other rows of the model using the row binder.
+    The pool holds the rows in view plus a few hidden buffer rows, the amount of rows in view follows the height of the list when it is resized.
+    The amount of widgets therefore does not depend on the amount of rows, so large data sets can be browsed.
+    Edit/view mode and theme are handled by the pooled entries, the same as in a WidgetList.
+    """
+
+    def __init__(self, parent, rowFactory, rowBinder, rowCount:int=0, visibleRows:int=20, bufferRows:int=2, editMode:bool=False, lTitles:list[str]=None, **kwargs):
+        """Constructor
+
+        :param parent: Parent frame in which the list will be placed
+        :type parent: tkinter.Frame
+        :param rowFactory: Called once with each pooled ListEntry, adds the widgets of a row (use ListEntry.add_widget)
+        :type rowFactory: function
+        :param rowBinder: Called with a pooled ListEntry and the index of a row in the data model, shows that row in the widgets
+        :type rowBinder: function
+        :param rowCount: Amount of rows in the data model, defaults to 0
+        :type rowCount: integer, optional
+        :param visibleRows: Amount of rows in view until the list is mapped, afterwards it follows the height of the list.
+            Give the list a height through its grid options (sticky "ns" and a weight for its row in the parent) to let the rows follow the window, defaults to 20
+        :type visibleRows: integer, optional
+        :param bufferRows: Amount of hidden entries kept next to the rows in view, so the view can grow without running the row factory, defaults to 2
+        :type bufferRows: integer, optional
+        :param editMode: If the rows need to be in edit mode, defaults to False
+        :type editMode: boolean, optional
+        :param lTitles: Titles placed above the rows, defaults to None
+        :type lTitles: list[string], optional
+        :param kwargs: Grid options of the list in the parent frame
+        """
+        self.rowFactory = rowFactory
+        """ Adds the widgets of a row to a new pooled entry """
+        self.rowBinder = rowBinder
+        """ Shows a row of the data model in a pooled entry """
+        self.rowCount = rowCount
+        """ Amount of rows in the data model """
+        self.visibleRows = max(1, visibleRows)
+        """ Amount of rows in view, the pool holds bufferRows entries more """
+        self.bufferRows = bufferRows
+        """ Amount of hidden entries kept next to the rows in view """
+        self.firstRow = 0
+        """ Index in the data model of the top row in view """
+        self.editMode = editMode
+        """Boolean defining if this object is in edit (True) or view mode (False)"""
+        self.mode = "light"
+        """ Theme mode for this list """
+        self._destroyed = False
+        """ If destroy already ran, the destructor calls it again when the object is collected """
+        self._lBindings = list()
+        """ Scroll bindings made by bind_widget, as (widget, list[binding id]), removed when the list is destroyed """
+
+        self.uberRoot = ttk.Frame(parent)
+        """ Outer most frame, holds the rows and the scrollbar """
+        self.uberRoot.grid(**kwargs)
+
+        self.frame = ttk.Frame(self.uberRoot)
+        """ Frame in which the rows are placed """
+        self.frame.grid(column=0, row=0, sticky="news")
+
+        self.scrollBar = ttk.Scrollbar(self.uberRoot, orient="vertical", command=self._on_scroll_bar)
+        """ Scrollbar, which scrolls through the rows of the data model instead of through widgets """
+        self.scrollBar.grid(column=1, row=0, sticky="ns")
+        self._scrollBarShown = True
+        """ If the scrollbar is gridded, it is only changed when this changes """
+
+        self.titleEntry = None
+        """ Entry holding the titles, None if the list has no titles """
+        if lTitles is not None:
+            self.titleEntry = ListEntry(self.frame, 0, colorMode=self.mode)
+            for title in lTitles:
+                self.titleEntry.add_widget(ttk.Label(self.frame, text=str(title))).grid(padx=2.5, pady=2.5, sticky="news")
+
+        self.lEntries = list()
+        """ Pool of entries which are bound to the rows in view, followed by the hidden buffer entries """
+        self._lShown = list()
+        """ If the pooled entry at the same index is shown, entries below the last row and buffer entries are hidden """
+        self._rowHeight = 0
+        """ Height of a row in pixels, measured when the list is resized, 0 until a row has been measured """
+
+        self._add_entries(self.visibleRows + self.bufferRows)
+
+        self._bind_scroll(self.frame)
+        self.uberRoot.bind("<Configure>", self._on_configure)
+
+        self._refreshLimiter = RateLimiter(self.refresh, self.frame, 0)
+        """ Combines all scroll events before Tk becomes idle into a single refresh """
+
+        self.refresh()
+
+    def _add_entries(self, count:int):
+        """
+        _add_entries Add entries to the pool, filled by the row factory, they are shown or hidden at the next refresh
+
+        :param count: Amount of entries to add
+        :type count: integer
+        """
+        titleRows = 1 if self.titleEntry is not None else 0
+        for slot in range(len(self.lEntries), len(self.lEntries) + count):
+            entry = ListEntry(self.frame, slot, editMode=self.editMode, rowOffset=titleRows, colorMode=self.mode)
+            self.rowFactory(entry)
+
+            # The factory does not need to know about the titles, the entry is moved below them afterwards
+            entry.set_row_index(slot, titleRows)
+
+            for widget in entry.lWidgets:
+                for tkWidget in get_tk_widgets(widget):
+                    self._bind_scroll(tkWidget)
+
+            self.lEntries.append(entry)
+            self._lShown.append(True)
+
+    def set_visible_rows(self, visibleRows:int):
+        """
+        set_visible_rows Change the amount of rows in view, this is done automatically when the list is resized.
+        The pool grows to the rows in view plus bufferRows, entries beyond twice that buffer are destroyed.
+
+        :param visibleRows: Amount of rows in view, at least 1
+        :type visibleRows: integer
+        """
+        visibleRows = max(1, visibleRows)
+        if visibleRows == self.visibleRows:
+            return
+        self.visibleRows = visibleRows
+
+        if len(self.lEntries) < visibleRows:
+            self._add_entries(visibleRows + self.bufferRows - len(self.lEntries))
+        elif len(self.lEntries) > visibleRows + 2 * self.bufferRows:
+            # Shrinking a little keeps the entries, so resizing back and forth does not run the row factory
+            keep = visibleRows + self.bufferRows
+            with batch(self.frame):
+                destroy_entries(self.lEntries[keep:])
+            del self.lEntries[keep:]
+            del self._lShown[keep:]
+
+        self.scroll_to(self.firstRow)
+
+    def _on_configure(self, event):
+        """
+        _on_configure Fit the amount of rows in view to the new height of the list, a row which is partly in view counts as well
+
+        :param event: Tkinter configure event of the outer frame
+        :type event: Event
+        """
+        titleRows = 1 if self.titleEntry is not None else 0
+        bbox = self.frame.grid_bbox(0, titleRows)
+        if bbox is None:
+            return
+
+        # A hidden first row has no height, the last measured height is used
+        top, height = bbox[1], bbox[3]
+        if height > 1:
+            self._rowHeight = height
+        if self._rowHeight > 0:
+            self.set_visible_rows(ceil((event.height - top) / self._rowHeight))
+
+    def bind_widget(self, widget):
+        """
+        Make the list scroll when the mouse wheel is used while hovering over the provided widget
+
+        :param widget: Widget over which the mouse hover allows scrolling
+        :type widget: tkinter widget
+        """
+        self._lBindings.append((widget, self._bind_scroll(widget)))
+
+    def _bind_scroll(self, widget):
+        """
+        _bind_scroll Bind the mouse wheel events of a widget to scrolling, next to the bindings the widget already has.
+        The widgets of the list itself lose their bindings when they are destroyed
+
+        :param widget: Widget over which the mouse hover allows scrolling
+        :type widget: tkinter widget
+        :return: Binding ids, in the order of _tWheelSequences
+        :rtype: list[string]
+        """
+        return [widget.bind(sequence, self._on_mouse_wheel, add="+") for sequence in _tWheelSequences]
+
+    def destroy(self):
+        """
+        destroy Destroy the list with a single Tcl script: the pooled entries, the titles and the frames.
+        The scroll bindings made by bind_widget are removed, so other widgets don't keep the list alive.
+        """
+        if self._destroyed:
+            return
+        self._destroyed = True
+        self._refreshLimiter.cancel()
+
+        for widget, lBindingIds in self._lBindings:
+            for sequence, bindingId in zip(_tWheelSequences, lBindingIds):
+                try:
+                    remove_binding(widget, sequence, bindingId)
+                except tk.TclError:
+                    pass # The widget is already destroyed
+        self._lBindings.clear()
+
+        lEntries = self.lEntries + ([self.titleEntry] if self.titleEntry is not None else [])
+        with batch(self.frame):
+            destroy_entries(lEntries)
+            batched_destroy(self.uberRoot)
+
+        self.lEntries.clear()
+        self._lShown.clear()
+        self.titleEntry = None
+
+    def __del__(self):
+        """Destructor"""
+        try:
+            self.destroy()
+        except:
+            pass
+
+    def set_row_count(self, rowCount:int):
+        """
+        set_row_count Change the amount of rows in the data model, the rows in view are bound again
+
+        :param rowCount: Amount of rows in the data model
+        :type rowCount: integer
+        """
+        self.rowCount = rowCount
+        self.scroll_to(self.firstRow)
+
+    def scroll_to(self, index:int):
+        """
+        scroll_to Place a row of the data model at the top of the view, as far as the amount of rows allows.
+        The rows are bound right away, so get_entry returns the entries of the new rows
+
+        :param index: Index of the row in the data model
+        :type index: integer
+        """
+        self._set_first_row(index)
+        self.refresh()
+
+    def scroll(self, rows:int):
+        """
+        scroll Move the view through the data model
+
+        :param rows: Amount of rows to move, negative moves up
+        :type rows: integer
+        """
+        self.scroll_to(self.firstRow + rows)
+
+    def _set_first_row(self, index:int):
+        """
+        _set_first_row Change the top row in view without binding the entries, as far as the amount of rows allows
+
+        :param index: Index of the row in the data model
+        :type index: integer
+        """
+        self.firstRow = max(0, min(index, self.rowCount - self.visibleRows))
+
+    def refresh(self):
+        """
+        refresh Bind the pooled entries to the rows in view, use this after rows in the data model have changed
+        """
+        self._refreshLimiter.cancel()
+
+        # Rows which are shown or hidden are changed with a single Tcl script
+        with batch(self.frame):
+            for slot, entry in enumerate(self.lEntries):
+                index = self.firstRow + slot
+                if slot < self.visibleRows and index < self.rowCount:
+                    if not self._lShown[slot]:
+                        self._show_entry(slot)
+                    entry.modelIndex = index # RowIndex arguments of the widgets resolve to the model row
+                    self.rowBinder(entry, index)
+                else:
+                    entry.modelIndex = None
+                    if self._lShown[slot]:
+                        self._hide_entry(slot)
+
+        # The scrollbar is only shown when not all rows fit in view, it is only gridded when that changes
+        showScrollBar = self.rowCount > self.visibleRows
+        if showScrollBar:
+            self.scrollBar.set(self.firstRow / self.rowCount, (self.firstRow + self.visibleRows) / self.rowCount)
+        if showScrollBar != self._scrollBarShown:
+            if showScrollBar:
+                self.scrollBar.grid()
+            else:
+                self.scrollBar.grid_remove()
+            self._scrollBarShown = showScrollBar
+
+    def get_entry(self, index:int):
+        """
+        get_entry Get the entry which currently shows a row of the data model
+
+        :param index: Index of the row in the data model
+        :type index: integer
+        :return: The entry, None if the row is not in view
+        :rtype: ListEntry
+        """
+        # A refresh requested by a scroll event is made first, so the entry is bound to the row
+        self._refreshLimiter.flush()
+
+        slot = index - self.firstRow
+        if 0 <= slot < self.visibleRows and index < self.rowCount:
+            return self.lEntries[slot]
+        return None
+
+    def set_edit_mode(self):
+        """
+        Set this object to edit mode, to allow changing the user input fields
+        """
+        self.editMode = True
+        with batch(self.frame):
+            for slot, entry in enumerate(self.lEntries):
+                if self._lShown[slot]:
+                    entry.set_edit_mode()
+                else:
+                    entry.editMode = True # Applied when the entry is shown again
+
+    def set_view_mode(self):
+        """
+        Set this object to view mode, to prevent changing the user input fields
+        """
+        self.editMode = False
+        with batch(self.frame):
+            for slot, entry in enumerate(self.lEntries):
+                if self._lShown[slot]:
+                    entry.set_view_mode()
+                else:
+                    entry.editMode = False # Applied when the entry is shown again
+
+    def set_theme(self, mode:str="light"):
+        """set_theme Set color mode of this object
+
+        :param mode: Name of mode, "dark" and "light" are supported, defaults to "light"
+        :type mode: string, optional
+        """
+        self.mode = "dark" if mode == "dark" else "light"
+        for entry in self.lEntries:
+            entry.set_theme(self.mode)
+
+        if self.titleEntry is not None:
+            self.titleEntry.set_theme(self.mode)
+
+    def _show_entry(self, slot:int):
+        """
+        _show_entry Show the widgets of a pooled entry again, in its current mode
+
+        :param slot: Index of the entry in the pool
+        :type slot: integer
+        """
+        entry = self.lEntries[slot]
+        with batch(self.frame) as tclBatch:
+            for widget in entry.lWidgets:
+                tclBatch.grid(widget)
+            entry.reset_mode() # Hides the widgets which don't belong to the current mode
+        self._lShown[slot] = True
+
+    def _hide_entry(self, slot:int):
+        """
+        _hide_entry Hide the widgets of a pooled entry, used for entries below the last row of the data model
+
+        :param slot: Index of the entry in the pool
+        :type slot: integer
+        """
+        with batch(self.frame) as tclBatch:
+            for widget in self.lEntries[slot].lWidgets:
+                tclBatch.grid_remove(widget)
+        self._lShown[slot] = False
+
+    def _on_scroll_bar(self, *args):
+        """
+        _on_scroll_bar Handle the commands of the scrollbar: ("moveto", fraction) or ("scroll", amount, "units"/"pages")
+        """
+        if args[0] == "moveto":
+            self._set_first_row(int(float(args[1]) * self.rowCount + 0.5))
+        elif args[0] == "scroll":
+            self._set_first_row(self.firstRow + int(args[1]) * (self.visibleRows if args[2] == "pages" else 1))
+
+        # Dragging the scrollbar gives many commands before Tk becomes idle, they result in a single refresh
+        self._refreshLimiter.request()
+
+    def _on_mouse_wheel(self, event):
+        """
+        _on_mouse_wheel Scroll the list with the mouse wheel
+
+        :param event: Tkinter mouse wheel or button event
+        :type event: Event
+        """
+        if event.num == 4 or event.delta > 0:
+            self._set_first_row(self.firstRow - WHEEL_ROWS)
+        else:
+            self._set_first_row(self.firstRow + WHEEL_ROWS)
+        self._refreshLimiter.request()
+
+    def grid_info(self, **kwargs):
+        """Return information about the options
+        for positioning this widget in a grid"""
+        return self.uberRoot.grid_info(**kwargs)
+
+    def grid(self, **kwargs):
+        """Position the list in the parent widget in a grid, uses the same options as tkinter's grid"""
+        return self.uberRoot.grid(**kwargs)
+
+    def grid_remove(self, **kwargs):
+        """Unmap this widget but remember the grid options"""
+        return self.uberRoot.grid_remove(**kwargs)
+
+    def __repr__(self):
+        """
+        Representation of this class when it is printed or viewed in debugger window
+
+        :return: String of how this object should be represented
+        :rtype: string
+        """
+        return f"rowCount: {self.rowCount}\nfirstRow: {self.firstRow}\nvisibleRows: {self.visibleRows}\npooled entries: {len(self.lEntries)}\nedit mode: {self.editMode}"
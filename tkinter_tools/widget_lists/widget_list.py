@@ -7,7 +7,7 @@
 #                  used to implement lists of   #  |#   #   #      #|  #
 #                  row entries which have the   #   #\  #   #     /#   #
 #                  same functionality.          #    *= #   #    =+    #
-#  Rev:            4.0                          #     *++######++*     #
+#  Rev:            4.6                          #     *++######++*     #
 #                                               #        *-==-*        #
 # ==================================================================== #
 #  Revision history:                                                   #
@@ -18,6 +18,18 @@
 #  03-Mar-2023 Complete overhaul                                       #
 #  06-Mar-2023 Bug fixes for complete overhaul                         #
 #  10-May-2023 Cleaned and commented code                              #
+#  18-Oct-2026 Use the shared icon cache for the add button            #
+#  18-Oct-2026 Check callback keys without building a list of keys     #
+#  18-Oct-2026 The add button references the list weakly               #
+#  18-Oct-2026 Insert blocks of entries with a single reindex          #
+#  18-Oct-2026 Remove blocks of entries with a single reindex          #
+#  18-Oct-2026 Row index callback arguments are resolved when called   #
+#  18-Oct-2026 Reindex and switch modes with a single Tcl script       #
+#  18-Oct-2026 Optional widget pool for the widgets of removed rows    #
+#  18-Oct-2026 Removed update_callbacks, RowIndex arguments stay valid #
+#  18-Oct-2026 The add button references the list strongly again       #
+#  18-Oct-2026 Restored update_callbacks for plain row index arguments #
+#  18-Oct-2026 Only the callbacks of new entries are converted         #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
@@ -26,15 +38,19 @@
 # =========== #
 #   Imports   #
 # =========== #
-import os
 from tkinter import ttk
-import PIL.Image as Image
-import PIL.ImageTk as ImageTk
-from .list_entry import ListEntry
+from .list_entry import ListEntry, RowIndex, destroy_entries, release_entries
 from tkinter_tools.composite_widgets import Button
-from tkinter_tools.resources import decode_image, assets
+from tkinter_tools.resources import get_icon
+from tkinter_tools.tcl_batch import batch
 from tkinter_tools.tools import is_widget_this, WIDGET_TKT_BUTTON
 
+# =============== #
+#   Definitions   #
+# =============== #
+_tRemoveEntryKeys = tuple("removeEntry" + str(i) for i in range(25))
+""" Keys of the deletion callbacks, the number is the offset to the row index of the entry """
+
 # =========== #
 #   Classes   #
 # =========== #
@@ -44,7 +60,7 @@ class WidgetList:
     The list uses the ListEntry class to add, remove and edit separate rows.
     """
 
-    def __init__(self, parent, editMode:bool=False, lTitles:list[str]=None):
+    def __init__(self, parent, editMode:bool=False, lTitles:list[str]=None, pool=None):
         """Constructor
 
         :param parent: parent Frame in which the entry will be placed
@@ -53,6 +69,9 @@ class WidgetList:
         :type editMode: boolean, optional
         :param lTitles: List of titles to add to the WidgetList, if it is in the form of: list[list[strings]], each listed list will be added on a new row, defaults to None
         :type lTitles: list[strign], optional
+        :param pool: Pool which keeps the widgets of removed rows for reuse, its parent needs to be the parent of the list.
+            Row factories get their widgets from it with pool.acquire. If None the widgets are destroyed, defaults to None
+        :type pool: WidgetPool, optional
         """
 
         self.root = parent
@@ -65,10 +84,12 @@ class WidgetList:
         """ Starting row index offset """
         self.mode = "light"
         """ Theme mode for this list, used when new entries are added """
+        self.pool = pool
+        """ Pool which keeps the widgets of removed rows for reuse, None if they are destroyed """
 
-        baseDir =  os.path.abspath('./assets') + "\\"
-        add_icon_light=ImageTk.PhotoImage(Image.open(decode_image(assets.plus_icon)).resize((15, 15)), master=self.root)
-        add_icon_dark=ImageTk.PhotoImage(Image.open(decode_image(assets.plus_icon_inv)).resize((15, 15)), master=self.root)
+        # Icons are shared between all lists of the same Tk interpreter
+        add_icon_light=get_icon("plus_icon", self.root)
+        add_icon_dark=get_icon("plus_icon", self.root, theme="dark")
         
         # Add the add button at the bottom of the list
         self.addButton = Button(
@@ -143,14 +164,12 @@ class WidgetList:
         # Save value for future use
         self.baseRowIndex = newRowOffset
 
-        # Update each entry
-        for entry in self.lEntries:
-            entry.set_row_index(entry.rowIndex, newRowOffset)
-            
-        self.addButton.grid(row=len(self.lEntries) + self.baseRowIndex, column=0)
+        # Update each entry, all widgets are moved with a single Tcl script
+        with batch(self.root):
+            for entry in self.lEntries:
+                entry.set_row_index(entry.rowIndex, newRowOffset)
 
-        # Callbacks need to be updated since a changed rowIndex could break some callbacks
-        self.update_callbacks()
+            self.addButton.grid(row=len(self.lEntries) + self.baseRowIndex, column=0)
 
     def add_titles(self, lTitles:list[str], index:int=0):
         """add_titles Add titles to the WidgetList.
@@ -195,26 +214,51 @@ class WidgetList:
         :rtype: ListEntry
         """
 
+        return self.add_entries(1, index)[0]
+
+    def add_entries(self, entries, index:int=None):
+        """
+        add_entries Add a block of entries at the specified index, the following entries are only reindexed once.
+        Use this instead of repeated add_empty_entry calls when filling a list, since each of those calls reindexes all following entries.
+        If index is left as None, the entries will be placed at the end of the list
+
+        :param entries: Amount of empty entries, or a list of row factories which are called with a new entry to fill it with widgets
+        :type entries: integer or list[function]
+        :param index: Row location of the first new entry, defaults to None
+        :type index: integer, optional
+        :return: The entries which were created in this method
+        :rtype: list[ListEntry]
+        """
         # Check if the provided position is valid
         if index is None or index >= len(self.lEntries):
             index = len(self.lEntries)
 
-        # Add the entry
-        self.lEntries.insert(
-            index,
-            ListEntry(
+        lFactories = [None] * entries if isinstance(entries, int) else list(entries)
+
+        # Create the entries at their final row, so the widgets added by the factories are placed correctly right away
+        lNewEntries = list()
+        for offset, factory in enumerate(lFactories):
+            entry = ListEntry(
                 parent=self.root,
-                rowIndex=len(self.lEntries),
+                rowIndex=index + offset,
                 rowOffset=self.baseRowIndex,
                 editMode=self.editMode,
                 colorMode=self.mode
-            ),
-        )
+            )
+            if factory is not None:
+                factory(entry)
+            lNewEntries.append(entry)
+
+        # Insert the whole block at once
+        self.lEntries[index:index] = lNewEntries
 
         # Update any following entries and the add button
         self.update_indices(index)
 
-        return self.lEntries[index]
+        # Callbacks added by the factories with a plain row index are converted once, moves don't touch them afterwards
+        self.update_callbacks(index, index + len(lNewEntries))
+
+        return lNewEntries
 
     def remove_entry(self, index:int=-1):
         """
@@ -224,7 +268,10 @@ class WidgetList:
         :type index: integer, optional
         """
 
-        self.lEntries[index].__del__()
+        if self.pool is not None:
+            release_entries([self.lEntries[index]], self.pool)
+        else:
+            self.lEntries[index].__del__()
         self.lEntries.pop(index)
 
         # Reorder the remaining entries
@@ -233,6 +280,7 @@ class WidgetList:
     def remove_entries(self, startIndex:int=0, stopIndex:int=None):
         """
         remove_entries Remove multiple entries by defining the first and last entry index.
+        The widgets of all entries are destroyed at once and the remaining entries are reindexed once.
 
         :param startIndex: Index of the first entry which needs to be deleted, defaults to 0
         :type startIndex: integer, optional
@@ -244,11 +292,16 @@ class WidgetList:
             if stopIndex is None:
                 stopIndex = len(self.lEntries)
 
-            for entry in reversed(self.lEntries[startIndex:stopIndex]):
-                self.lEntries.remove(entry)
-                entry.__del__()
+            lRemovedEntries = self.lEntries[startIndex:stopIndex]
+            del self.lEntries[startIndex:stopIndex]
 
-            self.update_indices(startIndex)
+            # The destroy (or release to the pool) and the reindex run as a single Tcl script
+            with batch(self.root):
+                if self.pool is not None:
+                    release_entries(lRemovedEntries, self.pool)
+                else:
+                    destroy_entries(lRemovedEntries)
+                self.update_indices(startIndex)
 
     def update_indices(self, startIndex:int=0):
         """
@@ -257,18 +310,17 @@ class WidgetList:
         :param startIndex: Starting index from which the entries will be updated, defaults to 0
         :type startIndex: integer, optional
         """        
-        for index in range(startIndex, len(self.lEntries)):
-            self.lEntries[index].set_row_index(index, self.baseRowIndex)
+        # All entries are moved with a single Tcl script, instead of a call per widget
+        with batch(self.root):
+            for index in range(startIndex, len(self.lEntries)):
+                self.lEntries[index].set_row_index(index, self.baseRowIndex)
 
-        # Update the location of the add button
-        self.addButton.grid(row=len(self.lEntries) + self.baseRowIndex)
+            # Update the location of the add button
+            self.addButton.grid(row=len(self.lEntries) + self.baseRowIndex)
 
-        # Update callbacks which use the row index as argument
-        self.update_callbacks(startIndex)
-
-        # Hide add button if not in edit mode
-        if not self.editMode:
-            self.addButton.grid_remove()
+            # Hide add button if not in edit mode
+            if not self.editMode:
+                self.addButton.grid_remove()
 
     def set_edit_mode(self):
         """
@@ -277,11 +329,13 @@ class WidgetList:
 
         self.editMode = True
 
-        for entry in self.lEntries:
-            entry.set_edit_mode()
+        # Grid operations of the mode callbacks are recorded and run as a single Tcl script
+        with batch(self.root):
+            for entry in self.lEntries:
+                entry.set_edit_mode()
 
-        # Show add button
-        self.addButton.grid()
+            # Show add button
+            self.addButton.grid()
 
     def set_view_mode(self):
         """
@@ -289,20 +343,28 @@ class WidgetList:
         """    
         self.editMode = False
 
-        for entry in self.lEntries:
-            entry.set_view_mode()
+        # Grid operations of the mode callbacks are recorded and run as a single Tcl script
+        with batch(self.root):
+            for entry in self.lEntries:
+                entry.set_view_mode()
 
-        # Hide the add button
-        self.addButton.grid_remove()
+            # Hide the add button
+            self.addButton.grid_remove()
 
-    def update_callbacks(self, startIndex:int=0):
+    def update_callbacks(self, startIndex:int=0, stopIndex:int=None):
         """
-        update_callbacks Update callback arguments which are related to the row index of an entry
+        update_callbacks Make callback arguments which are related to the row index of an entry look up that index when called.
+        Callbacks added with a plain row index are converted to a RowIndex argument once, 
+        after which moving the entry no longer requires the callbacks to be changed.
+        add_entries does this for the callbacks added by its row factories, 
+        call it for callbacks which are added with a plain row index after the entry was added (or use RowIndex for those).
 
         :param startIndex: Index of the first entry to update, defaults to 0
         :type startIndex: integer, optional
+        :param stopIndex: Index after the last entry to update, if None all entries from startIndex onward are updated, defaults to None
+        :type stopIndex: integer, optional
         """        
-        for entry in self.lEntries[startIndex:]:
+        for entry in self.lEntries[startIndex:stopIndex]:
             if (
                 len(entry.lWidgets) > 0
                 and is_widget_this(entry.lWidgets[-1], WIDGET_TKT_BUTTON)
@@ -311,20 +373,18 @@ class WidgetList:
                 # Retreive the callback dictionary from the entry
                 callbackSet = entry.lWidgets[-1].dCallbackSets["default"]
                                 
-                # Update remove entry callback which point to entries below the current one
+                # Remove entry callbacks which point to entries below the current one
                 # This is used in for the setup and hold and period width parameters in the parameter window
-                i = 0
-                while i < 25:
-                    key = "removeEntry" + str(i)
-                    if key in callbackSet.get_keys():
-                        callbackSet.update_callback_argument(key,  entry.rowIndex + i)
-                        i += 1
-                    else: break
+                for offset, key in enumerate(_tRemoveEntryKeys):
+                    if key not in callbackSet:
+                        break
+                    if not isinstance(callbackSet.dCallbacks[key].argument, RowIndex):
+                        callbackSet.update_callback_argument(key, RowIndex(entry, offset))
                     
-                # Update the remove list callback
+                # The remove list callback
                 # Used where a seperate list is placed inside the entry, could be made redundant if the lVariables is used by such an entry
-                if "removeListEntry" in callbackSet.get_keys():
-                    callbackSet.update_callback_argument("removeListEntry", entry.rowIndex)
+                if "removeListEntry" in callbackSet and not isinstance(callbackSet.dCallbacks["removeListEntry"].argument, RowIndex):
+                    callbackSet.update_callback_argument("removeListEntry", RowIndex(entry))
                     
     def __repr__(self): 
         """
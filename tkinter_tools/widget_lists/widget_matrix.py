@@ -8,7 +8,7 @@
 #                  automatically place widgets  #   #\  #   #     /#   #
 #                  in a matrix of predefined    #    *= #   #    =+    #
 #                  width.                       #     *++######++*     #
-#  Rev:            3.0                          #        *-==-*        #
+#  Rev:            4.9                          #        *-==-*        #
 # ==================================================================== #
 #  Revision history:                                                   #
 #  Date        Description                                             #
@@ -18,6 +18,18 @@
 #  14-Mar-2023 Added comments                                          #
 #  11-May-2023 Cleaned up code and added comments                      #
 #  10-May-2023 Cleaned and commented code                              #
+#  18-Oct-2026 Use the shared icon cache for the add button            #
+#  18-Oct-2026 Place all widgets with a single Tcl script              #
+#  18-Oct-2026 Flat sorted cells, only moved cells are placed again    #
+#  18-Oct-2026 Derive all positions from the index of the cells        #
+#  18-Oct-2026 Look up values in a dictionary, cache the sorted values #
+#  18-Oct-2026 Clone from cached template options, add widgets in bulk #
+#  18-Oct-2026 Optional widget pool for removed widgets                #
+#  18-Oct-2026 get_values returns a list again                         #
+#  18-Oct-2026 Reconfiguring the template refreshes its cached options #
+#  18-Oct-2026 Cached sorted values through get_values_view            #
+#  18-Oct-2026 No configure wrapper, assigning widgetType refreshes    #
+#  18-Oct-2026 Tcl trace refreshes the template, reset pooled widgets  #
 # ==================================================================== #
 #  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
 #                                                                      #
@@ -26,19 +38,30 @@
 # =========== #
 #   Imports   #
 # =========== #
-import os
-import PIL.Image as Image
-import PIL.ImageTk as ImageTk
-from tkinter_tools.resources import decode_image, assets
+import tkinter as tk
+from bisect import bisect_left, bisect_right
+from functools import partial
+from weakref import ref
+from tkinter_tools.resources import get_icon
+from tkinter_tools.tcl_batch import batch
 from tkinter_tools.tools import Button, is_widget_this_list, WIDGET_ENTRY_LABEL, WIDGET_SELECTION_LABEL,WIDGET_VALUE_UNIT
 
+# =============== #
+#   Definitions   #
+# =============== #
+_tCreationOptions = ("class", "colormap", "container", "screen", "use", "visual")
+""" Options which Tk only accepts when a widget is created, they are left out when a reused widget is reset """
+
 # =========== #
 #   Classes   #
 # =========== #
 class WidgetMatrix:
-    """ A class for a matrix of widgets of the same type"""
+    """ A class for a matrix of widgets of the same type.
+        The cells are kept in a flat list sorted by value, the index of a cell defines its row and column.
+        Adding, removing or changing a value inserts the cell with bisect and only places the cells which moved.
+    """
 
-    def __init__(self, parent, widgetType, maxColumns:int=-1, editMode:bool=False):
+    def __init__(self, parent, widgetType, maxColumns:int=-1, editMode:bool=False, pool=None):
         """Constructor
 
         :param parent: Parent frame to place matrix in
@@ -49,12 +72,16 @@ class WidgetMatrix:
         :type maxColumns: integer, optional
         :param editMode: Editing state, defaults to False
         :type editMode: boolean, optional
+        :param pool: Pool which keeps removed widgets for reuse, its parent needs to be the parent of the matrix, if None removed widgets are destroyed, defaults to None
+        :type pool: WidgetPool, optional
         """
         self.root = parent
         """ Matrix parent frame where all widgets are placed in"""
 
+        self._watchedTemplate = None
+        """ Template widget and the Tcl command of its trace as (widget, command), None while no template is traced """
+
         self.widgetType = widgetType
-        """ All elements will have be a clone of this widget. """
 
         self.maxColumns = maxColumns
         """ Maximum amount of columns in the matrix, before a new row is added. """
@@ -62,11 +89,25 @@ class WidgetMatrix:
         self.currentRow = 0
         """ What the current row is (internally used). """
 
-        self.lllWidgets = list()
-        """ Matrix of all widgets, coupled with a value for sorting. [row][column][value, widget] """
+        self.llCells = list()
+        """ All cells sorted by value, as [value, widget] """
+
+        self.lValues = list()
+        """ Values of llCells in the same order, used to find cells with bisect """
+
+        self.dCells = dict()
+        """ First cell of each value, as value: [value, widget] """
+
+        self._tSortedValues = None
+        """ Values returned by get_values_view, None when the cells changed since the last call """
 
-        self.add_icon_light=ImageTk.PhotoImage(Image.open(decode_image(assets.plus_icon)).resize((15, 15)), master=self.root)
-        self.add_icon_dark=ImageTk.PhotoImage(Image.open(decode_image(assets.plus_icon_inv)).resize((15, 15)), master=self.root)
+        self._templateConfig = None
+        """ Options of widgetType as (non-default options, all options), taken at the first clone, None when the options need to be read again """
+        self.pool = pool
+        """ Pool which keeps removed widgets for reuse, None if they are destroyed """
+
+        self.add_icon_light=get_icon("plus_icon", self.root)
+        self.add_icon_dark=get_icon("plus_icon", self.root, theme="dark")
 
         self.addButton = Button(
             self.root, self.add_icon_light, self.add_icon_dark, image=self.add_icon_light, highlightthickness=0, bd=0
@@ -94,18 +135,20 @@ class WidgetMatrix:
 
     def __del__(self):
         """ Destructor """
-        for row in self.lllWidgets:
-            for widget in row:
-                # Delete each widget from frame
-                if is_widget_this_list(widget, WIDGET_ENTRY_LABEL, WIDGET_SELECTION_LABEL,  WIDGET_VALUE_UNIT):
-                    widget[1].__del__()
-                else:
-                    widget[1].destroy()
-
-                # Clear the widget value set
-                widget.clear()
-            row.clear()
-        self.lllWidgets.clear()
+        for cell in self.llCells:
+            # Delete each widget from frame
+            if is_widget_this_list(cell[1], WIDGET_ENTRY_LABEL, WIDGET_SELECTION_LABEL,  WIDGET_VALUE_UNIT):
+                cell[1].__del__()
+            else:
+                cell[1].destroy()
+
+            # Clear the widget value set
+            cell.clear()
+        self.llCells.clear()
+        self.lValues.clear()
+        self.dCells.clear()
+        self._tSortedValues = None
+        self._unwatch_template()
 
         # Finally destroy the delete button
         self.addButton.destroy()
@@ -123,20 +166,31 @@ class WidgetMatrix:
 
         self.addButton.set_theme(mode)
 
+    @property
+    def widgetType(self):
+        """ All elements will be a clone of this widget, reconfiguring it or assigning another widget drops the cached options of the template """
+        return self._widgetType
+
+    @widgetType.setter
+    def widgetType(self, widget):
+        if self._watchedTemplate is not None and self._watchedTemplate[0] is not widget:
+            self._unwatch_template()
+        self._widgetType = widget
+        self._templateConfig = None
+
+    @property
+    def lllWidgets(self):
+        """ Matrix of all widgets, coupled with a value for sorting. [row][column][value, widget], built from llCells """
+        return self.create_matrix(self.llCells)
+
     def explode_widget_list(self):
         """explode_widget_list Convert the widget matrix into a one dimensional list holding (value, widget)
 
         :return: List of widgets and value pairs (value, widget)
         :rtype: list[[any, Widget]]
         """
-
-        # Place all widgets into a list
-        llBufferList = list()
-        for llRow in self.lllWidgets:
-            llBufferList += llRow
-
-        # Pass the list on
-        return llBufferList
+        # The cells are already kept as a one dimensional list
+        return list(self.llCells)
 
     def set_value(self, oldValue:str, newValue:str):
         """
@@ -147,41 +201,29 @@ class WidgetMatrix:
         :param newValue: Value to replace the old value with
         :type newValue: string
         """        
-        # Convert the list for sorting
-        oneDimensionalList = self.explode_widget_list()
-
-        # Delete the widget of the selected value
-        for entry in oneDimensionalList:
-            if oldValue == entry[0]:
-                entry[0] = newValue
-                entry[1].configure(text=newValue)
-                newValue = -1
-
-        # Sort the list order based on the value element (index=0)
-        oneDimensionalList.sort(key=lambda index: index[0])
-
-        # Recreate the matrix
-        self.lllWidgets = self.create_matrix(oneDimensionalList)
-
-        # Place all widgets into the correct spot
-        self.set_all_positions()
-        self.set_add_button_position()
+        oldIndex = self._find_cell(oldValue)
+        if oldIndex is None:
+            return
+
+        # Move the cell to the sorted position of its new value
+        cell = self._remove_cell(oldIndex)
+        cell[0] = newValue
+        cell[1].configure(text=newValue)
+        newIndex = self._insert_cell(cell)
+
+        # Only the cells between the old and new position have moved
+        self._place_cells(min(oldIndex, newIndex), max(oldIndex, newIndex) + 1)
         
     def clear_all(self):
         """
         clear_all Clear all widgets from the matrix
         """
-        # Convert the list for sorting
-        oneDimensionalList = self.explode_widget_list()
+        self.llCells.clear()
+        self.lValues.clear()
+        self.dCells.clear()
+        self._tSortedValues = None
 
-        # Delete the widget of the selected value
-        oneDimensionalList.clear()
-
-        # Recreate the matrix
-        self.lllWidgets = self.create_matrix(oneDimensionalList)
-
-        # Place all widgets into the correct spot
-        self.set_all_positions()
+        # Place the add button at the start
         self.set_add_button_position()
         
     def add_widget(self, value:int=None):
@@ -190,28 +232,89 @@ class WidgetMatrix:
         :param value: Value of the new widget, defaults to None
         :type value: integer, optional
         """
-        # Convert the list for sorting
-        llOneDimensionalList = self.explode_widget_list()
+        return self.add_widgets([value])[0]
 
-        # Clone the widget configuration
-        llOneDimensionalList.append([value if value is not None else len(
-            llOneDimensionalList), clone_widget(self.widgetType, self.root)])
+    def add_widgets(self, lValues:list):
+        """
+        add_widgets Add a new widget for each value, the widgets are placed with a single Tcl script.
+        Use this instead of repeated add_widget calls when filling a matrix.
 
-        newWidget = llOneDimensionalList[-1]
+        :param lValues: Values of the new widgets, a value of None is replaced by the amount of widgets
+        :type lValues: list
+        :return: The new cells, as [value, widget]
+        :rtype: list[list]
+        """
+        # The options of the template are read once, not for every clone
+        dConfig = self.get_template_config()
+        dResetConfig = self._templateConfig[1]
 
-        llOneDimensionalList[-1][1].configure(text=str(value if value is not None else len(llOneDimensionalList)+1))
+        llNewWidgets = list()
+        firstIndex = len(self.llCells)
+        for value in lValues:
+            # Clone the widget configuration
+            newWidget = [value if value is not None else len(self.llCells), self._create_widget(dConfig, dResetConfig)]
 
-        # Sort the list order based on the value element (index=0)
-        llOneDimensionalList.sort(key=lambda index: index[0])
+            # Insert the cell at its sorted position
+            firstIndex = min(firstIndex, self._insert_cell(newWidget))
 
-        # Recreate the matrix
-        self.lllWidgets = self.create_matrix(llOneDimensionalList)
+            newWidget[1].configure(text=str(value if value is not None else len(self.llCells)+1))
+            llNewWidgets.append(newWidget)
 
-        # Place all widgets into the correct spot
-        self.set_all_positions()
-        self.set_add_button_position()
+        # Only the new widgets and the widgets after the first of them have moved
+        self._place_cells(firstIndex)
         
-        return newWidget
+        return llNewWidgets
+
+    def get_template_config(self):
+        """
+        get_template_config Get the non-default options of widgetType, which are copied into every new widget.
+        The options are read from Tk once, and again after widgetType is reconfigured, replaced by another widget or refresh_template is called.
+
+        :return: Options as keyword arguments for the constructor
+        :rtype: dict
+        """
+        if self._templateConfig is None:
+            self._watch_template()
+            self._templateConfig = _get_widget_configs(self.widgetType)
+        return self._templateConfig[0]
+
+    def refresh_template(self):
+        """
+        refresh_template Read the options of widgetType again at the next clone.
+        Reconfiguring a tkinter or ttk widgetType is noticed by a Tcl trace, this is only needed for composite widgets, which have no Tcl command of their own.
+        """
+        self._templateConfig = None
+
+    def _watch_template(self):
+        """
+        _watch_template Trace the Tcl command of widgetType, so a configure call which changes options drops the cached options.
+        The trace runs in Tcl, so configure, config, item assignment and Tcl scripts are all noticed without changing the widget in Python.
+        Each matrix has its own trace, which is removed when the template is replaced or the matrix is destroyed.
+        """
+        template = self.widgetType
+        if not isinstance(template, tk.Misc) or (self._watchedTemplate is not None and self._watchedTemplate[0] is template):
+            return
+
+        # The command holds the matrix weakly, the template does not keep the matrix alive
+        command = template.register(partial(_template_traced, ref(self)))
+        template.tk.call("trace", "add", "execution", template._w, "leave", command)
+        self._watchedTemplate = (template, command)
+
+    def _unwatch_template(self):
+        """
+        _unwatch_template Remove the trace of the template widget, if there is one
+        """
+        if self._watchedTemplate is None:
+            return
+
+        template, command = self._watchedTemplate
+        self._watchedTemplate = None
+        try:
+            template.tk.call("trace", "remove", "execution", template._w, "leave", command)
+        except tk.TclError:
+            return # The template was destroyed, which removed its trace and command
+
+        template.deletecommand(command)
     
     def get_widget(self, value):
         """
@@ -222,12 +325,8 @@ class WidgetMatrix:
         :return: Widget which has the requested value, if none are found None will be returned
         :rtype: Widget
         """        
-        widgetList = self.explode_widget_list()
-        for widgetValue, widget in widgetList:
-            if widgetValue == value:
-                return widget
-            
-        return None
+        cell = self.dCells.get(value)
+        return cell[1] if cell is not None else None
     
     def remove_widget(self, value):
         """remove_widget Remove a widget from the matrix
@@ -235,24 +334,126 @@ class WidgetMatrix:
         :param value: Value of the widget to remove
         :type value: string
         """
-        # Convert the list for sorting
-        oneDimensionalList = self.explode_widget_list()
+        index = self._find_cell(value)
+        if index is None:
+            return
+
+        # Delete the widgets of the selected value
+        lRemovedWidgets = list()
+        while index < len(self.lValues) and self.lValues[index] == value:
+            lRemovedWidgets.append(self._remove_cell(index)[1])
+
+        # Pooled widgets are hidden instead of destroyed, and reused by the next add
+        if self.pool is not None:
+            self.pool.release_widgets(lRemovedWidgets)
+        else:
+            for widget in lRemovedWidgets:
+                widget.destroy()
 
-        # Delete the widget of the selected value
-        for entry in oneDimensionalList:
-            if value == entry[0]:
-                oneDimensionalList.remove(entry)
-                entry[1].destroy()
+        # Only the widgets after the removed ones have moved
+        self._place_cells(index)
 
-        # Sort the list order based on the value element (index=0)
-        oneDimensionalList.sort(key=lambda index: index[0])
+    def _create_widget(self, dConfig:dict, dResetConfig:dict):
+        """
+        _create_widget Get a widget with the options of widgetType, from the pool if there is one
+
+        :param dConfig: Non-default options of widgetType, see get_template_config
+        :type dConfig: dict
+        :param dResetConfig: All options of widgetType, defaults included, so a reused widget loses the options set on it during its last use
+        :type dResetConfig: dict
+        :return: The widget
+        :rtype: tkinter, ttk, or composite_widgets widget
+        """
+        if self.pool is not None:
+            return self.pool.acquire(self.widgetType.__class__, **dResetConfig)
+        return clone_widget(self.widgetType, self.root, dConfig)
 
-        # Recreate the matrix
-        self.lllWidgets = self.create_matrix(oneDimensionalList)
+    def _find_cell(self, value):
+        """
+        _find_cell Find the first cell with a value
 
-        # Place all widgets into the correct spot
-        self.set_all_positions()
-        self.set_add_button_position()
+        :param value: Value to look for
+        :type value: any
+        :return: Index of the cell in llCells, None if no cell has the value
+        :rtype: integer
+        """
+        if value not in self.dCells:
+            return None
+        return bisect_left(self.lValues, value)
+
+    def _insert_cell(self, cell:list):
+        """
+        _insert_cell Insert a cell at the sorted position of its value, after the cells with the same value
+
+        :param cell: Cell to insert, [value, widget]
+        :type cell: list
+        :return: Index of the cell in llCells
+        :rtype: integer
+        """
+        index = bisect_right(self.lValues, cell[0])
+        self.lValues.insert(index, cell[0])
+        self.llCells.insert(index, cell)
+
+        # Cells with the same value are inserted after the existing ones, so the first cell stays the same
+        self.dCells.setdefault(cell[0], cell)
+        self._tSortedValues = None
+        return index
+
+    def _remove_cell(self, index:int):
+        """
+        _remove_cell Remove a cell from the sorted cells, its widget is not destroyed
+
+        :param index: Index of the cell in llCells
+        :type index: integer
+        :return: The removed cell, [value, widget]
+        :rtype: list
+        """
+        del self.lValues[index]
+        cell = self.llCells.pop(index)
+
+        # If this was the first cell of its value, the next cell with the same value (now at the same index) takes over
+        if self.dCells.get(cell[0]) is cell:
+            if index < len(self.lValues) and self.lValues[index] == cell[0]:
+                self.dCells[cell[0]] = self.llCells[index]
+            else:
+                del self.dCells[cell[0]]
+
+        self._tSortedValues = None
+        return cell
+
+    def _place_cells(self, startIndex:int=0, stopIndex:int=None):
+        """
+        _place_cells Place the cells of an index range at the row and column of their index, and move the add button behind the last cell.
+        All widgets are placed with a single Tcl script.
+
+        :param startIndex: Index of the first cell to place, defaults to 0
+        :type startIndex: integer, optional
+        :param stopIndex: Index after the last cell to place, if None all cells from startIndex onward are placed, defaults to None
+        :type stopIndex: integer, optional
+        """
+        if stopIndex is None:
+            stopIndex = len(self.llCells)
+
+        with batch(self.root) as tclBatch:
+            for index in range(startIndex, stopIndex):
+                row, column = self._get_position(index)
+                tclBatch.grid(self.llCells[index][1], row=row, column=column)
+
+            self.set_add_button_position()
+
+    def _get_position(self, index:int):
+        """
+        _get_position Get the row and column of a cell, these follow from its index and maxColumns, so nothing has to be searched.
+        Without a column limit (maxColumns of -1) each cell has its own row.
+
+        :param index: Index of the cell in llCells
+        :type index: integer
+        :return: Row and column
+        :rtype: tuple(integer, integer)
+        """
+        if self.maxColumns > 0:
+            return divmod(index, self.maxColumns)
+        return index, 0
 
     def create_matrix(self, llOneDimensionalList:list[list]):
         """create_matrix Create a matrix from a one dimensional list
@@ -262,56 +463,62 @@ class WidgetMatrix:
         :return: List of lists of (value, widget)
         :rtype: list[list[(any, Widget)]]
         """
-        lllNewMatrix = list()
-
-        for index in range(len(llOneDimensionalList)):
-            # With a maxColumns of 7, each row will have index 0 to 6
-            column = index % self.maxColumns
-            # Formula works, it"s hard to explain in a comment
-            row = (index - column) / self.maxColumns
-            # If the current column is equal to the maxColumns (Because indexing start from 0)
-            if column == 0:
-                lllNewMatrix.append([llOneDimensionalList[index]])  # Create a new row
-            else:  # Add it into the current row
-                # int is used to because floats are not accepted
-                lllNewMatrix[int(row)].append(llOneDimensionalList[index])
-                
         if len(llOneDimensionalList) == 0:
-            lllNewMatrix = [[]]
+            return [[]]
 
-        return lllNewMatrix
+        # Without a column limit each element gets its own row (see _get_position)
+        if self.maxColumns <= 0:
+            return [[element] for element in llOneDimensionalList]
 
-    def set_all_positions(self):
-        """set_all_positions Place all widgets in the frame based on their row and column inside the matrix lllWidgets"""
+        # With a maxColumns of 7, each row holds the elements of 7 consecutive indices
+        return [llOneDimensionalList[index:index + self.maxColumns] for index in range(0, len(llOneDimensionalList), self.maxColumns)]
 
-        for row in self.lllWidgets:
-            for element in row:
-                element[1].grid(
-                    column=row.index(element),
-                    row=self.lllWidgets.index(row)
-                )  # place the widget on the same location as it is in the lllWidgets
+    def set_max_columns(self, maxColumns:int):
+        """
+        set_max_columns Change the amount of columns before a new row is added, all widgets are placed again
+
+        :param maxColumns: How many columns are allowed before a new row is added, -1 for no limit
+        :type maxColumns: integer
+        """
+        self.maxColumns = maxColumns
+        self.set_all_positions()
+
+    def set_all_positions(self):
+        """set_all_positions Place all widgets and the add button in the frame, based on the index of their cell (see _get_position)"""
+        self._place_cells(0)
 
     def set_add_button_position(self):
         """ set_add_button_position Place the add button at the end of the matrix)"""
-        lastRow = self.lllWidgets[-1]
-        # Check if the last row has space for the add button
-        if len(lastRow) == self.maxColumns:  # No space left, place it on the next row
-            self.addButton.grid(
-                column=0, row=self.lllWidgets.index(lastRow) + 1)
-        else:  # Place it in the current row
-            self.addButton.grid(column=len(lastRow),
-                                row=self.lllWidgets.index(lastRow))
+        cellCount = len(self.llCells)
+
+        if self.maxColumns <= 0 and cellCount > 0:
+            # Each cell has its own row, the add button is placed next to the last cell
+            self.addButton.grid(column=1, row=cellCount - 1)
+        else:
+            # The add button takes the position of the next cell, which is on a new row if the last row is full
+            row, column = self._get_position(cellCount)
+            self.addButton.grid(column=column, row=row)
 
     def get_values(self):
         """
-        Get the saved values in a sorted list
+        Get the saved values in a sorted list, lValues is already sorted so it only needs to be copied
 
         :return: List of sorted values
         :rtype: list[int]
         """        
-        values = [entry[0] for entry in self.explode_widget_list()]
-        values.sort()
-        return values   
+        return list(self.lValues)
+
+    def get_values_view(self):
+        """
+        Get the saved values in a sorted tuple, the same tuple is returned until the cells change.
+        Use this instead of get_values when the values are read often, for example on every keystroke of a filter
+
+        :return: Tuple of sorted values
+        :rtype: tuple[int]
+        """
+        if self._tSortedValues is None:
+            self._tSortedValues = tuple(self.lValues)
+        return self._tSortedValues
 
     def __repr__(self): 
         """
@@ -322,22 +529,77 @@ class WidgetMatrix:
         """   
         return f"root: {self.root}\naddButton cb: {self.addButton.dCallbackSets[self.addButton.currentMode]}\n widget type: {self.widgetType.__name__}\nmax columns: {self.maxColumns}"
 
-def clone_widget(widget, parent=None):
+def clone_widget(widget, parent=None, dConfig:dict=None):
     """clone_widget Clone a widget
 
     :param widget: Widget to copy
     :type widget: tkinter, ttk, or composite_widgets widget
     :param parent: Parent to which the new widget will be assigned, defaults to None
     :type parent: tkinter frame, optional
+    :param dConfig: Options of the widget from get_widget_config, pass these when cloning the same widget many times, if None they are read from the widget, defaults to None
+    :type dConfig: dict, optional
     :return: A carbon copy of the widget
     :rtype: tkinter, ttk, or composite_widgets widget
     """
     cls = widget.__class__
 
     # Clone the widget configuration
-    cfg = {key: widget.cget(key) for key in widget.configure()}
-    dolly = cls(parent if parent is not None else widget.parent, **cfg)
+    if dConfig is None:
+        dConfig = get_widget_config(widget)
+    dolly = cls(parent if parent is not None else widget.parent, **dConfig)
 
     return dolly
 
-    
\ No newline at end of file
+def get_widget_config(widget):
+    """
+    get_widget_config Get the options of a widget which differ from their default, with a single Tcl call.
+    Reading each option with cget would cost a Tcl call per option.
+
+    :param widget: Widget to read
+    :type widget: tkinter or ttk widget
+    :return: Options as keyword arguments for the constructor
+    :rtype: dict
+    """
+    return _get_widget_configs(widget)[0]
+
+def _get_widget_configs(widget):
+    """
+    _get_widget_configs Get the non-default options and all options of a widget, with a single Tcl call.
+    All options leave out the options which can only be set when a widget is created.
+
+    :param widget: Widget to read
+    :type widget: tkinter or ttk widget
+    :return: Non-default options and all options, both as keyword arguments
+    :rtype: tuple(dict, dict)
+    """
+    dConfig = dict()
+    dResetConfig = dict()
+    for key, tOption in widget.configure().items():
+        # Aliases (like "bd" for "borderwidth") only hold the name of the option
+        if len(tOption) != 5:
+            continue
+
+        if str(tOption[4]) != str(tOption[3]):
+            dConfig[key] = tOption[4]
+        if key not in _tCreationOptions:
+            dResetConfig[key] = tOption[4]
+    return dConfig, dResetConfig
+
+def _template_traced(matrixReference, command:str, *args):
+    """
+    _template_traced Called by Tcl after each command of a template widget, a configure which changes options drops the cached options of the matrix.
+    Reading options ("configure" or "configure -option") keeps them.
+
+    :param matrixReference: Weak reference to the matrix
+    :type matrixReference: weakref.ref
+    :param command: The command which ran, as a Tcl list
+    :type command: string
+    :param args: Return code, result and operation of the trace, not used
+    """
+    matrix = matrixReference()
+    if matrix is None:
+        return
+
+    lWords = matrix.root.tk.splitlist(command)
+    if len(lWords) > 3 and lWords[1] == "configure":
+        matrix._templateConfig = None
@@ -0,0 +1,204 @@
+# ==================================================================== #
+#  File name:      widget_pool.py               #        _.==._        #
+#  Author:         Arjan Lemmens                #     .+=##**##=+.     #
+#  Date:           18-Oct-2026                  #    *= #        =*    #
+# ============================================= #   #/  #         \#   #
+#  Description:    Keeps removed widgets hidden #  |#   #   $      #|  #
+#                  for reuse, so filtering and  #  |#   #   #      #|  #
+#                  paging don't destroy and     #   #\  #   #     /#   #
+#                  create widgets all the time. #    *= #   #    =+    #
+#  Rev:            1.2                          #     *++######++*     #
+#                                               #        *-==-*        #
+# ==================================================================== #
+#  Revision history:                                                   #
+#  Date        Description                                             #
+#  18-Oct-2026 File created                                            #
+#  18-Oct-2026 Composite widgets are destroyed by their own destructor #
+#  18-Oct-2026 Delete the typed text of released entry widgets         #
+# ==================================================================== #
+#  To-Do: !=Priority, ~=Bug, ?=Idea/nice to have                       #
+#                                                                      #
+# ==================================================================== #
+
+# =========== #
+#   Imports   #
+# =========== #
+import tkinter as tk
+from tkinter import ttk
+from tkinter_tools.rate_limiter import RateLimiter
+from tkinter_tools.tcl_batch import batch
+from tkinter_tools.tools import destroy_widgets, is_widget_this, WIDGET_TKT_BUTTON
+
+# =============== #
+#   Definitions   #
+# =============== #
+_tTextClasses = (((tk.Entry, tk.Spinbox, ttk.Entry), "0"), ((tk.Text,), "1.0"))
+""" Classes of which the text is deleted when they are released, with the index of their first character (ttk.Combobox and ttk.Spinbox are ttk.Entry widgets) """
+
+#=============#
+#   Classes   #
+#=============#
+class WidgetPool:
+    """
+    Pool of hidden widgets of one parent frame, kept per widget class.
+    Released widgets are unmapped with grid_remove instead of destroyed, acquiring a widget reconfigures a pooled one if there is any.
+    A reused widget keeps the options which are not passed to acquire, so pass every option which differs between uses.
+    The text of entry, spinbox and text widgets is deleted when they are released (which also clears a linked textvariable),
+    other state is kept: bindings, the value of other variables and the text of a disabled or readonly widget.
+    Each class holds at most maxSize widgets, the rest is destroyed.
+    Once the pool has not been used for trimDelay, each class is trimmed down to trimSize widgets.
+    Only tkinter widgets are pooled, composite widgets and Buttons of this package (which hold callbacks) are destroyed when released.
+    """
+
+    def __init__(self, parent, maxSize:int=64, trimDelay:int=30000, trimSize:int=0):
+        """
+        Constructor
+
+        :param parent: Parent frame of the pooled widgets, widgets can't be moved to another parent in Tk
+        :type parent: tkinter widget
+        :param maxSize: Maximum amount of pooled widgets of each class, defaults to 64
+        :type maxSize: integer, optional
+        :param trimDelay: Time in milliseconds without releases or acquires after which the pool is trimmed, defaults to 30000
+        :type trimDelay: integer, optional
+        :param trimSize: Amount of widgets of each class which are kept when the pool is trimmed, defaults to 0
+        :type trimSize: integer, optional
+        """
+        self.parent = parent
+        """ Parent frame of the pooled widgets """
+        self.maxSize = maxSize
+        """ Maximum amount of pooled widgets of each class """
+        self.trimSize = trimSize
+        """ Amount of widgets of each class which are kept when the pool is trimmed """
+        self.dPools = dict()
+        """ Hidden widgets of each class, as class: list[widget] """
+        self._trimLimiter = RateLimiter(self.trim, parent, trimDelay)
+        """ Trims the pool once it has not been used for trimDelay """
+
+    def acquire(self, widgetClass, **kwargs):
+        """
+        Get a widget of a class, a pooled widget is reconfigured, otherwise a new one is created.
+        The widget is not placed, grid it like a new widget.
+
+        :param widgetClass: Class of the widget, it is created with the parent of the pool
+        :type widgetClass: tkinter or ttk widget class
+        :param kwargs: Options of the widget
+        :return: The widget
+        :rtype: tkinter or ttk widget
+        """
+        lPool = self.dPools.get(widgetClass)
+        if not lPool:
+            return widgetClass(self.parent, **kwargs)
+
+        widget = lPool.pop()
+        if len(kwargs) > 0:
+            widget.configure(**kwargs)
+
+        self._trimLimiter.request()
+        return widget
+
+    def release(self, widget):
+        """
+        Hide a widget and keep it for reuse, it is destroyed if the pool of its class is full
+
+        :param widget: Widget which is no longer used, it needs to be a child of the parent of the pool
+        :type widget: tkinter, ttk, or composite_widgets widget
+        """
+        self.release_widgets([widget])
+
+    def release_widgets(self, lWidgets:list):
+        """
+        Hide widgets and keep them for reuse, all with a single Tcl script.
+        Widgets which don't fit in the pool of their class, or are not tkinter widgets, are destroyed.
+        The text of pooled entry, spinbox and text widgets is deleted in the same script.
+
+        :param lWidgets: Widgets which are no longer used, they need to be children of the parent of the pool
+        :type lWidgets: list[tkinter, ttk, or composite_widgets widget]
+        """
+        lDestroyedWidgets = list()
+        lTextWidgets = list()
+
+        with batch(self.parent) as tclBatch:
+            for widget in lWidgets:
+                lPool = None
+                if isinstance(widget, tk.BaseWidget) and not is_widget_this(widget, WIDGET_TKT_BUTTON):
+                    lPool = self.dPools.setdefault(widget.__class__, list())
+
+                if lPool is not None and len(lPool) < self.maxSize:
+                    tclBatch.grid_remove(widget)
+                    lPool.append(widget)
+                    lTextWidgets.append(widget)
+                elif isinstance(widget, tk.BaseWidget):
+                    lDestroyedWidgets.append(widget)
+                else:
+                    widget.__del__() # Composite widgets destroy their own parts, recorded in the batch
+
+            # Deleted after the loop, so all widgets are hidden with a single grid remove command
+            for widget in lTextWidgets:
+                firstIndex = _get_first_index(widget)
+                if firstIndex is not None:
+                    tclBatch.call(widget._w, "delete", firstIndex, "end")
+
+            destroy_widgets(lDestroyedWidgets)
+
+        self._trimLimiter.request()
+
+    def trim(self, size:int=None):
+        """
+        Destroy pooled widgets until each class holds at most size widgets, this is done automatically once the pool has not been used for a while
+
+        :param size: Amount of widgets of each class to keep, if None trimSize is used, defaults to None
+        :type size: integer, optional
+        """
+        if size is None:
+            size = self.trimSize
+
+        lDestroyedWidgets = list()
+        for lPool in self.dPools.values():
+            # The most recently released widgets are kept, the oldest ones are destroyed
+            excess = max(0, len(lPool) - size)
+            lDestroyedWidgets += lPool[:excess]
+            del lPool[:excess]
+
+        destroy_widgets(lDestroyedWidgets)
+
+    def clear(self):
+        """
+        Destroy all pooled widgets
+        """
+        self._trimLimiter.cancel()
+        self.trim(0)
+
+    def __len__(self):
+        """
+        Amount of pooled widgets of all classes
+
+        :return: Amount of widgets
+        :rtype: integer
+        """
+        return sum(len(lPool) for lPool in self.dPools.values())
+
+    def __repr__(self):
+        """
+        Representation of this class when it is printed or viewed in debugger window
+
+        :return: String of how this object should be represented
+        :rtype: string
+        """
+        return f"parent: {self.parent}\nmax size: {self.maxSize}\npooled: {', '.join(f'{widgetClass.__name__}: {len(lPool)}' for widgetClass, lPool in self.dPools.items())}"
+
+# =========== #
+#   Methods   #
+# =========== #
+def _get_first_index(widget):
+    """
+    Get the index of the first character of a widget which holds typed text
+
+    :param widget: Released widget
+    :type widget: tkinter or ttk widget
+    :return: Index for the delete command, None if the widget holds no typed text
+    :rtype: string
+    """
+    for tClasses, firstIndex in _tTextClasses:
+        if isinstance(widget, tClasses):
+            return firstIndex
+    return None